@@ -0,0 +1,42 @@
+"""add nutrition estimate cache table
+
+Revision ID: 3b8e1f0c9a21
+Revises: ecdd67ebcfe9
+Create Date: 2026-10-17 10:12:31.402118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b8e1f0c9a21'
+down_revision: Union[str, Sequence[str], None] = 'ecdd67ebcfe9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'nutrition_estimate_cache',
+        sa.Column('cache_key', sa.String(length=64), nullable=False),
+        sa.Column('model', sa.String(length=64), nullable=False),
+        sa.Column('prompt_version', sa.String(length=32), nullable=False),
+        sa.Column('nutrients', postgresql.JSONB(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True),
+                  server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('cache_key')
+    )
+    op.create_index('ix_nutrition_estimate_cache_created_at',
+                    'nutrition_estimate_cache', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_nutrition_estimate_cache_created_at',
+                  table_name='nutrition_estimate_cache')
+    op.drop_table('nutrition_estimate_cache')
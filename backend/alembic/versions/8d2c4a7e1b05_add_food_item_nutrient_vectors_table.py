@@ -0,0 +1,39 @@
+"""add food item nutrient vectors table
+
+Revision ID: 8d2c4a7e1b05
+Revises: 3b8e1f0c9a21
+Create Date: 2026-10-17 14:03:52.118406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2c4a7e1b05'
+down_revision: Union[str, Sequence[str], None] = '3b8e1f0c9a21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'food_item_nutrient_vectors',
+        sa.Column('name', sa.String(length=255), nullable=False),
+        sa.Column('unit', sa.String(length=32), nullable=False),
+        sa.Column('model', sa.String(length=64), nullable=False),
+        sa.Column('prompt_version', sa.String(length=32), nullable=False),
+        sa.Column('nutrients', postgresql.JSONB(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True),
+                  server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('name', 'unit', 'model', 'prompt_version')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('food_item_nutrient_vectors')
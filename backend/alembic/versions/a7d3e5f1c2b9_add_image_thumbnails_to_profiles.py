@@ -0,0 +1,32 @@
+"""add image_thumbnails to profiles
+
+Revision ID: a7d3e5f1c2b9
+Revises: e2b7d4c9a1f6
+Create Date: 2026-10-17 18:42:13.207561
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d3e5f1c2b9'
+down_revision: Union[str, Sequence[str], None] = 'e2b7d4c9a1f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'profiles',
+        sa.Column('image_thumbnails', postgresql.JSONB(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('profiles', 'image_thumbnails')
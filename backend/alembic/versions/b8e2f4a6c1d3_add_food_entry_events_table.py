@@ -0,0 +1,53 @@
+"""add food entry events table
+
+Revision ID: b8e2f4a6c1d3
+Revises: a7d3e5f1c2b9
+Create Date: 2026-10-17 19:26:40.118342
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e2f4a6c1d3'
+down_revision: Union[str, Sequence[str], None] = 'a7d3e5f1c2b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'food_entry_events',
+        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('meal_type', sa.String(length=16), nullable=False),
+        sa.Column('meal_index', sa.SmallInteger(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True),
+                  server_default=sa.text('now()'), nullable=False),
+        sa.Column('available_at', sa.DateTime(timezone=True),
+                  server_default=sa.text('now()'), nullable=False),
+        sa.Column('claimed_until', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('attempts', sa.SmallInteger(),
+                  server_default=sa.text('0'), nullable=False),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_food_entry_events_available_at',
+        'food_entry_events',
+        ['available_at'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_food_entry_events_available_at',
+                  table_name='food_entry_events')
+    op.drop_table('food_entry_events')
@@ -0,0 +1,42 @@
+"""add nutrients_compact columns
+
+Revision ID: c4f1a9d2e7b3
+Revises: 8d2c4a7e1b05
+Create Date: 2026-10-17 16:21:08.532914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f1a9d2e7b3'
+down_revision: Union[str, Sequence[str], None] = '8d2c4a7e1b05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_TABLES = (
+    'meal_nutrition_summaries',
+    'daily_nutrition_summaries',
+    'targets',
+    'daily_target_snapshots',
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in _TABLES:
+        op.add_column(
+            table,
+            sa.Column('nutrients_compact', postgresql.JSONB(), nullable=True),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(_TABLES):
+        op.drop_column(table, 'nutrients_compact')
@@ -0,0 +1,40 @@
+"""add daily report output cache table
+
+Revision ID: d5a8c3e6f2b4
+Revises: b8e2f4a6c1d3
+Create Date: 2026-10-17 21:04:12.583907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a8c3e6f2b4'
+down_revision: Union[str, Sequence[str], None] = 'b8e2f4a6c1d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'daily_report_output_cache',
+        sa.Column('cache_key', sa.String(length=64), nullable=False),
+        sa.Column('output', postgresql.JSONB(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True),
+                  server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('cache_key')
+    )
+    op.create_index('ix_daily_report_output_cache_created_at',
+                    'daily_report_output_cache', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_daily_report_output_cache_created_at',
+                  table_name='daily_report_output_cache')
+    op.drop_table('daily_report_output_cache')
@@ -0,0 +1,42 @@
+"""add user day rollups table
+
+Revision ID: e2b7d4c9a1f6
+Revises: c4f1a9d2e7b3
+Create Date: 2026-10-17 17:42:15.604271
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b7d4c9a1f6'
+down_revision: Union[str, Sequence[str], None] = 'c4f1a9d2e7b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'user_day_rollups',
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('has_meal_logs', sa.Boolean(),
+                  server_default=sa.text('false'), nullable=False),
+        sa.Column('nutrition_achievement', sa.Integer(), nullable=True),
+        sa.Column('has_daily_report', sa.Boolean(),
+                  server_default=sa.text('false'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True),
+                  server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'date')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('user_day_rollups')
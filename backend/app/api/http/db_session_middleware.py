@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infra.db.request_scope import (
+    RequestSessionScope,
+    bind_request_scope,
+    detach_request_scope,
+    reset_request_scope,
+)
+
+
+class RequestSessionScopeMiddleware:
+    """
+    1 リクエスト = 1 Session / 1 トランザクションにまとめるミドルウェア（pure ASGI）。
+
+    - リクエスト内の UoW はすべて共有 Session 上の SAVEPOINT になる。
+    - レスポンスヘッダを送る直前に 1 回だけ COMMIT する（失敗したら例外のまま
+      伝播し、レスポンスを送る前なので 500 になる）。
+    - 未処理例外が伝播した場合は ROLLBACK する。
+    - COMMIT 後はスコープを外すので、バックグラウンドタスクの UoW は単独で commit する。
+    - commit / rollback はブロッキング I/O なのでスレッドプールで実行する。
+    - BaseHTTPMiddleware と違い、エンドポイントと同じタスク / コンテキストで動く
+      （レスポンスをバッファしない）。
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        db_scope = RequestSessionScope()
+        token = bind_request_scope(db_scope)
+        finished = False
+
+        async def finish(commit: bool) -> None:
+            nonlocal finished
+            if finished:
+                return
+            finished = True
+            detach_request_scope()
+            if db_scope.has_sessions:
+                await run_in_threadpool(db_scope.finish, commit)
+
+        async def send_after_commit(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                await finish(True)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_after_commit)
+        except BaseException:
+            await finish(False)
+            raise
+        else:
+            # レスポンスを返さずに終わった場合（クライアント切断など）
+            await finish(True)
+        finally:
+            reset_request_scope(token)
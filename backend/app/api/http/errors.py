@@ -130,6 +130,13 @@ async def profile_domain_error_handler(
             status_code=status.HTTP_404_NOT_FOUND,
         )
 
+    if isinstance(exc, profile_domain_errors.InvalidProfileImageError):
+        return error_response(
+            code="INVALID_PROFILE_IMAGE",
+            message=str(exc) or "プロフィール画像が不正です。",
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+
     logger.exception("Unhandled ProfileError: %s", exc)
     return error_response(
         code="INTERNAL_ERROR",
@@ -322,6 +329,13 @@ async def meal_domain_error_handler(
             message=str(exc) or "Invalid food amount",
         )
 
+    if isinstance(exc, meal_domain_errors.InvalidFoodEntryBatchError):
+        return error_response(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            code="INVALID_FOOD_ENTRY_BATCH",
+            message=str(exc) or "Invalid food entry batch",
+        )
+
     if isinstance(exc, DailyLogProfileNotFoundError):
         return error_response(
             status_code=status.HTTP_400_BAD_REQUEST,
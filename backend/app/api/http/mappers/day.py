@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from app.api.http.schemas.daily_report import DailyNutritionReportResponse
+from app.api.http.schemas.day import DayOverviewResponse, DayTargetResponse
+from app.api.http.schemas.meal import MealItemResponse
+from app.api.http.schemas.meal_recommendation import (
+    MealRecommendationResponse,
+    RecommendedMealResponse,
+)
+from app.api.http.schemas.nutrition import (
+    DailyNutrientResponse,
+    DailyNutritionSummaryResponse,
+    MealNutrientResponse,
+    MealNutritionSummaryResponse,
+)
+from app.api.http.schemas.target import TargetNutrientSchema
+from app.application.day.dto.day_dto import DayOverviewDTO, DayTargetDTO
+from app.application.meal.dto.food_entry_dto import FoodEntryDTO
+from app.domain.nutrition.daily_nutrition import DailyNutritionSummary
+from app.domain.nutrition.daily_report import DailyNutritionReport
+from app.domain.nutrition.meal_nutrition import MealNutritionSummary
+from app.domain.nutrition.meal_recommendation import MealRecommendation
+
+
+def to_day_overview_response(dto: DayOverviewDTO) -> DayOverviewResponse:
+    return DayOverviewResponse(
+        date=dto.date,
+        is_premium=dto.is_premium,
+        items=[_to_meal_item(e) for e in dto.entries],
+        meal_summaries=[_to_meal_summary(s) for s in dto.meal_summaries],
+        daily_summary=(
+            _to_daily_summary(dto.daily_summary) if dto.daily_summary else None
+        ),
+        target=_to_target(dto.target) if dto.target else None,
+        report=_to_report(dto.report) if dto.report else None,
+        recommendation=(
+            _to_recommendation(dto.recommendation) if dto.recommendation else None
+        ),
+    )
+
+
+def _to_meal_item(dto: FoodEntryDTO) -> MealItemResponse:
+    return MealItemResponse(
+        id=dto.id,
+        date=dto.date,
+        meal_type=dto.meal_type,
+        meal_index=dto.meal_index,
+        name=dto.name,
+        amount_value=dto.amount_value,
+        amount_unit=dto.amount_unit,
+        serving_count=dto.serving_count,
+        note=dto.note,
+    )
+
+
+def _to_meal_summary(summary: MealNutritionSummary) -> MealNutritionSummaryResponse:
+    return MealNutritionSummaryResponse(
+        id=str(summary.id.value),
+        date=summary.date,
+        meal_type=summary.meal_type.value,
+        meal_index=summary.meal_index,
+        generated_at=summary.generated_at,
+        nutrients=[
+            MealNutrientResponse(
+                code=n.code.value,
+                value=n.amount.value,
+                unit=n.amount.unit,
+                source=n.source.value,
+            )
+            for n in summary.nutrients
+        ],
+    )
+
+
+def _to_daily_summary(summary: DailyNutritionSummary) -> DailyNutritionSummaryResponse:
+    return DailyNutritionSummaryResponse(
+        id=str(summary.id.value),
+        date=summary.date,
+        generated_at=summary.generated_at,
+        nutrients=[
+            DailyNutrientResponse(
+                code=n.code.value,
+                value=n.amount.value,
+                unit=n.amount.unit,
+                source=n.source.value,
+            )
+            for n in summary.nutrients
+        ],
+    )
+
+
+def _to_target(target: DayTargetDTO) -> DayTargetResponse:
+    return DayTargetResponse(
+        target_id=target.target_id,
+        source=target.source,
+        nutrients=[
+            TargetNutrientSchema(
+                code=n.code.value,
+                amount=n.amount.value,
+                unit=n.amount.unit,
+                source=n.source.value,
+            )
+            for n in target.nutrients
+        ],
+    )
+
+
+def _to_report(report: DailyNutritionReport) -> DailyNutritionReportResponse:
+    return DailyNutritionReportResponse(
+        date=report.date,
+        summary=report.summary,
+        good_points=report.good_points,
+        improvement_points=report.improvement_points,
+        tomorrow_focus=report.tomorrow_focus,
+        created_at=report.created_at,
+    )
+
+
+def _to_recommendation(recommendation: MealRecommendation) -> MealRecommendationResponse:
+    return MealRecommendationResponse(
+        id=recommendation.id.value,
+        user_id=recommendation.user_id.value,
+        generated_for_date=recommendation.generated_for_date,
+        body=recommendation.body,
+        tips=recommendation.tips,
+        recommended_meals=[
+            RecommendedMealResponse(
+                title=meal.title,
+                description=meal.description,
+                ingredients=meal.ingredients,
+                nutrition_focus=meal.nutrition_focus,
+            )
+            for meal in recommendation.recommended_meals
+        ],
+        created_at=recommendation.created_at,
+    )
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import math
+import time
+from typing import Callable
+
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp
+
+from app.infra.db.read_routing import (
+    ReadRoutingState,
+    bind_read_routing,
+    reset_read_routing,
+)
+
+LAST_WRITE_COOKIE = "db_last_write"
+
+
+class ReadReplicaStickinessMiddleware(BaseHTTPMiddleware):
+    """
+    読み取りレプリカの read-your-writes を保証するミドルウェア。
+
+    - リクエスト内で書き込みがあれば、レスポンスに最終書き込み時刻の Cookie を付ける。
+    - Cookie が sticky_seconds 以内なら、そのリクエストの読み取り専用 UoW もプライマリで読む。
+    - 状態をクライアント側に持つので、複数ワーカー / 複数台でも同じように効く。
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        sticky_seconds: float,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        super().__init__(app)
+        self._sticky_seconds = sticky_seconds
+        self._clock = clock
+
+    def _is_sticky(self, request: Request) -> bool:
+        raw = request.cookies.get(LAST_WRITE_COOKIE)
+        if raw is None:
+            return False
+        try:
+            last_write = float(raw)
+        except ValueError:
+            return False
+        return self._clock() - last_write < self._sticky_seconds
+
+    async def dispatch(
+        self,
+        request: Request,
+        call_next: RequestResponseEndpoint,
+    ) -> Response:
+        state = ReadRoutingState(sticky=self._is_sticky(request))
+        token = bind_read_routing(state)
+        try:
+            response = await call_next(request)
+        finally:
+            reset_read_routing(token)
+
+        if state.wrote:
+            response.set_cookie(
+                LAST_WRITE_COOKIE,
+                f"{self._clock():.3f}",
+                max_age=max(1, math.ceil(self._sticky_seconds)),
+                httponly=True,
+                samesite="lax",
+            )
+        return response
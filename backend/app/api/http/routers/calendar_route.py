@@ -1,12 +1,23 @@
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 from app.api.http.schemas.calendar import (
+    CalendarRangeResponseSchema,
     MonthlyCalendarQuerySchema,
     MonthlyCalendarResponseSchema,
     CalendarDaySnapshotSchema
 )
 from app.application.auth.dto.auth_user_dto import AuthUserDTO
-from app.application.calendar.use_cases.get_monthly_calendar import GetMonthlyCalendarUseCase
-from app.application.calendar.dto.calendar_dto import MonthlyCalendarDto, MonthlyCalendarResultDto
+from app.application.calendar.use_cases.get_monthly_calendar import (
+    MAX_RANGE_DAYS,
+    GetMonthlyCalendarUseCase,
+)
+from app.application.calendar.dto.calendar_dto import (
+    CalendarRangeDto,
+    CalendarRangeResultDto,
+    MonthlyCalendarDto,
+    MonthlyCalendarResultDto,
+)
 from app.api.http.dependencies.auth import get_current_user_dto
 from app.domain.calendar.errors import CalendarError
 from app.di.container import get_get_monthly_calendar_use_case
@@ -20,13 +31,13 @@ router = APIRouter()
     summary="月次カレンダーサマリー取得",
     description="指定した年月の各日の食事ログ・達成度・レポート状況を取得"
 )
-def get_monthly_summary(
+async def get_monthly_summary(
     query: MonthlyCalendarQuerySchema = Depends(),
     current_user: AuthUserDTO = Depends(get_current_user_dto),
     use_case: GetMonthlyCalendarUseCase = Depends(
         get_get_monthly_calendar_use_case)
 ) -> MonthlyCalendarResponseSchema:
-    """月次カレンダーサマリーを取得"""
+    """月次カレンダーサマリーを取得（async DB が有効ならスレッドプールを使わずに読む）"""
 
     try:
         request_dto = MonthlyCalendarDto(
@@ -35,7 +46,7 @@ def get_monthly_summary(
             month=query.month
         )
 
-        result: MonthlyCalendarResultDto = use_case.execute(
+        result: MonthlyCalendarResultDto = await use_case.execute_async(
             request_dto)
 
         return MonthlyCalendarResponseSchema(
@@ -58,6 +69,46 @@ def get_monthly_summary(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@router.get(
+    "/range",
+    response_model=CalendarRangeResponseSchema,
+    summary="期間カレンダーサマリー取得",
+    description=(
+        f"from〜to（両端を含む、最大 {MAX_RANGE_DAYS} 日）の各日の食事ログ・達成度・レポート状況を"
+        "1 回のクエリで取得。レスポンスは日ごとの配列を並べた列指向形式"
+    )
+)
+async def get_range_summary(
+    start_date: date = Query(..., alias="from", description="開始日（YYYY-MM-DD）"),
+    end_date: date = Query(..., alias="to", description="終了日（YYYY-MM-DD）"),
+    current_user: AuthUserDTO = Depends(get_current_user_dto),
+    use_case: GetMonthlyCalendarUseCase = Depends(
+        get_get_monthly_calendar_use_case)
+) -> CalendarRangeResponseSchema:
+    """期間カレンダーサマリーを取得（async DB が有効ならスレッドプールを使わずに読む）"""
+
+    try:
+        result: CalendarRangeResultDto = await use_case.execute_range_async(
+            CalendarRangeDto(
+                user_id=current_user.id,
+                start_date=start_date,
+                end_date=end_date
+            )
+        )
+
+        return CalendarRangeResponseSchema(
+            start_date=result.start_date.isoformat(),
+            end_date=result.end_date.isoformat(),
+            has_meal_logs=[day.has_meal_logs for day in result.days],
+            nutrition_achievement=[
+                day.nutrition_achievement for day in result.days],
+            has_daily_report=[day.has_daily_report for day in result.days],
+        )
+
+    except CalendarError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.get(
     "/monthly-summary-dev",
     response_model=MonthlyCalendarResponseSchema,
@@ -65,7 +65,7 @@ def _report_to_response(report: DailyNutritionReport) -> DailyNutritionReportRes
         "409": {"model": ErrorResponse},
     },
 )
-def generate_daily_nutrition_report(
+async def generate_daily_nutrition_report(
     request: GenerateDailyReportRequest,
     current_user: AuthUserDTO = Depends(get_current_user_dto),
     use_case: GenerateDailyNutritionReportUseCase = Depends(
@@ -82,12 +82,13 @@ def generate_daily_nutrition_report(
         - DailyNutritionReportAlreadyExistsError
         - DailyLogProfileNotFoundError など
       → ここでは捕まえず、共通エラーハンドラで HTTP にマッピングする。
+    - LLM 呼び出しはイベントループ上で await する（スレッドプールを占有しない）。
     """
 
     user_id = UserId(current_user.id)
     target_date: DateType = request.date
 
-    report = use_case.execute(user_id=user_id, date_=target_date)
+    report = await use_case.execute_async(user_id=user_id, date_=target_date)
     return _report_to_response(report)
 
 
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import hashlib
+from datetime import date as DateType
+
+# === Third-party ============================================================
+from fastapi import APIRouter, Depends, Header, Response, status
+
+# === API (schemas / dependencies) ==========================================
+from app.api.http.dependencies.auth import get_current_user_dto
+from app.api.http.mappers.day import to_day_overview_response
+from app.api.http.schemas.day import DayOverviewResponse
+from app.api.http.schemas.errors import ErrorResponse
+
+# === Application (DTO / UseCase) ============================================
+from app.application.auth.dto.auth_user_dto import AuthUserDTO
+from app.application.day.use_cases.get_day_overview import GetDayOverviewUseCase
+
+# === Domain ================================================================
+from app.domain.auth.value_objects import UserId
+
+# === DI =====================================================================
+from app.di.container import get_get_day_overview_use_case
+
+router = APIRouter(tags=["Day"])
+
+# 中身から作る ETag なので、毎回サーバに確認させる（304 なら本文は送らない）
+DAY_CACHE_CONTROL = "private, no-cache"
+
+
+# === Helpers ===============================================================
+
+
+def _etag_for(body: bytes) -> str:
+    # JSON の表現をそのままハッシュする（圧縮などで変わってもよいよう弱い ETag）
+    return f'W/"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def _matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    If-None-Match に etag が含まれるか（弱い比較なので W/ の有無は無視する）。
+    """
+    if not if_none_match:
+        return False
+    candidates = [c.strip() for c in if_none_match.split(",")]
+    if "*" in candidates:
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(c.removeprefix("W/") == opaque for c in candidates)
+
+
+# === Routes ================================================================
+
+
+@router.get(
+    "/days/{date}",
+    response_model=DayOverviewResponse,
+    responses={
+        304: {"description": "Not Modified（If-None-Match が ETag と一致）"},
+        400: {"model": ErrorResponse},
+        401: {"model": ErrorResponse},
+    },
+)
+def get_day_overview(
+    date: DateType,
+    current_user: AuthUserDTO = Depends(get_current_user_dto),
+    use_case: GetDayOverviewUseCase = Depends(get_get_day_overview_use_case),
+    if_none_match: str | None = Header(default=None),
+) -> Response:
+    """
+    ホーム画面の 1 日分をまとめて返す。
+
+    - 食事ログ / 食事ごとの栄養サマリ / 日次サマリ / ターゲット / 日次レポート /
+      食事提案を 1 回の認証・プラン判定・DB セッションで読む。
+    - 無いものは null / 空配列（404 にはしない）。プレミアムでなければ栄養サマリは返さない。
+    - ETag を付ける。If-None-Match が一致すれば 304 を返す。
+    """
+    overview = use_case.execute(UserId(current_user.id), date)
+    body = to_day_overview_response(overview).model_dump_json().encode()
+
+    etag = _etag_for(body)
+    headers = {"ETag": etag, "Cache-Control": DAY_CACHE_CONTROL}
+    if _matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
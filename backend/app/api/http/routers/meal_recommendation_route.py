@@ -81,7 +81,7 @@ def _to_response(recommendation: MealRecommendation) -> MealRecommendationRespon
         500: {"description": "Failed to generate recommendation"},
     },
 )
-def generate_meal_recommendation(
+async def generate_meal_recommendation(
     request: GenerateMealRecommendationRequest,
     current_user: AuthUserDTO = Depends(get_current_user_dto),
     use_case: GenerateMealRecommendationUseCase = Depends(
@@ -101,7 +101,7 @@ def generate_meal_recommendation(
     )
 
     try:
-        recommendation = use_case.execute(input_dto)
+        recommendation = await use_case.execute_async(input_dto)
         return GenerateMealRecommendationResponse(
             recommendation=_to_response(recommendation)
         )
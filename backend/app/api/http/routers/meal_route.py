@@ -10,6 +10,9 @@ from fastapi import APIRouter, Depends, Path, Query, Response, status
 # === API (schemas / dependencies) ==========================================
 from app.api.http.dependencies.auth import get_current_user_dto
 from app.api.http.schemas.meal import (
+    MealItemBatchCreateRequest,
+    MealItemBatchDeleteRequest,
+    MealItemBatchUpdateRequest,
     MealItemListResponse,
     MealItemRequest,
     MealItemResponse,
@@ -31,18 +34,24 @@ from app.application.meal.use_cases.list_food_entries_by_date import (
     ListFoodEntriesByDateUseCase,
 )
 from app.application.meal.use_cases.update_food_entry import UpdateFoodEntryUseCase
-from app.application.nutrition.use_cases.compute_daily_nutrition import (
-    ComputeDailyNutritionSummaryUseCase,
+from app.application.nutrition.ports.daily_recompute_scheduler_port import (
+    DailyNutritionRecomputeSchedulerPort,
+    MealSlot,
+)
+from app.application.nutrition.use_cases.compute_meal_nutrition import (
+    ComputeMealNutritionUseCase,
 )
 
 # === DI =====================================================================
 from app.di.container import (
-    get_compute_daily_nutrition_summary_use_case,
+    get_compute_meal_nutrition_use_case,
     get_create_food_entry_use_case,
+    get_daily_nutrition_recompute_scheduler,
     get_delete_food_entry_use_case,
     get_list_food_entries_by_date_use_case,
     get_update_food_entry_use_case,
 )
+from app.settings import settings
 
 router = APIRouter(tags=["Meal"])
 
@@ -67,20 +76,29 @@ def _dto_to_response(dto: FoodEntryDTO) -> MealItemResponse:
     )
 
 
-def _recompute_daily_summaries(
+def _recompute_meal_slots(
     *,
-    compute_daily_uc: ComputeDailyNutritionSummaryUseCase,
+    compute_meal_uc: ComputeMealNutritionUseCase,
+    recompute_scheduler: DailyNutritionRecomputeSchedulerPort | None,
     user_id: UserId,
-    dates: set[DateType],
+    slots: set[tuple[DateType, MealSlot]],
 ) -> None:
     """
-    影響のある日付の DailyNutritionSummary を再計算する共通処理。
+    影響のある食事スロット（変更前 / 変更後）の MealNutritionSummary を計算し直す共通処理。
+
+    - 食事サマリの保存時に差分が日次サマリへ反映されるので、日次は別に計算しない。
+    - recompute_scheduler があれば、続けて編集されることが多いので
+      リクエスト内では計算せず、(user, date) ごとにまとめて後で同じ計算をする。
     """
-    for d in dates:
-        compute_daily_uc.execute(
-            user_id=user_id,
-            date_=d,
-        )
+    by_date: dict[DateType, set[MealSlot]] = {}
+    for d, slot in slots:
+        by_date.setdefault(d, set()).add(slot)
+
+    for d, day_slots in sorted(by_date.items()):
+        if recompute_scheduler is not None:
+            recompute_scheduler.schedule(user_id, d, day_slots)
+        else:
+            compute_meal_uc.recompute_slots(user_id, d, day_slots)
 
 
 # === Routes ================================================================
@@ -157,13 +175,19 @@ def update_meal_item(
     entry_id: str = Path(..., description="FoodEntry ID (UUID 文字列)"),
     current_user: AuthUserDTO = Depends(get_current_user_dto),
     use_case: UpdateFoodEntryUseCase = Depends(get_update_food_entry_use_case),
-    compute_daily_uc: ComputeDailyNutritionSummaryUseCase = Depends(
-        get_compute_daily_nutrition_summary_use_case
+    compute_meal_uc: ComputeMealNutritionUseCase = Depends(
+        get_compute_meal_nutrition_use_case
+    ),
+    recompute_scheduler: DailyNutritionRecomputeSchedulerPort | None = Depends(
+        get_daily_nutrition_recompute_scheduler
     ),
 ) -> MealItemResponse:
     """
     既存の FoodEntry を更新し、
-    影響のある日の DailyNutritionSummary を再計算する。
+    影響のある食事スロット（と日次サマリ）の栄養を計算し直す。
+
+    - FOOD_ENTRY_OUTBOX_ENABLED のときは、変更イベントを元にワーカーが
+      食事 / 日次サマリを計算し直すので、ここでは計算しない。
     """
 
     input_dto = UpdateFoodEntryInputDTO(
@@ -182,13 +206,17 @@ def update_meal_item(
     result = use_case.execute(UserId(current_user.id), input_dto)
     dto = result.entry
 
-    # 影響する日付 = {更新前の日, 更新後の日}
-    impacted_dates = {result.old_date, dto.date}
-    _recompute_daily_summaries(
-        compute_daily_uc=compute_daily_uc,
-        user_id=UserId(current_user.id),
-        dates=impacted_dates,
-    )
+    # 影響する食事スロット = {更新前のスロット, 更新後のスロット}
+    if not settings.FOOD_ENTRY_OUTBOX_ENABLED:
+        _recompute_meal_slots(
+            compute_meal_uc=compute_meal_uc,
+            recompute_scheduler=recompute_scheduler,
+            user_id=UserId(current_user.id),
+            slots={
+                (result.old_date, (result.old_meal_type, result.old_meal_index)),
+                (dto.date, (dto.meal_type, dto.meal_index)),
+            },
+        )
 
     return _dto_to_response(dto)
 
@@ -205,24 +233,181 @@ def delete_meal_item(
     entry_id: str = Path(..., description="FoodEntry ID (UUID 文字列)"),
     current_user: AuthUserDTO = Depends(get_current_user_dto),
     use_case: DeleteFoodEntryUseCase = Depends(get_delete_food_entry_use_case),
-    compute_daily_uc: ComputeDailyNutritionSummaryUseCase = Depends(
-        get_compute_daily_nutrition_summary_use_case
+    compute_meal_uc: ComputeMealNutritionUseCase = Depends(
+        get_compute_meal_nutrition_use_case
+    ),
+    recompute_scheduler: DailyNutritionRecomputeSchedulerPort | None = Depends(
+        get_daily_nutrition_recompute_scheduler
     ),
 ) -> Response:
     """
-    FoodEntry を削除し、その日の DailyNutritionSummary を再計算する。
+    FoodEntry を削除し、その食事スロット（と日次サマリ）の栄養を計算し直す。
 
     - Repository 実装側ではソフトデリートを想定。
+    - FOOD_ENTRY_OUTBOX_ENABLED のときは、再計算はワーカーに任せる。
     """
 
     # DeleteFoodEntryUseCase は DeleteFoodEntryResultDTO を返す想定
     result = use_case.execute(UserId(current_user.id), entry_id)
 
-    if result is not None:
-        _recompute_daily_summaries(
-            compute_daily_uc=compute_daily_uc,
+    if result is not None and not settings.FOOD_ENTRY_OUTBOX_ENABLED:
+        _recompute_meal_slots(
+            compute_meal_uc=compute_meal_uc,
+            recompute_scheduler=recompute_scheduler,
+            user_id=UserId(current_user.id),
+            slots={(result.date, (result.meal_type, result.meal_index))},
+        )
+
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+# === Batch =================================================================
+# 複数品の食事をまとめて記録するクライアント向け。1 リクエスト = 1 トランザクションで、
+# 全件成功か全件失敗。栄養の計算し直しは影響のある食事スロットごとに 1 回だけ行う。
+
+
+@router.post(
+    "/meal-items:batch",
+    response_model=MealItemListResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        400: {"model": ErrorResponse},
+        401: {"model": ErrorResponse},
+    },
+)
+def create_meal_items_batch(
+    request: MealItemBatchCreateRequest,
+    current_user: AuthUserDTO = Depends(get_current_user_dto),
+    use_case: CreateFoodEntryUseCase = Depends(get_create_food_entry_use_case),
+    compute_meal_uc: ComputeMealNutritionUseCase = Depends(
+        get_compute_meal_nutrition_use_case
+    ),
+    recompute_scheduler: DailyNutritionRecomputeSchedulerPort | None = Depends(
+        get_daily_nutrition_recompute_scheduler
+    ),
+) -> MealItemListResponse:
+    """
+    FoodEntry をまとめて作成する（複数行を 1 回の INSERT で保存）。
+    """
+
+    input_dtos = [
+        CreateFoodEntryInputDTO(
+            date=item.date,
+            meal_type=item.meal_type.value,
+            meal_index=item.meal_index,
+            name=item.name,
+            amount_value=item.amount_value,
+            amount_unit=item.amount_unit,
+            serving_count=item.serving_count,
+            note=item.note,
+        )
+        for item in request.items
+    ]
+
+    dtos = use_case.execute_many(UserId(current_user.id), input_dtos)
+
+    if not settings.FOOD_ENTRY_OUTBOX_ENABLED:
+        _recompute_meal_slots(
+            compute_meal_uc=compute_meal_uc,
+            recompute_scheduler=recompute_scheduler,
+            user_id=UserId(current_user.id),
+            slots={(dto.date, (dto.meal_type, dto.meal_index)) for dto in dtos},
+        )
+
+    return MealItemListResponse(items=[_dto_to_response(dto) for dto in dtos])
+
+
+@router.patch(
+    "/meal-items:batch",
+    response_model=MealItemListResponse,
+    responses={
+        400: {"model": ErrorResponse},
+        401: {"model": ErrorResponse},
+        404: {"model": ErrorResponse},
+    },
+)
+def update_meal_items_batch(
+    request: MealItemBatchUpdateRequest,
+    current_user: AuthUserDTO = Depends(get_current_user_dto),
+    use_case: UpdateFoodEntryUseCase = Depends(get_update_food_entry_use_case),
+    compute_meal_uc: ComputeMealNutritionUseCase = Depends(
+        get_compute_meal_nutrition_use_case
+    ),
+    recompute_scheduler: DailyNutritionRecomputeSchedulerPort | None = Depends(
+        get_daily_nutrition_recompute_scheduler
+    ),
+) -> MealItemListResponse:
+    """
+    既存の FoodEntry をまとめて更新する（対象は 1 クエリで読む）。
+    1 件でも見つからなければ 404 で、何も更新しない。
+    """
+
+    input_dtos = [
+        UpdateFoodEntryInputDTO(
+            entry_id=str(item.id),
+            date=item.date,
+            meal_type=item.meal_type.value,
+            meal_index=item.meal_index,
+            name=item.name,
+            amount_value=item.amount_value,
+            amount_unit=item.amount_unit,
+            serving_count=item.serving_count,
+            note=item.note,
+        )
+        for item in request.items
+    ]
+
+    results = use_case.execute_many(UserId(current_user.id), input_dtos)
+
+    if not settings.FOOD_ENTRY_OUTBOX_ENABLED:
+        _recompute_meal_slots(
+            compute_meal_uc=compute_meal_uc,
+            recompute_scheduler=recompute_scheduler,
+            user_id=UserId(current_user.id),
+            slots={
+                (r.old_date, (r.old_meal_type, r.old_meal_index)) for r in results
+            } | {
+                (r.entry.date, (r.entry.meal_type, r.entry.meal_index)) for r in results
+            },
+        )
+
+    return MealItemListResponse(items=[_dto_to_response(r.entry) for r in results])
+
+
+@router.delete(
+    "/meal-items:batch",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={
+        401: {"model": ErrorResponse},
+        404: {"model": ErrorResponse},
+    },
+)
+def delete_meal_items_batch(
+    request: MealItemBatchDeleteRequest,
+    current_user: AuthUserDTO = Depends(get_current_user_dto),
+    use_case: DeleteFoodEntryUseCase = Depends(get_delete_food_entry_use_case),
+    compute_meal_uc: ComputeMealNutritionUseCase = Depends(
+        get_compute_meal_nutrition_use_case
+    ),
+    recompute_scheduler: DailyNutritionRecomputeSchedulerPort | None = Depends(
+        get_daily_nutrition_recompute_scheduler
+    ),
+) -> Response:
+    """
+    FoodEntry をまとめて削除する（ソフトデリート）。
+    1 件でも見つからなければ 404 で、何も削除しない。
+    """
+
+    results = use_case.execute_many(
+        UserId(current_user.id), [str(entry_id) for entry_id in request.ids]
+    )
+
+    if not settings.FOOD_ENTRY_OUTBOX_ENABLED:
+        _recompute_meal_slots(
+            compute_meal_uc=compute_meal_uc,
+            recompute_scheduler=recompute_scheduler,
             user_id=UserId(current_user.id),
-            dates={result.date},
+            slots={(r.date, (r.meal_type, r.meal_index)) for r in results},
         )
 
     return Response(status_code=status.HTTP_204_NO_CONTENT)
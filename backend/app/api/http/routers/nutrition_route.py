@@ -4,6 +4,7 @@ from datetime import date as DateType
 
 # === Third-party ============================================================
 from fastapi import APIRouter, Depends, Query, HTTPException
+from starlette.concurrency import run_in_threadpool
 
 # === API (schemas / dependencies) ==========================================
 from app.api.http.dependencies.auth import get_current_user_dto
@@ -106,7 +107,7 @@ def _to_daily_response(summary: DailyNutritionSummary) -> DailyNutritionSummaryR
         404: {"model": ErrorResponse},
     },
 )
-def get_meal_and_daily_nutrition(
+async def get_meal_and_daily_nutrition(
     date: DateType = Query(..., description="対象日 (YYYY-MM-DD)"),
     meal_type: str = Query(
         ...,
@@ -134,6 +135,7 @@ def get_meal_and_daily_nutrition(
 
     OpenAI計算は行わず、DBに保存されているデータのみを返す。
     データが存在しない場合は404エラーを返す。
+    ASYNC_DATABASE_URL があればスレッドプールを使わずに async UoW で読む。
 
     フロー:
       1. GetMealNutritionUseCase → 既存データ取得のみ
@@ -145,7 +147,7 @@ def get_meal_and_daily_nutrition(
     user_id: UserId = UserId(current_user.id)
 
     # ① 1食分の既存栄養サマリを取得（OpenAI計算なし）
-    meal_summary = get_meal_uc.execute(
+    meal_summary = await get_meal_uc.execute_async(
         user_id=user_id,
         date_=date,
         meal_type_str=meal_type,
@@ -153,7 +155,7 @@ def get_meal_and_daily_nutrition(
     )
 
     # ② 1日分の既存栄養サマリを取得（OpenAI計算なし）
-    daily_summary = get_daily_uc.execute(
+    daily_summary = await get_daily_uc.execute_async(
         user_id=user_id,
         date_=date,
     )
@@ -183,7 +185,7 @@ def get_meal_and_daily_nutrition(
         409: {"model": ErrorResponse},
     },
 )
-def compute_meal_and_daily_nutrition(
+async def compute_meal_and_daily_nutrition(
     date: DateType = Query(..., description="対象日 (YYYY-MM-DD)"),
     meal_type: str = Query(
         ...,
@@ -213,23 +215,26 @@ def compute_meal_and_daily_nutrition(
     既存データの有無に関わらず、常に再計算を行います。
 
     フロー:
-      1. ComputeMealNutritionUseCase → OpenAI計算 & DB保存
-      2. ComputeDailyNutritionSummaryUseCase → OpenAI計算 & DB保存
+      1. ComputeMealNutritionUseCase → OpenAI計算 & DB保存（日次サマリへ差分反映）
+      2. ComputeDailyNutritionSummaryUseCase → 日次サマリを取得（無ければ全再計算）
       3. Meal + Daily をまとめて返す
+
+    OpenAI 呼び出しはイベントループ上で await し、DB 処理だけをスレッドで行う。
     """
 
     user_id: UserId = UserId(current_user.id)
 
     # ① 1食分の栄養サマリをOpenAIで再計算 & 保存
-    meal_summary = compute_meal_uc.execute(
+    meal_summary = await compute_meal_uc.execute_async(
         user_id=user_id,
         date_=date,
         meal_type_str=meal_type,
         meal_index=meal_index,
     )
 
-    # ② 1日分の栄養サマリをOpenAIで再計算 & 保存
-    daily_summary = compute_daily_uc.execute(
+    # ② 1日分の栄養サマリ（①で差分反映済みなので読むだけ）
+    daily_summary = await run_in_threadpool(
+        compute_daily_uc.get_or_compute,
         user_id=user_id,
         date_=date,
     )
@@ -5,16 +5,33 @@ from fastapi import APIRouter, Depends, Response, status
 # === API (schemas / dependencies) ==========================================
 from app.api.http.dependencies.auth import get_current_user_dto
 from app.api.http.schemas.errors import ErrorResponse
-from app.api.http.schemas.profile import ProfileRequest, ProfileResponse
+from app.api.http.schemas.profile import (
+    ProfileImageConfirmRequest,
+    ProfileImageUploadRequest,
+    ProfileImageUploadResponse,
+    ProfileRequest,
+    ProfileResponse,
+)
 
 # === Application (DTO / UseCase) ============================================
 from app.application.auth.dto.auth_user_dto import AuthUserDTO
-from app.application.profile.dto.profile_dto import UpsertProfileInputDTO
+from app.application.profile.dto.profile_dto import (
+    ConfirmProfileImageUploadInputDTO,
+    UpsertProfileInputDTO,
+)
+from app.application.profile.use_cases.confirm_profile_image_upload import (
+    ConfirmProfileImageUploadUseCase,
+)
+from app.application.profile.use_cases.create_profile_image_upload import (
+    CreateProfileImageUploadUseCase,
+)
 from app.application.profile.use_cases.get_my_profile import GetMyProfileUseCase
 from app.application.profile.use_cases.upsert_profile import UpsertProfileUseCase
 
 # === DI =====================================================================
 from app.di.container import (
+    get_confirm_profile_image_upload_use_case,
+    get_create_profile_image_upload_use_case,
     get_my_profile_use_case,
     get_upsert_profile_use_case,
 )
@@ -60,8 +77,9 @@ def upsert_my_profile(
     """
     現在ログイン中ユーザーのプロフィールを作成 / 更新する。
 
-    現時点では画像は受け取らず、テキスト情報のみ更新。
-    画像は後で別エンドポイントや multipart PATCH などで拡張する前提。
+    画像は受け取らず、テキスト情報のみ更新。
+    画像は POST /profile/me/image/upload-url → ストレージへ直接 PUT →
+    PUT /profile/me/image で差し替える。
     """
     input_dto = UpsertProfileInputDTO(
         user_id=current_user.id,
@@ -76,3 +94,54 @@ def upsert_my_profile(
 
     dto = use_case.execute(input_dto)
     return ProfileResponse.model_validate(dto.__dict__)
+
+
+@router.post(
+    "/me/image/upload-url",
+    response_model=ProfileImageUploadResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        400: {"model": ErrorResponse},
+        401: {"model": ErrorResponse},
+    },
+)
+def create_profile_image_upload(
+    request: ProfileImageUploadRequest,
+    current_user: AuthUserDTO = Depends(get_current_user_dto),
+    use_case: CreateProfileImageUploadUseCase = Depends(
+        get_create_profile_image_upload_use_case),
+) -> ProfileImageUploadResponse:
+    """
+    プロフィール画像のアップロード先（presigned PUT）を発行する。
+    画像の本体は API を経由せず、クライアントがストレージへ直接送る。
+    """
+    dto = use_case.execute(current_user.id, request.content_type)
+    return ProfileImageUploadResponse.model_validate(dto.__dict__)
+
+
+@router.put(
+    "/me/image",
+    response_model=ProfileResponse,
+    responses={
+        400: {"model": ErrorResponse},
+        401: {"model": ErrorResponse},
+        404: {"model": ErrorResponse},
+    },
+)
+def confirm_profile_image_upload(
+    request: ProfileImageConfirmRequest,
+    current_user: AuthUserDTO = Depends(get_current_user_dto),
+    use_case: ConfirmProfileImageUploadUseCase = Depends(
+        get_confirm_profile_image_upload_use_case),
+) -> ProfileResponse:
+    """
+    アップロード済みの画像（image_id）をプロフィール画像として確定する。
+    API はオブジェクトの存在 / サイズ / Content-Type だけを確認する。
+    """
+    dto = use_case.execute(
+        ConfirmProfileImageUploadInputDTO(
+            user_id=current_user.id,
+            image_id=request.image_id,
+        )
+    )
+    return ProfileResponse.model_validate(dto.__dict__)
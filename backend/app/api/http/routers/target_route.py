@@ -66,7 +66,7 @@ logger = logging.getLogger("target_route")
         409: {"model": ErrorResponse},  # 上限超えなどドメインエラーを想定
     },
 )
-def create_target(
+async def create_target(
     request: CreateTargetRequest,
     current_user: AuthUserDTO = Depends(get_current_user_dto),
     use_case: CreateTargetUseCase = Depends(get_create_target_use_case),
@@ -74,6 +74,7 @@ def create_target(
     """
     新しいターゲットを作成する。
     10栄養素はサーバ側で TargetGenerator により決定される。
+    LLM 呼び出しはイベントループ上で await する（スレッドプールを占有しない）。
     """
     input_dto = CreateTargetInputDTO(
         user_id=current_user.id,
@@ -83,7 +84,7 @@ def create_target(
         activity_level=request.activity_level,
     )
 
-    result = use_case.execute(input_dto)
+    result = await use_case.execute_async(input_dto)
 
     logger.info(
         "Target created: user_id=%s target_id=%s",
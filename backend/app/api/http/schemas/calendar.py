@@ -20,4 +20,17 @@ class MonthlyCalendarResponseSchema(BaseModel):
     """月次カレンダーレスポンス"""
     year: int
     month: int
-    days: List[CalendarDaySnapshotSchema]
\ No newline at end of file
+    days: List[CalendarDaySnapshotSchema]
+
+
+class CalendarRangeResponseSchema(BaseModel):
+    """
+    期間カレンダーレスポンス（列指向）
+
+    各配列の i 番目は start_date + i 日の値。日ごとのオブジェクトを並べるより小さい。
+    """
+    start_date: str
+    end_date: str
+    has_meal_logs: List[bool]
+    nutrition_achievement: List[Optional[int]]
+    has_daily_report: List[bool]
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import datetime
+from typing import Literal, Optional
+
+from pydantic import BaseModel, Field
+
+from app.api.http.schemas.daily_report import DailyNutritionReportResponse
+from app.api.http.schemas.meal import MealItemResponse
+from app.api.http.schemas.meal_recommendation import MealRecommendationResponse
+from app.api.http.schemas.nutrition import (
+    DailyNutritionSummaryResponse,
+    MealNutritionSummaryResponse,
+)
+from app.api.http.schemas.target import TargetNutrientSchema
+
+
+class DayTargetResponse(BaseModel):
+    """
+    その日に使うターゲット値。
+    """
+
+    target_id: str = Field(..., description="TargetDefinition ID (UUID 文字列)")
+    source: Literal["snapshot", "active"] = Field(
+        ...,
+        description='"snapshot": その日のスナップショット / "active": 現在 Active なターゲット',
+    )
+    nutrients: list[TargetNutrientSchema]
+
+
+class DayOverviewResponse(BaseModel):
+    """
+    GET /days/{date} のレスポンス（ホーム画面 1 日分）。
+
+    - 無いものは null / 空配列で返す。
+    - プレミアムでないユーザーは meal_summaries が空、daily_summary が null。
+    """
+
+    date: datetime.date = Field(..., description="対象日 (YYYY-MM-DD)")
+    is_premium: bool = Field(..., description="栄養サマリを返す対象かどうか")
+    items: list[MealItemResponse] = Field(..., description="その日の食事ログ")
+    meal_summaries: list[MealNutritionSummaryResponse] = Field(
+        ..., description="食事ごとの栄養サマリ"
+    )
+    daily_summary: Optional[DailyNutritionSummaryResponse] = None
+    target: Optional[DayTargetResponse] = None
+    report: Optional[DailyNutritionReportResponse] = None
+    recommendation: Optional[MealRecommendationResponse] = None
@@ -3,6 +3,7 @@ from __future__ import annotations
 import datetime
 from enum import Enum
 from typing import Optional
+from uuid import UUID
 
 from pydantic import BaseModel, Field
 
@@ -67,7 +68,7 @@ class MealItemResponse(MealItemRequest):
     FoodEntry 1件分のレスポンススキーマ。
     """
 
-    id: str = Field(..., description="FoodEntry ID (UUID 文字列)")
+    id: UUID = Field(..., description="FoodEntry ID (UUID)")
 
 
 class MealItemListResponse(BaseModel):
@@ -76,3 +77,54 @@ class MealItemListResponse(BaseModel):
     """
 
     items: list[MealItemResponse] = Field(..., description="FoodEntry の配列")
+
+
+# 一括操作 1 回あたりの上限（1 食分の品数としては十分な数）
+MEAL_ITEMS_BATCH_MAX = 50
+
+
+class MealItemBatchCreateRequest(BaseModel):
+    """
+    FoodEntry 一括作成リクエスト（POST /meal-items:batch）。
+    """
+
+    items: list[MealItemRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=MEAL_ITEMS_BATCH_MAX,
+        description="作成する FoodEntry の配列（全件成功か全件失敗）",
+    )
+
+
+class MealItemBatchUpdateItem(MealItemRequest):
+    """
+    一括更新の 1 件分（更新対象の ID + フル更新の内容）。
+    """
+
+    id: UUID = Field(..., description="FoodEntry ID (UUID)")
+
+
+class MealItemBatchUpdateRequest(BaseModel):
+    """
+    FoodEntry 一括更新リクエスト（PATCH /meal-items:batch）。
+    """
+
+    items: list[MealItemBatchUpdateItem] = Field(
+        ...,
+        min_length=1,
+        max_length=MEAL_ITEMS_BATCH_MAX,
+        description="更新する FoodEntry の配列（全件成功か全件失敗）",
+    )
+
+
+class MealItemBatchDeleteRequest(BaseModel):
+    """
+    FoodEntry 一括削除リクエスト（DELETE /meal-items:batch）。
+    """
+
+    ids: list[UUID] = Field(
+        ...,
+        min_length=1,
+        max_length=MEAL_ITEMS_BATCH_MAX,
+        description="削除する FoodEntry ID (UUID) の配列",
+    )
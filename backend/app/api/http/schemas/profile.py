@@ -31,6 +31,27 @@ class ProfileRequest(BaseModel):
     )
 
 
+class ProfileImageUploadRequest(BaseModel):
+    """
+    プロフィール画像アップロード先（presigned PUT）の発行リクエスト。
+    """
+
+    content_type: str = Field(
+        description="アップロードする画像の Content-Type（image/jpeg / image/png / image/webp）",
+    )
+
+
+class ProfileImageConfirmRequest(BaseModel):
+    """
+    presigned PUT でアップロードした画像をプロフィールに紐づけるリクエスト。
+    """
+
+    image_id: str = Field(
+        min_length=1,
+        description="アップロード先の発行時に返された image_id（オブジェクトキー）",
+    )
+
+
 # === Response schema ========================================================
 
 
@@ -52,6 +73,22 @@ class ProfileResponse(BaseModel):
         description="プロフィール画像のストレージ上の ID（オブジェクトキーなど）",
     )
 
+    image_url: str | None = Field(
+        default=None,
+        description=(
+            "プロフィール画像の読み取り URL（公開 URL または presigned GET）。"
+            "キーは画像ごとに変わるので長くキャッシュしてよい"
+        ),
+    )
+
+    image_thumbnail_urls: dict[int, str] = Field(
+        default_factory=dict,
+        description=(
+            "WebP サムネイルの読み取り URL（キーは辺の長さ px）。"
+            "画像の保存後に非同期で作るので、生成前は空"
+        ),
+    )
+
     meals_per_day: int | None = Field(
         default=None,
         ge=1,
@@ -61,3 +98,18 @@ class ProfileResponse(BaseModel):
 
     created_at: datetime
     updated_at: datetime
+
+
+class ProfileImageUploadResponse(BaseModel):
+    """
+    クライアントがストレージへ直接アップロードするための情報。
+
+    upload_url に method で、headers を付けて画像の本体を送り、
+    その後 PUT /profile/me/image に image_id を渡して確定する。
+    """
+
+    image_id: str
+    upload_url: str
+    method: str
+    headers: dict[str, str]
+    expires_at: datetime
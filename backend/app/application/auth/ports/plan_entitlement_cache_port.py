@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Protocol
+
+from app.domain.auth.value_objects import TrialInfo, UserId, UserPlan
+
+
+@dataclass(frozen=True)
+class PlanEntitlement:
+    """
+    プラン判定に必要な User の情報だけを切り出したもの。
+
+    - trial の終了判定は is_premium(now) で都度行うので、
+      キャッシュ済みでも trial 期限切れはそのまま反映される。
+    """
+
+    plan: UserPlan
+    trial_ends_at: datetime | None
+
+    def is_premium(self, now: datetime) -> bool:
+        # trial 中なら許可
+        if TrialInfo(trial_ends_at=self.trial_ends_at).is_trial_active(now):
+            return True
+        # trial 終了後は plan == PAID のみ許可
+        return self.plan == UserPlan.PAID
+
+
+class PlanEntitlementCachePort(Protocol):
+    """
+    ユーザーごとの PlanEntitlement をキャッシュするためのポート。
+
+    - PlanCheckerService がヒット時に Auth UoW を開かずに判定するために使う。
+    - プランを変更するユースケース（Billing Webhook / 退会）は invalidate() を呼ぶ。
+    """
+
+    def get(self, user_id: UserId) -> PlanEntitlement | None:
+        ...
+
+    def set(self, user_id: UserId, entitlement: PlanEntitlement) -> None:
+        ...
+
+    def invalidate(self, user_id: UserId) -> None:
+        ...
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Protocol
+
+from app.application.auth.dto.auth_user_dto import AuthUserDTO
+
+
+@dataclass(frozen=True)
+class PrincipalCacheStats:
+    """
+    キャッシュのヒット / ミス状況（メトリクス用）。
+    """
+
+    hits: int
+    misses: int
+    size: int
+
+
+class PrincipalCachePort(Protocol):
+    """
+    認証済みユーザー (AuthUserDTO) を user_id 単位でキャッシュするためのポート。
+
+    - GetCurrentUserUseCase がヒット時に DB 参照を省略するために使う。
+    - User を変更するユースケース（退会 / プラン変更 / ログアウト）は
+      invalidate() を呼んでキャッシュを破棄する。
+    """
+
+    def get(self, user_id: str) -> AuthUserDTO | None:
+        ...
+
+    def set(self, user: AuthUserDTO) -> None:
+        ...
+
+    def invalidate(self, user_id: str) -> None:
+        ...
+
+    def stats(self) -> PrincipalCacheStats:
+        ...
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from app.application.auth.ports.uow_port import AuthUnitOfWorkPort
 from app.application.auth.ports.clock_port import ClockPort
+from app.application.auth.ports.plan_entitlement_cache_port import PlanEntitlementCachePort
+from app.application.auth.ports.principal_cache_port import PrincipalCachePort
 
 from app.domain.auth.value_objects import UserId
 from app.domain.auth.errors import UserNotFoundError
@@ -12,9 +14,13 @@ class DeleteAccountUseCase:
         self,
         uow: AuthUnitOfWorkPort,
         clock: ClockPort,
+        principal_cache: PrincipalCachePort | None = None,
+        entitlement_cache: PlanEntitlementCachePort | None = None,
     ) -> None:
         self._uow = uow
         self._clock = clock
+        self._principal_cache = principal_cache
+        self._entitlement_cache = entitlement_cache
 
     def execute(self, user_id: str) -> None:
         with self._uow as uow:
@@ -25,3 +31,9 @@ class DeleteAccountUseCase:
             now = self._clock.now()
             user.mark_deleted(now)
             uow.user_repo.save(user)
+
+        # commit 後に破棄して、退会済みユーザーがキャッシュから復活しないようにする
+        if self._principal_cache is not None:
+            self._principal_cache.invalidate(user_id)
+        if self._entitlement_cache is not None:
+            self._entitlement_cache.invalidate(UserId(user_id))
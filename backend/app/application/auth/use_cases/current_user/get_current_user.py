@@ -1,19 +1,34 @@
 from __future__ import annotations
 
 from app.application.auth.dto.auth_user_dto import AuthUserDTO
+from app.application.auth.ports.principal_cache_port import PrincipalCachePort
 from app.application.auth.ports.uow_port import AuthUnitOfWorkPort
 from app.domain.auth.value_objects import UserId
 from app.domain.auth.errors import UserNotFoundError
 
 
 class GetCurrentUserUseCase:
-    def __init__(self, uow: AuthUnitOfWorkPort) -> None:
+    def __init__(
+        self,
+        uow: AuthUnitOfWorkPort,
+        principal_cache: PrincipalCachePort | None = None,
+    ) -> None:
         self._uow = uow
+        self._principal_cache = principal_cache
 
     def execute(self, user_id: str) -> AuthUserDTO:
+        # キャッシュにヒットすれば DB 参照を省略する
+        if self._principal_cache is not None:
+            cached = self._principal_cache.get(user_id)
+            if cached is not None:
+                return cached
+
         with self._uow as uow:
             user = uow.user_repo.get_by_id(UserId(user_id))
             if user is None or not user.is_active:
                 raise UserNotFoundError("User not found")
 
-        return AuthUserDTO.from_entity(user)
+        dto = AuthUserDTO.from_entity(user)
+        if self._principal_cache is not None:
+            self._principal_cache.set(dto)
+        return dto
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+from app.application.auth.ports.principal_cache_port import PrincipalCachePort
+
 
 class LogoutUserUseCase:
     """
-    現時点ではサーバ側でトークン管理をしていないため、No-Op。
+    現時点ではサーバ側でトークン管理をしていないため、
+    Principal キャッシュの破棄のみを行う。
     将来、リフレッシュトークンのブラックリストやセッションテーブルを
     導入する場合は、ここで無効化処理を行う。
     """
 
+    def __init__(self, principal_cache: PrincipalCachePort | None = None) -> None:
+        self._principal_cache = principal_cache
+
     def execute(self, user_id: str | None = None) -> None:
-        # 何もしない
+        if user_id is not None and self._principal_cache is not None:
+            self._principal_cache.invalidate(user_id)
         return None
@@ -8,6 +8,8 @@ from app.application.billing.ports.uow_port import BillingUnitOfWorkPort
 from app.application.auth.ports.uow_port import AuthUnitOfWorkPort
 from app.application.auth.ports.user_repository_port import UserRepositoryPort
 from app.application.auth.ports.clock_port import ClockPort
+from app.application.auth.ports.plan_entitlement_cache_port import PlanEntitlementCachePort
+from app.application.auth.ports.principal_cache_port import PrincipalCachePort
 from app.domain.auth.value_objects import UserId, UserPlan
 from app.domain.billing.entities import BillingSubscriptionStatus
 from app.domain.billing.entities import BillingAccount
@@ -31,11 +33,15 @@ class HandleStripeWebhookUseCase:
         auth_uow: AuthUnitOfWorkPort,
         stripe_client: StripeClientPort,
         clock: ClockPort,
+        principal_cache: PrincipalCachePort | None = None,
+        entitlement_cache: PlanEntitlementCachePort | None = None,
     ) -> None:
         self._billing_uow = billing_uow
         self._auth_uow = auth_uow
         self._stripe = stripe_client
         self._clock = clock
+        self._principal_cache = principal_cache
+        self._entitlement_cache = entitlement_cache
 
     def execute(self, input: HandleStripeWebhookInput) -> None:
         event = self._stripe.construct_event(
@@ -130,6 +136,9 @@ class HandleStripeWebhookUseCase:
             user.plan = new_plan
             user_repo.save(user)  # save がある前提
 
+        # commit 後にキャッシュを破棄して、新しいプランを即時反映させる
+        self._invalidate_user_caches(user_id)
+
     def _handle_subscription_updated(self, sub_obj: dict) -> None:
         """
         customer.subscription.updated / deleted 用の処理。
@@ -165,6 +174,12 @@ class HandleStripeWebhookUseCase:
             # このフェーズではスケルトンのみ提示。
             pass
 
+    def _invalidate_user_caches(self, user_id: UserId) -> None:
+        if self._principal_cache is not None:
+            self._principal_cache.invalidate(user_id.value)
+        if self._entitlement_cache is not None:
+            self._entitlement_cache.invalidate(user_id)
+
     def _map_subscription_status(self, stripe_status: str) -> BillingSubscriptionStatus:
         """
         stripe.Subscription.status を BillingSubscriptionStatus にマッピングする。
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import date
 from typing import List
 from app.domain.calendar.entities import CalendarDaySnapshot
 
@@ -17,3 +18,19 @@ class MonthlyCalendarResultDto:
     year: int
     month: int
     days: List[CalendarDaySnapshot]
+
+
+@dataclass(frozen=True)
+class CalendarRangeDto:
+    """期間カレンダー取得リクエスト（start_date / end_date は両端を含む）"""
+    user_id: str
+    start_date: date
+    end_date: date
+
+
+@dataclass(frozen=True)
+class CalendarRangeResultDto:
+    """期間カレンダー取得結果（days は start_date から 1 日ずつ並ぶ）"""
+    start_date: date
+    end_date: date
+    days: List[CalendarDaySnapshot]
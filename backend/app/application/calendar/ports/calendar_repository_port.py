@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import List
 from app.domain.calendar.entities import CalendarDaySnapshot
-from app.application.calendar.dto.calendar_dto import MonthlyCalendarDto
+from app.application.calendar.dto.calendar_dto import CalendarRangeDto, MonthlyCalendarDto
 
 
 class CalendarRepositoryPort(ABC):
@@ -14,3 +14,31 @@ class CalendarRepositoryPort(ABC):
     ) -> List[CalendarDaySnapshot]:
         """指定月の日次スナップショット一覧を取得"""
         pass
+
+    @abstractmethod
+    def get_range_summary(
+        self,
+        request: CalendarRangeDto
+    ) -> List[CalendarDaySnapshot]:
+        """指定期間（両端を含む）の日次スナップショット一覧を 1 クエリで取得"""
+        pass
+
+
+class AsyncCalendarRepositoryPort(ABC):
+    """カレンダーリポジトリのポート（async 版）"""
+
+    @abstractmethod
+    async def get_monthly_summary(
+        self,
+        request: MonthlyCalendarDto
+    ) -> List[CalendarDaySnapshot]:
+        """指定月の日次スナップショット一覧を取得"""
+        pass
+
+    @abstractmethod
+    async def get_range_summary(
+        self,
+        request: CalendarRangeDto
+    ) -> List[CalendarDaySnapshot]:
+        """指定期間（両端を含む）の日次スナップショット一覧を 1 クエリで取得"""
+        pass
@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
-from app.application.calendar.ports.calendar_repository_port import CalendarRepositoryPort
+from app.application.calendar.ports.calendar_repository_port import (
+    AsyncCalendarRepositoryPort,
+    CalendarRepositoryPort,
+)
 
 
 class CalendarUnitOfWorkPort(ABC):
@@ -13,3 +16,16 @@ class CalendarUnitOfWorkPort(ABC):
     @abstractmethod
     def __exit__(self, exc_type, exc_val, exc_tb):
         pass
+
+
+class AsyncCalendarUnitOfWorkPort(ABC):
+    """カレンダー用 Unit of Work ポート（async 版）"""
+    calendar_repo: AsyncCalendarRepositoryPort
+
+    @abstractmethod
+    async def __aenter__(self):
+        pass
+
+    @abstractmethod
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
@@ -1,21 +1,37 @@
-from app.application.calendar.dto.calendar_dto import MonthlyCalendarDto, MonthlyCalendarResultDto
-from app.application.calendar.ports.calendar_unit_of_work_port import CalendarUnitOfWorkPort
+import asyncio
+
+from app.application.calendar.dto.calendar_dto import (
+    CalendarRangeDto,
+    CalendarRangeResultDto,
+    MonthlyCalendarDto,
+    MonthlyCalendarResultDto,
+)
+from app.application.calendar.ports.calendar_unit_of_work_port import (
+    AsyncCalendarUnitOfWorkPort,
+    CalendarUnitOfWorkPort,
+)
 from app.domain.calendar.errors import InvalidDateRangeError
 
 
+# 期間取得で 1 回に返す最大日数（うるう年の 1 年分）
+MAX_RANGE_DAYS = 366
+
+
 class GetMonthlyCalendarUseCase:
     """月次カレンダー取得ユースケース"""
 
-    def __init__(self, uow: CalendarUnitOfWorkPort):
+    def __init__(
+        self,
+        uow: CalendarUnitOfWorkPort,
+        async_uow: AsyncCalendarUnitOfWorkPort | None = None,
+    ):
         self._uow = uow
+        # async ルート用。None なら同期版をスレッドで呼ぶ
+        self._async_uow = async_uow
 
     def execute(self, request: MonthlyCalendarDto) -> MonthlyCalendarResultDto:
         """月次カレンダーを取得"""
-        # バリデーション
-        if not (1 <= request.month <= 12):
-            raise InvalidDateRangeError(f"Invalid month: {request.month}")
-        if not (2000 <= request.year <= 3000):
-            raise InvalidDateRangeError(f"Invalid year: {request.year}")
+        self._validate_month(request)
 
         # UoW を使ってリポジトリにアクセス
         with self._uow:
@@ -26,3 +42,68 @@ class GetMonthlyCalendarUseCase:
                 month=request.month,
                 days=days
             )
+
+    async def execute_async(self, request: MonthlyCalendarDto) -> MonthlyCalendarResultDto:
+        """execute() の async 版（async UoW が無ければスレッドで同期版を呼ぶ）"""
+        if self._async_uow is None:
+            return await asyncio.to_thread(self.execute, request)
+
+        self._validate_month(request)
+
+        async with self._async_uow:
+            days = await self._async_uow.calendar_repo.get_monthly_summary(request)
+
+            return MonthlyCalendarResultDto(
+                year=request.year,
+                month=request.month,
+                days=days
+            )
+
+    def execute_range(self, request: CalendarRangeDto) -> CalendarRangeResultDto:
+        """期間カレンダーを取得（年表示 / 連続記録表示用）"""
+        self._validate_range(request)
+
+        with self._uow:
+            days = self._uow.calendar_repo.get_range_summary(request)
+
+            return CalendarRangeResultDto(
+                start_date=request.start_date,
+                end_date=request.end_date,
+                days=days
+            )
+
+    async def execute_range_async(self, request: CalendarRangeDto) -> CalendarRangeResultDto:
+        """execute_range() の async 版（async UoW が無ければスレッドで同期版を呼ぶ）"""
+        if self._async_uow is None:
+            return await asyncio.to_thread(self.execute_range, request)
+
+        self._validate_range(request)
+
+        async with self._async_uow:
+            days = await self._async_uow.calendar_repo.get_range_summary(request)
+
+            return CalendarRangeResultDto(
+                start_date=request.start_date,
+                end_date=request.end_date,
+                days=days
+            )
+
+    @staticmethod
+    def _validate_month(request: MonthlyCalendarDto) -> None:
+        if not (1 <= request.month <= 12):
+            raise InvalidDateRangeError(f"Invalid month: {request.month}")
+        if not (2000 <= request.year <= 3000):
+            raise InvalidDateRangeError(f"Invalid year: {request.year}")
+
+    @staticmethod
+    def _validate_range(request: CalendarRangeDto) -> None:
+        if request.start_date > request.end_date:
+            raise InvalidDateRangeError(
+                f"Invalid range: {request.start_date} > {request.end_date}")
+        if not (2000 <= request.start_date.year and request.end_date.year <= 3000):
+            raise InvalidDateRangeError(
+                f"Invalid range: {request.start_date}..{request.end_date}")
+        span = (request.end_date - request.start_date).days + 1
+        if span > MAX_RANGE_DAYS:
+            raise InvalidDateRangeError(
+                f"Range too long: {span} days (max {MAX_RANGE_DAYS})")
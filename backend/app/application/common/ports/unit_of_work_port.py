@@ -23,3 +23,25 @@ class UnitOfWorkPort(Protocol):
 
     def rollback(self) -> None:
         ...
+
+
+@runtime_checkable
+class AsyncUnitOfWorkPort(Protocol):
+    """
+    UnitOfWorkPort の async 版。
+
+    - async with ブロックのスコープでトランザクションを管理する
+    - async ルートから、スレッドプールを使わずに DB を読む用途
+    """
+
+    async def __aenter__(self) -> Self:
+        ...
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        ...
+
+    async def commit(self) -> None:
+        ...
+
+    async def rollback(self) -> None:
+        ...
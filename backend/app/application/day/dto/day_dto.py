@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Literal
+
+from app.application.meal.dto.food_entry_dto import FoodEntryDTO
+from app.domain.nutrition.daily_nutrition import DailyNutritionSummary
+from app.domain.nutrition.daily_report import DailyNutritionReport
+from app.domain.nutrition.meal_nutrition import MealNutritionSummary
+from app.domain.nutrition.meal_recommendation import MealRecommendation
+from app.domain.target.entities import TargetNutrient
+
+
+@dataclass(frozen=True)
+class DayTargetDTO:
+    """
+    その日に使うターゲット値。
+
+    - source: "snapshot"（その日に確定したスナップショット）
+              / "active"（スナップショットが無いので現在 Active なターゲット）
+    """
+
+    target_id: str
+    source: Literal["snapshot", "active"]
+    nutrients: tuple[TargetNutrient, ...]
+
+
+@dataclass(frozen=True)
+class DayOverviewDTO:
+    """
+    1 日分のホーム画面表示用データ。
+
+    - is_premium が False のときは栄養サマリ（meal_summaries / daily_summary）を読まない
+      （meal_summaries は空、daily_summary は None）。
+    - 無いものは None / 空で返す（404 にはしない）。
+    """
+
+    date: date
+    is_premium: bool
+    entries: list[FoodEntryDTO] = field(default_factory=list)
+    meal_summaries: list[MealNutritionSummary] = field(default_factory=list)
+    daily_summary: DailyNutritionSummary | None = None
+    report: DailyNutritionReport | None = None
+    recommendation: MealRecommendation | None = None
+    target: DayTargetDTO | None = None
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from typing import Protocol
+
+from app.application.common.ports.unit_of_work_port import UnitOfWorkPort
+from app.application.meal.ports.food_entry_repository_port import (
+    FoodEntryRepositoryPort,
+)
+from app.application.nutrition.ports.daily_nutrition_repository_port import (
+    DailyNutritionSummaryRepositoryPort,
+)
+from app.application.nutrition.ports.daily_report_repository_port import (
+    DailyNutritionReportRepositoryPort,
+)
+from app.application.nutrition.ports.meal_nutrition_repository_port import (
+    MealNutritionSummaryRepositoryPort,
+)
+from app.application.nutrition.ports.recommendation_repository_port import (
+    MealRecommendationRepositoryPort,
+)
+from app.application.target.ports.target_repository_port import TargetRepositoryPort
+from app.application.target.ports.target_snapshot_repository_port import (
+    TargetSnapshotRepositoryPort,
+)
+
+
+class DayReadUnitOfWorkPort(UnitOfWorkPort, Protocol):
+    """
+    1 日分の画面表示に必要なものを 1 つのセッションで読む UoW。
+
+    - meal / nutrition / target のリポジトリを同じトランザクションで使う。
+    - GetDayOverviewUseCase が使う（参照専用）。
+    """
+
+    food_entry_repo: FoodEntryRepositoryPort
+    meal_nutrition_repo: MealNutritionSummaryRepositoryPort
+    daily_nutrition_repo: DailyNutritionSummaryRepositoryPort
+    daily_report_repo: DailyNutritionReportRepositoryPort
+    meal_recommendation_repo: MealRecommendationRepositoryPort
+    target_repo: TargetRepositoryPort
+    target_snapshot_repo: TargetSnapshotRepositoryPort
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from datetime import date as DateType
+
+from app.application.auth.ports.plan_checker_port import PlanCheckerPort
+from app.application.day.dto.day_dto import DayOverviewDTO, DayTargetDTO
+from app.application.day.ports.uow_port import DayReadUnitOfWorkPort
+from app.application.meal.use_cases._helpers import food_entry_to_dto
+from app.application.nutrition.ports.daily_recompute_scheduler_port import (
+    DailyNutritionRecomputeSchedulerPort,
+)
+from app.domain.auth.errors import PremiumFeatureRequiredError
+from app.domain.auth.value_objects import UserId
+
+
+class GetDayOverviewUseCase:
+    """
+    1 日分のホーム画面表示用データをまとめて取得する UseCase。
+
+    食事ログ / 食事ごとの栄養サマリ / 日次サマリ / ターゲット / 日次レポート /
+    食事提案を、1 回のプラン判定と 1 つの UoW（セッション）で読む。
+    OpenAI計算は行わず、DBに保存されているデータのみを返す。
+
+    フロー:
+      1. プラン判定（プレミアムでなければ栄養サマリは読まない）
+      2. 遅延中の栄養サマリの計算があれば先に済ませる
+      3. 各リポジトリから (user_id, date) 単位でまとめて読む
+         （ターゲットはその日のスナップショット、無ければ Active なもの）
+    """
+
+    def __init__(
+        self,
+        uow: DayReadUnitOfWorkPort,
+        plan_checker: PlanCheckerPort,
+        recompute_scheduler: DailyNutritionRecomputeSchedulerPort | None = None,
+    ) -> None:
+        self._uow = uow
+        self._plan_checker = plan_checker
+        # 食事ログ編集後の栄養サマリの計算を遅らせている場合に渡される
+        self._recompute_scheduler = recompute_scheduler
+
+    def execute(self, user_id: UserId, date_: DateType) -> DayOverviewDTO:
+        is_premium = self._is_premium(user_id)
+
+        if is_premium and self._recompute_scheduler is not None:
+            self._recompute_scheduler.flush(user_id, date_)
+
+        with self._uow as uow:
+            entries = uow.food_entry_repo.list_by_user_and_date(user_id, date_)
+
+            meal_summaries = []
+            daily_summary = None
+            if is_premium:
+                meal_summaries = list(
+                    uow.meal_nutrition_repo.list_by_user_and_date(
+                        user_id=user_id,
+                        target_date=date_,
+                    )
+                )
+                daily_summary = uow.daily_nutrition_repo.get_by_user_and_date(
+                    user_id=user_id,
+                    target_date=date_,
+                )
+
+            report = uow.daily_report_repo.get_by_user_and_date(
+                user_id=user_id,
+                target_date=date_,
+            )
+            recommendation = uow.meal_recommendation_repo.get_by_user_and_date(
+                user_id=user_id,
+                generated_for_date=date_,
+            )
+            target = self._load_target(uow, user_id, date_)
+
+        return DayOverviewDTO(
+            date=date_,
+            is_premium=is_premium,
+            entries=[food_entry_to_dto(e) for e in entries],
+            meal_summaries=meal_summaries,
+            daily_summary=daily_summary,
+            report=report,
+            recommendation=recommendation,
+            target=target,
+        )
+
+    # --- 内部 -----------------------------------------------------------
+
+    def _is_premium(self, user_id: UserId) -> bool:
+        try:
+            self._plan_checker.ensure_premium_feature(user_id)
+        except PremiumFeatureRequiredError:
+            return False
+        return True
+
+    @staticmethod
+    def _load_target(
+        uow: DayReadUnitOfWorkPort,
+        user_id: UserId,
+        date_: DateType,
+    ) -> DayTargetDTO | None:
+        # スナップショットは過去日にしか無いので、今日以降は Active なターゲットを使う
+        snapshot = uow.target_snapshot_repo.get_by_user_and_date(user_id, date_)
+        if snapshot is not None:
+            return DayTargetDTO(
+                target_id=snapshot.target_id.value,
+                source="snapshot",
+                nutrients=tuple(snapshot.nutrients),
+            )
+
+        active = uow.target_repo.get_active(user_id)
+        if active is None:
+            return None
+        return DayTargetDTO(
+            target_id=active.id.value,
+            source="active",
+            nutrients=tuple(active.nutrients),
+        )
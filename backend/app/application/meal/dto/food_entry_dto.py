@@ -80,13 +80,16 @@ class FoodEntryDTO:
 @dataclass
 class UpdateFoodEntryResultDTO:
     """
-    FoodEntry 更新結果 + 変更前の日付。
+    FoodEntry 更新結果 + 変更前の日付 / 食事スロット。
 
     - entry: 更新後の FoodEntryDTO
     - old_date: 更新前の date
+    - old_meal_type / old_meal_index: 更新前の食事スロット
     """
     entry: FoodEntryDTO
     old_date: date
+    old_meal_type: str
+    old_meal_index: int | None
 
 
 @dataclass
@@ -95,5 +98,8 @@ class DeleteFoodEntryResultDTO:
     FoodEntry 削除結果。
 
     - date: 削除されたエントリが属していた日付
+    - meal_type / meal_index: 削除されたエントリが属していた食事スロット
     """
     date: date
+    meal_type: str
+    meal_index: int | None
@@ -31,6 +31,24 @@ class FoodEntryRepositoryPort(Protocol):
         """FoodEntry を削除する（ソフト/ハードは実装側に委ねる）。"""
         ...
 
+    def add_many(self, entries: Sequence[FoodEntry]) -> None:
+        """
+        複数の FoodEntry をまとめて永続化する（1 回の INSERT で入れる想定）。
+        """
+        ...
+
+    def update_many(self, entries: Sequence[FoodEntry]) -> None:
+        """
+        複数の既存 FoodEntry をまとめて更新する。
+
+        - 1 件でも見つからなければ FoodEntryNotFoundError。
+        """
+        ...
+
+    def delete_many(self, entries: Sequence[FoodEntry]) -> None:
+        """複数の FoodEntry をまとめて削除する（削除済みのものは無視する）。"""
+        ...
+
     def get_by_id(self, user_id: UserId, entry_id: FoodEntryId) -> FoodEntry | None:
         """
         指定したユーザーの FoodEntry を ID で取得する。
@@ -41,6 +59,18 @@ class FoodEntryRepositoryPort(Protocol):
 
     # --- 検索系 ------------------------------------------------------
 
+    def list_by_ids(
+        self,
+        user_id: UserId,
+        entry_ids: Sequence[FoodEntryId],
+    ) -> Sequence[FoodEntry]:
+        """
+        指定したユーザーの FoodEntry を ID でまとめて取得する（1 クエリ）。
+
+        - 見つからない（他ユーザー / 削除済み）ID は結果に含まれない。
+        """
+        ...
+
     def list_by_user_and_date(self, user_id: UserId, target_date: date) -> Sequence[FoodEntry]:
         """
         指定したユーザーの、ある1日分の FoodEntry 一覧を取得する。
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Sequence
+
 from app.application.meal.dto.food_entry_dto import (
     CreateFoodEntryInputDTO,
     FoodEntryDTO,
@@ -21,13 +23,40 @@ class CreateFoodEntryUseCase:
         self._meal_uow = meal_uow
 
     def execute(self, user_id: UserId, input_dto: CreateFoodEntryInputDTO) -> FoodEntryDTO:
+        entry = self._build_entry(user_id, input_dto)
+
+        with self._meal_uow as uow:
+            uow.food_entry_repo.add(entry)
+
+        return food_entry_to_dto(entry)
+
+    def execute_many(
+        self,
+        user_id: UserId,
+        input_dtos: Sequence[CreateFoodEntryInputDTO],
+    ) -> list[FoodEntryDTO]:
+        """
+        複数の FoodEntry をまとめて作成する（1 トランザクション）。
+
+        - 先に全件を検証し、1 件でも不正なら何も保存しない。
+        """
+        entries = [self._build_entry(user_id, dto) for dto in input_dtos]
+
+        with self._meal_uow as uow:
+            uow.food_entry_repo.add_many(entries)
+
+        return [food_entry_to_dto(entry) for entry in entries]
+
+    def _build_entry(
+        self, user_id: UserId, input_dto: CreateFoodEntryInputDTO
+    ) -> FoodEntry:
         try:
             meal_type = MealType(input_dto.meal_type)
         except ValueError:
             raise InvalidMealTypeError(
                 f"Invalid meal_type: {input_dto.meal_type}")
 
-        entry = FoodEntry(
+        return FoodEntry(
             id=FoodEntryId.new(),
             user_id=user_id,
             date=input_dto.date,
@@ -42,8 +71,3 @@ class CreateFoodEntryUseCase:
             updated_at=None,
             deleted_at=None,
         )
-
-        with self._meal_uow as uow:
-            uow.food_entry_repo.add(entry)
-
-        return food_entry_to_dto(entry)
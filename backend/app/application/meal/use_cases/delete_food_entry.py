@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from typing import Sequence
 from uuid import UUID
 
 from app.domain.auth.value_objects import UserId
@@ -30,11 +31,47 @@ class DeleteFoodEntryUseCase:
                     f"FoodEntry not found for id={entry_id_str} user_id={user_id.value}"
                 )
 
-            # 削除対象の date を保持
-            deleted_date = existing.date
-
             uow.food_entry_repo.delete(existing)
             # 2回目以降の呼び出しは Repository 側で no-op として冪等性を担保
 
-        # 削除された日の情報だけ返す
-        return DeleteFoodEntryResultDTO(date=deleted_date)
+        # 削除された日 / 食事スロットの情報だけ返す
+        return DeleteFoodEntryResultDTO(
+            date=existing.date,
+            meal_type=existing.meal_type.value,
+            meal_index=existing.meal_index,
+        )
+
+    def execute_many(
+        self,
+        user_id: UserId,
+        entry_id_strs: Sequence[str],
+    ) -> list[DeleteFoodEntryResultDTO]:
+        """
+        複数の FoodEntry をまとめて削除する（1 トランザクション）。
+
+        - 1 件でも見つからなければ何も削除しない（単体の削除と同じく NotFound）。
+        - 同じ ID が重なっていても 1 回だけ削除する。
+        """
+        entry_ids = list(
+            {eid.value: eid for eid in (FoodEntryId(UUID(s)) for s in entry_id_strs)}.values()
+        )
+
+        with self._meal_uow as uow:
+            existing = list(uow.food_entry_repo.list_by_ids(user_id, entry_ids))
+            found = {e.id.value for e in existing}
+            missing = [str(eid.value) for eid in entry_ids if eid.value not in found]
+            if missing:
+                raise FoodEntryNotFoundError(
+                    f"FoodEntry not found for id={missing[0]} user_id={user_id.value}"
+                )
+
+            uow.food_entry_repo.delete_many(existing)
+
+        return [
+            DeleteFoodEntryResultDTO(
+                date=e.date,
+                meal_type=e.meal_type.value,
+                meal_index=e.meal_index,
+            )
+            for e in existing
+        ]
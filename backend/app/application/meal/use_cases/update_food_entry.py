@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from typing import Sequence
 from uuid import UUID
 
 from app.application.meal.dto.food_entry_dto import (
@@ -9,7 +10,11 @@ from app.application.meal.dto.food_entry_dto import (
 from app.application.meal.use_cases._helpers import food_entry_to_dto
 from app.domain.auth.value_objects import UserId
 from app.domain.meal.entities import FoodEntry
-from app.domain.meal.errors import FoodEntryNotFoundError, InvalidMealTypeError
+from app.domain.meal.errors import (
+    FoodEntryNotFoundError,
+    InvalidFoodEntryBatchError,
+    InvalidMealTypeError,
+)
 from app.domain.meal.value_objects import FoodEntryId, MealType
 from app.application.meal.ports.uow_port import MealUnitOfWorkPort
 
@@ -34,37 +39,80 @@ class UpdateFoodEntryUseCase:
                     f"FoodEntry not found for id={dto.entry_id} user_id={user_id.value}"
                 )
 
-            # 変更前の日付を保持
-            old_date = existing.date
-
-            try:
-                meal_type = MealType(dto.meal_type)
-            except ValueError:
-                raise InvalidMealTypeError(f"Invalid meal_type: {dto.meal_type}")
-
-            # created_at / deleted_at は既存を維持、updated_at は None にして Repo/DB に任せる
-            updated_entry = FoodEntry(
-                id=existing.id,
-                user_id=existing.user_id,
-                date=dto.date,
-                meal_type=meal_type,
-                meal_index=dto.meal_index,
-                name=dto.name,
-                amount_value=dto.amount_value,
-                amount_unit=dto.amount_unit,
-                serving_count=dto.serving_count,
-                note=dto.note,
-                created_at=existing.created_at,
-                updated_at=None,
-                deleted_at=existing.deleted_at,
-            )
-
+            updated_entry = self._build_updated(existing, dto)
             uow.food_entry_repo.update(updated_entry)
 
-        updated_dto = food_entry_to_dto(updated_entry)
-
-        # 更新後 DTO + 変更前の日付をまとめて返す
+        # 更新後 DTO + 変更前の日付 / 食事スロットをまとめて返す
         return UpdateFoodEntryResultDTO(
-            entry=updated_dto,
-            old_date=old_date,
+            entry=food_entry_to_dto(updated_entry),
+            old_date=existing.date,
+            old_meal_type=existing.meal_type.value,
+            old_meal_index=existing.meal_index,
+        )
+
+    def execute_many(
+        self,
+        user_id: UserId,
+        dtos: Sequence[UpdateFoodEntryInputDTO],
+    ) -> list[UpdateFoodEntryResultDTO]:
+        """
+        複数の FoodEntry をまとめて更新する（1 トランザクション）。
+
+        - 対象は 1 クエリでまとめて読む。1 件でも見つからなければ何も更新しない。
+        - 同じ ID を 2 回指定した場合は InvalidFoodEntryBatchError。
+        """
+        entry_ids = [FoodEntryId(UUID(dto.entry_id)) for dto in dtos]
+        if len({eid.value for eid in entry_ids}) != len(entry_ids):
+            raise InvalidFoodEntryBatchError(
+                "FoodEntry ids must be unique within a batch update")
+
+        with self._meal_uow as uow:
+            existing_by_id = {
+                e.id.value: e
+                for e in uow.food_entry_repo.list_by_ids(user_id, entry_ids)
+            }
+            pairs = []
+            for entry_id, dto in zip(entry_ids, dtos):
+                existing = existing_by_id.get(entry_id.value)
+                if existing is None:
+                    raise FoodEntryNotFoundError(
+                        f"FoodEntry not found for id={dto.entry_id} user_id={user_id.value}"
+                    )
+                pairs.append((existing, self._build_updated(existing, dto)))
+
+            uow.food_entry_repo.update_many([updated for _, updated in pairs])
+
+        return [
+            UpdateFoodEntryResultDTO(
+                entry=food_entry_to_dto(updated),
+                old_date=existing.date,
+                old_meal_type=existing.meal_type.value,
+                old_meal_index=existing.meal_index,
+            )
+            for existing, updated in pairs
+        ]
+
+    def _build_updated(
+        self, existing: FoodEntry, dto: UpdateFoodEntryInputDTO
+    ) -> FoodEntry:
+        try:
+            meal_type = MealType(dto.meal_type)
+        except ValueError:
+            raise InvalidMealTypeError(f"Invalid meal_type: {dto.meal_type}")
+
+        # created_at / deleted_at は既存を維持、updated_at は None にして Repo/DB に任せる
+        return FoodEntry(
+            id=existing.id,
+            user_id=existing.user_id,
+            date=dto.date,
+            meal_type=meal_type,
+            meal_index=dto.meal_index,
+            name=dto.name,
+            amount_value=dto.amount_value,
+            amount_unit=dto.amount_unit,
+            serving_count=dto.serving_count,
+            note=dto.note,
+            created_at=existing.created_at,
+            updated_at=None,
+            deleted_at=existing.deleted_at,
         )
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import Protocol, Sequence
+from typing import Mapping, Protocol, Sequence
 
 from app.domain.auth.value_objects import UserId
 from app.domain.nutrition.daily_nutrition import DailyNutritionSummary
+from app.domain.target.value_objects import NutrientCode
 
 
 class DailyNutritionSummaryRepositoryPort(Protocol):
@@ -44,3 +45,50 @@ class DailyNutritionSummaryRepositoryPort(Protocol):
         - なければ insert
         """
         ...
+
+    def lock_for_update(
+        self,
+        *,
+        user_id: UserId,
+        target_date: date,
+    ) -> bool:
+        """
+        その日のサマリのヘッダ行を行ロックする（無ければ栄養素なしの行を作ってからロック）。
+
+        - 同じ日の日次サマリを変える処理を直列化するため、食事サマリを読む前に呼ぶ。
+          行が無い日でもロック対象ができるので、初回の計算同士も直列になる。
+        - 既にサマリがあれば True、いま空の行を作った場合は False
+          （False なら呼び出し側で全再計算して中身を埋めること）。
+        """
+        ...
+
+    def apply_nutrient_deltas(
+        self,
+        *,
+        user_id: UserId,
+        target_date: date,
+        deltas: Mapping[NutrientCode, float],
+    ) -> bool:
+        """
+        既存サマリの各栄養素に差分 (新 - 旧) を加算する（増分メンテナンス用）。
+
+        - サマリが無い / deltas のコードに対応する行が揃っていない場合は False。
+          このとき一部だけ加算されている可能性があるので、呼び出し側は
+          同じトランザクション内で全再計算 (save) して上書きすること。
+        """
+        ...
+
+
+class AsyncDailyNutritionSummaryRepositoryPort(Protocol):
+    """
+    DailyNutritionSummaryRepositoryPort の async 版（参照系のみ）。
+    async ルートからスレッドプールを使わずに読むためのもの。
+    """
+
+    async def get_by_user_and_date(
+        self,
+        *,
+        user_id: UserId,
+        target_date: date,
+    ) -> DailyNutritionSummary | None:
+        ...
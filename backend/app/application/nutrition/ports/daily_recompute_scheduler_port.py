@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from datetime import date as DateType
+from typing import Iterable, Protocol
+
+from app.domain.auth.value_objects import UserId
+
+# 食事スロット (meal_type, meal_index)
+MealSlot = tuple[str, int | None]
+
+
+class DailyNutritionRecomputeSchedulerPort(Protocol):
+    """
+    食事ログ編集後の栄養サマリの計算し直しを遅らせてまとめるポート。
+
+    - schedule() はすぐ戻る。同じ (user_id, date) への依頼は、
+      静かな時間（最後の依頼からの待ち）が過ぎたところで 1 回にまとめて実行される。
+      その間に依頼された食事スロットを計算し直し、差分が日次サマリに反映される。
+    - 読む側は、読む前に flush() を呼べば未実行の計算を済ませた状態で読める。
+    """
+
+    def schedule(
+        self,
+        user_id: UserId,
+        date_: DateType,
+        slots: Iterable[MealSlot],
+    ) -> None:
+        ...
+
+    def pending(self, user_id: UserId, date_: DateType) -> bool:
+        """まだ終わっていない（待ち中 / 実行中の）計算があるか。"""
+        ...
+
+    def flush(self, user_id: UserId, date_: DateType) -> None:
+        """
+        待ち中の計算があれば呼び出し元で実行し、実行中なら終わるまで待つ。
+        """
+        ...
@@ -23,3 +23,12 @@ class DailyNutritionReportGeneratorPort(Protocol):
         1 日分のレポート（summary / good / improvement / tomorrow_focus）を生成する。
         """
         raise NotImplementedError
+
+
+class AsyncDailyNutritionReportGeneratorPort(Protocol):
+    """
+    DailyNutritionReportGeneratorPort の async 版（async ルートから await される）。
+    """
+
+    async def generate(self, input: DailyReportLLMInput) -> DailyReportLLMOutput:
+        raise NotImplementedError
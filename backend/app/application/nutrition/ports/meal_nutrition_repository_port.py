@@ -40,6 +40,19 @@ class MealNutritionSummaryRepositoryPort(Protocol):
         """
         ...
 
+    def list_user_dates_in_range(
+        self,
+        *,
+        start_date: date,
+        end_date: date,
+    ) -> Sequence[tuple[UserId, date]]:
+        """
+        指定期間に MealNutritionSummary を持つ (user_id, date) の一覧を返す。
+
+        - 日次サマリの一括再計算（修復 / 検証）で対象を列挙するために使う。
+        """
+        ...
+
     def save(self, summary: MealNutritionSummary) -> None:
         """
         MealNutritionSummary を保存する。
@@ -48,3 +61,20 @@ class MealNutritionSummaryRepositoryPort(Protocol):
         - なければ insert 相当として扱う
         """
         ...
+
+
+class AsyncMealNutritionSummaryRepositoryPort(Protocol):
+    """
+    MealNutritionSummaryRepositoryPort の async 版（参照系のみ）。
+    async ルートからスレッドプールを使わずに読むためのもの。
+    """
+
+    async def get_by_user_date_meal(
+        self,
+        *,
+        user_id: UserId,
+        target_date: date,
+        meal_type: MealType,
+        meal_index: int | None,
+    ) -> MealNutritionSummary | None:
+        ...
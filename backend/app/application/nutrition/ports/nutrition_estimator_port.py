@@ -25,3 +25,20 @@ class NutritionEstimatorPort(Protocol):
         entries: Sequence[FoodEntry],
     ) -> list[MealNutrientIntake]:
         ...
+
+
+
+class AsyncNutritionEstimatorPort(Protocol):
+    """
+    NutritionEstimatorPort の async 版。
+
+    - async ルートからイベントループ上で await される（スレッドを占有しない）。
+    """
+
+    async def estimate_for_entries(
+        self,
+        user_id: UserId,
+        date: DateType,
+        entries: Sequence[FoodEntry],
+    ) -> list[MealNutrientIntake]:
+        ...
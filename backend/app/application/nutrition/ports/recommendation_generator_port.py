@@ -18,3 +18,15 @@ class MealRecommendationGeneratorPort(Protocol):
         input: MealRecommendationLLMInput,
     ) -> MealRecommendationLLMOutput:
         ...
+
+
+class AsyncMealRecommendationGeneratorPort(Protocol):
+    """
+    MealRecommendationGeneratorPort の async 版（async ルートから await される）。
+    """
+
+    async def generate(
+        self,
+        input: MealRecommendationLLMInput,
+    ) -> MealRecommendationLLMOutput:
+        ...
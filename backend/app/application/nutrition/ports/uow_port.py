@@ -2,11 +2,16 @@ from __future__ import annotations
 
 from typing import Protocol
 
-from app.application.common.ports.unit_of_work_port import UnitOfWorkPort
+from app.application.common.ports.unit_of_work_port import (
+    AsyncUnitOfWorkPort,
+    UnitOfWorkPort,
+)
 from app.application.nutrition.ports.meal_nutrition_repository_port import (
+    AsyncMealNutritionSummaryRepositoryPort,
     MealNutritionSummaryRepositoryPort,
 )
 from app.application.nutrition.ports.daily_nutrition_repository_port import (
+    AsyncDailyNutritionSummaryRepositoryPort,
     DailyNutritionSummaryRepositoryPort,
 )
 from app.application.nutrition.ports.daily_report_repository_port import (
@@ -62,3 +67,12 @@ class NutritionUnitOfWorkPort(
       “細い” 型を受け取って OK
     """
     ...
+
+
+class AsyncNutritionReadUnitOfWorkPort(AsyncUnitOfWorkPort, Protocol):
+    """
+    Meal / Daily の栄養サマリを async で読むだけの UoW。
+    - GetMealNutritionUseCase / GetDailyNutritionUseCase の async 版が使う。
+    """
+    meal_nutrition_repo: AsyncMealNutritionSummaryRepositoryPort
+    daily_nutrition_repo: AsyncDailyNutritionSummaryRepositoryPort
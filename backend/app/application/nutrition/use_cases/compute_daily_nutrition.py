@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import logging
+import math
 from collections import defaultdict
+from dataclasses import dataclass
 from datetime import date as DateType
 from typing import Sequence
 
@@ -11,7 +14,12 @@ from app.domain.nutrition.daily_nutrition import (
     DailyNutritionSummary,
 )
 from app.domain.target.value_objects import NutrientCode, NutrientAmount, NutrientSource
-from app.application.nutrition.ports.uow_port import NutritionUnitOfWorkPort
+from app.application.nutrition.ports.uow_port import (
+    DailyNutritionUnitOfWorkPort,
+    NutritionUnitOfWorkPort,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class ComputeDailyNutritionSummaryUseCase:
@@ -28,6 +36,9 @@ class ComputeDailyNutritionSummaryUseCase:
     - 出力:
         最新の DailyNutritionSummary
 
+    通常の更新は ComputeMealNutritionUseCase が差分 (新 - 旧) を反映するので、
+    execute() による全再計算は修復 / 検証用。読むだけなら get_or_compute() を使う。
+
     追加: プレミアム機能チェック
       - trial / paid のユーザーのみ実行可能。
       - FREE の場合は PremiumFeatureRequiredError を投げる。
@@ -46,39 +57,227 @@ class ComputeDailyNutritionSummaryUseCase:
         self._plan_checker.ensure_premium_feature(user_id)
 
         with self._uow as uow:
-            meals: Sequence[MealNutritionSummary] = uow.meal_nutrition_repo.list_by_user_and_date(
+            return recompute_daily_summary(uow, user_id, date_)
+
+    def get_or_compute(
+        self,
+        user_id: UserId,
+        date_: DateType,
+    ) -> DailyNutritionSummary:
+        """
+        保存済みのサマリを返す。まだ無ければ全再計算して作る。
+
+        - 食事サマリの保存時に差分が反映済みなので、通常はこれで最新になる。
+        """
+        self._plan_checker.ensure_premium_feature(user_id)
+
+        with self._uow as uow:
+            existing = uow.daily_nutrition_repo.get_by_user_and_date(
                 user_id=user_id,
                 target_date=date_,
             )
+            if existing is not None:
+                return existing
+            return recompute_daily_summary(uow, user_id, date_)
 
-            totals: dict[NutrientCode, float] = defaultdict(float)
-            unit_map: dict[NutrientCode, str] = {}
 
-            for meal in meals:
-                for n in meal.nutrients:
-                    totals[n.code] += n.amount.value
-                    unit_map.setdefault(n.code, n.amount.unit)
+@dataclass(frozen=True)
+class RebuildDailyNutritionResult:
+    """
+    日次サマリ一括再計算の結果。
 
-            pairs: list[tuple[NutrientCode, NutrientAmount]] = [
-                (code, NutrientAmount(value=value, unit=unit_map[code]))
-                for code, value in totals.items()
-            ]
+    - checked: 対象にした (user, date) の数
+    - drifted: 保存値と再計算値がずれていた数（サマリ欠落も含む）
+    - fixed: 実際に上書きした数（dry_run なら 0）
+    """
 
-            existing = uow.daily_nutrition_repo.get_by_user_and_date(
-                user_id=user_id,
-                target_date=date_,
+    checked: int
+    drifted: int
+    fixed: int
+
+
+class RebuildDailyNutritionSummariesUseCase:
+    """
+    期間内の DailyNutritionSummary を MealNutritionSummary から全再計算する
+    修復 / 検証用の UseCase（バッチから実行する想定）。
+
+    - 1 日ずつ別トランザクションで処理する。
+    - dry_run=True なら保存せず、ずれの件数だけ数える。
+    """
+
+    def __init__(self, uow: NutritionUnitOfWorkPort, *, tolerance: float = 1e-6) -> None:
+        self._uow = uow
+        self._tolerance = tolerance
+
+    def execute(
+        self,
+        start_date: DateType,
+        end_date: DateType,
+        *,
+        dry_run: bool = False,
+    ) -> RebuildDailyNutritionResult:
+        with self._uow as uow:
+            keys = list(
+                uow.meal_nutrition_repo.list_user_dates_in_range(
+                    start_date=start_date,
+                    end_date=end_date,
+                )
             )
-            summary_id = existing.id if existing is not None else None
-            source = NutrientSource("llm")
 
-            summary = DailyNutritionSummary.from_nutrient_amounts(
-                user_id=user_id,
-                date=date_,
-                nutrients=pairs,
-                source=source,
-                summary_id=summary_id,
+        drifted = 0
+        fixed = 0
+        for user_id, date_ in keys:
+            with self._uow as uow:
+                existing = uow.daily_nutrition_repo.get_by_user_and_date(
+                    user_id=user_id,
+                    target_date=date_,
+                )
+                expected = _sum_meal_nutrients(
+                    uow.meal_nutrition_repo.list_by_user_and_date(
+                        user_id=user_id,
+                        target_date=date_,
+                    )
+                )
+                if existing is not None and self._matches(existing, expected):
+                    continue
+
+                drifted += 1
+                logger.info(
+                    "Daily nutrition drift: user=%s date=%s", user_id.value, date_
+                )
+                if not dry_run:
+                    recompute_daily_summary(uow, user_id, date_)
+                    fixed += 1
+
+        return RebuildDailyNutritionResult(
+            checked=len(keys), drifted=drifted, fixed=fixed
+        )
+
+    def _matches(
+        self,
+        summary: DailyNutritionSummary,
+        expected: dict[NutrientCode, NutrientAmount],
+    ) -> bool:
+        actual = {n.code: n.amount for n in summary.nutrients}
+        if actual.keys() != expected.keys():
+            return False
+        return all(
+            actual[code].unit == amount.unit
+            and math.isclose(
+                actual[code].value,
+                amount.value,
+                rel_tol=self._tolerance,
+                abs_tol=self._tolerance,
             )
+            for code, amount in expected.items()
+        )
+
+
+# === 日次サマリの更新ヘルパー（UoW の内側で使う） ==========================
+
+
+def recompute_daily_summary(
+    uow: DailyNutritionUnitOfWorkPort,
+    user_id: UserId,
+    date_: DateType,
+) -> DailyNutritionSummary:
+    """
+    その日の MealNutritionSummary を合計し直して日次サマリを上書き保存する。
+
+    - 先に日次サマリの行をロックするので、同じ日の食事サマリの更新とは直列になる
+      （ロックを取ってから読むので、先に終わった更新の食事サマリも合計に入る）。
+    """
+    uow.daily_nutrition_repo.lock_for_update(user_id=user_id, target_date=date_)
+    meals: Sequence[MealNutritionSummary] = uow.meal_nutrition_repo.list_by_user_and_date(
+        user_id=user_id,
+        target_date=date_,
+    )
+    totals = _sum_meal_nutrients(meals)
+
+    existing = uow.daily_nutrition_repo.get_by_user_and_date(
+        user_id=user_id,
+        target_date=date_,
+    )
+    summary_id = existing.id if existing is not None else None
+    source = NutrientSource("llm")
+
+    summary = DailyNutritionSummary.from_nutrient_amounts(
+        user_id=user_id,
+        date=date_,
+        nutrients=list(totals.items()),
+        source=source,
+        summary_id=summary_id,
+    )
+
+    uow.daily_nutrition_repo.save(summary)
+
+    return summary
+
+
+def apply_meal_change_to_daily(
+    uow: DailyNutritionUnitOfWorkPort,
+    *,
+    user_id: UserId,
+    date_: DateType,
+    old: MealNutritionSummary | None,
+    new: MealNutritionSummary,
+) -> None:
+    """
+    1 食分のサマリが old -> new に変わったとき、日次サマリに差分だけを反映する。
+
+    - 呼び出し側は、old を読む前に daily_nutrition_repo.lock_for_update() で
+      その日の行をロックしておくこと（同じ日の更新が直列にならないと差分が二重に入る）。
+    - 差分は UPDATE 1 文で加算する。
+    - 日次サマリが無い / 栄養素の行が揃っていない / 単位が食い違う場合は
+      全再計算にフォールバックする。
+    """
+    deltas = meal_nutrient_deltas(old, new)
+    if deltas is not None and uow.daily_nutrition_repo.apply_nutrient_deltas(
+        user_id=user_id,
+        target_date=date_,
+        deltas=deltas,
+    ):
+        return
+    recompute_daily_summary(uow, user_id, date_)
+
+
+def meal_nutrient_deltas(
+    old: MealNutritionSummary | None,
+    new: MealNutritionSummary,
+) -> dict[NutrientCode, float] | None:
+    """
+    NutrientCode ごとの (新 - 旧)。単位が変わった栄養素があれば None。
+    """
+    previous = {n.code: n.amount for n in old.nutrients} if old is not None else {}
+
+    deltas: dict[NutrientCode, float] = {}
+    for n in new.nutrients:
+        before = previous.pop(n.code, None)
+        if before is None:
+            deltas[n.code] = n.amount.value
+            continue
+        if before.unit != n.amount.unit:
+            return None
+        deltas[n.code] = n.amount.value - before.value
+
+    # 新しいサマリから消えた栄養素は丸ごと差し引く
+    for code, amount in previous.items():
+        deltas[code] = -amount.value
+    return deltas
+
+
+def _sum_meal_nutrients(
+    meals: Sequence[MealNutritionSummary],
+) -> dict[NutrientCode, NutrientAmount]:
+    totals: dict[NutrientCode, float] = defaultdict(float)
+    unit_map: dict[NutrientCode, str] = {}
 
-            uow.daily_nutrition_repo.save(summary)
+    for meal in meals:
+        for n in meal.nutrients:
+            totals[n.code] += n.amount.value
+            unit_map.setdefault(n.code, n.amount.unit)
 
-            return summary
+    return {
+        code: NutrientAmount(value=value, unit=unit_map[code])
+        for code, value in totals.items()
+    }
@@ -1,15 +1,25 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import date as DateType
+from typing import Iterable, Sequence
 
 from app.application.nutrition.ports.meal_entry_query_port import MealEntryQueryPort
 from app.application.nutrition.ports.uow_port import NutritionUnitOfWorkPort
 from app.application.nutrition.ports.nutrition_estimator_port import (
+    AsyncNutritionEstimatorPort,
     NutritionEstimatorPort,
 )
+from app.application.nutrition.dto.meal_nutrient_intake_dto import MealNutrientIntake
 from app.application.auth.ports.plan_checker_port import PlanCheckerPort
+from app.application.nutrition.use_cases.compute_daily_nutrition import (
+    apply_meal_change_to_daily,
+    recompute_daily_summary,
+)
 
+from app.domain.auth.errors import PremiumFeatureRequiredError
 from app.domain.auth.value_objects import UserId
+from app.domain.meal.entities import FoodEntry
 from app.domain.meal.value_objects import MealType
 from app.domain.meal.errors import InvalidMealTypeError, InvalidMealIndexError
 from app.domain.nutrition.meal_nutrition import MealNutritionSummary
@@ -25,11 +35,16 @@ class ComputeMealNutritionUseCase:
       2. NutritionEstimatorPort で栄養ベクトルを推定
       3. 既存の MealNutritionSummary があれば ID を引き継いで再計算 (upsert)
       4. nutrition_uow.meal_nutrition_repo.save(...) で保存
-      5. 最新の MealNutritionSummary を返す
+      5. 同じトランザクションで、日次サマリに差分 (新 - 旧) だけを反映
+         （日次サマリの行を最初にロックして、同じ日の更新を直列化する）
+      6. 最新の MealNutritionSummary を返す
 
     追加: プレミアム機能チェック
       - trial / paid のユーザーのみ実行可能。
       - FREE の場合は PremiumFeatureRequiredError を投げる。
+
+    async_estimator を渡すと、execute_async() は推定をイベントループ上で await する
+    （async ルート用）。渡さない場合は execute() をスレッドで実行する。
     """
 
     def __init__(
@@ -38,11 +53,13 @@ class ComputeMealNutritionUseCase:
         nutrition_uow: NutritionUnitOfWorkPort,
         estimator: NutritionEstimatorPort,
         plan_checker: PlanCheckerPort,
+        async_estimator: AsyncNutritionEstimatorPort | None = None,
     ) -> None:
         self._meal_entry_query_service = meal_entry_query_service
         self._nutrition_uow = nutrition_uow
         self._estimator = estimator
         self._plan_checker = plan_checker
+        self._async_estimator = async_estimator
 
     def execute(
         self,
@@ -51,6 +68,85 @@ class ComputeMealNutritionUseCase:
         meal_type_str: str,
         meal_index: int | None,
     ) -> MealNutritionSummary:
+        meal_type, entries = self._load_entries(
+            user_id, date_, meal_type_str, meal_index
+        )
+
+        # 2. 栄養推定（estimator はそのまま）
+        nutrient_intakes = self._estimator.estimate_for_entries(
+            user_id=user_id,
+            date=date_,
+            entries=entries,
+        )
+
+        return self._save_summary(
+            user_id, date_, meal_type, meal_index, nutrient_intakes
+        )
+
+    async def execute_async(
+        self,
+        user_id: UserId,
+        date_: DateType,
+        meal_type_str: str,
+        meal_index: int | None,
+    ) -> MealNutritionSummary:
+        """
+        execute() の async 版。DB を触るフェーズはスレッドで実行し、
+        推定（LLM 呼び出し）だけをイベントループ上で待つ。
+        """
+        if self._async_estimator is None:
+            return await asyncio.to_thread(
+                self.execute, user_id, date_, meal_type_str, meal_index
+            )
+
+        meal_type, entries = await asyncio.to_thread(
+            self._load_entries, user_id, date_, meal_type_str, meal_index
+        )
+
+        nutrient_intakes = await self._async_estimator.estimate_for_entries(
+            user_id=user_id,
+            date=date_,
+            entries=entries,
+        )
+
+        return await asyncio.to_thread(
+            self._save_summary,
+            user_id,
+            date_,
+            meal_type,
+            meal_index,
+            nutrient_intakes,
+        )
+
+    def recompute_slots(
+        self,
+        user_id: UserId,
+        date_: DateType,
+        slots: Iterable[tuple[str, int | None]],
+    ) -> None:
+        """
+        食事ログを編集した日の、影響のある食事スロットをまとめて計算し直す。
+
+        - 各スロットの保存時に差分が日次サマリへ反映されるので、日次は別に計算しない。
+        - 食事ログの編集は無料プランでもできるので、プレミアムでなければ何もしない。
+        """
+        try:
+            self._plan_checker.ensure_premium_feature(user_id)
+        except PremiumFeatureRequiredError:
+            return
+
+        for meal_type_str, meal_index in sorted(
+            set(slots), key=lambda slot: (slot[0], slot[1] or 0)
+        ):
+            self.execute(user_id, date_, meal_type_str, meal_index)
+
+    def _load_entries(
+        self,
+        user_id: UserId,
+        date_: DateType,
+        meal_type_str: str,
+        meal_index: int | None,
+    ) -> tuple[MealType, list[FoodEntry]]:
         # --- 0. プレミアム機能チェック --------------------------------
         self._plan_checker.ensure_premium_feature(user_id)
 
@@ -72,7 +168,7 @@ class ComputeMealNutritionUseCase:
                     f"MealType=snack の場合、meal_index は None である必要があります: {meal_index}"
                 )
 
-         # 1. MealEntry 取得（MealEntryQueryPort 経由）
+        # 1. MealEntry 取得（MealEntryQueryPort 経由）
         entries = list(
             self._meal_entry_query_service.list_entries_for_meal(
                 user_id=user_id,
@@ -81,16 +177,24 @@ class ComputeMealNutritionUseCase:
                 meal_index=meal_index,
             )
         )
+        return meal_type, entries
 
-        # 2. 栄養推定（estimator はそのまま）
-        nutrient_intakes = self._estimator.estimate_for_entries(
-            user_id=user_id,
-            date=date_,
-            entries=entries,
-        )
-
+    def _save_summary(
+        self,
+        user_id: UserId,
+        date_: DateType,
+        meal_type: MealType,
+        meal_index: int | None,
+        nutrient_intakes: Sequence[MealNutrientIntake],
+    ) -> MealNutritionSummary:
         # 3. 既存サマリの取得 & 4. 保存 は NutritionUoW 経由
         with self._nutrition_uow as uow:
+            # 同じ日の更新（別スロット・初回計算を含む）とは日次サマリの行ロックで直列化する。
+            # 食事サマリの行は初回だと存在せずロックできないので、こちらを先に取る
+            has_daily = uow.daily_nutrition_repo.lock_for_update(
+                user_id=user_id,
+                target_date=date_,
+            )
             existing = uow.meal_nutrition_repo.get_by_user_date_meal(
                 user_id=user_id,
                 target_date=date_,
@@ -115,4 +219,17 @@ class ComputeMealNutritionUseCase:
             uow.meal_nutrition_repo.save(summary)
             summary.ensure_full_nutrients()
 
+            # 5. 日次サマリは全再計算せず、このスロットの増減だけを加算する
+            #    （日次サマリがまだ無かった日は全再計算で作る）
+            if has_daily:
+                apply_meal_change_to_daily(
+                    uow,
+                    user_id=user_id,
+                    date_=date_,
+                    old=existing,
+                    new=summary,
+                )
+            else:
+                recompute_daily_summary(uow, user_id, date_)
+
             return summary
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import date as DateType
 
 from app.application.auth.ports.clock_port import ClockPort
 from app.application.nutrition.ports.daily_report_generator_port import (
+    AsyncDailyNutritionReportGeneratorPort,
     DailyNutritionReportGeneratorPort,
 )
 from app.application.nutrition.ports.uow_port import NutritionUnitOfWorkPort
@@ -51,8 +53,12 @@ class GenerateDailyNutritionReportUseCase:
         1. 記録完了チェック (CheckDailyLogCompletionUseCase)
         2. 既存レポートの有無をチェック（あればエラー）
         3. Profile / DailyTargetSnapshot / DailyNutritionSummary / MealNutritionSummary を取得
-        4. LLM ポートでレポート本文を生成
-        5. DailyNutritionReport エンティティを組み立てて保存
+        4. LLM ポートでレポート本文を生成（UoW の外で実行）
+        5. DailyNutritionReport エンティティを組み立て、
+           既存レポートの有無を再チェックしてから保存
+
+    async_report_generator を渡すと、execute_async() は 4. をイベントループ上で
+    await する（async ルート用）。渡さない場合は execute() をスレッドで実行する。
     """
 
     def __init__(
@@ -64,6 +70,7 @@ class GenerateDailyNutritionReportUseCase:
         nutrition_uow: NutritionUnitOfWorkPort,
         report_generator: DailyNutritionReportGeneratorPort,
         clock: ClockPort,
+        async_report_generator: AsyncDailyNutritionReportGeneratorPort | None = None,
     ) -> None:
         self._daily_log_uc = daily_log_uc
         self._profile_query = profile_query
@@ -72,6 +79,7 @@ class GenerateDailyNutritionReportUseCase:
         self._uow = nutrition_uow
         self._report_generator = report_generator
         self._clock = clock
+        self._async_report_generator = async_report_generator
 
     def execute(
         self,
@@ -88,7 +96,35 @@ class GenerateDailyNutritionReportUseCase:
             - ProfileNotFound / TargetSnapshotNotFound 等（各 Repo / UC 由来）
             - PremiumFeatureRequiredError（プレミアム機能が不足している場合）
         """
+        llm_input = self._build_llm_input(user_id, date_)
+
+        # 数秒かかり得るので、DB 接続 / トランザクションを持たない状態で呼ぶ
+        llm_output: DailyReportLLMOutput = self._report_generator.generate(
+            llm_input)
+
+        return self._save_report(user_id, date_, llm_output)
+
+    async def execute_async(
+        self,
+        user_id: UserId,
+        date_: DateType,
+    ) -> DailyNutritionReport:
+        """
+        execute() の async 版。DB を触るフェーズはスレッドで実行し、
+        レポート生成（LLM 呼び出し）だけをイベントループ上で待つ。
+        """
+        if self._async_report_generator is None:
+            return await asyncio.to_thread(self.execute, user_id, date_)
 
+        llm_input = await asyncio.to_thread(self._build_llm_input, user_id, date_)
+        llm_output = await self._async_report_generator.generate(llm_input)
+        return await asyncio.to_thread(self._save_report, user_id, date_, llm_output)
+
+    def _build_llm_input(
+        self,
+        user_id: UserId,
+        date_: DateType,
+    ) -> DailyReportLLMInput:
         # --- 1. 記録完了チェック --------------------------------------
         completion: DailyLogCompletionResultDTO = self._daily_log_uc.execute(
             user_id=user_id,
@@ -131,16 +167,10 @@ class GenerateDailyNutritionReportUseCase:
             date_=date_,
         )
 
+        # --- 読み取りフェーズ ------------------------------------------
         with self._uow as uow:
             # --- 3. 既存レポートの有無をチェック ---------------------
-            existing = uow.daily_report_repo.get_by_user_and_date(
-                user_id=user_id,
-                target_date=date_,
-            )
-            if existing is not None:
-                raise DailyNutritionReportAlreadyExistsError(
-                    f"DailyNutritionReport already exists for user_id={user_id.value}, date={date_}"
-                )
+            self._ensure_report_not_exists(uow, user_id, date_)
 
             # --- 4. その日の MealNutritionSummary 一覧 ---------------
             meal_summaries: list[MealNutritionSummary] = list(
@@ -150,37 +180,60 @@ class GenerateDailyNutritionReportUseCase:
                 )
             )
 
-            # --- 5. LLM 入力 DTO を組み立ててレポート生成 -------------
-            llm_input = DailyReportLLMInput(
-                user_id=user_id,
-                date=date_,
-                profile=ProfileForDailyLog(
-                    sex=profile.sex,
-                    birthdate=profile.birthdate,
-                    height_cm=profile.height_cm,
-                    weight_kg=profile.weight_kg,
-                    meals_per_day=profile.meals_per_day,
-                ),
-                target_snapshot=target_snapshot,
-                daily_summary=daily_summary,
-                meal_summaries=meal_summaries,
-            )
+        # --- 5. LLM 入力 DTO を組み立てる -----------------------------
+        llm_input = DailyReportLLMInput(
+            user_id=user_id,
+            date=date_,
+            profile=ProfileForDailyLog(
+                sex=profile.sex,
+                birthdate=profile.birthdate,
+                height_cm=profile.height_cm,
+                weight_kg=profile.weight_kg,
+                meals_per_day=profile.meals_per_day,
+            ),
+            target_snapshot=target_snapshot,
+            daily_summary=daily_summary,
+            meal_summaries=meal_summaries,
+        )
 
-            llm_output: DailyReportLLMOutput = self._report_generator.generate(
-                llm_input)
-
-            # --- 6. DailyNutritionReport エンティティを組み立て -----
-            report = DailyNutritionReport.create(
-                user_id=user_id,
-                date=date_,
-                summary=llm_output.summary,
-                good_points=llm_output.good_points,
-                improvement_points=llm_output.improvement_points,
-                tomorrow_focus=llm_output.tomorrow_focus,
-                created_at=self._clock.now(),
-            )
+        return llm_input
+
+    def _save_report(
+        self,
+        user_id: UserId,
+        date_: DateType,
+        llm_output: DailyReportLLMOutput,
+    ) -> DailyNutritionReport:
+        # --- 6. DailyNutritionReport エンティティを組み立て -----------
+        report = DailyNutritionReport.create(
+            user_id=user_id,
+            date=date_,
+            summary=llm_output.summary,
+            good_points=llm_output.good_points,
+            improvement_points=llm_output.improvement_points,
+            tomorrow_focus=llm_output.tomorrow_focus,
+            created_at=self._clock.now(),
+        )
 
-            # --- 7. 保存 ---------------------------------------------
+        # --- 7. 書き込みフェーズ ---------------------------------------
+        with self._uow as uow:
+            # LLM 呼び出し中に別リクエストで作成されている可能性があるので再チェック
+            self._ensure_report_not_exists(uow, user_id, date_)
             uow.daily_report_repo.save(report)
 
         return report
+
+    @staticmethod
+    def _ensure_report_not_exists(
+        uow: NutritionUnitOfWorkPort,
+        user_id: UserId,
+        date_: DateType,
+    ) -> None:
+        existing = uow.daily_report_repo.get_by_user_and_date(
+            user_id=user_id,
+            target_date=date_,
+        )
+        if existing is not None:
+            raise DailyNutritionReportAlreadyExistsError(
+                f"DailyNutritionReport already exists for user_id={user_id.value}, date={date_}"
+            )
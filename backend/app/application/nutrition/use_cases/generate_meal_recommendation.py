@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from datetime import date as DateType
 
 from app.application.auth.ports.clock_port import ClockPort
 from app.application.nutrition.ports.recommendation_generator_port import (
+    AsyncMealRecommendationGeneratorPort,
     MealRecommendationGeneratorPort,
 )
 from app.application.auth.ports.plan_checker_port import PlanCheckerPort
@@ -13,6 +15,7 @@ from app.application.nutrition.ports.uow_port import NutritionUnitOfWorkPort
 
 from app.application.nutrition.dto.meal_recommendation_llm_dto import (
     MealRecommendationLLMInput,
+    MealRecommendationLLMOutput,
 )
 
 from app.domain.auth.value_objects import UserId
@@ -43,6 +46,9 @@ class GenerateMealRecommendationUseCase:
 
     - 他コンテキストの Profile は ProfileQueryPort 経由
     - DailyNutritionReport / MealRecommendation など栄養ドメインの書き込みは NutritionUnitOfWorkPort 経由
+    - LLM 呼び出しは UoW の外で行い、書き込み時に日次制限 / クールダウンを再チェックする
+    - async_generator を渡すと、execute_async() は LLM 呼び出しをイベントループ上で
+      await する（async ルート用）。渡さない場合は execute() をスレッドで実行する
     """
 
     def __init__(
@@ -56,6 +62,7 @@ class GenerateMealRecommendationUseCase:
         plan_checker: PlanCheckerPort | None = None,
         cooldown_minutes: int = 30,
         daily_limit: int = 5,
+        async_generator: AsyncMealRecommendationGeneratorPort | None = None,
     ) -> None:
         self._profile_query = profile_query
         self._nutrition_uow = nutrition_uow
@@ -66,8 +73,38 @@ class GenerateMealRecommendationUseCase:
         self._plan_checker = plan_checker
         self._cooldown_minutes = cooldown_minutes
         self._daily_limit = daily_limit
+        self._async_generator = async_generator
 
     def execute(self, input: GenerateMealRecommendationInput) -> MealRecommendation:
+        llm_input = self._build_llm_input(input)
+
+        # --- LLM で提案生成 ------------------------------------------
+        # 数秒かかり得るので、DB 接続 / トランザクションを持たない状態で呼ぶ
+        llm_output = self._generator.generate(llm_input)
+
+        return self._save_recommendation(llm_input, llm_output)
+
+    async def execute_async(
+        self,
+        input: GenerateMealRecommendationInput,
+    ) -> MealRecommendation:
+        """
+        execute() の async 版。DB を触るフェーズはスレッドで実行し、
+        提案生成（LLM 呼び出し）だけをイベントループ上で待つ。
+        """
+        if self._async_generator is None:
+            return await asyncio.to_thread(self.execute, input)
+
+        llm_input = await asyncio.to_thread(self._build_llm_input, input)
+        llm_output = await self._async_generator.generate(llm_input)
+        return await asyncio.to_thread(
+            self._save_recommendation, llm_input, llm_output
+        )
+
+    def _build_llm_input(
+        self,
+        input: GenerateMealRecommendationInput,
+    ) -> MealRecommendationLLMInput:
         import logging
         logger = logging.getLogger(__name__)
 
@@ -90,44 +127,9 @@ class GenerateMealRecommendationUseCase:
                 f"Profile not found for user_id={user_id.value}"
             )
 
-        # --- Nutrition UoW 経由で DailyReport / Recommendation を操作 ---
+        # --- 読み取りフェーズ: 制約チェック + 直近の DailyReport 取得 ---
         with self._nutrition_uow as uow:
-            # 制約チェック1: 日次制限
-            current_count = uow.meal_recommendation_repo.count_by_user_and_date(
-                user_id=user_id,
-                generated_for_date=base_date,
-            )
-            logger.info(f"Daily limit check: current_count={current_count}, daily_limit={self._daily_limit}")
-            if current_count >= self._daily_limit:
-                logger.warning(f"Daily limit exceeded: {current_count}/{self._daily_limit}")
-                raise MealRecommendationDailyLimitError(
-                    current_count=current_count,
-                    limit=self._daily_limit,
-                )
-
-            # 制約チェック2: クールダウン期間（cooldown_minutes=0の場合はスキップ）
-            if self._cooldown_minutes > 0:
-                logger.info(f"Cooldown check enabled: cooldown_minutes={self._cooldown_minutes}")
-                latest_recommendation = uow.meal_recommendation_repo.get_latest_by_user(
-                    user_id=user_id
-                )
-                if latest_recommendation is not None:
-                    from datetime import timedelta
-                    now = self._clock.now()
-                    wait_until = latest_recommendation.created_at + timedelta(minutes=self._cooldown_minutes)
-                    logger.info(f"Latest recommendation: {latest_recommendation.created_at}, wait_until: {wait_until}, now: {now}")
-
-                    if now < wait_until:
-                        remaining_minutes = int((wait_until - now).total_seconds() / 60)
-                        logger.warning(f"Cooldown period active: remaining_minutes={remaining_minutes}")
-                        raise MealRecommendationCooldownError(
-                            wait_until=wait_until,
-                            remaining_minutes=remaining_minutes,
-                        )
-                else:
-                    logger.info("No previous recommendations found, cooldown check passed")
-            else:
-                logger.info("Cooldown check disabled (cooldown_minutes=0)")
+            self._ensure_within_limits(uow, user_id, base_date)
 
             # 直近最大5日分の DailyNutritionReport を取得
             recent_reports = list(
@@ -142,31 +144,40 @@ class GenerateMealRecommendationUseCase:
                     f"but got {len(recent_reports)} for user_id={user_id.value}."
                 )
 
-            # --- LLM 入力 DTO 構築 ------------------------------------
-            llm_input = MealRecommendationLLMInput(
-                user_id=user_id,
-                base_date=base_date,
-                profile=profile,
-                recent_reports=recent_reports,
-            )
-
-            # --- LLM で提案生成 --------------------------------------
-            llm_output = self._generator.generate(llm_input)
+        # --- LLM 入力 DTO 構築 ----------------------------------------
+        llm_input = MealRecommendationLLMInput(
+            user_id=user_id,
+            base_date=base_date,
+            profile=profile,
+            recent_reports=recent_reports,
+        )
+        return llm_input
 
-            # --- MealRecommendation エンティティ生成 -----------------
-            now = self._clock.now()
+    def _save_recommendation(
+        self,
+        llm_input: MealRecommendationLLMInput,
+        llm_output: MealRecommendationLLMOutput,
+    ) -> MealRecommendation:
+        user_id = llm_input.user_id
+        base_date = llm_input.base_date
+
+        # --- MealRecommendation エンティティ生成 ---------------------
+        # DTO -> ドメインエンティティ変換
+        from app.domain.nutrition.meal_recommendation import RecommendedMeal
+        recommended_meals = [
+            RecommendedMeal(
+                title=meal.title,
+                description=meal.description,
+                ingredients=meal.ingredients,
+                nutrition_focus=meal.nutrition_focus,
+            )
+            for meal in llm_output.recommended_meals
+        ]
 
-            # DTO -> ドメインエンティティ変換
-            from app.domain.nutrition.meal_recommendation import RecommendedMeal
-            recommended_meals = [
-                RecommendedMeal(
-                    title=meal.title,
-                    description=meal.description,
-                    ingredients=meal.ingredients,
-                    nutrition_focus=meal.nutrition_focus,
-                )
-                for meal in llm_output.recommended_meals
-            ]
+        # --- 書き込みフェーズ ----------------------------------------
+        with self._nutrition_uow as uow:
+            # LLM 呼び出し中に別リクエストで生成されている可能性があるので再チェック
+            self._ensure_within_limits(uow, user_id, base_date)
 
             recommendation = MealRecommendation.create(
                 user_id=user_id,
@@ -174,7 +185,7 @@ class GenerateMealRecommendationUseCase:
                 body=llm_output.body,
                 tips=llm_output.tips,
                 recommended_meals=recommended_meals,
-                created_at=now,
+                created_at=self._clock.now(),
             )
 
             # --- 永続化 ---------------------------------------------
@@ -182,3 +193,49 @@ class GenerateMealRecommendationUseCase:
             # commit / rollback は UoW.__exit__ が担当
 
         return recommendation
+
+    def _ensure_within_limits(
+        self,
+        uow: NutritionUnitOfWorkPort,
+        user_id: UserId,
+        base_date: DateType,
+    ) -> None:
+        import logging
+        logger = logging.getLogger(__name__)
+
+        # 制約チェック1: 日次制限
+        current_count = uow.meal_recommendation_repo.count_by_user_and_date(
+            user_id=user_id,
+            generated_for_date=base_date,
+        )
+        logger.info(f"Daily limit check: current_count={current_count}, daily_limit={self._daily_limit}")
+        if current_count >= self._daily_limit:
+            logger.warning(f"Daily limit exceeded: {current_count}/{self._daily_limit}")
+            raise MealRecommendationDailyLimitError(
+                current_count=current_count,
+                limit=self._daily_limit,
+            )
+
+        # 制約チェック2: クールダウン期間（cooldown_minutes=0の場合はスキップ）
+        if self._cooldown_minutes > 0:
+            logger.info(f"Cooldown check enabled: cooldown_minutes={self._cooldown_minutes}")
+            latest_recommendation = uow.meal_recommendation_repo.get_latest_by_user(
+                user_id=user_id
+            )
+            if latest_recommendation is not None:
+                from datetime import timedelta
+                now = self._clock.now()
+                wait_until = latest_recommendation.created_at + timedelta(minutes=self._cooldown_minutes)
+                logger.info(f"Latest recommendation: {latest_recommendation.created_at}, wait_until: {wait_until}, now: {now}")
+
+                if now < wait_until:
+                    remaining_minutes = int((wait_until - now).total_seconds() / 60)
+                    logger.warning(f"Cooldown period active: remaining_minutes={remaining_minutes}")
+                    raise MealRecommendationCooldownError(
+                        wait_until=wait_until,
+                        remaining_minutes=remaining_minutes,
+                    )
+            else:
+                logger.info("No previous recommendations found, cooldown check passed")
+        else:
+            logger.info("Cooldown check disabled (cooldown_minutes=0)")
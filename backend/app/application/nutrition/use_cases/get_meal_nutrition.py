@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import date as DateType
 
-from app.application.nutrition.ports.uow_port import NutritionUnitOfWorkPort
+from app.application.nutrition.ports.daily_recompute_scheduler_port import (
+    DailyNutritionRecomputeSchedulerPort,
+)
+from app.application.nutrition.ports.uow_port import (
+    AsyncNutritionReadUnitOfWorkPort,
+    NutritionUnitOfWorkPort,
+)
 from app.application.auth.ports.plan_checker_port import PlanCheckerPort
 
 from app.domain.auth.value_objects import UserId
@@ -19,17 +26,24 @@ class GetMealNutritionUseCase:
     データが存在しない場合はNoneを返す。
 
     フロー:
-      1. (user_id, date, meal_type, meal_index) に対応する既存データを検索
-      2. 見つかればそのまま返す、なければNone
+      1. 遅延中の計算があれば先に済ませる（古い値を返さないように）
+      2. (user_id, date, meal_type, meal_index) に対応する既存データを検索
+      3. 見つかればそのまま返す、なければNone
     """
 
     def __init__(
         self,
         nutrition_uow: NutritionUnitOfWorkPort,
         plan_checker: PlanCheckerPort,
+        async_nutrition_uow: AsyncNutritionReadUnitOfWorkPort | None = None,
+        recompute_scheduler: DailyNutritionRecomputeSchedulerPort | None = None,
     ) -> None:
         self._nutrition_uow = nutrition_uow
         self._plan_checker = plan_checker
+        # async ルート用。None なら同期版をスレッドで呼ぶ
+        self._async_nutrition_uow = async_nutrition_uow
+        # 食事ログ編集後の計算を遅らせている場合に渡される
+        self._recompute_scheduler = recompute_scheduler
 
     def execute(
         self,
@@ -41,6 +55,65 @@ class GetMealNutritionUseCase:
         # --- 0. プレミアム機能チェック --------------------------------
         self._plan_checker.ensure_premium_feature(user_id)
 
+        meal_type = self._parse_meal_slot(meal_type_str, meal_index)
+
+        if self._recompute_scheduler is not None:
+            self._recompute_scheduler.flush(user_id, date_)
+
+        # 既存データの検索のみ（OpenAI計算なし）
+        with self._nutrition_uow as uow:
+            existing = uow.meal_nutrition_repo.get_by_user_date_meal(
+                user_id=user_id,
+                target_date=date_,
+                meal_type=meal_type,
+                meal_index=meal_index,
+            )
+
+            if existing:
+                existing.ensure_full_nutrients()
+
+            return existing
+
+    async def execute_async(
+        self,
+        user_id: UserId,
+        date_: DateType,
+        meal_type_str: str,
+        meal_index: int | None,
+    ) -> MealNutritionSummary | None:
+        """
+        execute() の async 版。async UoW が無ければスレッドで同期版を呼ぶ。
+        プラン判定は同期ポートなのでスレッドで行う（通常はキャッシュで DB に行かない）。
+        """
+        if self._async_nutrition_uow is None:
+            return await asyncio.to_thread(
+                self.execute, user_id, date_, meal_type_str, meal_index
+            )
+
+        await asyncio.to_thread(self._plan_checker.ensure_premium_feature, user_id)
+        meal_type = self._parse_meal_slot(meal_type_str, meal_index)
+
+        # 待ち中の計算が無ければスレッドに移らない
+        if self._recompute_scheduler is not None and self._recompute_scheduler.pending(
+            user_id, date_
+        ):
+            await asyncio.to_thread(self._recompute_scheduler.flush, user_id, date_)
+
+        async with self._async_nutrition_uow as uow:
+            existing = await uow.meal_nutrition_repo.get_by_user_date_meal(
+                user_id=user_id,
+                target_date=date_,
+                meal_type=meal_type,
+                meal_index=meal_index,
+            )
+
+            if existing:
+                existing.ensure_full_nutrients()
+
+            return existing
+
+    @staticmethod
+    def _parse_meal_slot(meal_type_str: str, meal_index: int | None) -> MealType:
         # --- meal_type の文字列 → Enum 変換 ----------------------------
         try:
             meal_type = MealType(meal_type_str)
@@ -58,17 +131,4 @@ class GetMealNutritionUseCase:
                 raise InvalidMealIndexError(
                     f"MealType=snack の場合、meal_index は None である必要があります: {meal_index}"
                 )
-
-        # 既存データの検索のみ（OpenAI計算なし）
-        with self._nutrition_uow as uow:
-            existing = uow.meal_nutrition_repo.get_by_user_date_meal(
-                user_id=user_id,
-                target_date=date_,
-                meal_type=meal_type,
-                meal_index=meal_index,
-            )
-
-            if existing:
-                existing.ensure_full_nutrients()
-
-            return existing
\ No newline at end of file
+        return meal_type
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, datetime
+from typing import TYPE_CHECKING
 
+from app.domain.profile.entities import Profile
 from app.domain.profile.value_objects import Sex
 
+if TYPE_CHECKING:
+    from app.application.profile.ports.profile_image_storage_port import (
+        ProfileImageStoragePort,
+    )
+
 
 # === Core DTO ===============================================================
 
@@ -16,6 +23,8 @@ class ProfileDTO:
 
     - Sex はドメインの ValueObject をそのまま保持
     - height_cm / weight_kg は数値（単位付き）
+    - image_url / image_thumbnail_urls はストレージが発行する読み取り URL
+      （出せない場合は None / 空）
     """
 
     user_id: str
@@ -27,6 +36,40 @@ class ProfileDTO:
     created_at: datetime
     updated_at: datetime
     meals_per_day: int | None = None
+    image_url: str | None = None
+
+    # サムネイルの読み取り URL（辺の長さ px → URL）
+    image_thumbnail_urls: dict[int, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_entity(
+        cls,
+        profile: Profile,
+        image_storage: ProfileImageStoragePort | None = None,
+    ) -> "ProfileDTO":
+        """image_storage があれば画像 / サムネイルの読み取り URL も詰める。"""
+        image_url = None
+        thumbnail_urls: dict[int, str] = {}
+        if image_storage is not None and profile.image_id is not None:
+            image_url = image_storage.get_url(profile.image_id)
+            for size, thumbnail_id in sorted(profile.image_thumbnails.items()):
+                url = image_storage.get_url(thumbnail_id)
+                if url is not None:
+                    thumbnail_urls[size] = url
+
+        return cls(
+            user_id=profile.user_id.value,
+            sex=profile.sex,
+            birthdate=profile.birthdate,
+            height_cm=profile.height_cm.value,
+            weight_kg=profile.weight_kg.value,
+            image_id=profile.image_id.value if profile.image_id else None,
+            meals_per_day=profile.meals_per_day,
+            created_at=profile.created_at,
+            updated_at=profile.updated_at,
+            image_url=image_url,
+            image_thumbnail_urls=thumbnail_urls,
+        )
 
 
 # === Input DTO (UseCase 入力) ===============================================
@@ -52,6 +95,31 @@ class UpsertProfileInputDTO:
     meals_per_day: int | None = None
 
 
+@dataclass
+class ConfirmProfileImageUploadInputDTO:
+    """
+    presigned PUT でアップロードした画像をプロフィールに紐づけるときの入力 DTO。
+
+    - image_id は CreateProfileImageUploadUseCase が払い出したオブジェクトキー
+    """
+
+    user_id: str
+    image_id: str
+
+
+@dataclass
+class ProfileImageUploadDTO:
+    """
+    クライアントがストレージへ直接アップロードするための情報。
+    """
+
+    image_id: str
+    upload_url: str
+    method: str
+    headers: dict[str, str]
+    expires_at: datetime
+
+
 # === Output DTO (用途が絞られたレスポンス用など) ============================
 
 
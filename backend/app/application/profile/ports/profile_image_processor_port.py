@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from typing import Protocol
+
+from app.domain.auth.value_objects import UserId
+from app.domain.profile.value_objects import ProfileImageId
+
+
+class ProfileImageProcessorPort(Protocol):
+    """
+    保存されたプロフィール画像の後処理（サムネイル生成など）を依頼するポート。
+
+    - schedule() はすぐ戻る（処理はリクエストの外で行う）。
+    - 処理結果はプロフィールに記録される。処理中に画像が差し替えられていたら捨てる。
+    """
+
+    def schedule(self, user_id: UserId, image_id: ProfileImageId) -> None:
+        ...
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from typing import Protocol
 
 from app.domain.auth.value_objects import UserId
@@ -14,15 +15,39 @@ class StoredProfileImage:
 
     - id: ストレージ側のID（オブジェクトキー等）
     - url: フロントからアクセスするためのURL（必要であれば）
+    - size / content_type: アップロード確認時にストレージから読んだ値（分かる場合）
     """
 
     id: ProfileImageId
     url: str | None = None
+    size: int | None = None
+    content_type: str | None = None
+
+
+@dataclass
+class ProfileImageUpload:
+    """
+    クライアントがストレージへ直接アップロードするための情報（presigned PUT）。
+
+    - id: アップロード先のオブジェクトキー（確認 API にそのまま渡してもらう）
+    - url / method / headers: クライアントが送るリクエスト
+    - expires_at: url の有効期限
+    """
+
+    id: ProfileImageId
+    url: str
+    expires_at: datetime
+    method: str = "PUT"
+    headers: dict[str, str] = field(default_factory=dict)
 
 
 class ProfileImageStoragePort(Protocol):
     """
     プロフィール画像の保存 / 削除を抽象化するポート。
+
+    - 画像の本体は API を経由させず、create_upload() の URL でクライアントが直接送る。
+    - オブジェクトキーはアップロードごとに新しくする（同じキーの中身は変わらない）ので、
+      読み取り URL は長くキャッシュしてよい。
     """
 
     def save(
@@ -33,13 +58,62 @@ class ProfileImageStoragePort(Protocol):
     ) -> StoredProfileImage:
         """
         新しい画像を保存して StoredProfileImage を返す。
-        既存画像の上書きにするか、別IDで保存するかは実装次第。
+        （API が画像の本体を受け取る場合の経路。通常は create_upload を使う）
+        """
+        ...
+
+    def create_upload(
+        self,
+        user_id: UserId,
+        content_type: str,
+        expires_in: timedelta,
+    ) -> ProfileImageUpload:
+        """
+        新しいオブジェクトキーを払い出し、そこへの presigned PUT を発行する。
+        """
+        ...
+
+    def find_upload(
+        self,
+        user_id: UserId,
+        image_id: ProfileImageId,
+    ) -> StoredProfileImage | None:
+        """
+        アップロード済みのオブジェクトを確認する。
+
+        - そのユーザー用のキーでない / オブジェクトが無い場合は None。
+        """
+        ...
+
+    def read(self, image_id: ProfileImageId) -> bytes:
+        """
+        保存済みの画像の本体を読む（サムネイル生成などの後処理用）。
+        """
+        ...
+
+    def save_derivative(
+        self,
+        user_id: UserId,
+        name: str,
+        content: bytes,
+        content_type: str,
+    ) -> ProfileImageId:
+        """
+        画像から作った派生物（サムネイルなど）を保存する。
+        キーは内容のハッシュから作るので、同じ内容なら同じ ID になる。
+        """
+        ...
+
+    def get_url(self, image_id: ProfileImageId) -> str | None:
+        """
+        クライアントが画像を読むための URL（公開 URL または presigned GET）。
+        URL を出せない実装では None。
         """
         ...
 
     def delete(self, image_id: ProfileImageId) -> None:
         """
         指定したプロフィール画像を削除する。
-        （後で画像差し替え時のクリーンアップなどで利用）
+        （画像差し替え時のクリーンアップなどで利用）
         """
         ...
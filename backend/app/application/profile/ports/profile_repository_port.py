@@ -4,6 +4,7 @@ from typing import Protocol
 
 from app.domain.auth.value_objects import UserId
 from app.domain.profile.entities import Profile
+from app.domain.profile.value_objects import ProfileImageId
 
 
 class ProfileRepositoryPort(Protocol):
@@ -21,5 +22,18 @@ class ProfileRepositoryPort(Protocol):
     def save(self, profile: Profile) -> Profile:
         """
         新規 or 更新を抽象化。
+        image_thumbnails は書かない（画像を差し替えたときだけ空にする）。
+        """
+        ...
+
+    def attach_thumbnails(
+        self,
+        user_id: UserId,
+        image_id: ProfileImageId,
+        thumbnails: dict[int, ProfileImageId],
+    ) -> bool:
+        """
+        プロフィール画像が今も image_id のときだけ、サムネイルを記録する。
+        記録できなかった（画像が差し替えられていた / プロフィールが無い）なら False。
         """
         ...
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Protocol
+from typing import Callable, Protocol
 
 from app.application.common.ports.unit_of_work_port import UnitOfWorkPort
 from app.application.profile.ports.profile_repository_port import ProfileRepositoryPort
@@ -11,3 +11,10 @@ class ProfileUnitOfWorkPort(UnitOfWorkPort, Protocol):
     profile ドメイン用の Unit of Work。
     """
     profile_repo: ProfileRepositoryPort
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """
+        トランザクションを COMMIT した後に callback を呼ぶ（ロールバックしたら呼ばない）。
+        ストレージの削除やサムネイル生成の依頼など、DB の外の副作用に使う。
+        """
+        ...
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from functools import partial
+
+from app.application.profile.dto.profile_dto import (
+    ConfirmProfileImageUploadInputDTO,
+    ProfileDTO,
+)
+from app.application.profile.ports.uow_port import ProfileUnitOfWorkPort
+from app.application.profile.ports.profile_image_storage_port import ProfileImageStoragePort
+from app.application.profile.ports.profile_image_processor_port import ProfileImageProcessorPort
+from app.application.profile.use_cases.create_profile_image_upload import (
+    ALLOWED_PROFILE_IMAGE_CONTENT_TYPES,
+)
+
+from app.domain.auth.value_objects import UserId
+from app.domain.profile.errors import InvalidProfileImageError, ProfileNotFoundError
+from app.domain.profile.value_objects import ProfileImageId
+
+
+class ConfirmProfileImageUploadUseCase:
+    """
+    presigned PUT でアップロードされた画像をプロフィールに紐づけるユースケース。
+
+    フロー:
+      1. image_id がこのユーザーのキーで、オブジェクトが存在するか確認
+      2. サイズ / Content-Type を検査（NG ならオブジェクトを消してエラー）
+      3. プロフィールの image_id を差し替え、古い画像（とサムネイル）はコミット後に消す
+      4. サムネイル生成を依頼する（image_processor があれば。コミット後）
+    """
+
+    def __init__(
+        self,
+        uow: ProfileUnitOfWorkPort,
+        image_storage: ProfileImageStoragePort,
+        max_bytes: int,
+        image_processor: ProfileImageProcessorPort | None = None,
+    ) -> None:
+        self._uow = uow
+        self._image_storage = image_storage
+        self._max_bytes = max_bytes
+        self._image_processor = image_processor
+
+    def execute(self, input_dto: ConfirmProfileImageUploadInputDTO) -> ProfileDTO:
+        user_id = UserId(input_dto.user_id)
+        image_id = ProfileImageId(input_dto.image_id)
+
+        stored = self._image_storage.find_upload(user_id, image_id)
+        if stored is None:
+            raise InvalidProfileImageError(
+                f"Uploaded image not found: {image_id.value}")
+        if (
+            stored.size is not None and stored.size > self._max_bytes
+        ) or stored.content_type not in ALLOWED_PROFILE_IMAGE_CONTENT_TYPES:
+            self._image_storage.delete(image_id)
+            raise InvalidProfileImageError(
+                f"Uploaded image rejected: size={stored.size} "
+                f"content_type={stored.content_type}"
+            )
+
+        with self._uow as uow:
+            profile = uow.profile_repo.get_by_user_id(user_id)
+            if profile is None:
+                raise ProfileNotFoundError("Profile not found.")
+
+            stale_image_ids = profile.replace_image(image_id)
+            profile.updated_at = datetime.now(timezone.utc)
+            saved = uow.profile_repo.save(profile)
+
+            # ストレージの削除とサムネイル生成の依頼は、コミットされてから行う
+            for stale_id in stale_image_ids:
+                uow.after_commit(partial(self._image_storage.delete, stale_id))
+            if self._image_processor is not None and not saved.image_thumbnails:
+                uow.after_commit(
+                    partial(self._image_processor.schedule, user_id, image_id))
+
+        return ProfileDTO.from_entity(saved, self._image_storage)
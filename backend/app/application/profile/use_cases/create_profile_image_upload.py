@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from app.application.profile.dto.profile_dto import ProfileImageUploadDTO
+from app.application.profile.ports.profile_image_storage_port import ProfileImageStoragePort
+
+from app.domain.auth.value_objects import UserId
+from app.domain.profile.errors import InvalidProfileImageError
+
+# プロフィール画像として受け付ける Content-Type
+ALLOWED_PROFILE_IMAGE_CONTENT_TYPES = frozenset(
+    {"image/jpeg", "image/png", "image/webp"}
+)
+
+
+class CreateProfileImageUploadUseCase:
+    """
+    プロフィール画像のアップロード先（presigned PUT）を発行するユースケース。
+
+    - 画像の本体は API を経由させず、クライアントがストレージへ直接送る。
+    - アップロード後、ConfirmProfileImageUploadUseCase で image_id をプロフィールに紐づける。
+    """
+
+    def __init__(
+        self,
+        image_storage: ProfileImageStoragePort,
+        upload_ttl: timedelta,
+    ) -> None:
+        self._image_storage = image_storage
+        self._upload_ttl = upload_ttl
+
+    def execute(self, user_id: str, content_type: str) -> ProfileImageUploadDTO:
+        if content_type not in ALLOWED_PROFILE_IMAGE_CONTENT_TYPES:
+            raise InvalidProfileImageError(
+                f"Unsupported content type: {content_type}")
+
+        upload = self._image_storage.create_upload(
+            user_id=UserId(user_id),
+            content_type=content_type,
+            expires_in=self._upload_ttl,
+        )
+        return ProfileImageUploadDTO(
+            image_id=upload.id.value,
+            upload_url=upload.url,
+            method=upload.method,
+            headers=dict(upload.headers),
+            expires_at=upload.expires_at,
+        )
@@ -3,6 +3,7 @@ from __future__ import annotations
 from app.application.profile.dto.profile_dto import ProfileDTO
 
 from app.application.profile.ports.uow_port import ProfileUnitOfWorkPort
+from app.application.profile.ports.profile_image_storage_port import ProfileImageStoragePort
 
 from app.domain.auth.value_objects import UserId
 from app.domain.profile.errors import ProfileNotFoundError
@@ -14,10 +15,16 @@ class GetMyProfileUseCase:
 
     - プロフィールが存在しない場合は UserNotFoundError を投げる。
       （将来的に ProfileNotFoundError を追加してもよい）
+    - image_storage があれば、画像 / サムネイルの読み取り URL も返す。
     """
 
-    def __init__(self, uow: ProfileUnitOfWorkPort) -> None:
+    def __init__(
+        self,
+        uow: ProfileUnitOfWorkPort,
+        image_storage: ProfileImageStoragePort | None = None,
+    ) -> None:
         self._uow = uow
+        self._image_storage = image_storage
 
     def execute(self, user_id: str) -> ProfileDTO:
         user_id = UserId(user_id)
@@ -27,14 +34,4 @@ class GetMyProfileUseCase:
             if profile is None:
                 raise ProfileNotFoundError("Profile not found.")
 
-        return ProfileDTO(
-            user_id=profile.user_id.value,
-            sex=profile.sex,
-            birthdate=profile.birthdate,
-            height_cm=profile.height_cm.value,
-            weight_kg=profile.weight_kg.value,
-            image_id=profile.image_id.value if profile.image_id else None,
-            meals_per_day=profile.meals_per_day,
-            created_at=profile.created_at,
-            updated_at=profile.updated_at,
-        )
+        return ProfileDTO.from_entity(profile, self._image_storage)
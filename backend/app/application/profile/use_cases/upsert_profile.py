@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import partial
 from typing import Optional
 
 from app.application.profile.dto.profile_dto import ProfileDTO, UpsertProfileInputDTO
 
 from app.application.profile.ports.uow_port import ProfileUnitOfWorkPort
 from app.application.profile.ports.profile_image_storage_port import ProfileImageStoragePort
+from app.application.profile.ports.profile_image_processor_port import ProfileImageProcessorPort
 
 from app.domain.auth.value_objects import UserId
 from app.domain.profile.entities import Profile
@@ -18,20 +20,24 @@ class UpsertProfileUseCase:
     プロフィールの作成 / 更新を行うユースケース。
 
     - 基本情報（性別 / 生年月日 / 身長 / 体重）
-    - プロフィール画像（任意）
+    - プロフィール画像（任意）。保存した場合はサムネイル生成を依頼する
     """
 
     def __init__(
         self,
         uow: ProfileUnitOfWorkPort,
         image_storage: ProfileImageStoragePort,
+        image_processor: ProfileImageProcessorPort | None = None,
     ) -> None:
         self._uow = uow
         self._image_storage = image_storage
+        self._image_processor = image_processor
 
     def execute(self, input_dto: UpsertProfileInputDTO) -> ProfileDTO:
         now = datetime.now(timezone.utc)
         user_id = UserId(input_dto.user_id)
+        new_image_id: Optional[ProfileImageId] = None
+        stale_image_ids: list[ProfileImageId] = []
 
         with self._uow as uow:
             existing = uow.profile_repo.get_by_user_id(user_id)
@@ -47,6 +53,7 @@ class UpsertProfileUseCase:
                     content_type=input_dto.image_content_type,
                 )
                 image_id = stored.id
+                new_image_id = stored.id
 
             if existing is None:
                 profile = Profile(
@@ -65,21 +72,24 @@ class UpsertProfileUseCase:
                 existing.birthdate = input_dto.birthdate
                 existing.height_cm = HeightCm(input_dto.height_cm)
                 existing.weight_kg = WeightKg(input_dto.weight_kg)
-                existing.image_id = image_id
+                stale_image_ids = existing.replace_image(image_id)
                 existing.meals_per_day = input_dto.meals_per_day
                 existing.updated_at = now
                 profile = existing
 
             saved = uow.profile_repo.save(profile)
 
-        return ProfileDTO(
-            user_id=saved.user_id.value,
-            sex=saved.sex,
-            birthdate=saved.birthdate,
-            height_cm=saved.height_cm.value,
-            weight_kg=saved.weight_kg.value,
-            image_id=saved.image_id.value if saved.image_id else None,
-            meals_per_day=saved.meals_per_day,
-            created_at=saved.created_at,
-            updated_at=saved.updated_at,
-        )
+            # キーは画像ごとに変わるので、差し替えた古い画像（とサムネイル）は消す。
+            # サムネイル生成はリクエストの外（プロセスプール）で行う。
+            # どちらもコミットされてから行う（ロールバックしたら画像を失う / 無駄になる）
+            for stale_id in stale_image_ids:
+                uow.after_commit(partial(self._image_storage.delete, stale_id))
+            if (
+                new_image_id is not None
+                and self._image_processor is not None
+                and not saved.image_thumbnails
+            ):
+                uow.after_commit(
+                    partial(self._image_processor.schedule, user_id, new_image_id))
+
+        return ProfileDTO.from_entity(saved, self._image_storage)
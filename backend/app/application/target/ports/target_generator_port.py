@@ -63,3 +63,13 @@ class TargetGeneratorPort(Protocol):
         ターゲット生成を行い、10栄養素 + 説明文を返す。
         """
         ...
+
+
+@runtime_checkable
+class AsyncTargetGeneratorPort(Protocol):
+    """
+    TargetGeneratorPort の async 版（async ルートから await される）。
+    """
+
+    async def generate(self, ctx: TargetGenerationContext) -> TargetGenerationResult:
+        ...
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from uuid import uuid4
 
 # === Application (DTO / Ports) ==============================================
@@ -16,6 +17,7 @@ from app.application.target.dto.target_dto import (
 )
 from app.application.target.errors import TargetGenerationFailedError, TargetLimitExceededError, TargetProfileNotFoundError
 from app.application.target.ports.target_generator_port import (
+    AsyncTargetGeneratorPort,
     TargetGenerationContext,
     TargetGeneratorPort,
     TargetGenerationResult,
@@ -37,6 +39,9 @@ class CreateTargetUseCase:
 
     - プロフィール + 目標情報から TargetGeneratorPort を使って 10 栄養素を生成
     - 初めての Target なら is_active=True、それ以外は is_active=False
+    - LLM 呼び出しは UoW の外で行い、書き込み時に上限を再チェックする
+    - async_generator を渡すと、execute_async() は LLM 呼び出しをイベントループ上で
+      await する（async ルート用）。渡さない場合は execute() をスレッドで実行する
     """
 
     def __init__(
@@ -45,11 +50,13 @@ class CreateTargetUseCase:
         generator: TargetGeneratorPort,
         profile_query: ProfileQueryPort,
         clock: ClockPort,
+        async_generator: AsyncTargetGeneratorPort | None = None,
     ) -> None:
         self._uow = uow
         self._generator = generator
         self._profile_query = profile_query
         self._clock = clock
+        self._async_generator = async_generator
 
     def execute(self, input_dto: CreateTargetInputDTO) -> TargetDTO:
         """
@@ -59,55 +66,84 @@ class CreateTargetUseCase:
             TargetLimitExceededError: ユーザーが既に上限数のターゲットを持っている場合
             ProfileNotFoundError: ターゲット生成に必要なプロフィールが存在しない場合
         """
+        ctx = self._build_context(input_dto)
+
+        # --- 3. ターゲット生成（LLM or Stub） --------------------------
+        # 数秒かかり得るので、DB 接続 / トランザクションを持たない状態で呼ぶ
+        gen_result: TargetGenerationResult = self._generator.generate(ctx)
+
+        return self._save_target(input_dto, ctx.user_id, gen_result)
+
+    async def execute_async(self, input_dto: CreateTargetInputDTO) -> TargetDTO:
+        """
+        execute() の async 版。DB を触るフェーズはスレッドで実行し、
+        ターゲット生成（LLM 呼び出し）だけをイベントループ上で待つ。
+        """
+        if self._async_generator is None:
+            return await asyncio.to_thread(self.execute, input_dto)
+
+        ctx = await asyncio.to_thread(self._build_context, input_dto)
+        gen_result = await self._async_generator.generate(ctx)
+        return await asyncio.to_thread(
+            self._save_target, input_dto, ctx.user_id, gen_result
+        )
+
+    def _build_context(
+        self,
+        input_dto: CreateTargetInputDTO,
+    ) -> TargetGenerationContext:
         user_id = UserId(input_dto.user_id)
 
+        # --- 1. 読み取りフェーズ: 上限チェック（5個まで） -------------
         with self._uow as uow:
-            # --- 1. 上限チェック（5個まで） ---------------------------
-            existing_targets = uow.target_repo.list_by_user(
-                user_id=user_id,
-                limit=MAX_TARGETS_PER_USER + 1,
-            )
-            if len(existing_targets) >= MAX_TARGETS_PER_USER:
-                raise TargetLimitExceededError(
-                    f"User already has {MAX_TARGETS_PER_USER} targets."
-                )
-
-            # --- 2. プロフィール取得 -----------------------------------
-            profile: ProfileForTarget | None = self._profile_query.get_profile_for_target(
-                user_id
+            self._ensure_within_limit(uow, user_id)
+
+        # --- 2. プロフィール取得 ---------------------------------------
+        profile: ProfileForTarget | None = self._profile_query.get_profile_for_target(
+            user_id
+        )
+        if profile is None:
+            raise TargetProfileNotFoundError(
+                f"Profile not found for user {user_id}."
             )
-            if profile is None:
-                raise TargetProfileNotFoundError(
-                    f"Profile not found for user {user_id}."
-                )
 
-            # --- 3. ターゲット生成（LLM or Stub） ----------------------
-            ctx = TargetGenerationContext(
-                user_id=user_id,
-                sex=profile.sex,
-                birthdate=profile.birthdate,
-                height_cm=profile.height_cm,
-                weight_kg=profile.weight_kg,
-                goal_type=GoalType(input_dto.goal_type),
-                activity_level=ActivityLevel(input_dto.activity_level),
+        # --- 3. ターゲット生成の入力 -----------------------------------
+        ctx = TargetGenerationContext(
+            user_id=user_id,
+            sex=profile.sex,
+            birthdate=profile.birthdate,
+            height_cm=profile.height_cm,
+            weight_kg=profile.weight_kg,
+            goal_type=GoalType(input_dto.goal_type),
+            activity_level=ActivityLevel(input_dto.activity_level),
+        )
+        return ctx
+
+    def _save_target(
+        self,
+        input_dto: CreateTargetInputDTO,
+        user_id: UserId,
+        gen_result: TargetGenerationResult,
+    ) -> TargetDTO:
+        # ここで「10 栄養素そろっているか」を検査
+        present = {n.code for n in gen_result.nutrients}
+        missing = [
+            code for code in ALL_NUTRIENT_CODES if code not in present]
+        if missing:
+            codes_str = ", ".join(c.value for c in missing)
+            raise TargetGenerationFailedError(
+                f"TargetGenerator returned nutrients missing codes: {codes_str}"
             )
-            gen_result: TargetGenerationResult = self._generator.generate(ctx)
-
-            # ここで「10 栄養素そろっているか」を検査
-            present = {n.code for n in gen_result.nutrients}
-            missing = [
-                code for code in ALL_NUTRIENT_CODES if code not in present]
-            if missing:
-                codes_str = ", ".join(c.value for c in missing)
-                raise TargetGenerationFailedError(
-                    f"TargetGenerator returned nutrients missing codes: {codes_str}"
-                )
+
+        # --- 4. 書き込みフェーズ ---------------------------------------
+        with self._uow as uow:
+            # LLM 呼び出し中に別リクエストで作成されている可能性があるので再チェック
+            self._ensure_within_limit(uow, user_id)
 
             # 既にアクティブなターゲットがなければ、このターゲットを is_active=True に
             already_active = uow.target_repo.get_active(user_id)
             is_active = already_active is None
 
-            # --- 4. TargetDefinition を組み立て -----------------------
             now = self._clock.now()
             target = TargetDefinition(
                 id=TargetId(str(uuid4())),
@@ -126,7 +162,18 @@ class CreateTargetUseCase:
 
             uow.target_repo.add(target)
 
-            return _to_dto(target)
+        return _to_dto(target)
+
+    @staticmethod
+    def _ensure_within_limit(uow: TargetUnitOfWorkPort, user_id: UserId) -> None:
+        existing_targets = uow.target_repo.list_by_user(
+            user_id=user_id,
+            limit=MAX_TARGETS_PER_USER + 1,
+        )
+        if len(existing_targets) >= MAX_TARGETS_PER_USER:
+            raise TargetLimitExceededError(
+                f"User already has {MAX_TARGETS_PER_USER} targets."
+            )
 
 
 # === Domain -> DTO 変換ヘルパー ============================================
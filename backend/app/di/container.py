@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 # === Standard library =======================================================
+from datetime import date as DateType
+from datetime import timedelta
 from typing import Callable, TypeVar, cast
 
 # === Third-party ============================================================
@@ -10,13 +12,29 @@ from sqlalchemy.orm import Session
 
 # === Core settings / infra ==================================================
 from app.settings import settings
+from app.infra.db.async_session import has_async_engine
 from app.infra.db.session import create_session
+from app.infra.db.request_scope import release_connections_before_calls
+from app.infra.db.uow.sqlalchemy_base import SqlAlchemyUnitOfWorkBase
+from app.infra.llm.concurrency_limiter import OpenAICallLimiter
+from app.infra.llm.daily_report_output_cache import (
+    SqlAlchemyDailyReportOutputCacheStore,
+)
+from app.infra.llm.single_flight import (
+    AsyncSingleFlightDailyReportGenerator,
+    AsyncSingleFlightNutritionEstimator,
+    PostgresAdvisoryLock,
+    SingleFlight,
+    SingleFlightDailyReportGenerator,
+    SingleFlightNutritionEstimator,
+)
 from app.infra.time.system_clock import SystemClock
 
 # === Auth ===================================================================
 # Ports
 from app.application.auth.ports.clock_port import ClockPort
 from app.application.auth.ports.password_hasher_port import PasswordHasherPort
+from app.application.auth.ports.principal_cache_port import PrincipalCachePort
 from app.application.auth.ports.token_service_port import TokenServicePort
 from app.application.auth.ports.uow_port import AuthUnitOfWorkPort
 
@@ -30,7 +48,8 @@ from app.application.auth.use_cases.session.login_user import LoginUserUseCase
 from app.application.auth.use_cases.session.logout_user import LogoutUserUseCase
 from app.application.auth.use_cases.session.refresh_token import RefreshTokenUseCase
 
-# Infra (repo / security / uow)
+# Infra (repo / security / uow / cache)
+from app.infra.auth.principal_cache import InMemoryPrincipalCache
 from app.infra.db.uow.auth import SqlAlchemyAuthUnitOfWork
 from app.infra.security.jwt_token_service import JwtTokenService
 from app.infra.security.password_hasher import BcryptPasswordHasher
@@ -38,8 +57,12 @@ from app.infra.security.password_hasher import BcryptPasswordHasher
 # === Auth: PlanChecker ======================================================
 # Ports
 from app.application.auth.ports.plan_checker_port import PlanCheckerPort
+from app.application.auth.ports.plan_entitlement_cache_port import (
+    PlanEntitlementCachePort,
+)
 # Infra
 from app.infra.auth.plan_checker_service import PlanCheckerService
+from app.infra.auth.plan_entitlement_cache import InMemoryPlanEntitlementCache
 
 # === Profile ================================================================
 # Ports
@@ -47,21 +70,34 @@ from app.application.profile.ports.profile_image_storage_port import (
     ProfileImageStoragePort,
 )
 from app.application.profile.ports.uow_port import ProfileUnitOfWorkPort
+from app.application.profile.ports.profile_image_processor_port import (
+    ProfileImageProcessorPort,
+)
 from app.application.profile.ports.profile_query_port import ProfileQueryPort
 
 # Use cases
 from app.application.profile.use_cases.get_my_profile import GetMyProfileUseCase
 from app.application.profile.use_cases.upsert_profile import UpsertProfileUseCase
+from app.application.profile.use_cases.create_profile_image_upload import (
+    CreateProfileImageUploadUseCase,
+)
+from app.application.profile.use_cases.confirm_profile_image_upload import (
+    ConfirmProfileImageUploadUseCase,
+)
 
 # Infra (repo / uow / storage / query service)
 from app.infra.db.uow.profile import SqlAlchemyProfileUnitOfWork
 from app.infra.profile.profile_query_service import ProfileQueryService
 from app.infra.storage.minio_profile_image_storage import MinioProfileImageStorage
 from app.infra.storage.profile_image_storage import InMemoryProfileImageStorage
+from app.infra.storage.profile_image_thumbnails import ProcessPoolProfileImageProcessor
 
 # === Target ================================================================
 # Ports
-from app.application.target.ports.target_generator_port import TargetGeneratorPort
+from app.application.target.ports.target_generator_port import (
+    AsyncTargetGeneratorPort,
+    TargetGeneratorPort,
+)
 from app.application.target.ports.uow_port import TargetUnitOfWorkPort
 
 # Use cases
@@ -79,6 +115,7 @@ from app.application.target.use_cases.delete_target import DeleteTargetUseCase
 # Infra (repo / uow / llm)
 from app.infra.db.uow.target import SqlAlchemyTargetUnitOfWork
 from app.infra.llm.target_generator_openai import (
+    AsyncOpenAITargetGenerator,
     OpenAITargetGenerator,
     OpenAITargetGeneratorConfig,
 )
@@ -105,19 +142,33 @@ from app.infra.meal.meal_entry_query_service import MealEntryQueryService
 
 # === Nutrition ==============================================================
 # Ports
-from app.application.nutrition.ports.uow_port import NutritionUnitOfWorkPort
+from app.application.nutrition.ports.uow_port import (
+    AsyncNutritionReadUnitOfWorkPort,
+    NutritionUnitOfWorkPort,
+)
 from app.application.nutrition.ports.meal_entry_query_port import MealEntryQueryPort
+from app.application.nutrition.ports.daily_recompute_scheduler_port import (
+    DailyNutritionRecomputeSchedulerPort,
+    MealSlot,
+)
+from app.domain.auth.value_objects import UserId
 from app.application.nutrition.ports.daily_report_generator_port import (
+    AsyncDailyNutritionReportGeneratorPort,
     DailyNutritionReportGeneratorPort,
 )
-from app.application.nutrition.ports.nutrition_estimator_port import NutritionEstimatorPort
+from app.application.nutrition.ports.nutrition_estimator_port import (
+    AsyncNutritionEstimatorPort,
+    NutritionEstimatorPort,
+)
 from app.application.nutrition.ports.recommendation_generator_port import (
+    AsyncMealRecommendationGeneratorPort,
     MealRecommendationGeneratorPort,
 )
 
 # Use cases
 from app.application.nutrition.use_cases.compute_daily_nutrition import (
     ComputeDailyNutritionSummaryUseCase,
+    RebuildDailyNutritionSummariesUseCase,
 )
 from app.application.nutrition.use_cases.compute_meal_nutrition import (
     ComputeMealNutritionUseCase,
@@ -138,11 +189,29 @@ from app.application.nutrition.use_cases.get_daily_nutrition import (
 # infra (estimators / llm)
 from app.infra.nutrition.estimator_stub import StubNutritionEstimator
 from app.infra.llm.estimator_openai import (
+    PROMPT_VERSION as NUTRITION_ESTIMATOR_PROMPT_VERSION,
+    AsyncOpenAINutritionEstimator,
     OpenAINutritionEstimator,
     OpenAINutritionEstimatorConfig,
 )
+from app.infra.llm.food_item_estimator_openai import (
+    ITEM_PROMPT_VERSION as NUTRITION_ITEM_PROMPT_VERSION,
+    OpenAIFoodItemNutrientEstimator,
+)
+from app.infra.nutrition.caching_estimator import (
+    AsyncCachingNutritionEstimator,
+    CachingNutritionEstimator,
+)
+from app.infra.nutrition.food_item_vectors import SqlAlchemyFoodItemVectorStore
+from app.infra.nutrition.item_vector_estimator import ItemVectorNutritionEstimator
+from app.infra.nutrition.estimate_cache import SqlAlchemyNutritionEstimateCacheStore
+from app.infra.nutrition.daily_recompute_scheduler import (
+    DebouncedDailyNutritionRecomputeScheduler,
+)
+from app.infra.cache.lru_ttl_cache import LruTtlCache
 
 from app.infra.llm.daily_report_generator_openai import (
+    AsyncOpenAIDailyNutritionReportGenerator,
     OpenAIDailyNutritionReportGenerator,
     OpenAIDailyReportGeneratorConfig,
 )
@@ -160,22 +229,32 @@ from app.application.nutrition.use_cases.list_meal_recommendations import (
 )
 from app.infra.llm.stub_recommendation_generator import StubMealRecommendationGenerator
 from app.infra.llm.meal_recommendation_generator_openai import (
+    AsyncOpenAIMealRecommendationGenerator,
     OpenAIMealRecommendationGenerator,
     OpenAIMealRecommendationGeneratorConfig,
 )
 
 # Infra (repos)
-from app.infra.db.uow.nutrition import SqlAlchemyNutritionUnitOfWork
+from app.infra.db.uow.nutrition import (
+    AsyncSqlAlchemyNutritionReadUnitOfWork,
+    SqlAlchemyNutritionUnitOfWork,
+)
 
 # === Calendar ================================================================
 # Ports
-from app.application.calendar.ports.calendar_unit_of_work_port import CalendarUnitOfWorkPort
+from app.application.calendar.ports.calendar_unit_of_work_port import (
+    AsyncCalendarUnitOfWorkPort,
+    CalendarUnitOfWorkPort,
+)
 
 # Use cases
 from app.application.calendar.use_cases.get_monthly_calendar import GetMonthlyCalendarUseCase
 
 # Infra (uow)
-from app.infra.db.uow.calendar import SqlAlchemyCalendarUnitOfWork
+from app.infra.db.uow.calendar import (
+    AsyncSqlAlchemyCalendarUnitOfWork,
+    SqlAlchemyCalendarUnitOfWork,
+)
 
 # === Billing ================================================================
 # Ports
@@ -208,6 +287,16 @@ from app.application.tutorial.use_cases.complete_tutorial import CompleteTutoria
 # Infra (repository)
 from app.infra.db.uow.tutorial import SqlAlchemyTutorialUnitOfWork
 
+# === Day ====================================================================
+# Ports
+from app.application.day.ports.uow_port import DayReadUnitOfWorkPort
+
+# Use cases
+from app.application.day.use_cases.get_day_overview import GetDayOverviewUseCase
+
+# Infra (uow)
+from app.infra.db.uow.day import SqlAlchemyDayReadUnitOfWork
+
 
 # =============================================================================
 # Helpers
@@ -226,6 +315,28 @@ def _resolve_dep(value: object, fallback_factory: Callable[[], T]) -> T:
     return cast(T, value)
 
 
+def _as_read_only(uow: T) -> T:
+    """
+    参照系ユースケース用に、UoW を読み取り専用（レプリカ向け）にしたものを返す。
+    SQLAlchemy 以外の UoW（テストの Fake など）はそのまま返す。
+    """
+    if isinstance(uow, SqlAlchemyUnitOfWorkBase):
+        return uow.as_read_only()
+    return uow
+
+
+def _async_uow_for(sync_uow: object, async_uow: T | None) -> T | None:
+    """
+    async ルート用の UoW を使うかどうか。
+
+    同期 UoW がテストの Fake などに差し替えられているときは使わない
+    （ユースケースは同期 UoW をスレッドで呼ぶ）。
+    """
+    if async_uow is None or not isinstance(sync_uow, SqlAlchemyUnitOfWorkBase):
+        return None
+    return async_uow
+
+
 
 # =============================================================================
 # Common / DB / Clock
@@ -239,6 +350,54 @@ def get_clock() -> ClockPort:
     return SystemClock()
 
 
+_openai_call_limiter_singleton: OpenAICallLimiter | None = None
+
+
+def get_openai_call_limiter() -> OpenAICallLimiter:
+    """
+    OpenAI アダプタ（同期 / async）が共有する、プロセス全体の同時実行数 / RPM リミッタ。
+    キュー待ち時間などは stats() で取得できる。
+    """
+    global _openai_call_limiter_singleton
+    if _openai_call_limiter_singleton is None:
+        _openai_call_limiter_singleton = OpenAICallLimiter(
+            max_concurrency=settings.OPENAI_MAX_CONCURRENCY,
+            requests_per_minute=settings.OPENAI_REQUESTS_PER_MINUTE,
+        )
+    return _openai_call_limiter_singleton
+
+
+_llm_single_flight_singleton: SingleFlight | None = None
+
+
+def get_llm_single_flight() -> SingleFlight:
+    """
+    栄養推定 / 日次レポートの同一呼び出しをまとめる single-flight（プロセス共有）。
+    """
+    global _llm_single_flight_singleton
+    if _llm_single_flight_singleton is None:
+        lock = None
+        if settings.LLM_SINGLE_FLIGHT_ADVISORY_LOCK_ENABLED:
+            lock = PostgresAdvisoryLock(
+                session_factory=create_session,
+                timeout_seconds=settings.LLM_SINGLE_FLIGHT_LOCK_TIMEOUT_SECONDS,
+                poll_interval_seconds=settings.LLM_SINGLE_FLIGHT_LOCK_POLL_SECONDS,
+            )
+        _llm_single_flight_singleton = SingleFlight(cross_process_lock=lock)
+    return _llm_single_flight_singleton
+
+
+def _build_daily_report_output_cache() -> SqlAlchemyDailyReportOutputCacheStore | None:
+    # 出力の共有はワーカー間の直列化（advisory lock）を有効にしたときだけ意味がある
+    if not settings.LLM_SINGLE_FLIGHT_ADVISORY_LOCK_ENABLED:
+        return None
+    return SqlAlchemyDailyReportOutputCacheStore(
+        session_factory=create_session,
+        clock=SystemClock(),
+        ttl_seconds=settings.LLM_SINGLE_FLIGHT_REPORT_OUTPUT_TTL_SECONDS,
+    )
+
+
 # =============================================================================
 # Auth
 # =============================================================================
@@ -247,6 +406,20 @@ def get_auth_uow() -> AuthUnitOfWorkPort:
     return SqlAlchemyAuthUnitOfWork()
 
 
+_principal_cache_singleton: PrincipalCachePort | None = None
+
+
+def get_principal_cache() -> PrincipalCachePort:
+    # リクエスト間で共有するため singleton（DB/UoW は抱えない）
+    global _principal_cache_singleton
+    if _principal_cache_singleton is None:
+        _principal_cache_singleton = InMemoryPrincipalCache(
+            ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+            max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+        )
+    return _principal_cache_singleton
+
+
 def get_password_hasher() -> PasswordHasherPort:
     return BcryptPasswordHasher()
 
@@ -290,20 +463,45 @@ def get_login_user_use_case(
     )
 
 
-def get_logout_user_use_case() -> LogoutUserUseCase:
-    return LogoutUserUseCase()
+def get_logout_user_use_case(
+    principal_cache: PrincipalCachePort = Depends(get_principal_cache),
+) -> LogoutUserUseCase:
+    principal_cache = _resolve_dep(principal_cache, get_principal_cache)
+    return LogoutUserUseCase(principal_cache=principal_cache)
+
+
+_plan_entitlement_cache_singleton: PlanEntitlementCachePort | None = None
+
+
+def get_plan_entitlement_cache() -> PlanEntitlementCachePort:
+    # リクエスト間で共有するため singleton（DB/UoW は抱えない）
+    global _plan_entitlement_cache_singleton
+    if _plan_entitlement_cache_singleton is None:
+        _plan_entitlement_cache_singleton = InMemoryPlanEntitlementCache(
+            ttl_seconds=settings.PLAN_ENTITLEMENT_CACHE_TTL_SECONDS,
+            max_size=settings.PLAN_ENTITLEMENT_CACHE_MAX_SIZE,
+        )
+    return _plan_entitlement_cache_singleton
 
 
 def get_delete_account_use_case(
     uow: AuthUnitOfWorkPort = Depends(get_auth_uow),
     clock: ClockPort = Depends(get_clock),
+    principal_cache: PrincipalCachePort = Depends(get_principal_cache),
+    entitlement_cache: PlanEntitlementCachePort = Depends(
+        get_plan_entitlement_cache),
 ) -> DeleteAccountUseCase:
     uow = _resolve_dep(uow, get_auth_uow)
     clock = _resolve_dep(clock, get_clock)
+    principal_cache = _resolve_dep(principal_cache, get_principal_cache)
+    entitlement_cache = _resolve_dep(
+        entitlement_cache, get_plan_entitlement_cache)
 
     return DeleteAccountUseCase(
         uow=uow,
         clock=clock,
+        principal_cache=principal_cache,
+        entitlement_cache=entitlement_cache,
     )
 
 
@@ -322,22 +520,29 @@ def get_refresh_token_use_case(
 
 def get_current_user_use_case(
     uow: AuthUnitOfWorkPort = Depends(get_auth_uow),
+    principal_cache: PrincipalCachePort = Depends(get_principal_cache),
 ) -> GetCurrentUserUseCase:
     uow = _resolve_dep(uow, get_auth_uow)
-    return GetCurrentUserUseCase(uow=uow)
+    principal_cache = _resolve_dep(principal_cache, get_principal_cache)
+    return GetCurrentUserUseCase(uow=uow, principal_cache=principal_cache)
 
 
 # ✅ UoW を抱える singleton は廃止（毎回生成）
 def get_plan_checker(
     auth_uow: AuthUnitOfWorkPort = Depends(get_auth_uow),
     clock: ClockPort = Depends(get_clock),
+    entitlement_cache: PlanEntitlementCachePort = Depends(
+        get_plan_entitlement_cache),
 ) -> PlanCheckerPort:
     auth_uow = _resolve_dep(auth_uow, get_auth_uow)
     clock = _resolve_dep(clock, get_clock)
+    entitlement_cache = _resolve_dep(
+        entitlement_cache, get_plan_entitlement_cache)
 
     return PlanCheckerService(
         auth_uow=auth_uow,
         clock=clock,
+        entitlement_cache=entitlement_cache,
     )
 
 
@@ -358,29 +563,103 @@ def get_profile_image_storage() -> ProfileImageStoragePort:
     return _profile_image_storage_singleton
 
 
+def start_profile_image_storage_warmup() -> None:
+    """
+    起動時に呼ぶ。ストレージを作ってバケット確認をバックグラウンドで始める（待たない）。
+    """
+    if not settings.USE_FAKE_INFRA:
+        get_profile_image_storage()
+
+
 def get_profile_uow() -> ProfileUnitOfWorkPort:
     return SqlAlchemyProfileUnitOfWork()
 
 
+_profile_image_processor_singleton: ProcessPoolProfileImageProcessor | None = None
+
+
+def get_profile_image_processor() -> ProfileImageProcessorPort | None:
+    """
+    サムネイル生成（プロセスプール）。Fake インフラ / WORKERS=0 では生成しない（None）。
+    """
+    global _profile_image_processor_singleton
+    if settings.USE_FAKE_INFRA or settings.PROFILE_IMAGE_THUMBNAIL_WORKERS <= 0:
+        return None
+    if _profile_image_processor_singleton is None:
+        _profile_image_processor_singleton = ProcessPoolProfileImageProcessor(
+            image_storage=get_profile_image_storage(),
+            uow_factory=SqlAlchemyProfileUnitOfWork,
+            sizes=settings.PROFILE_IMAGE_THUMBNAIL_SIZES,
+            max_workers=settings.PROFILE_IMAGE_THUMBNAIL_WORKERS,
+        )
+    return _profile_image_processor_singleton
+
+
+def shutdown_profile_image_processor() -> None:
+    """アプリ終了時にサムネイル生成のプールを止める。"""
+    global _profile_image_processor_singleton
+    processor, _profile_image_processor_singleton = (
+        _profile_image_processor_singleton, None)
+    if processor is not None:
+        processor.shutdown()
+
+
 def get_upsert_profile_use_case(
     uow: ProfileUnitOfWorkPort = Depends(get_profile_uow),
     image_storage: ProfileImageStoragePort = Depends(
         get_profile_image_storage),
+    image_processor: ProfileImageProcessorPort | None = Depends(
+        get_profile_image_processor),
 ) -> UpsertProfileUseCase:
     uow = _resolve_dep(uow, get_profile_uow)
     image_storage = _resolve_dep(image_storage, get_profile_image_storage)
+    image_processor = _resolve_dep(image_processor, get_profile_image_processor)
 
     return UpsertProfileUseCase(
         uow=uow,
         image_storage=image_storage,
+        image_processor=image_processor,
     )
 
 
 def get_my_profile_use_case(
     uow: ProfileUnitOfWorkPort = Depends(get_profile_uow),
+    image_storage: ProfileImageStoragePort = Depends(
+        get_profile_image_storage),
 ) -> GetMyProfileUseCase:
     uow = _resolve_dep(uow, get_profile_uow)
-    return GetMyProfileUseCase(uow=uow)
+    image_storage = _resolve_dep(image_storage, get_profile_image_storage)
+    return GetMyProfileUseCase(uow=uow, image_storage=image_storage)
+
+
+def get_create_profile_image_upload_use_case(
+    image_storage: ProfileImageStoragePort = Depends(
+        get_profile_image_storage),
+) -> CreateProfileImageUploadUseCase:
+    image_storage = _resolve_dep(image_storage, get_profile_image_storage)
+    return CreateProfileImageUploadUseCase(
+        image_storage=image_storage,
+        upload_ttl=timedelta(
+            seconds=settings.PROFILE_IMAGE_UPLOAD_URL_TTL_SECONDS),
+    )
+
+
+def get_confirm_profile_image_upload_use_case(
+    uow: ProfileUnitOfWorkPort = Depends(get_profile_uow),
+    image_storage: ProfileImageStoragePort = Depends(
+        get_profile_image_storage),
+    image_processor: ProfileImageProcessorPort | None = Depends(
+        get_profile_image_processor),
+) -> ConfirmProfileImageUploadUseCase:
+    uow = _resolve_dep(uow, get_profile_uow)
+    image_storage = _resolve_dep(image_storage, get_profile_image_storage)
+    image_processor = _resolve_dep(image_processor, get_profile_image_processor)
+    return ConfirmProfileImageUploadUseCase(
+        uow=uow,
+        image_storage=image_storage,
+        max_bytes=settings.PROFILE_IMAGE_MAX_BYTES,
+        image_processor=image_processor,
+    )
 
 
 def get_profile_query_service(
@@ -412,21 +691,48 @@ def get_target_generator() -> TargetGeneratorPort:
                 config=OpenAITargetGeneratorConfig(
                     model=settings.OPENAI_TARGET_MODEL,
                     temperature=settings.OPENAI_TARGET_TEMPERATURE,
-                )
+                ),
+                limiter=get_openai_call_limiter(),
             )
         else:
             _target_generator_singleton = StubTargetGenerator()
     return _target_generator_singleton
 
 
+_async_target_generator_singleton: AsyncTargetGeneratorPort | None = None
+
+
+def get_async_target_generator() -> AsyncTargetGeneratorPort | None:
+    """
+    async ルート用。OpenAI 実装のときだけ返す（Stub は None = スレッドで同期版を呼ぶ）。
+    """
+    global _async_target_generator_singleton
+    if _async_target_generator_singleton is None and settings.USE_OPENAI_TARGET_GENERATOR:
+        _async_target_generator_singleton = AsyncOpenAITargetGenerator(
+            config=OpenAITargetGeneratorConfig(
+                model=settings.OPENAI_TARGET_MODEL,
+                temperature=settings.OPENAI_TARGET_TEMPERATURE,
+            ),
+            limiter=get_openai_call_limiter(),
+        )
+    return _async_target_generator_singleton
+
+
 def get_create_target_use_case(
     uow: TargetUnitOfWorkPort = Depends(get_target_uow),
     generator: TargetGeneratorPort = Depends(get_target_generator),
     profile_query: ProfileQueryPort = Depends(get_profile_query_service),
     clock: ClockPort = Depends(get_clock),
+    async_generator: AsyncTargetGeneratorPort | None = Depends(
+        get_async_target_generator),
 ) -> CreateTargetUseCase:
     uow = _resolve_dep(uow, get_target_uow)
     generator = _resolve_dep(generator, get_target_generator)
+    # LLM 呼び出し中はリクエスト共有の DB 接続を握らない
+    generator = release_connections_before_calls(generator)
+    async_generator = _resolve_dep(async_generator, get_async_target_generator)
+    if async_generator is not None:
+        async_generator = release_connections_before_calls(async_generator)
     profile_query = _resolve_dep(profile_query, get_profile_query_service)
     clock = _resolve_dep(clock, get_clock)
 
@@ -435,6 +741,7 @@ def get_create_target_use_case(
         generator=generator,
         profile_query=profile_query,
         clock=clock,
+        async_generator=async_generator,
     )
 
 
@@ -448,7 +755,7 @@ def get_get_active_target_use_case(
 def get_list_targets_use_case(
     uow: TargetUnitOfWorkPort = Depends(get_target_uow),
 ) -> ListTargetsUseCase:
-    uow = _resolve_dep(uow, get_target_uow)
+    uow = _as_read_only(_resolve_dep(uow, get_target_uow))
     return ListTargetsUseCase(uow=uow)
 
 
@@ -511,7 +818,7 @@ def get_delete_food_entry_use_case(
 def get_list_food_entries_by_date_use_case(
     meal_uow: MealUnitOfWorkPort = Depends(get_meal_uow),
 ) -> ListFoodEntriesByDateUseCase:
-    meal_uow = _resolve_dep(meal_uow, get_meal_uow)
+    meal_uow = _as_read_only(_resolve_dep(meal_uow, get_meal_uow))
     return ListFoodEntriesByDateUseCase(meal_uow=meal_uow)
 
 
@@ -529,38 +836,164 @@ def get_nutrition_uow() -> NutritionUnitOfWorkPort:
     return SqlAlchemyNutritionUnitOfWork()
 
 
+def get_async_nutrition_read_uow() -> AsyncNutritionReadUnitOfWorkPort | None:
+    """
+    async ルート用。ASYNC_DATABASE_URL があるときだけ返す
+    （None = スレッドで同期版を呼ぶ）。
+    """
+    if not has_async_engine():
+        return None
+    return AsyncSqlAlchemyNutritionReadUnitOfWork()
+
+
 _nutrition_estimator_singleton: NutritionEstimatorPort | None = None
+_caching_nutrition_estimator_singleton: CachingNutritionEstimator | None = None
+
+
+def _build_item_vector_nutrition_estimator(
+    config: OpenAINutritionEstimatorConfig,
+) -> ItemVectorNutritionEstimator:
+    item_estimator = OpenAIFoodItemNutrientEstimator(
+        config=config, limiter=get_openai_call_limiter())
+    persistent_store = None
+    if settings.NUTRITION_ESTIMATE_CACHE_DB_ENABLED:
+        persistent_store = SqlAlchemyFoodItemVectorStore(
+            session_factory=create_session,
+            clock=SystemClock(),
+            model=item_estimator.model,
+            prompt_version=item_estimator.prompt_version,
+        )
+    return ItemVectorNutritionEstimator(
+        item_estimator,
+        memory_cache=LruTtlCache(
+            ttl_seconds=settings.NUTRITION_ITEM_VECTOR_MEMORY_TTL_SECONDS,
+            max_size=settings.NUTRITION_ITEM_VECTOR_MEMORY_MAX_SIZE,
+        ),
+        persistent_store=persistent_store,
+    )
+
+
+def _build_caching_nutrition_estimator(
+    inner: NutritionEstimatorPort,
+    prompt_version: str,
+) -> CachingNutritionEstimator:
+    persistent_store = None
+    if settings.NUTRITION_ESTIMATE_CACHE_DB_ENABLED:
+        persistent_store = SqlAlchemyNutritionEstimateCacheStore(
+            session_factory=create_session,
+            clock=SystemClock(),
+            ttl_days=settings.NUTRITION_ESTIMATE_CACHE_DB_TTL_DAYS,
+            max_rows=settings.NUTRITION_ESTIMATE_CACHE_DB_MAX_ROWS,
+        )
+    return CachingNutritionEstimator(
+        inner,
+        model=settings.OPENAI_NUTRITION_MODEL,
+        prompt_version=prompt_version,
+        memory_cache=LruTtlCache(
+            ttl_seconds=settings.NUTRITION_ESTIMATE_CACHE_MEMORY_TTL_SECONDS,
+            max_size=settings.NUTRITION_ESTIMATE_CACHE_MEMORY_MAX_SIZE,
+        ),
+        persistent_store=persistent_store,
+    )
 
 
 def get_nutrition_estimator() -> NutritionEstimatorPort:
     """
     ✅ env フラグは「初回呼び出し時」に読む
     """
-    global _nutrition_estimator_singleton
+    global _nutrition_estimator_singleton, _caching_nutrition_estimator_singleton
     if _nutrition_estimator_singleton is None:
         if settings.USE_OPENAI_NUTRITION_ESTIMATOR:
-            _nutrition_estimator_singleton = OpenAINutritionEstimator(
-                config=OpenAINutritionEstimatorConfig(
-                    model=settings.OPENAI_NUTRITION_MODEL,
-                    temperature=settings.OPENAI_NUTRITION_TEMPERATURE,
-                )
+            config = OpenAINutritionEstimatorConfig(
+                model=settings.OPENAI_NUTRITION_MODEL,
+                temperature=settings.OPENAI_NUTRITION_TEMPERATURE,
             )
+            estimator: NutritionEstimatorPort
+            if settings.NUTRITION_ITEM_VECTOR_STORE_ENABLED:
+                estimator = _build_item_vector_nutrition_estimator(config)
+                prompt_version = NUTRITION_ITEM_PROMPT_VERSION
+            else:
+                estimator = OpenAINutritionEstimator(
+                    config=config, limiter=get_openai_call_limiter())
+                prompt_version = NUTRITION_ESTIMATOR_PROMPT_VERSION
+            if settings.NUTRITION_ESTIMATE_CACHE_ENABLED:
+                estimator = _build_caching_nutrition_estimator(
+                    estimator, prompt_version)
+                _caching_nutrition_estimator_singleton = estimator
+            _nutrition_estimator_singleton = estimator
         else:
             _nutrition_estimator_singleton = StubNutritionEstimator()
+
+        if settings.USE_OFFLINE_NUTRITION_ESTIMATOR:
+            # numpy を使うので、オフライン推定を有効にしたときだけ import する
+            from app.infra.nutrition.estimator_offline import OfflineNutritionEstimator
+            from app.infra.nutrition.food_composition import FoodCompositionTable
+
+            _nutrition_estimator_singleton = OfflineNutritionEstimator(
+                FoodCompositionTable.from_csv(),
+                min_score=settings.OFFLINE_NUTRITION_MIN_MATCH_SCORE,
+                fallback=_nutrition_estimator_singleton,
+            )
+
+        if settings.LLM_SINGLE_FLIGHT_ENABLED:
+            _nutrition_estimator_singleton = SingleFlightNutritionEstimator(
+                _nutrition_estimator_singleton, get_llm_single_flight())
     return _nutrition_estimator_singleton
 
 
+_async_nutrition_estimator_singleton: AsyncNutritionEstimatorPort | None = None
+
+
+def get_async_nutrition_estimator() -> AsyncNutritionEstimatorPort | None:
+    """
+    async ルート用。OpenAI 直呼び（+ 推定キャッシュ）の構成のときだけ返す。
+
+    品目ベクトル / オフライン推定は同期の合成なので None を返し、
+    ユースケース側で同期版をスレッド実行させる。
+    """
+    global _async_nutrition_estimator_singleton
+    if (
+        _async_nutrition_estimator_singleton is None
+        and settings.USE_OPENAI_NUTRITION_ESTIMATOR
+        and not settings.NUTRITION_ITEM_VECTOR_STORE_ENABLED
+        and not settings.USE_OFFLINE_NUTRITION_ESTIMATOR
+    ):
+        estimator: AsyncNutritionEstimatorPort = AsyncOpenAINutritionEstimator(
+            config=OpenAINutritionEstimatorConfig(
+                model=settings.OPENAI_NUTRITION_MODEL,
+                temperature=settings.OPENAI_NUTRITION_TEMPERATURE,
+            ),
+            limiter=get_openai_call_limiter(),
+        )
+        get_nutrition_estimator()
+        if _caching_nutrition_estimator_singleton is not None:
+            # 同期版（バッチ等）とキャッシュ / 統計を共有する
+            estimator = AsyncCachingNutritionEstimator(
+                _caching_nutrition_estimator_singleton, estimator)
+        if settings.LLM_SINGLE_FLIGHT_ENABLED:
+            estimator = AsyncSingleFlightNutritionEstimator(
+                estimator, get_llm_single_flight())
+        _async_nutrition_estimator_singleton = estimator
+    return _async_nutrition_estimator_singleton
+
+
 def get_compute_meal_nutrition_use_case(
     meal_entry_query_service: MealEntryQueryPort = Depends(
         get_meal_entry_query_service),
     nutrition_uow: NutritionUnitOfWorkPort = Depends(get_nutrition_uow),
     estimator: NutritionEstimatorPort = Depends(get_nutrition_estimator),
     plan_checker: PlanCheckerPort = Depends(get_plan_checker),
+    async_estimator: AsyncNutritionEstimatorPort | None = Depends(
+        get_async_nutrition_estimator),
 ) -> ComputeMealNutritionUseCase:
     meal_entry_query_service = _resolve_dep(
         meal_entry_query_service, get_meal_entry_query_service)
     nutrition_uow = _resolve_dep(nutrition_uow, get_nutrition_uow)
     estimator = _resolve_dep(estimator, get_nutrition_estimator)
+    estimator = release_connections_before_calls(estimator)
+    async_estimator = _resolve_dep(async_estimator, get_async_nutrition_estimator)
+    if async_estimator is not None:
+        async_estimator = release_connections_before_calls(async_estimator)
     plan_checker = _resolve_dep(plan_checker, get_plan_checker)
 
     return ComputeMealNutritionUseCase(
@@ -568,6 +1001,7 @@ def get_compute_meal_nutrition_use_case(
         nutrition_uow=nutrition_uow,
         estimator=estimator,
         plan_checker=plan_checker,
+        async_estimator=async_estimator,
     )
 
 
@@ -584,29 +1018,100 @@ def get_compute_daily_nutrition_summary_use_case(
     )
 
 
+_daily_recompute_scheduler_singleton: DebouncedDailyNutritionRecomputeScheduler | None = None
+
+
+def _recompute_meal_slots_in_background(
+    user_id: UserId,
+    date_: DateType,
+    slots: frozenset[MealSlot],
+) -> None:
+    # UoW はスレッドをまたいで使えないので、実行のたびに作る
+    get_compute_meal_nutrition_use_case().recompute_slots(user_id, date_, slots)
+
+
+def get_daily_nutrition_recompute_scheduler() -> DailyNutritionRecomputeSchedulerPort | None:
+    """
+    食事ログ編集後の栄養サマリ計算の遅延実行。
+    Fake インフラ / QUIET_SECONDS=0（既定）では使わない（None = リクエスト内で計算する）。
+    """
+    global _daily_recompute_scheduler_singleton
+    if settings.USE_FAKE_INFRA or settings.DAILY_RECOMPUTE_QUIET_SECONDS <= 0:
+        return None
+    if _daily_recompute_scheduler_singleton is None:
+        _daily_recompute_scheduler_singleton = DebouncedDailyNutritionRecomputeScheduler(
+            _recompute_meal_slots_in_background,
+            quiet_window=settings.DAILY_RECOMPUTE_QUIET_SECONDS,
+            max_delay=settings.DAILY_RECOMPUTE_MAX_DELAY_SECONDS,
+            max_workers=settings.DAILY_RECOMPUTE_WORKERS,
+        )
+    return _daily_recompute_scheduler_singleton
+
+
+def shutdown_daily_nutrition_recompute_scheduler() -> None:
+    """アプリ終了時に、待ち中の栄養サマリの計算を済ませてから止める。"""
+    global _daily_recompute_scheduler_singleton
+    scheduler, _daily_recompute_scheduler_singleton = (
+        _daily_recompute_scheduler_singleton, None)
+    if scheduler is not None:
+        scheduler.shutdown()
+
+
+def get_rebuild_daily_nutrition_summaries_use_case(
+    uow: NutritionUnitOfWorkPort = Depends(get_nutrition_uow),
+) -> RebuildDailyNutritionSummariesUseCase:
+    uow = _resolve_dep(uow, get_nutrition_uow)
+
+    return RebuildDailyNutritionSummariesUseCase(uow=uow)
+
+
 def get_get_meal_nutrition_use_case(
     nutrition_uow: NutritionUnitOfWorkPort = Depends(get_nutrition_uow),
     plan_checker: PlanCheckerPort = Depends(get_plan_checker),
+    async_nutrition_uow: AsyncNutritionReadUnitOfWorkPort | None = Depends(
+        get_async_nutrition_read_uow),
+    recompute_scheduler: DailyNutritionRecomputeSchedulerPort | None = Depends(
+        get_daily_nutrition_recompute_scheduler),
 ) -> GetMealNutritionUseCase:
-    nutrition_uow = _resolve_dep(nutrition_uow, get_nutrition_uow)
+    nutrition_uow = _as_read_only(_resolve_dep(nutrition_uow, get_nutrition_uow))
     plan_checker = _resolve_dep(plan_checker, get_plan_checker)
+    async_nutrition_uow = _async_uow_for(
+        nutrition_uow,
+        _resolve_dep(async_nutrition_uow, get_async_nutrition_read_uow),
+    )
+    recompute_scheduler = _resolve_dep(
+        recompute_scheduler, get_daily_nutrition_recompute_scheduler)
 
     return GetMealNutritionUseCase(
         nutrition_uow=nutrition_uow,
         plan_checker=plan_checker,
+        async_nutrition_uow=async_nutrition_uow,
+        recompute_scheduler=recompute_scheduler,
     )
 
 
 def get_get_daily_nutrition_use_case(
     nutrition_uow: NutritionUnitOfWorkPort = Depends(get_nutrition_uow),
     plan_checker: PlanCheckerPort = Depends(get_plan_checker),
+    async_nutrition_uow: AsyncNutritionReadUnitOfWorkPort | None = Depends(
+        get_async_nutrition_read_uow),
+    recompute_scheduler: DailyNutritionRecomputeSchedulerPort | None = Depends(
+        get_daily_nutrition_recompute_scheduler),
 ) -> GetDailyNutritionUseCase:
-    nutrition_uow = _resolve_dep(nutrition_uow, get_nutrition_uow)
+    nutrition_uow = _as_read_only(_resolve_dep(nutrition_uow, get_nutrition_uow))
     plan_checker = _resolve_dep(plan_checker, get_plan_checker)
+    async_nutrition_uow = _async_uow_for(
+        nutrition_uow,
+        _resolve_dep(async_nutrition_uow, get_async_nutrition_read_uow),
+    )
+    recompute_scheduler = _resolve_dep(
+        recompute_scheduler, get_daily_nutrition_recompute_scheduler)
 
     return GetDailyNutritionUseCase(
         nutrition_uow=nutrition_uow,
         plan_checker=plan_checker,
+        async_nutrition_uow=async_nutrition_uow,
+        recompute_scheduler=recompute_scheduler,
     )
 
 
@@ -626,13 +1131,50 @@ def get_daily_nutrition_report_generator() -> DailyNutritionReportGeneratorPort:
                 config=OpenAIDailyReportGeneratorConfig(
                     model=model,
                     temperature=temperature,
-                )
+                ),
+                limiter=get_openai_call_limiter(),
             )
         else:
             _daily_report_generator_singleton = StubDailyNutritionReportGenerator()
+
+        if settings.LLM_SINGLE_FLIGHT_ENABLED:
+            _daily_report_generator_singleton = SingleFlightDailyReportGenerator(
+                _daily_report_generator_singleton,
+                get_llm_single_flight(),
+                output_cache=_build_daily_report_output_cache(),
+            )
     return _daily_report_generator_singleton
 
 
+_async_daily_report_generator_singleton: AsyncDailyNutritionReportGeneratorPort | None = None
+
+
+def get_async_daily_nutrition_report_generator() -> AsyncDailyNutritionReportGeneratorPort | None:
+    """
+    async ルート用。OpenAI 実装のときだけ返す（Stub は None）。
+    """
+    global _async_daily_report_generator_singleton
+    if (
+        _async_daily_report_generator_singleton is None
+        and settings.USE_OPENAI_DAILY_REPORT_GENERATOR
+    ):
+        generator: AsyncDailyNutritionReportGeneratorPort = AsyncOpenAIDailyNutritionReportGenerator(
+            config=OpenAIDailyReportGeneratorConfig(
+                model=settings.OPENAI_DAILY_REPORT_MODEL,
+                temperature=settings.OPENAI_DAILY_REPORT_TEMPERATURE,
+            ),
+            limiter=get_openai_call_limiter(),
+        )
+        if settings.LLM_SINGLE_FLIGHT_ENABLED:
+            generator = AsyncSingleFlightDailyReportGenerator(
+                generator,
+                get_llm_single_flight(),
+                output_cache=_build_daily_report_output_cache(),
+            )
+        _async_daily_report_generator_singleton = generator
+    return _async_daily_report_generator_singleton
+
+
 def get_check_daily_log_completion_use_case(
     profile_query: ProfileQueryPort = Depends(get_profile_query_service),
     meal_uow: MealUnitOfWorkPort = Depends(get_meal_uow),
@@ -665,6 +1207,8 @@ def get_generate_daily_nutrition_report_use_case(
     report_generator: DailyNutritionReportGeneratorPort = Depends(
         get_daily_nutrition_report_generator),
     clock: ClockPort = Depends(get_clock),
+    async_report_generator: AsyncDailyNutritionReportGeneratorPort | None = Depends(
+        get_async_daily_nutrition_report_generator),
 ) -> GenerateDailyNutritionReportUseCase:
     daily_log_uc = _resolve_dep(
         daily_log_uc, get_check_daily_log_completion_use_case)
@@ -676,6 +1220,12 @@ def get_generate_daily_nutrition_report_use_case(
     nutrition_uow = _resolve_dep(nutrition_uow, get_nutrition_uow)
     report_generator = _resolve_dep(
         report_generator, get_daily_nutrition_report_generator)
+    report_generator = release_connections_before_calls(report_generator)
+    async_report_generator = _resolve_dep(
+        async_report_generator, get_async_daily_nutrition_report_generator)
+    if async_report_generator is not None:
+        async_report_generator = release_connections_before_calls(
+            async_report_generator)
     clock = _resolve_dep(clock, get_clock)
 
     return GenerateDailyNutritionReportUseCase(
@@ -686,13 +1236,14 @@ def get_generate_daily_nutrition_report_use_case(
         nutrition_uow=nutrition_uow,
         report_generator=report_generator,
         clock=clock,
+        async_report_generator=async_report_generator,
     )
 
 
 def get_get_daily_nutrition_report_use_case(
     uow: NutritionUnitOfWorkPort = Depends(get_nutrition_uow),
 ) -> GetDailyNutritionReportUseCase:
-    uow = _resolve_dep(uow, get_nutrition_uow)
+    uow = _as_read_only(_resolve_dep(uow, get_nutrition_uow))
     return GetDailyNutritionReportUseCase(uow=uow)
 
 
@@ -715,13 +1266,36 @@ def get_meal_recommendation_generator() -> MealRecommendationGeneratorPort:
                 config=OpenAIMealRecommendationGeneratorConfig(
                     model=model,
                     temperature=temperature,
-                )
+                ),
+                limiter=get_openai_call_limiter(),
             )
         else:
             _recommendation_generator_singleton = StubMealRecommendationGenerator()
     return _recommendation_generator_singleton
 
 
+_async_recommendation_generator_singleton: AsyncMealRecommendationGeneratorPort | None = None
+
+
+def get_async_meal_recommendation_generator() -> AsyncMealRecommendationGeneratorPort | None:
+    """
+    async ルート用。OpenAI 実装のときだけ返す（Stub は None）。
+    """
+    global _async_recommendation_generator_singleton
+    if (
+        _async_recommendation_generator_singleton is None
+        and settings.USE_OPENAI_MEAL_RECOMMENDATION_GENERATOR
+    ):
+        _async_recommendation_generator_singleton = AsyncOpenAIMealRecommendationGenerator(
+            config=OpenAIMealRecommendationGeneratorConfig(
+                model=settings.OPENAI_MEAL_RECOMMENDATION_MODEL,
+                temperature=settings.OPENAI_MEAL_RECOMMENDATION_TEMPERATURE,
+            ),
+            limiter=get_openai_call_limiter(),
+        )
+    return _async_recommendation_generator_singleton
+
+
 def get_generate_meal_recommendation_use_case(
     profile_query: ProfileQueryPort = Depends(get_profile_query_service),
     nutrition_uow: NutritionUnitOfWorkPort = Depends(get_nutrition_uow),
@@ -729,10 +1303,17 @@ def get_generate_meal_recommendation_use_case(
         get_meal_recommendation_generator),
     clock: ClockPort = Depends(get_clock),
     plan_checker: PlanCheckerPort = Depends(get_plan_checker),
+    async_generator: AsyncMealRecommendationGeneratorPort | None = Depends(
+        get_async_meal_recommendation_generator),
 ) -> GenerateMealRecommendationUseCase:
     profile_query = _resolve_dep(profile_query, get_profile_query_service)
     nutrition_uow = _resolve_dep(nutrition_uow, get_nutrition_uow)
     generator = _resolve_dep(generator, get_meal_recommendation_generator)
+    generator = release_connections_before_calls(generator)
+    async_generator = _resolve_dep(
+        async_generator, get_async_meal_recommendation_generator)
+    if async_generator is not None:
+        async_generator = release_connections_before_calls(async_generator)
     clock = _resolve_dep(clock, get_clock)
     plan_checker = _resolve_dep(plan_checker, get_plan_checker)
 
@@ -754,6 +1335,7 @@ def get_generate_meal_recommendation_use_case(
         plan_checker=plan_checker,
         cooldown_minutes=cooldown_minutes,
         daily_limit=daily_limit,
+        async_generator=async_generator,
     )
 
 
@@ -761,7 +1343,7 @@ def get_list_meal_recommendations_use_case(
     nutrition_uow: NutritionUnitOfWorkPort = Depends(get_nutrition_uow),
     plan_checker: PlanCheckerPort = Depends(get_plan_checker),
 ) -> ListMealRecommendationsUseCase:
-    nutrition_uow = _resolve_dep(nutrition_uow, get_nutrition_uow)
+    nutrition_uow = _as_read_only(_resolve_dep(nutrition_uow, get_nutrition_uow))
     plan_checker = _resolve_dep(plan_checker, get_plan_checker)
     return ListMealRecommendationsUseCase(
         nutrition_uow=nutrition_uow,
@@ -825,17 +1407,25 @@ def get_handle_stripe_webhook_use_case(
     auth_uow: AuthUnitOfWorkPort = Depends(get_auth_uow),
     stripe_client: StripeClientPort = Depends(get_stripe_client),
     clock: ClockPort = Depends(get_clock),
+    principal_cache: PrincipalCachePort = Depends(get_principal_cache),
+    entitlement_cache: PlanEntitlementCachePort = Depends(
+        get_plan_entitlement_cache),
 ) -> HandleStripeWebhookUseCase:
     billing_uow = _resolve_dep(billing_uow, get_billing_uow)
     auth_uow = _resolve_dep(auth_uow, get_auth_uow)
     stripe_client = _resolve_dep(stripe_client, get_stripe_client)
     clock = _resolve_dep(clock, get_clock)
+    principal_cache = _resolve_dep(principal_cache, get_principal_cache)
+    entitlement_cache = _resolve_dep(
+        entitlement_cache, get_plan_entitlement_cache)
 
     return HandleStripeWebhookUseCase(
         billing_uow=billing_uow,
         auth_uow=auth_uow,
         stripe_client=stripe_client,
         clock=clock,
+        principal_cache=principal_cache,
+        entitlement_cache=entitlement_cache,
     )
 
 
@@ -846,11 +1436,23 @@ def get_calendar_uow() -> CalendarUnitOfWorkPort:
     return SqlAlchemyCalendarUnitOfWork()
 
 
+def get_async_calendar_uow() -> AsyncCalendarUnitOfWorkPort | None:
+    """
+    async ルート用。ASYNC_DATABASE_URL があるときだけ返す
+    （None = スレッドで同期版を呼ぶ）。
+    """
+    if not has_async_engine():
+        return None
+    return AsyncSqlAlchemyCalendarUnitOfWork()
+
+
 def get_get_monthly_calendar_use_case(
     uow: CalendarUnitOfWorkPort = Depends(get_calendar_uow),
+    async_uow: AsyncCalendarUnitOfWorkPort | None = Depends(get_async_calendar_uow),
 ) -> GetMonthlyCalendarUseCase:
-    uow = _resolve_dep(uow, get_calendar_uow)
-    return GetMonthlyCalendarUseCase(uow=uow)
+    uow = _as_read_only(_resolve_dep(uow, get_calendar_uow))
+    async_uow = _async_uow_for(uow, _resolve_dep(async_uow, get_async_calendar_uow))
+    return GetMonthlyCalendarUseCase(uow=uow, async_uow=async_uow)
 
 
 # =============================================================================
@@ -875,3 +1477,27 @@ def get_complete_tutorial_use_case(
     """チュートリアル完了ユースケースを取得"""
     tutorial_uow = _resolve_dep(tutorial_uow, get_tutorial_uow)
     return CompleteTutorialUseCase(tutorial_uow)
+
+
+# =============================================================================
+# Day
+# =============================================================================
+def get_day_uow() -> DayReadUnitOfWorkPort:
+    return SqlAlchemyDayReadUnitOfWork()
+
+
+def get_get_day_overview_use_case(
+    uow: DayReadUnitOfWorkPort = Depends(get_day_uow),
+    plan_checker: PlanCheckerPort = Depends(get_plan_checker),
+    recompute_scheduler: DailyNutritionRecomputeSchedulerPort | None = Depends(
+        get_daily_nutrition_recompute_scheduler),
+) -> GetDayOverviewUseCase:
+    uow = _as_read_only(_resolve_dep(uow, get_day_uow))
+    plan_checker = _resolve_dep(plan_checker, get_plan_checker)
+    recompute_scheduler = _resolve_dep(
+        recompute_scheduler, get_daily_nutrition_recompute_scheduler)
+    return GetDayOverviewUseCase(
+        uow=uow,
+        plan_checker=plan_checker,
+        recompute_scheduler=recompute_scheduler,
+    )
@@ -0,0 +1,38 @@
+"""カレンダードメインサービス"""
+
+from __future__ import annotations
+
+import math
+from typing import Iterable
+
+from app.domain.target.entities import TargetNutrient
+from app.domain.nutrition.daily_nutrition import DailyNutrientIntake
+
+
+def compute_nutrition_achievement(
+    daily_nutrients: Iterable[DailyNutrientIntake],
+    target_nutrients: Iterable[TargetNutrient],
+) -> int | None:
+    """栄養達成度（%）を計算する
+
+    摂取した各栄養素について「摂取量 / 目標量 × 100」を求め、その平均を四捨五入する。
+    目標に無い・目標量が 0 以下の栄養素は 0% として数える。
+
+    Args:
+        daily_nutrients: その日の摂取量
+        target_nutrients: その日のターゲット（DailyTargetSnapshot の値。無い日はアクティブな目標）
+
+    Returns:
+        int | None: 達成度。摂取データが無ければ None
+    """
+    targets = {n.code: n.amount.value for n in target_nutrients}
+    ratios = [
+        n.amount.value / targets[n.code] * 100
+        if targets.get(n.code, 0) > 0
+        else 0.0
+        for n in daily_nutrients
+    ]
+    if not ratios:
+        return None
+    # SQL の ROUND と同じく 0.5 は切り上げる
+    return int(math.floor(sum(ratios) / len(ratios) + 0.5))
@@ -46,6 +46,16 @@ class FoodEntryNotFoundError(MealDomainError):
     pass
 
 
+class InvalidFoodEntryBatchError(MealDomainError):
+    """
+    FoodEntry の一括操作の指定が不正な場合のエラー。
+
+    例:
+      - 同じ FoodEntry の ID が 1 回のリクエストに複数回含まれている
+    """
+    pass
+
+
 class DailyLogProfileNotFoundError(MealDomainError):
     """
     記録完了判定などで、ユーザーの Profile が存在しない場合のエラー。
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, datetime
 
 from app.domain.auth.value_objects import UserId
@@ -30,6 +30,34 @@ class Profile:
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
+    # image_id から生成したサムネイル（辺の長さ px → 画像ID）。生成前 / 画像なしは空
+    image_thumbnails: dict[int, ProfileImageId] = field(default_factory=dict)
+
+    def replace_image(
+        self, image_id: ProfileImageId | None
+    ) -> list[ProfileImageId]:
+        """
+        プロフィール画像を差し替える（サムネイルは作り直すので空にする）。
+        不要になった画像（元画像とサムネイル）の ID を返す。
+        """
+        if image_id == self.image_id:
+            return []
+        stale = [*([self.image_id] if self.image_id else []), *self.image_thumbnails.values()]
+        self.image_id = image_id
+        self.image_thumbnails = {}
+        return stale
+
+    def attach_thumbnails(
+        self, image_id: ProfileImageId, thumbnails: dict[int, ProfileImageId]
+    ) -> bool:
+        """
+        image_id のサムネイルを記録する。生成中に画像が差し替えられていたら False。
+        """
+        if self.image_id != image_id:
+            return False
+        self.image_thumbnails = dict(thumbnails)
+        return True
+
     @property
     def age(self) -> int:
         """
@@ -9,3 +9,8 @@ class ProfileError(Exception):
 class ProfileNotFoundError(ProfileError):
     """Profile not found."""
     pass
+
+
+class InvalidProfileImageError(ProfileError):
+    """Uploaded profile image is missing, too large, or not an allowed type."""
+    pass
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from datetime import datetime
-
 from app.application.auth.ports.plan_checker_port import PlanCheckerPort
+from app.application.auth.ports.plan_entitlement_cache_port import (
+    PlanEntitlement,
+    PlanEntitlementCachePort,
+)
 from app.application.auth.ports.uow_port import AuthUnitOfWorkPort
 from app.application.auth.ports.clock_port import ClockPort
 from app.application.auth.ports.user_repository_port import UserRepositoryPort
@@ -10,7 +12,7 @@ from app.domain.auth.errors import (
     UserNotFoundError,
     PremiumFeatureRequiredError,
 )
-from app.domain.auth.value_objects import UserId, UserPlan
+from app.domain.auth.value_objects import UserId
 
 
 class PlanCheckerService(PlanCheckerPort):
@@ -19,34 +21,48 @@ class PlanCheckerService(PlanCheckerPort):
 
     - trial_info.is_active(now) または plan == PAID ならプレミアム機能OK。
     - それ以外は PremiumFeatureRequiredError を投げる。
+    - entitlement_cache があれば plan / trial_ends_at をキャッシュし、
+      判定自体は毎回 clock.now() で行う（trial 期限切れは DB なしで反映される）。
     """
 
     def __init__(
         self,
         auth_uow: AuthUnitOfWorkPort,
         clock: ClockPort,
+        entitlement_cache: PlanEntitlementCachePort | None = None,
     ) -> None:
         self._auth_uow = auth_uow
         self._clock = clock
+        self._entitlement_cache = entitlement_cache
 
     def ensure_premium_feature(self, user_id: UserId) -> None:
         now = self._clock.now()
 
+        entitlement = self._load_entitlement(user_id)
+        if entitlement.is_premium(now):
+            return
+
+        # それ以外は NG
+        raise PremiumFeatureRequiredError(
+            f"Premium feature requires trial or paid plan for user_id={user_id.value}"
+        )
+
+    def _load_entitlement(self, user_id: UserId) -> PlanEntitlement:
+        if self._entitlement_cache is not None:
+            cached = self._entitlement_cache.get(user_id)
+            if cached is not None:
+                return cached
+
         with self._auth_uow as uow:
             user_repo: UserRepositoryPort = uow.user_repo
             user = user_repo.get_by_id(user_id)
             if user is None:
                 raise UserNotFoundError(f"User not found: {user_id.value}")
 
-            # trial 中なら許可
-            if user.trial_info and user.trial_info.is_trial_active(now):
-                return
-
-            # trial 終了後は plan == PAID のみ許可
-            if user.plan == UserPlan.PAID:
-                return
-
-            # それ以外は NG
-            raise PremiumFeatureRequiredError(
-                f"Premium feature requires trial or paid plan for user_id={user_id.value}"
-            )
+        entitlement = PlanEntitlement(
+            plan=user.plan,
+            trial_ends_at=user.trial_info.trial_ends_at,
+        )
+        if self._entitlement_cache is not None:
+            self._entitlement_cache.set(user_id, entitlement)
+        return entitlement
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import time
+from typing import Callable
+
+from app.application.auth.ports.plan_entitlement_cache_port import (
+    PlanEntitlement,
+    PlanEntitlementCachePort,
+)
+from app.domain.auth.value_objects import UserId
+from app.infra.cache.lru_ttl_cache import CacheStats, LruTtlCache
+
+
+class InMemoryPlanEntitlementCache(PlanEntitlementCachePort):
+    """
+    プロセス内で共有する PlanEntitlement キャッシュ。
+
+    - key は user_id。
+    - 追い出し / 期限切れの挙動は LruTtlCache に委譲する。
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_size: int,
+        monotonic: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._cache: LruTtlCache[PlanEntitlement] = LruTtlCache(
+            ttl_seconds=ttl_seconds,
+            max_size=max_size,
+            monotonic=monotonic,
+        )
+
+    def get(self, user_id: UserId) -> PlanEntitlement | None:
+        return self._cache.get(user_id.value)
+
+    def set(self, user_id: UserId, entitlement: PlanEntitlement) -> None:
+        self._cache.set(user_id.value, entitlement)
+
+    def invalidate(self, user_id: UserId) -> None:
+        self._cache.invalidate(user_id.value)
+
+    def stats(self) -> CacheStats:
+        return self._cache.stats()
+
+    def clear(self) -> None:
+        self._cache.clear()
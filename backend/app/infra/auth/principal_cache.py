@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import time
+from typing import Callable
+
+from app.application.auth.dto.auth_user_dto import AuthUserDTO
+from app.application.auth.ports.principal_cache_port import (
+    PrincipalCachePort,
+    PrincipalCacheStats,
+)
+from app.infra.cache.lru_ttl_cache import LruTtlCache
+
+
+class InMemoryPrincipalCache(PrincipalCachePort):
+    """
+    プロセス内で共有する TTL 付き・サイズ上限付きの Principal キャッシュ。
+
+    - key は user_id。
+    - 追い出し / 期限切れの挙動は LruTtlCache に委譲する。
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_size: int,
+        monotonic: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._cache: LruTtlCache[AuthUserDTO] = LruTtlCache(
+            ttl_seconds=ttl_seconds,
+            max_size=max_size,
+            monotonic=monotonic,
+        )
+
+    def get(self, user_id: str) -> AuthUserDTO | None:
+        return self._cache.get(user_id)
+
+    def set(self, user: AuthUserDTO) -> None:
+        self._cache.set(user.id, user)
+
+    def invalidate(self, user_id: str) -> None:
+        self._cache.invalidate(user_id)
+
+    def stats(self) -> PrincipalCacheStats:
+        stats = self._cache.stats()
+        return PrincipalCacheStats(
+            hits=stats.hits,
+            misses=stats.misses,
+            size=stats.size,
+        )
+
+    def clear(self) -> None:
+        self._cache.clear()
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Generic, TypeVar
+
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    キャッシュのヒット / ミス状況（メトリクス用）。
+    """
+
+    hits: int
+    misses: int
+    size: int
+
+
+class LruTtlCache(Generic[V]):
+    """
+    プロセス内で共有する TTL 付き・サイズ上限付きの汎用キャッシュ。
+
+    - エントリ数が max_size を超えたら、最も古く使われたものから追い出す (LRU)。
+    - ttl_seconds を過ぎたエントリはミス扱いにして破棄する。
+    - ttl_seconds / max_size が 0 以下ならキャッシュしない。
+    - FastAPI の sync ルートはスレッドプールで動くため、Lock で保護する。
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_size: int,
+        monotonic: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_size = max_size
+        self._monotonic = monotonic
+        # key -> (expires_at, value)
+        self._entries: OrderedDict[str, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: str) -> V | None:
+        now = self._monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: str, value: V) -> None:
+        if self._max_size <= 0 or self._ttl_seconds <= 0:
+            return
+
+        expires_at = self._monotonic() + self._ttl_seconds
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._entries),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+from app.infra.db.pool_metrics import DbPoolStats, PoolMetrics
+from app.settings import settings
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+
+# ----------------------------
+# 非同期エンジン（任意）
+# ----------------------------
+# ASYNC_DATABASE_URL が無ければ作らない（async ルートは同期 UoW をスレッドで呼ぶ）。
+# sqlalchemy.ext.asyncio は greenlet を必要とするので、import も最初の利用時まで遅らせる。
+
+_lock = threading.Lock()
+_async_engine: AsyncEngine | None = None
+_AsyncSessionLocal: async_sessionmaker[AsyncSession] | None = None
+_pool_metrics: PoolMetrics | None = None
+
+
+def has_async_engine() -> bool:
+    return bool(settings.ASYNC_DATABASE_URL)
+
+
+def _session_factory() -> async_sessionmaker[AsyncSession]:
+    global _async_engine, _AsyncSessionLocal, _pool_metrics
+    if _AsyncSessionLocal is not None:
+        return _AsyncSessionLocal
+
+    with _lock:
+        if _AsyncSessionLocal is None:
+            from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+            _async_engine = create_async_engine(
+                settings.ASYNC_DATABASE_URL,
+                pool_pre_ping=True,
+                pool_size=settings.ASYNC_DB_POOL_SIZE,
+                max_overflow=settings.ASYNC_DB_MAX_OVERFLOW,
+            )
+            _pool_metrics = PoolMetrics(_async_engine.sync_engine)
+            _AsyncSessionLocal = async_sessionmaker(
+                bind=_async_engine,
+                autoflush=False,
+                expire_on_commit=False,
+            )
+    return _AsyncSessionLocal
+
+
+def create_async_session() -> AsyncSession:
+    """
+    非同期 Session を生成するヘルパー。async UoW が使う。
+    """
+    if not has_async_engine():
+        raise RuntimeError("ASYNC_DATABASE_URL is not configured.")
+    return _session_factory()()
+
+
+def async_pool_stats() -> DbPoolStats | None:
+    """非同期エンジンのプール状況（まだ作られていなければ None）。"""
+    return _pool_metrics.stats() if _pool_metrics is not None else None
+
+
+async def dispose_async_engine() -> None:
+    """アプリ終了時にプールの接続を閉じる。"""
+    global _async_engine, _AsyncSessionLocal, _pool_metrics
+    with _lock:
+        engine, _async_engine = _async_engine, None
+        _AsyncSessionLocal = None
+        _pool_metrics = None
+    if engine is not None:
+        await engine.dispose()
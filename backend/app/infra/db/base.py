@@ -3,6 +3,7 @@ from __future__ import annotations
 from sqlalchemy import create_engine
 from sqlalchemy.orm import declarative_base, sessionmaker, DeclarativeMeta
 
+from app.infra.db.pool_metrics import DbPoolStats, PoolMetrics
 from app.settings import settings  # ← ここが効くようになった
 
 
@@ -24,3 +25,38 @@ SessionLocal = sessionmaker(
     bind=engine,
     expire_on_commit=False,
 )
+
+# ----------------------------
+# 読み取りレプリカ（任意）
+# ----------------------------
+# DATABASE_REPLICA_URL が無ければ None（読み取り専用 UoW もプライマリを使う）
+
+replica_engine = (
+    create_engine(
+        settings.DATABASE_REPLICA_URL,
+        pool_pre_ping=True,
+        future=True,
+    )
+    if settings.DATABASE_REPLICA_URL
+    else None
+)
+
+ReplicaSessionLocal = (
+    sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=replica_engine,
+        expire_on_commit=False,
+    )
+    if replica_engine is not None
+    else None
+)
+
+_pool_metrics: dict[str, PoolMetrics] = {"primary": PoolMetrics(engine)}
+if replica_engine is not None:
+    _pool_metrics["replica"] = PoolMetrics(replica_engine)
+
+
+def pool_stats() -> dict[str, DbPoolStats]:
+    """プライマリ（とレプリカがあればレプリカ）のプール状況を返す。"""
+    return {name: metrics.stats() for name, metrics in _pool_metrics.items()}
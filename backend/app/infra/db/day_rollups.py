@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.infra.db.uow.hooks import UnitOfWorkHook, register_unit_of_work_hook
+
+_DIRTY_KEY = "dirty_day_rollups"
+_TARGET_CHANGED_KEY = "day_rollup_target_changed_users"
+
+# user_day_rollups の集計列
+HAS_MEAL_LOGS = "has_meal_logs"
+NUTRITION_ACHIEVEMENT = "nutrition_achievement"
+HAS_DAILY_REPORT = "has_daily_report"
+ROLLUP_COLUMNS = (HAS_MEAL_LOGS, NUTRITION_ACHIEVEMENT, HAS_DAILY_REPORT)
+
+# 「元テーブルから計算し直す」印（値そのものには None もあり得るので別のオブジェクト）
+RECOMPUTE: Any = object()
+
+DayRollupChanges = dict[tuple[UUID, date], dict[str, Any]]
+
+
+def _changes(session: Session, user_id: UUID | str, date_: date) -> dict[str, Any]:
+    key = (user_id if isinstance(user_id, UUID) else UUID(user_id), date_)
+    return session.info.setdefault(_DIRTY_KEY, {}).setdefault(key, {})
+
+
+def mark_day_rollup_dirty(
+    session: Session,
+    user_id: UUID | str,
+    date_: date,
+    *columns: str,
+) -> None:
+    """
+    user_day_rollups の (user_id, date) の列を再計算対象として session に記録する。
+
+    - カレンダーに関わるテーブルに書き込むリポジトリが、変わり得る列だけを渡す
+      （省略時は全列）。
+    - 実際の再計算は UoW の commit 直前にまとめて行う
+      （SqlAlchemyUserDayRollupRepository.refresh_dirty）。同じ日に何度書いても 1 回で済む。
+    """
+    changes = _changes(session, user_id, date_)
+    for column in columns or ROLLUP_COLUMNS:
+        changes[column] = RECOMPUTE
+
+
+def set_day_rollup_value(
+    session: Session,
+    user_id: UUID | str,
+    date_: date,
+    column: str,
+    value: Any,
+) -> None:
+    """
+    書き込み側が集計値を知っている場合（記録を追加した → has_meal_logs=True など）に、
+    元テーブルを読まずにその値で更新するよう記録する。
+    """
+    _changes(session, user_id, date_)[column] = value
+
+
+def mark_active_target_changed(session: Session, user_id: UUID | str) -> None:
+    """
+    ユーザーのアクティブな目標が変わった（作成 / 切り替え / 更新 / 削除）ことを記録する。
+
+    - スナップショットの無い日の達成率はアクティブな目標で計算しているので、
+      commit 直前にそういう日を探して nutrition_achievement を再計算する。
+    """
+    uid = user_id if isinstance(user_id, UUID) else UUID(user_id)
+    session.info.setdefault(_TARGET_CHANGED_KEY, set()).add(uid)
+
+
+def pop_active_target_changes(session: Session) -> set[UUID]:
+    """mark_active_target_changed() で記録したユーザーを取り出して空にする。"""
+    return session.info.pop(_TARGET_CHANGED_KEY, set())
+
+
+def pop_dirty_day_rollups(session: Session) -> DayRollupChanges:
+    """記録済みの (user_id, date) → {列: 値 or RECOMPUTE} を取り出して空にする。"""
+    return session.info.pop(_DIRTY_KEY, {})
+
+
+def _discard_day_rollups(session: Session) -> None:
+    pop_active_target_changes(session)
+    pop_dirty_day_rollups(session)
+
+
+def refresh_dirty_day_rollups(session: Session) -> None:
+    """記録された日の集計を同じトランザクション内で更新する（UoW の commit 直前に呼ばれる）。"""
+    if not session.info.get(_DIRTY_KEY) and not session.info.get(_TARGET_CHANGED_KEY):
+        return
+    # リポジトリはこのモジュールの定数を使うので、ここで import する
+    from app.infra.db.repositories.user_day_rollup_repository import (
+        SqlAlchemyUserDayRollupRepository,
+    )
+
+    SqlAlchemyUserDayRollupRepository(session).refresh_dirty()
+
+
+register_unit_of_work_hook(
+    UnitOfWorkHook(
+        name="user_day_rollups",
+        before_commit=refresh_dirty_day_rollups,
+        discard=_discard_day_rollups,
+    )
+)
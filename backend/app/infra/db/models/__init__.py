@@ -16,3 +16,10 @@ from app.infra.db.models.meal_recommendation import MealRecommendationModel
 from app.infra.db.models.billing_account import BillingAccountModel
 
 from app.infra.db.models.tutorial import TutorialCompletionModel
+
+from app.infra.db.models.nutrition_estimate_cache import NutritionEstimateCacheModel
+from app.infra.db.models.daily_report_output_cache import DailyReportOutputCacheModel
+from app.infra.db.models.food_item_nutrient_vector import FoodItemNutrientVectorModel
+
+from app.infra.db.models.user_day_rollup import UserDayRollupModel
+from app.infra.db.models.food_entry_event import FoodEntryEventModel
@@ -27,6 +27,15 @@ class DailyNutritionSummaryModel(Base):
 
     date = sa.Column(sa.Date(), nullable=False, index=True)
 
+    # 栄養素のコンパクト形式 {code: [amount_value, amount_unit, source]}。
+    # NUTRIENT_STORAGE_MODE が dual / compact のときに書く。NULL でなければモードにかかわらず
+    # こちらを読む（NULL なら子テーブルを読む）。
+    nutrients_compact = sa.Column(
+        sa.JSON(none_as_null=True).with_variant(
+            pg.JSONB(none_as_null=True), "postgresql"),
+        nullable=True,
+    )
+
     generated_at = sa.Column(
         sa.DateTime(timezone=True),
         nullable=False,
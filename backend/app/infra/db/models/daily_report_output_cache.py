@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import sqlalchemy as sa
+import sqlalchemy.dialects.postgresql as pg
+
+from app.infra.db.base import Base
+
+
+class DailyReportOutputCacheModel(Base):
+    """
+    日次レポート (LLM) 出力の短期キャッシュ。
+
+    - single-flight の advisory lock を取ったワーカーが、LLM を呼ぶ前に引く。
+      別ワーカーが同じ入力で生成済みなら、その出力を使う。
+    - cache_key は daily_report_flight_key() の SHA-256。
+    - output は DailyReportLLMOutput を JSON 化したもの。
+    - TTL 切れの行は書き込み時に created_at を基準に消す。
+    """
+
+    __tablename__ = "daily_report_output_cache"
+
+    cache_key = sa.Column(sa.String(64), primary_key=True)
+
+    output = sa.Column(
+        sa.JSON().with_variant(pg.JSONB(), "postgresql"),
+        nullable=False,
+    )
+
+    created_at = sa.Column(
+        sa.DateTime(timezone=True),
+        nullable=False,
+        server_default=sa.func.now(),
+    )
+
+    __table_args__ = (
+        sa.Index("ix_daily_report_output_cache_created_at", "created_at"),
+    )
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import sqlalchemy as sa
+import sqlalchemy.dialects.postgresql as pg
+
+from app.infra.db.base import Base
+
+
+class FoodEntryEventModel(Base):
+    """
+    food_entry_events テーブル（トランザクショナル outbox）。
+
+    1レコード = ある食事スロット (user_id, date, meal_type, meal_index) の FoodEntry が
+    変わったという通知。FoodEntry の書き込みと同じトランザクションで追加し
+    （app/infra/db/outbox.py）、ワーカーが FOR UPDATE SKIP LOCKED で取り出して
+    食事 / 日次の栄養サマリを再計算する（app/jobs/food_entry_event_worker.py）。
+    処理できたら行を消す。
+    """
+
+    __tablename__ = "food_entry_events"
+
+    id = sa.Column(
+        sa.BigInteger().with_variant(sa.Integer(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    )
+
+    user_id = sa.Column(pg.UUID(as_uuid=True), nullable=False)
+    date = sa.Column(sa.Date(), nullable=False)
+    # "main" or "snack"
+    meal_type = sa.Column(sa.String(length=16), nullable=False)
+    # main のとき: 1..N / snack のとき: NULL
+    meal_index = sa.Column(sa.SmallInteger(), nullable=True)
+
+    created_at = sa.Column(
+        sa.DateTime(timezone=True),
+        nullable=False,
+        server_default=sa.func.now(),
+    )
+    # この時刻以降に処理する（失敗時のリトライ間隔）
+    available_at = sa.Column(
+        sa.DateTime(timezone=True),
+        nullable=False,
+        server_default=sa.func.now(),
+    )
+    # ワーカーが取り出したときのリース期限。期限切れ（ワーカーが落ちた）なら取り直せる
+    claimed_until = sa.Column(sa.DateTime(timezone=True), nullable=True)
+    attempts = sa.Column(
+        sa.SmallInteger(), nullable=False, server_default=sa.text("0"))
+    last_error = sa.Column(sa.Text(), nullable=True)
+
+    __table_args__ = (
+        sa.Index("ix_food_entry_events_available_at", "available_at"),
+    )
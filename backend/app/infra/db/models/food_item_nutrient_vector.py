@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import sqlalchemy as sa
+import sqlalchemy.dialects.postgresql as pg
+
+from app.infra.db.base import Base
+
+
+class FoodItemNutrientVectorModel(Base):
+    """
+    食品 1 品目あたりの栄養素ベクトル（基準量あたり）。
+
+    - (name, unit) は正規化済み。unit="serving" は 1 人前、それ以外は 100 単位あたり。
+    - model / prompt_version が変わったら別の行として扱う。
+    - nutrients は {NutrientCode.value: amount} の JSON（単位は EXPECTED_UNITS に従う）。
+    """
+
+    __tablename__ = "food_item_nutrient_vectors"
+
+    name = sa.Column(sa.String(255), primary_key=True)
+    unit = sa.Column(sa.String(32), primary_key=True)
+    model = sa.Column(sa.String(64), primary_key=True)
+    prompt_version = sa.Column(sa.String(32), primary_key=True)
+
+    nutrients = sa.Column(
+        sa.JSON().with_variant(pg.JSONB(), "postgresql"),
+        nullable=False,
+    )
+
+    created_at = sa.Column(
+        sa.DateTime(timezone=True),
+        nullable=False,
+        server_default=sa.func.now(),
+    )
@@ -23,6 +23,15 @@ class MealNutritionSummaryModel(Base):
     meal_type = sa.Column(sa.String(length=16), nullable=False, index=True)
     meal_index = sa.Column(sa.SmallInteger(), nullable=True)
 
+    # 栄養素のコンパクト形式 {code: [amount_value, amount_unit, source]}。
+    # NUTRIENT_STORAGE_MODE が dual / compact のときに書く。NULL でなければモードにかかわらず
+    # こちらを読む（NULL なら子テーブルを読む）。
+    nutrients_compact = sa.Column(
+        sa.JSON(none_as_null=True).with_variant(
+            pg.JSONB(none_as_null=True), "postgresql"),
+        nullable=True,
+    )
+
     generated_at = sa.Column(
         sa.DateTime(timezone=True),
         nullable=False,
@@ -54,6 +63,7 @@ class MealNutritionSummaryModel(Base):
             "user_id", "date", "meal_type",
             unique=True,
             postgresql_where=sa.text("meal_index IS NULL"),
+            sqlite_where=sa.text("meal_index IS NULL"),
         ),
     )
 
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import sqlalchemy as sa
+import sqlalchemy.dialects.postgresql as pg
+
+from app.infra.db.base import Base
+
+
+class NutritionEstimateCacheModel(Base):
+    """
+    栄養推定 (LLM) 結果の永続キャッシュ。
+
+    - cache_key は「正規化した FoodEntry 群 + モデル + プロンプト版」の SHA-256。
+    - nutrients は MealNutrientIntake のリストを JSON 化したもの。
+    - TTL / 件数上限による掃除は created_at を基準に行う。
+    """
+
+    __tablename__ = "nutrition_estimate_cache"
+
+    cache_key = sa.Column(sa.String(64), primary_key=True)
+
+    model = sa.Column(sa.String(64), nullable=False)
+    prompt_version = sa.Column(sa.String(32), nullable=False)
+
+    nutrients = sa.Column(
+        sa.JSON().with_variant(pg.JSONB(), "postgresql"),
+        nullable=False,
+    )
+
+    created_at = sa.Column(
+        sa.DateTime(timezone=True),
+        nullable=False,
+        server_default=sa.func.now(),
+    )
+
+    __table_args__ = (
+        sa.Index("ix_nutrition_estimate_cache_created_at", "created_at"),
+    )
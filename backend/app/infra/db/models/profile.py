@@ -32,6 +32,12 @@ class ProfileModel(Base):
     weight_kg = sa.Column(sa.Float, nullable=False)
 
     image_id = sa.Column(sa.String, nullable=True)
+    # image_id から生成したサムネイル {"<辺の長さ px>": "<オブジェクトキー>"}
+    image_thumbnails = sa.Column(
+        sa.JSON(none_as_null=True).with_variant(
+            pg.JSONB(none_as_null=True), "postgresql"),
+        nullable=True,
+    )
 
     meals_per_day = sa.Column(sa.SmallInteger, nullable=True)
 
@@ -42,6 +42,15 @@ class TargetModel(Base):
     llm_rationale = sa.Column(sa.Text, nullable=True)
     disclaimer = sa.Column(sa.Text, nullable=True)
 
+    # 栄養素のコンパクト形式 {code: [amount_value, amount_unit, source]}。
+    # NUTRIENT_STORAGE_MODE が dual / compact のときに書く。NULL でなければモードにかかわらず
+    # こちらを読む（NULL なら子テーブルを読む）。
+    nutrients_compact = sa.Column(
+        sa.JSON(none_as_null=True).with_variant(
+            pg.JSONB(none_as_null=True), "postgresql"),
+        nullable=True,
+    )
+
     created_at = sa.Column(sa.DateTime(timezone=True), nullable=False)
     updated_at = sa.Column(sa.DateTime(timezone=True), nullable=False)
 
@@ -101,6 +110,15 @@ class DailyTargetSnapshotModel(Base):
 
     created_at = sa.Column(sa.DateTime(timezone=True), nullable=False)
 
+    # 栄養素のコンパクト形式 {code: [amount_value, amount_unit, source]}。
+    # NUTRIENT_STORAGE_MODE が dual / compact のときに書く。NULL でなければモードにかかわらず
+    # こちらを読む（NULL なら子テーブルを読む）。
+    nutrients_compact = sa.Column(
+        sa.JSON(none_as_null=True).with_variant(
+            pg.JSONB(none_as_null=True), "postgresql"),
+        nullable=True,
+    )
+
     __table_args__ = (
         sa.UniqueConstraint("user_id", "date",
                             name="uq_daily_target_snapshot_user_date"),
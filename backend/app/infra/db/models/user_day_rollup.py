@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import sqlalchemy as sa
+import sqlalchemy.dialects.postgresql as pg
+
+from app.infra.db.base import Base
+
+
+class UserDayRollupModel(Base):
+    """
+    user_day_rollups テーブル。
+
+    1レコード = あるユーザーの 1日分のカレンダー表示用の集計。
+    food_entries / daily_nutrition_summaries / daily_target_snapshots /
+    daily_nutrition_reports への書き込み時に、UoW の commit 直前で再計算する
+    （app/infra/db/day_rollups.py）。
+    何も無い日は行を持たない。
+    """
+
+    __tablename__ = "user_day_rollups"
+
+    user_id = sa.Column(
+        pg.UUID(as_uuid=True),
+        sa.ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    date = sa.Column(sa.Date(), primary_key=True)
+
+    has_meal_logs = sa.Column(
+        sa.Boolean, nullable=False, server_default=sa.text("false"))
+    # その日の DailyTargetSnapshot（無ければアクティブな目標）に対する達成度（%）。目標か摂取データが無ければ NULL
+    nutrition_achievement = sa.Column(sa.Integer, nullable=True)
+    has_daily_report = sa.Column(
+        sa.Boolean, nullable=False, server_default=sa.text("false"))
+
+    updated_at = sa.Column(
+        sa.DateTime(timezone=True),
+        nullable=False,
+        server_default=sa.func.now(),
+    )
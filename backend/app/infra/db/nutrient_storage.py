@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from enum import Enum
+from typing import Any, Callable, Iterable, Mapping, TypeVar
+
+from sqlalchemy.orm import lazyload, selectinload
+
+from app.domain.target.value_objects import NutrientAmount, NutrientCode, NutrientSource
+from app.settings import settings
+
+T = TypeVar("T")
+
+
+class NutrientStorageMode(str, Enum):
+    """
+    栄養素の保存形式（サマリ / ターゲット / スナップショット共通）。
+
+    - rows   : 子テーブルに 1 栄養素 1 行（従来形式）。親行の nutrients_compact は NULL にする。
+    - dual   : 子テーブルと nutrients_compact の両方に書く（移行期間用）。
+    - compact: nutrients_compact だけに書き、子テーブルの行は消す。
+
+    読み取りはモードにかかわらず nutrients_compact が NULL でなければそれを読み、
+    NULL の行（バックフィル前 / rows で書いたデータ）だけ子テーブルから読む。
+    compact で書いた行には子テーブルの行が無いので、rows / dual に戻しても
+    nutrients_compact から読める（次に書いたときに子テーブルへ書き戻される）。
+    """
+
+    ROWS = "rows"
+    DUAL = "dual"
+    COMPACT = "compact"
+
+    @property
+    def writes_rows(self) -> bool:
+        return self is not NutrientStorageMode.COMPACT
+
+    @property
+    def writes_compact(self) -> bool:
+        return self is not NutrientStorageMode.ROWS
+
+    @property
+    def reads_compact(self) -> bool:
+        return self is not NutrientStorageMode.ROWS
+
+
+def current_nutrient_storage_mode() -> NutrientStorageMode:
+    return NutrientStorageMode(settings.NUTRIENT_STORAGE_MODE)
+
+
+def nutrients_load_option(mode: NutrientStorageMode, relationship: Any) -> Any:
+    """
+    子テーブルの読み込み方。
+
+    - rows のときは従来どおり selectin でまとめて読む
+      （compact で書いた行が残っていても空の子が読まれるだけ）。
+    - dual / compact では読まない（NULL の行で参照されたときだけ遅延ロード）。
+    """
+    if mode.reads_compact:
+        return lazyload(relationship)
+    return selectinload(relationship)
+
+
+def encode_nutrients(nutrients: Iterable[Any]) -> dict[str, list[Any]]:
+    """
+    code / amount / source を持つ栄養素の並びを
+    {code: [amount_value, amount_unit, source]} に詰める。
+    """
+    return {
+        n.code.value: [n.amount.value, n.amount.unit, n.source.value]
+        for n in nutrients
+    }
+
+
+def encode_nutrient_rows(rows: Iterable[Any]) -> dict[str, list[Any]]:
+    """
+    子テーブルの行（code / amount_value / amount_unit / source を持つモデル）を
+    encode_nutrients() と同じ形に詰める。バックフィル用。
+    """
+    return {
+        row.code: [row.amount_value, row.amount_unit, row.source]
+        for row in rows
+    }
+
+
+def decode_nutrients(
+    raw: Mapping[str, list[Any]],
+    factory: Callable[..., T],
+) -> list[T]:
+    """
+    encode_nutrients() の逆。factory は MealNutrientIntake / TargetNutrient など
+    (code, amount, source) を受け取る型。
+    """
+    return [
+        factory(
+            code=NutrientCode(code),
+            amount=NutrientAmount(value=float(value), unit=unit),
+            source=NutrientSource(source),
+        )
+        for code, (value, unit, source) in sorted(raw.items())
+    ]
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.infra.db.models.food_entry_event import FoodEntryEventModel
+from app.settings import settings
+
+
+def enqueue_food_entry_changed(
+    session: Session,
+    user_id: UUID | str,
+    date_: date,
+    meal_type: str,
+    meal_index: int | None,
+) -> None:
+    """
+    食事スロットの FoodEntry が変わったことを outbox（food_entry_events）に追加する。
+
+    - FoodEntry に書き込むリポジトリが呼ぶ。FoodEntry の変更と同じ
+      トランザクションに入るので、ロールバックされればイベントも残らない。
+    - 同じスロットの行が複数あってもよい（ワーカーが取り出すときにまとめる）。
+    - FOOD_ENTRY_OUTBOX_ENABLED が False なら何もしない。
+    """
+    if not settings.FOOD_ENTRY_OUTBOX_ENABLED:
+        return
+
+    session.add(
+        FoodEntryEventModel(
+            user_id=user_id if isinstance(user_id, UUID) else UUID(user_id),
+            date=date_,
+            meal_type=meal_type,
+            meal_index=meal_index,
+            available_at=datetime.now(timezone.utc),
+        )
+    )
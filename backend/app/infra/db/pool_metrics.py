@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import Engine, event
+
+
+@dataclass(frozen=True)
+class DbPoolStats:
+    """
+    コネクションプールの状況（メトリクス用）。
+
+    - size / checked_in / checked_out / overflow: 現在のプールの状態
+      （QueuePool 以外では取れない値は 0。overflow はプールが埋まる前は 0）
+    - checkouts: これまでにプールから接続を借りた回数
+    - connects: これまでに DB へ新規接続した回数
+    """
+
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    connects: int
+
+
+class PoolMetrics:
+    """
+    Engine のプールにイベントリスナを付けて、借用 / 新規接続の回数を数える。
+    """
+
+    def __init__(self, engine: Engine) -> None:
+        self._engine = engine
+        self._lock = threading.Lock()
+        self._checkouts = 0
+        self._connects = 0
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "connect", self._on_connect)
+
+    def _on_checkout(self, *args: Any) -> None:
+        with self._lock:
+            self._checkouts += 1
+
+    def _on_connect(self, *args: Any) -> None:
+        with self._lock:
+            self._connects += 1
+
+    def stats(self) -> DbPoolStats:
+        pool = self._engine.pool
+
+        def _value(name: str) -> int:
+            method = getattr(pool, name, None)
+            return int(method()) if callable(method) else 0
+
+        with self._lock:
+            checkouts, connects = self._checkouts, self._connects
+        return DbPoolStats(
+            size=_value("size"),
+            checked_in=_value("checkedin"),
+            checked_out=_value("checkedout"),
+            overflow=max(_value("overflow"), 0),
+            checkouts=checkouts,
+            connects=connects,
+        )
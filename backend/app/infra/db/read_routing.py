@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from contextvars import ContextVar, Token
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session, UOWTransaction
+
+from app.infra.db.uow.hooks import UnitOfWorkHook, register_unit_of_work_hook
+
+_WROTE_KEY = "read_routing_wrote"
+
+
+class ReadRoutingState:
+    """
+    1 HTTP リクエスト分の読み取りルーティング状態。
+
+    - sticky: 直近（DB_REPLICA_STICKY_SECONDS 以内）に同じクライアントが書き込んだ
+      （read-your-writes のためプライマリで読む）
+    - wrote: このリクエスト内で書き込みがあった（以降の読み取りはプライマリ）
+    """
+
+    def __init__(self, *, sticky: bool = False) -> None:
+        self.sticky = sticky
+        self.wrote = False
+
+    @property
+    def prefer_primary(self) -> bool:
+        return self.sticky or self.wrote
+
+
+_current_state: ContextVar[ReadRoutingState | None] = ContextVar(
+    "db_read_routing_state", default=None
+)
+
+
+def current_read_routing() -> ReadRoutingState | None:
+    """現在のリクエストのルーティング状態。リクエスト外では None。"""
+    return _current_state.get()
+
+
+def bind_read_routing(state: ReadRoutingState) -> Token[ReadRoutingState | None]:
+    return _current_state.set(state)
+
+
+def reset_read_routing(token: Token[ReadRoutingState | None]) -> None:
+    _current_state.reset(token)
+
+
+def prefer_primary() -> bool:
+    """読み取り専用 UoW でもプライマリを使うべきか。"""
+    state = _current_state.get()
+    return state is not None and state.prefer_primary
+
+
+def note_session_commit(session: Session) -> None:
+    """
+    読み書き UoW の commit 時に呼ぶ。この UoW で書き込みがあれば
+    リクエストの状態に記録する（ミドルウェアがレスポンスに Cookie を付ける）。
+    """
+    if not session.info.pop(_WROTE_KEY, False):
+        return
+    state = _current_state.get()
+    if state is not None:
+        state.wrote = True
+
+
+def note_request_wrote() -> None:
+    """
+    UoW の外で書き込みを待った / 実行したときに呼ぶ（別スレッドの計算し直しを待った等）。
+    以降の読み取りと、次のリクエスト（Cookie）をプライマリに向ける。
+    """
+    state = _current_state.get()
+    if state is not None:
+        state.wrote = True
+
+
+def discard_session_writes(session: Session) -> None:
+    """rollback 時に呼ぶ（巻き戻した書き込みは数えない）。"""
+    session.info.pop(_WROTE_KEY, None)
+
+
+# commit 直前の他のフック（集計の更新など）の書き込みも数えるよう最後に呼ぶ
+register_unit_of_work_hook(
+    UnitOfWorkHook(
+        name="read_routing",
+        before_commit=note_session_commit,
+        discard=discard_session_writes,
+        order=100,
+    )
+)
+
+
+# --- 書き込みの検出 ----------------------------------------------------
+# ORM の flush と、session.execute() で発行した Core の INSERT / UPDATE / DELETE の
+# どちらでも session.info に印を付ける。
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flush(session: Session, flush_context: UOWTransaction) -> None:
+    session.info[_WROTE_KEY] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_dml(orm_execute_state: ORMExecuteState) -> None:
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        orm_execute_state.session.info[_WROTE_KEY] = True
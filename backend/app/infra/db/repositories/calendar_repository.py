@@ -1,11 +1,22 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from sqlalchemy.engine import Result, Row
-from typing import List, Any, Protocol
-from datetime import date
-from app.application.calendar.dto.calendar_dto import MonthlyCalendarDto
-from app.application.calendar.ports.calendar_repository_port import CalendarRepositoryPort
+from typing import TYPE_CHECKING, List, Any, Protocol
+from datetime import date, timedelta
+from uuid import UUID
+from app.application.calendar.dto.calendar_dto import CalendarRangeDto, MonthlyCalendarDto
+from app.application.calendar.ports.calendar_repository_port import (
+    AsyncCalendarRepositoryPort,
+    CalendarRepositoryPort,
+)
 from app.domain.calendar.entities import CalendarDaySnapshot
+from app.infra.db.repositories.user_day_rollup_repository import (
+    SqlAlchemyUserDayRollupRepository,
+)
+from app.settings import settings
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 
 class CalendarQueryRow(Protocol):
@@ -19,26 +30,79 @@ class CalendarQueryRow(Protocol):
 class SqlAlchemyCalendarRepository(CalendarRepositoryPort):
     """SQLAlchemy を使ったカレンダーリポジトリ実装"""
 
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: Session, use_rollups: bool | None = None) -> None:
         self._session = session
+        self._use_rollups = (
+            settings.CALENDAR_READ_FROM_ROLLUPS if use_rollups is None else use_rollups
+        )
 
     def get_monthly_summary(
         self,
         request: MonthlyCalendarDto
     ) -> List[CalendarDaySnapshot]:
-        """最適化されたSQL CTEクエリで月次データを取得"""
-
-        # 月の開始日と終了日を計算
-        start_date = f"{request.year}-{request.month:02d}-01"
-
-        # 月末日を計算（次の月の1日から1日引く）
+        """月次データを取得（user_day_rollups が有効ならそちらから読む）"""
+        start = date(request.year, request.month, 1)
+        # 月末日の翌日（次の月の1日）
         if request.month == 12:
-            end_year = request.year + 1
-            end_month = 1
+            end = date(request.year + 1, 1, 1)
         else:
-            end_year = request.year
-            end_month = request.month + 1
-        end_date = f"{end_year}-{end_month:02d}-01"
+            end = date(request.year, request.month + 1, 1)
+        return self._summarize(request.user_id, start, end)
+
+    def get_range_summary(
+        self,
+        request: CalendarRangeDto
+    ) -> List[CalendarDaySnapshot]:
+        """期間データを 1 クエリで取得（年表示などで月ごとに呼ばないためのもの）"""
+        return self._summarize(
+            request.user_id,
+            request.start_date,
+            request.end_date + timedelta(days=1),
+        )
+
+    def _summarize(
+        self,
+        user_id: str,
+        start: date,
+        end: date,
+    ) -> List[CalendarDaySnapshot]:
+        """[start, end) の日次スナップショットを取得"""
+        if self._use_rollups:
+            return self._summarize_from_rollups(user_id, start, end)
+        return self._summarize_from_sources(user_id, start, end)
+
+    def _summarize_from_rollups(
+        self,
+        user_id: str,
+        start: date,
+        end: date,
+    ) -> List[CalendarDaySnapshot]:
+        """user_day_rollups の範囲スキャン 1 本で取得（行の無い日は空で埋める）"""
+        rows = SqlAlchemyUserDayRollupRepository(self._session).list_range(
+            UUID(user_id), start, end
+        )
+        by_date = {row.date: row for row in rows}
+
+        days: List[CalendarDaySnapshot] = []
+        for offset in range((end - start).days):
+            key = (start + timedelta(days=offset)).strftime('%Y-%m-%d')
+            days.append(by_date.get(key) or CalendarDaySnapshot(
+                date=key,
+                has_meal_logs=False,
+                nutrition_achievement=None,
+                has_daily_report=False
+            ))
+        return days
+
+    def _summarize_from_sources(
+        self,
+        user_id: str,
+        start: date,
+        end: date,
+    ) -> List[CalendarDaySnapshot]:
+        """最適化されたSQL CTEクエリで [start, end) のデータを取得"""
+        start_date = start.isoformat()
+        end_date = end.isoformat()
 
         # 最適化されたCTEクエリ
         query = text("""
@@ -60,27 +124,58 @@ class SqlAlchemyCalendarRepository(CalendarRepositoryPort):
                     AND fe.deleted_at IS NULL
                 GROUP BY fe.date
             ),
+            -- 栄養素は子テーブル（nutrients_compact が NULL の行）と
+            -- nutrients_compact（{code: [value, unit, source]}）の両方から読む
+            daily_nutrients AS (
+                SELECT dns.date, dnn.code, dnn.amount_value
+                FROM daily_nutrition_summaries dns
+                JOIN daily_nutrition_nutrients dnn ON dns.id = dnn.summary_id
+                WHERE dns.user_id = :user_id
+                    AND dns.date >= CAST(:start_date AS date)
+                    AND dns.date < CAST(:end_date AS date)
+                    AND dns.nutrients_compact IS NULL
+                UNION ALL
+                SELECT dns.date, c.key AS code, (c.value->>0)::float AS amount_value
+                FROM daily_nutrition_summaries dns
+                CROSS JOIN LATERAL jsonb_each(dns.nutrients_compact) AS c
+                WHERE dns.user_id = :user_id
+                    AND dns.date >= CAST(:start_date AS date)
+                    AND dns.date < CAST(:end_date AS date)
+                    AND dns.nutrients_compact IS NOT NULL
+            ),
+            active_target AS (
+                SELECT target.id, target.nutrients_compact
+                FROM targets target
+                WHERE target.user_id = :user_id
+                    AND target.is_active = true
+            ),
+            target_nutrients_all AS (
+                SELECT at.id AS target_id, tn.code, tn.amount_value
+                FROM active_target at
+                JOIN target_nutrients tn ON at.id = tn.target_id
+                WHERE at.nutrients_compact IS NULL
+                UNION ALL
+                SELECT at.id AS target_id, c.key AS code, (c.value->>0)::float AS amount_value
+                FROM active_target at
+                CROSS JOIN LATERAL jsonb_each(at.nutrients_compact) AS c
+                WHERE at.nutrients_compact IS NOT NULL
+            ),
             nutrition_summary AS (
                 SELECT
-                    dns.date,
+                    dn.date,
                     CASE
-                        WHEN target.id IS NOT NULL THEN
+                        WHEN at.id IS NOT NULL THEN
                             ROUND(AVG(CASE
-                                WHEN tn.amount_value > 0 THEN (dnn.amount_value / tn.amount_value * 100)
+                                WHEN tn.amount_value > 0 THEN (dn.amount_value / tn.amount_value * 100)
                                 ELSE 0
                             END))
                         ELSE NULL
                     END AS achievement_percentage
-                FROM daily_nutrition_summaries dns
-                JOIN daily_nutrition_nutrients dnn ON dns.id = dnn.summary_id
-                LEFT JOIN targets target ON target.user_id = :user_id
-                    AND target.is_active = true
-                LEFT JOIN target_nutrients tn ON target.id = tn.target_id
-                    AND dnn.code = tn.code
-                WHERE dns.user_id = :user_id
-                    AND dns.date >= CAST(:start_date AS date)
-                    AND dns.date < CAST(:end_date AS date)
-                GROUP BY dns.date, target.id
+                FROM daily_nutrients dn
+                LEFT JOIN active_target at ON true
+                LEFT JOIN target_nutrients_all tn ON at.id = tn.target_id
+                    AND dn.code = tn.code
+                GROUP BY dn.date, at.id
             ),
             report_summary AS (
                 SELECT
@@ -105,7 +200,7 @@ class SqlAlchemyCalendarRepository(CalendarRepositoryPort):
         """)
 
         result: Result[Row[Any]] = self._session.execute(query, {
-            'user_id': request.user_id,
+            'user_id': user_id,
             'start_date': start_date,
             'end_date': end_date
         })
@@ -121,3 +216,35 @@ class SqlAlchemyCalendarRepository(CalendarRepositoryPort):
             ))
 
         return days
+
+
+class AsyncSqlAlchemyCalendarRepository(AsyncCalendarRepositoryPort):
+    """
+    AsyncSession 上のカレンダーリポジトリ実装。
+
+    クエリと行の変換は同期版をそのまま run_sync で実行する
+    （run_sync 内も async ドライバで待つので、イベントループは塞がない）。
+    """
+
+    def __init__(self, session: "AsyncSession", use_rollups: bool | None = None) -> None:
+        self._session = session
+        self._use_rollups = use_rollups
+
+    def _sync(self, session: Session) -> SqlAlchemyCalendarRepository:
+        return SqlAlchemyCalendarRepository(session, use_rollups=self._use_rollups)
+
+    async def get_monthly_summary(
+        self,
+        request: MonthlyCalendarDto
+    ) -> List[CalendarDaySnapshot]:
+        return await self._session.run_sync(
+            lambda session: self._sync(session).get_monthly_summary(request)
+        )
+
+    async def get_range_summary(
+        self,
+        request: CalendarRangeDto
+    ) -> List[CalendarDaySnapshot]:
+        return await self._session.run_sync(
+            lambda session: self._sync(session).get_range_summary(request)
+        )
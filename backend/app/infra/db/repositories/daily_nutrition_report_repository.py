@@ -4,6 +4,7 @@ from datetime import date
 from typing import Sequence
 from uuid import UUID
 
+import sqlalchemy as sa
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
@@ -15,7 +16,12 @@ from app.domain.nutrition.daily_report import (
     DailyNutritionReport,
     DailyNutritionReportId,
 )
+from app.infra.db.day_rollups import HAS_DAILY_REPORT, set_day_rollup_value
+from app.infra.db.models.daily_nutrition import DailyNutritionSummaryModel
 from app.infra.db.models.daily_nutrition_report import DailyNutritionReportModel
+from app.infra.db.models.meal import FoodEntryModel
+from app.infra.db.models.profile import ProfileModel
+from app.infra.db.models.user import UserModel
 
 
 class SqlAlchemyDailyNutritionReportRepository(DailyNutritionReportRepositoryPort):
@@ -112,4 +118,53 @@ class SqlAlchemyDailyNutritionReportRepository(DailyNutritionReportRepositoryPor
             self._session.add(model)
 
         self._update_model_from_entity(model, report)
+        set_day_rollup_value(
+            self._session, report.user_id.value, report.date, HAS_DAILY_REPORT, True
+        )
         # commit は Unit of Work / 外側に任せる
+
+    # --- バッチ用 -----------------------------------------------------
+
+    def list_report_ready_days(
+        self,
+        start_date: date,
+        end_date: date,
+    ) -> list[tuple[UUID, date]]:
+        """
+        [start_date, end_date] でレポートを作れる (user_id, date) を 1 クエリで返す（夜間ジョブ用）。
+
+        - 記録完了: main の meal_index（1..meals_per_day）の種類数が meals_per_day と一致
+          （CheckDailyLogCompletionUseCase と同じ条件）
+        - DailyNutritionSummary がある / レポートがまだ無い / 退会していない
+        """
+        fe = FoodEntryModel
+        p = ProfileModel
+        summary_exists = sa.exists().where(
+            DailyNutritionSummaryModel.user_id == fe.user_id,
+            DailyNutritionSummaryModel.date == fe.date,
+        )
+        report_exists = sa.exists().where(
+            DailyNutritionReportModel.user_id == fe.user_id,
+            DailyNutritionReportModel.date == fe.date,
+        )
+        stmt = (
+            sa.select(fe.user_id, fe.date)
+            .join(p, p.user_id == fe.user_id)
+            .join(UserModel, UserModel.id == fe.user_id)
+            .where(
+                fe.date >= start_date,
+                fe.date <= end_date,
+                fe.deleted_at.is_(None),
+                fe.meal_type == "main",
+                p.meals_per_day >= 1,
+                fe.meal_index >= 1,
+                fe.meal_index <= p.meals_per_day,
+                UserModel.deleted_at.is_(None),
+                summary_exists,
+                ~report_exists,
+            )
+            .group_by(fe.user_id, fe.date, p.meals_per_day)
+            .having(sa.func.count(sa.distinct(fe.meal_index)) == p.meals_per_day)
+            .order_by(fe.date, fe.user_id)
+        )
+        return [(row.user_id, row.date) for row in self._session.execute(stmt)]
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import Sequence
-from uuid import UUID
+from typing import TYPE_CHECKING, Mapping, Sequence
+from uuid import UUID, uuid4
 
-from sqlalchemy.orm import Session, selectinload
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
 
 from app.application.nutrition.ports.daily_nutrition_repository_port import (
+    AsyncDailyNutritionSummaryRepositoryPort,
     DailyNutritionSummaryRepositoryPort,
 )
 from app.domain.auth.value_objects import UserId
@@ -20,6 +22,18 @@ from app.infra.db.models.daily_nutrition import (
     DailyNutritionSummaryModel,
     DailyNutritionNutrientModel,
 )
+from app.infra.db.day_rollups import NUTRITION_ACHIEVEMENT, mark_day_rollup_dirty
+from app.infra.db.nutrient_storage import (
+    NutrientStorageMode,
+    current_nutrient_storage_mode,
+    decode_nutrients,
+    encode_nutrients,
+    nutrients_load_option,
+)
+from app.infra.db.upsert import dialect_insert, expire_cached
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 
 class SqlAlchemyDailyNutritionSummaryRepository(DailyNutritionSummaryRepositoryPort):
@@ -27,22 +41,29 @@ class SqlAlchemyDailyNutritionSummaryRepository(DailyNutritionSummaryRepositoryP
     DailyNutritionSummaryRepositoryPort の SQLAlchemy 実装。
     """
 
-    def __init__(self, session: Session) -> None:
+    def __init__(
+        self,
+        session: Session,
+        nutrient_storage: NutrientStorageMode | None = None,
+    ) -> None:
         self._session = session
+        self._storage = nutrient_storage or current_nutrient_storage_mode()
 
     # --- Entity <-> Model 変換 ----------------------------------------
 
     def _to_entity(self, model: DailyNutritionSummaryModel) -> DailyNutritionSummary:
-        nutrients: list[DailyNutrientIntake] = []
-        for n in model.nutrients:
-            nutrients.append(
+        if model.nutrients_compact is not None:
+            nutrients = decode_nutrients(model.nutrients_compact, DailyNutrientIntake)
+        else:
+            nutrients = [
                 DailyNutrientIntake(
                     code=NutrientCode(n.code),
                     amount=NutrientAmount(
                         value=n.amount_value, unit=n.amount_unit),
                     source=NutrientSource(n.source),
                 )
-            )
+                for n in model.nutrients
+            ]
 
         return DailyNutritionSummary(
             id=DailyNutritionSummaryId(model.id),
@@ -52,31 +73,6 @@ class SqlAlchemyDailyNutritionSummaryRepository(DailyNutritionSummaryRepositoryP
             generated_at=model.generated_at,
         )
 
-    def _apply_entity_to_model(
-        self,
-        entity: DailyNutritionSummary,
-        model: DailyNutritionSummaryModel,
-    ) -> None:
-        """
-        Entity の内容を既存の Model に反映する（nutrients は入れ替え）。
-        """
-        model.user_id = UUID(entity.user_id.value)
-        model.date = entity.date
-        # generated_at は原則として初回作成時の値を維持したいので、ここでは触らない
-
-        # nutrients: いったん全部消して入れ直すシンプルな実装
-        model.nutrients.clear()
-        for n in entity.nutrients:
-            model.nutrients.append(
-                DailyNutritionNutrientModel(
-                    summary_id=model.id,
-                    code=n.code.value,
-                    amount_value=n.amount.value,
-                    amount_unit=n.amount.unit,
-                    source=n.source.value,
-                )
-            )
-
     # --- Port 実装 -----------------------------------------------------
 
     def get_by_user_and_date(
@@ -87,7 +83,10 @@ class SqlAlchemyDailyNutritionSummaryRepository(DailyNutritionSummaryRepositoryP
     ) -> DailyNutritionSummary | None:
         model = (
             self._session.query(DailyNutritionSummaryModel)
-            .options(selectinload(DailyNutritionSummaryModel.nutrients))
+            .options(
+                nutrients_load_option(
+                    self._storage, DailyNutritionSummaryModel.nutrients)
+            )
             .filter(
                 DailyNutritionSummaryModel.user_id == UUID(user_id.value),
                 DailyNutritionSummaryModel.date == target_date,
@@ -107,7 +106,10 @@ class SqlAlchemyDailyNutritionSummaryRepository(DailyNutritionSummaryRepositoryP
     ) -> Sequence[DailyNutritionSummary]:
         models: Sequence[DailyNutritionSummaryModel] = (
             self._session.query(DailyNutritionSummaryModel)
-            .options(selectinload(DailyNutritionSummaryModel.nutrients))
+            .options(
+                nutrients_load_option(
+                    self._storage, DailyNutritionSummaryModel.nutrients)
+            )
             .filter(
                 DailyNutritionSummaryModel.user_id == UUID(user_id.value),
                 DailyNutritionSummaryModel.date >= start_date,
@@ -118,31 +120,260 @@ class SqlAlchemyDailyNutritionSummaryRepository(DailyNutritionSummaryRepositoryP
         )
         return [self._to_entity(m) for m in models]
 
+    def lock_for_update(
+        self,
+        *,
+        user_id: UserId,
+        target_date: date,
+    ) -> bool:
+        """
+        INSERT ... ON CONFLICT (user_id, date) DO NOTHING で空のヘッダ行を用意してから
+        SELECT ... FOR UPDATE でロックする。
+
+        - INSERT が競合した側は、先に入れた側のトランザクションが終わるまで待つ。
+        - 空の行は nutrients_compact が NULL で栄養素行も無いので、差分の反映は
+          失敗して全再計算に回る。
+        """
+        summaries = DailyNutritionSummaryModel.__table__
+        inserted = self._session.execute(
+            dialect_insert(self._session, summaries)
+            .values(
+                id=uuid4(),
+                user_id=UUID(user_id.value),
+                date=target_date,
+            )
+            .on_conflict_do_nothing(index_elements=["user_id", "date"])
+        ).rowcount
+        self._session.execute(
+            sa.select(summaries.c.id)
+            .where(
+                summaries.c.user_id == UUID(user_id.value),
+                summaries.c.date == target_date,
+            )
+            .with_for_update()
+        ).scalar_one()
+        return inserted == 0
+
+    def apply_nutrient_deltas(
+        self,
+        *,
+        user_id: UserId,
+        target_date: date,
+        deltas: Mapping[NutrientCode, float],
+    ) -> bool:
+        """
+        UPDATE daily_nutrition_nutrients
+           SET amount_value = amount_value + CASE code WHEN ... END
+         WHERE summary_id = (サマリの id) AND code IN (...)
+
+        を 1 文で発行する。一致した行数が deltas の件数と違えば False。
+
+        dual / compact では nutrients_compact も更新する。JSON の中身を SQL で
+        足し込むのは方言依存になるので、親行をロックして読み、Python で加算して書き戻す。
+        """
+        if not deltas:
+            return self._session.query(
+                sa.exists().where(
+                    DailyNutritionSummaryModel.user_id == UUID(user_id.value),
+                    DailyNutritionSummaryModel.date == target_date,
+                )
+            ).scalar()
+
+        mark_day_rollup_dirty(
+            self._session, user_id.value, target_date, NUTRITION_ACHIEVEMENT
+        )
+        if self._storage.writes_compact and not self._apply_compact_deltas(
+            user_id, target_date, deltas
+        ):
+            return False
+        if not self._storage.writes_rows:
+            return True
+
+        nutrients = DailyNutritionNutrientModel.__table__
+        # rows では nutrients_compact を持つ行（dual / compact で書いた行）に子テーブルだけ
+        # 足すと、そちらを優先する読み取りと食い違う。一致 0 件として計算し直させる。
+        summary_id = (
+            sa.select(DailyNutritionSummaryModel.id)
+            .where(
+                DailyNutritionSummaryModel.user_id == UUID(user_id.value),
+                DailyNutritionSummaryModel.date == target_date,
+                *(
+                    []
+                    if self._storage.writes_compact
+                    else [DailyNutritionSummaryModel.nutrients_compact.is_(None)]
+                ),
+            )
+            .scalar_subquery()
+        )
+        by_code = {code.value: float(delta) for code, delta in deltas.items()}
+
+        result = self._session.execute(
+            sa.update(nutrients)
+            .where(
+                nutrients.c.summary_id == summary_id,
+                nutrients.c.code.in_(list(by_code)),
+            )
+            .values(
+                amount_value=nutrients.c.amount_value
+                + sa.case(by_code, value=nutrients.c.code, else_=0.0)
+            )
+        )
+        # summary_id が分からないので、保持している栄養素行はまとめて読み直させる
+        expire_cached(
+            self._session, DailyNutritionNutrientModel, lambda identity: True
+        )
+        return result.rowcount == len(by_code)
+
+    def _apply_compact_deltas(
+        self,
+        user_id: UserId,
+        target_date: date,
+        deltas: Mapping[NutrientCode, float],
+    ) -> bool:
+        summaries = DailyNutritionSummaryModel.__table__
+        row = self._session.execute(
+            sa.select(summaries.c.id, summaries.c.nutrients_compact)
+            .where(
+                summaries.c.user_id == UUID(user_id.value),
+                summaries.c.date == target_date,
+            )
+            .with_for_update()
+        ).one_or_none()
+        if row is None or row.nutrients_compact is None:
+            return False
+
+        compact = dict(row.nutrients_compact)
+        if any(code.value not in compact for code in deltas):
+            return False
+        for code, delta in deltas.items():
+            value, unit, source = compact[code.value]
+            compact[code.value] = [float(value) + float(delta), unit, source]
+
+        self._session.execute(
+            sa.update(summaries)
+            .where(summaries.c.id == row.id)
+            .values(nutrients_compact=compact, updated_at=sa.func.now())
+        )
+        expire_cached(
+            self._session,
+            DailyNutritionSummaryModel,
+            lambda identity: identity[0] == row.id,
+        )
+        return True
+
     def save(self, summary: DailyNutritionSummary) -> None:
         """
-        summary.id をキーに insert/update を行う。
+        (user_id, date) をキーに upsert する。
+
+        - ヘッダ行: INSERT ... ON CONFLICT (user_id, date) DO UPDATE ... RETURNING id
+          （dual / compact ではここに nutrients_compact も入る）
+        - 栄養素行: 複数行 INSERT ... ON CONFLICT (summary_id, code) DO UPDATE
+          （compact では書かない）
+        - 新しいサマリに無い栄養素行だけ DELETE（compact では全行）
 
-        - 既存レコードがあれば更新
-        - なければ新規作成
+        既存行があればその id を summary.id に反映する（generated_at は初回の値を維持）。
         """
-        model = (
-            self._session.query(DailyNutritionSummaryModel)
-            .options(selectinload(DailyNutritionSummaryModel.nutrients))
-            .filter(DailyNutritionSummaryModel.id == summary.id.value)
-            .one_or_none()
+        summaries = DailyNutritionSummaryModel.__table__
+        header = dialect_insert(self._session, summaries).values(
+            id=summary.id.value,
+            user_id=UUID(summary.user_id.value),
+            date=summary.date,
+            generated_at=summary.generated_at,
+            updated_at=summary.generated_at,
+            nutrients_compact=(
+                encode_nutrients(summary.nutrients)
+                if self._storage.writes_compact
+                else None
+            ),
         )
+        summary_id: UUID = self._session.execute(
+            header.on_conflict_do_update(
+                index_elements=["user_id", "date"],
+                set_={
+                    "updated_at": sa.func.now(),
+                    "nutrients_compact": header.excluded.nutrients_compact,
+                },
+            ).returning(summaries.c.id)
+        ).scalar_one()
+        summary.id = DailyNutritionSummaryId(summary_id)
 
-        if model is None:
-            model = DailyNutritionSummaryModel(
-                id=summary.id.value,
-                user_id=UUID(summary.user_id.value),
-                date=summary.date,
-                generated_at=summary.generated_at,
-                updated_at=summary.generated_at,
-                nutrients=[],
+        nutrients = DailyNutritionNutrientModel.__table__
+        codes = (
+            [n.code.value for n in summary.nutrients]
+            if self._storage.writes_rows
+            else []
+        )
+        if codes:
+            rows = dialect_insert(self._session, nutrients).values(
+                [
+                    {
+                        "summary_id": summary_id,
+                        "code": n.code.value,
+                        "amount_value": n.amount.value,
+                        "amount_unit": n.amount.unit,
+                        "source": n.source.value,
+                    }
+                    for n in summary.nutrients
+                ]
             )
-            self._apply_entity_to_model(summary, model)
-            self._session.add(model)
-        else:
-            self._apply_entity_to_model(summary, model)
-            # updated_at は DB側の onupdate に任せる
+            self._session.execute(
+                rows.on_conflict_do_update(
+                    index_elements=["summary_id", "code"],
+                    set_={
+                        "amount_value": rows.excluded.amount_value,
+                        "amount_unit": rows.excluded.amount_unit,
+                        "source": rows.excluded.source,
+                    },
+                )
+            )
+        self._session.execute(
+            sa.delete(nutrients).where(
+                nutrients.c.summary_id == summary_id,
+                *([nutrients.c.code.not_in(codes)] if codes else []),
+            )
+        )
+
+        expire_cached(
+            self._session,
+            DailyNutritionSummaryModel,
+            lambda identity: identity[0] == summary_id,
+        )
+        expire_cached(
+            self._session,
+            DailyNutritionNutrientModel,
+            lambda identity: identity[0] == summary_id,
+        )
+        mark_day_rollup_dirty(
+            self._session, summary.user_id.value, summary.date, NUTRITION_ACHIEVEMENT
+        )
+
+
+class AsyncSqlAlchemyDailyNutritionSummaryRepository(
+    AsyncDailyNutritionSummaryRepositoryPort
+):
+    """
+    AsyncSession 上の参照系実装。
+
+    読み込み方（compact / 子テーブル、NULL 行の遅延ロード）は同期版と同じにしたいので、
+    同期版を run_sync 内で呼ぶ（遅延ロードも async ドライバで待つ）。
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        nutrient_storage: NutrientStorageMode | None = None,
+    ) -> None:
+        self._session = session
+        self._storage = nutrient_storage
+
+    async def get_by_user_and_date(
+        self,
+        *,
+        user_id: UserId,
+        target_date: date,
+    ) -> DailyNutritionSummary | None:
+        return await self._session.run_sync(
+            lambda session: SqlAlchemyDailyNutritionSummaryRepository(
+                session, self._storage
+            ).get_by_user_and_date(user_id=user_id, target_date=target_date)
+        )
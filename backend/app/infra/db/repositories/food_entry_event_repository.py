@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Sequence
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Session, aliased
+
+from app.infra.db.models.food_entry_event import FoodEntryEventModel
+
+# last_error に残す長さの上限
+_MAX_ERROR_LENGTH = 2000
+
+Slot = tuple[UUID, date, str, int | None]
+
+
+def _slot_lock_id(slot: Slot) -> int:
+    # pg_try_advisory_xact_lock は signed bigint を取る
+    key = "food_entry_event:" + ":".join("" if v is None else str(v) for v in slot)
+    digest = hashlib.sha256(key.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big", signed=True)
+
+
+@dataclass(frozen=True)
+class FoodEntryEvent:
+    """food_entry_events の 1 行（ワーカーが取り出したもの）。"""
+
+    id: int
+    user_id: UUID
+    date: date
+    meal_type: str
+    meal_index: int | None
+    attempts: int
+
+    @property
+    def slot(self) -> Slot:
+        return (self.user_id, self.date, self.meal_type, self.meal_index)
+
+
+class SqlAlchemyFoodEntryEventRepository:
+    """
+    outbox（food_entry_events）をワーカーから操作するリポジトリ。
+
+    - claim(): FOR UPDATE SKIP LOCKED で未処理の行を取り、リース期限を付けて返す。
+      取り出しは食事スロット単位で、リース中の行があるスロットの行は取らない
+      （同じスロットを 2 つのワーカーが同時に計算しないように）。同時に claim した
+      ワーカー同士はスロットごとの advisory xact lock で譲り合う（Postgres のみ）。
+      リースを付けたらすぐ commit するので、再計算（LLM 呼び出しを含む）の間は
+      ロックも DB 接続も持たない。
+    - complete(): 処理済みの行を消す。
+    - release(): 失敗した行のリースを外し、retry_at 以降に取り直せるようにする。
+    - attempts が max_attempts に達した行は取り出さない（調査用に残す）。
+    """
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def claim(
+        self,
+        limit: int,
+        lease: timedelta,
+        max_attempts: int,
+        now: datetime | None = None,
+    ) -> list[FoodEntryEvent]:
+        now = now or datetime.now(timezone.utc)
+        m = FoodEntryEventModel
+        other = aliased(FoodEntryEventModel)
+        # 同じスロットにリース中の行がある（別のワーカーが計算中）
+        slot_leased = sa.exists().where(
+            other.user_id == m.user_id,
+            other.date == m.date,
+            other.meal_type == m.meal_type,
+            other.meal_index.is_not_distinct_from(m.meal_index),
+            other.claimed_until >= now,
+        )
+        candidates = self._session.execute(
+            sa.select(m.id, m.user_id, m.date, m.meal_type, m.meal_index)
+            .where(
+                m.available_at <= now,
+                sa.or_(m.claimed_until.is_(None), m.claimed_until < now),
+                m.attempts < max_attempts,
+                ~slot_leased,
+            )
+            .order_by(m.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        ).all()
+        if not candidates:
+            return []
+
+        slots: dict[Slot, list[int]] = {}
+        for row in candidates:
+            slots.setdefault(
+                (row.user_id, row.date, row.meal_type, row.meal_index), []
+            ).append(row.id)
+        ids = [id_ for slot in self._lock_slots(list(slots)) for id_ in slots[slot]]
+        if not ids:
+            return []
+
+        claimed_until = now + lease
+        # 候補を読んだ後に別のワーカーが同じスロットをリースして commit していれば取らない
+        self._session.execute(
+            sa.update(m)
+            .where(m.id.in_(ids), ~slot_leased)
+            .values(claimed_until=claimed_until, attempts=m.attempts + 1)
+        )
+        rows = self._session.execute(
+            sa.select(
+                m.id, m.user_id, m.date, m.meal_type, m.meal_index, m.attempts
+            )
+            .where(m.id.in_(ids), m.claimed_until == claimed_until)
+            .order_by(m.id)
+        )
+        return [
+            FoodEntryEvent(
+                id=row.id,
+                user_id=row.user_id,
+                date=row.date,
+                meal_type=row.meal_type,
+                meal_index=row.meal_index,
+                attempts=row.attempts,
+            )
+            for row in rows
+        ]
+
+    def _lock_slots(self, slots: list[Slot]) -> list[Slot]:
+        """
+        スロットごとの advisory xact lock を取れたものだけ返す（commit で外れる）。
+        Postgres 以外（テストの SQLite）は並行するワーカーが無いので全部返す。
+        """
+        if self._session.get_bind().dialect.name != "postgresql":
+            return slots
+        lock_ids = {_slot_lock_id(slot): slot for slot in slots}
+        locked = self._session.scalars(
+            sa.text(
+                "SELECT lock_id FROM unnest(CAST(:lock_ids AS bigint[])) AS lock_id "
+                "WHERE pg_try_advisory_xact_lock(lock_id)"
+            ),
+            {"lock_ids": list(lock_ids)},
+        ).all()
+        return [lock_ids[lock_id] for lock_id in locked]
+
+    def complete(self, ids: Sequence[int]) -> None:
+        if not ids:
+            return
+        self._session.execute(
+            sa.delete(FoodEntryEventModel).where(FoodEntryEventModel.id.in_(ids))
+        )
+
+    def release(self, ids: Sequence[int], error: str, retry_at: datetime) -> None:
+        if not ids:
+            return
+        self._session.execute(
+            sa.update(FoodEntryEventModel)
+            .where(FoodEntryEventModel.id.in_(ids))
+            .values(
+                claimed_until=None,
+                available_at=retry_at,
+                last_error=error[:_MAX_ERROR_LENGTH],
+            )
+        )
+
+    def count_pending(self) -> int:
+        """未処理の行数（監視 / ログ用）。"""
+        return self._session.scalar(
+            sa.select(sa.func.count()).select_from(FoodEntryEventModel)
+        ) or 0
@@ -4,6 +4,7 @@ from datetime import datetime, date
 from typing import Sequence
 from uuid import UUID
 
+import sqlalchemy as sa
 from sqlalchemy.orm import Session
 
 from app.application.meal.ports.food_entry_repository_port import FoodEntryRepositoryPort
@@ -11,7 +12,13 @@ from app.domain.auth.value_objects import UserId
 from app.domain.meal.entities import FoodEntry
 from app.domain.meal.errors import FoodEntryNotFoundError
 from app.domain.meal.value_objects import FoodEntryId, MealType
+from app.infra.db.day_rollups import (
+    HAS_MEAL_LOGS,
+    mark_day_rollup_dirty,
+    set_day_rollup_value,
+)
 from app.infra.db.models.meal import FoodEntryModel
+from app.infra.db.outbox import enqueue_food_entry_changed
 
 
 class SqlAlchemyFoodEntryRepository(FoodEntryRepositoryPort):
@@ -22,6 +29,8 @@ class SqlAlchemyFoodEntryRepository(FoodEntryRepositoryPort):
 
     def __init__(self, session: Session) -> None:
         self._session = session
+        # list_by_ids() で読んだ行（identity map は弱参照なので、ここで持つ）
+        self._listed: dict[UUID, FoodEntryModel] = {}
 
     # --- Entity <-> Model 変換 ----------------------------------------
 
@@ -64,6 +73,11 @@ class SqlAlchemyFoodEntryRepository(FoodEntryRepositoryPort):
     def add(self, entry: FoodEntry) -> None:
         model = self._from_entity(entry)
         self._session.add(model)
+        self._notify_changed(
+            entry.user_id.value,
+            [(entry.date, entry.meal_type.value, entry.meal_index)],
+            added=True,
+        )
 
     def update(self, entry: FoodEntry) -> None:
         """
@@ -84,16 +98,7 @@ class SqlAlchemyFoodEntryRepository(FoodEntryRepositoryPort):
             raise FoodEntryNotFoundError(
                 f"FoodEntry not found for id={entry.id} user_id={entry.user_id}"
             )
-
-        model.date = entry.date
-        model.meal_type = entry.meal_type.value
-        model.meal_index = entry.meal_index
-        model.name = entry.name
-        model.amount_value = entry.amount_value
-        model.amount_unit = entry.amount_unit
-        model.serving_count = entry.serving_count
-        model.note = entry.note
-        model.updated_at = datetime.utcnow()
+        self._notify_changed(model.user_id, self._apply_update(model, entry))
 
     def delete(self, entry: FoodEntry) -> None:
         """
@@ -113,8 +118,153 @@ class SqlAlchemyFoodEntryRepository(FoodEntryRepositoryPort):
         if model is None:
             # 既に削除済みなら何もしない（冪等性のため）
             return
+        self._notify_changed(model.user_id, [self._soft_delete(model)])
+
+    # --- 一括操作 -----------------------------------------------------
+
+    def add_many(self, entries: Sequence[FoodEntry]) -> None:
+        """
+        複数行を 1 文の INSERT（VALUES に複数行）で入れる。
+
+        - ORM の identity map には載せない（作成直後に同じセッションで読む用途は無い）。
+        """
+        if not entries:
+            return
+        rows = [
+            {
+                column.key: getattr(model, column.key)
+                for column in FoodEntryModel.__table__.columns
+            }
+            for model in (self._from_entity(entry) for entry in entries)
+        ]
+        self._session.execute(sa.insert(FoodEntryModel.__table__).values(rows))
+        for user_id in {entry.user_id.value for entry in entries}:
+            self._notify_changed(
+                user_id,
+                [
+                    (entry.date, entry.meal_type.value, entry.meal_index)
+                    for entry in entries
+                    if entry.user_id.value == user_id
+                ],
+                added=True,
+            )
+
+    def update_many(self, entries: Sequence[FoodEntry]) -> None:
+        if not entries:
+            return
+        by_user: dict[str, list[FoodEntry]] = {}
+        for entry in entries:
+            by_user.setdefault(entry.user_id.value, []).append(entry)
+
+        for user_id, user_entries in by_user.items():
+            models = {
+                model.id: model
+                for model in self._reuse_or_load_many(
+                    user_id, [entry.id.value for entry in user_entries])
+            }
+            slots: list[tuple[date, str, int | None]] = []
+            for entry in user_entries:
+                model = models.get(entry.id.value)
+                if model is None:
+                    raise FoodEntryNotFoundError(
+                        f"FoodEntry not found for id={entry.id} user_id={entry.user_id}"
+                    )
+                slots.extend(self._apply_update(model, entry))
+            self._notify_changed(user_id, slots)
+
+    def delete_many(self, entries: Sequence[FoodEntry]) -> None:
+        by_user: dict[str, list[UUID]] = {}
+        for entry in entries:
+            by_user.setdefault(entry.user_id.value, []).append(entry.id.value)
+
+        for user_id, ids in by_user.items():
+            # 既に削除済みのものは読まれないので、何もしない（冪等性のため）
+            self._notify_changed(
+                user_id,
+                [
+                    self._soft_delete(model)
+                    for model in self._reuse_or_load_many(user_id, ids)
+                ],
+            )
+
+    # --- 更新の共通処理 -----------------------------------------------
+
+    def _load_many(self, user_id: str, ids: Sequence[UUID]) -> list[FoodEntryModel]:
+        if not ids:
+            return []
+        return (
+            self._session.query(FoodEntryModel)
+            .filter(
+                FoodEntryModel.id.in_(ids),
+                FoodEntryModel.user_id == UUID(user_id),
+                FoodEntryModel.deleted_at.is_(None),
+            )
+            .all()
+        )
+
+    def _reuse_or_load_many(
+        self, user_id: str, ids: Sequence[UUID]
+    ) -> list[FoodEntryModel]:
+        """
+        一括更新 / 削除の対象を返す。UseCase が同じ UoW の list_by_ids() で読んだ行は
+        そのときのモデルを使い、無いもの（読み直しが必要なもの）だけ IN で読む。
+        """
+        owner = UUID(user_id)
+        models: list[FoodEntryModel] = []
+        missing: list[UUID] = []
+        for id_ in ids:
+            model = self._listed.get(id_)
+            if model is None or sa.inspect(model).expired_attributes:
+                missing.append(id_)
+            elif model.user_id == owner and model.deleted_at is None:
+                models.append(model)
+        return models + self._load_many(user_id, missing)
+
+    def _apply_update(
+        self, model: FoodEntryModel, entry: FoodEntry
+    ) -> list[tuple[date, str, int | None]]:
+        """model に entry の内容を反映し、影響する (date, meal_type, meal_index) を返す。"""
+        # 日付 / 食事が変わる場合は移動元も計算し直すので、両方返す
+        old_slot = (model.date, model.meal_type, model.meal_index)
+        new_slot = (entry.date, entry.meal_type.value, entry.meal_index)
+
+        model.date = entry.date
+        model.meal_type = entry.meal_type.value
+        model.meal_index = entry.meal_index
+        model.name = entry.name
+        model.amount_value = entry.amount_value
+        model.amount_unit = entry.amount_unit
+        model.serving_count = entry.serving_count
+        model.note = entry.note
+        model.updated_at = datetime.utcnow()
+        return [old_slot] if new_slot == old_slot else [old_slot, new_slot]
 
+    def _soft_delete(self, model: FoodEntryModel) -> tuple[date, str, int | None]:
         model.deleted_at = datetime.utcnow()
+        return (model.date, model.meal_type, model.meal_index)
+
+    def _notify_changed(
+        self,
+        user_id: UUID | str,
+        slots: Sequence[tuple[date, str, int | None]],
+        *,
+        added: bool = False,
+    ) -> None:
+        """
+        変更のあった日の has_meal_logs を更新対象にし、食事スロットの栄養の計算し直しを依頼する。
+        一括操作で同じ日 / スロットが重なっても 1 回ずつにまとめる。
+
+        - 追加なら記録があるのは確定なので、集計は読み直さずに True を書く。
+        - 更新 / 削除はその日に記録が残っているかを commit 前に確かめ直す。
+        - 達成率は日別サマリの再計算（DailyNutritionSummary の保存）側で更新される。
+        """
+        for date_ in dict.fromkeys(slot[0] for slot in slots):
+            if added:
+                set_day_rollup_value(self._session, user_id, date_, HAS_MEAL_LOGS, True)
+            else:
+                mark_day_rollup_dirty(self._session, user_id, date_, HAS_MEAL_LOGS)
+        for slot in dict.fromkeys(slots):
+            enqueue_food_entry_changed(self._session, user_id, *slot)
 
     # --- 検索 ---------------------------------------------------------
 
@@ -132,6 +282,16 @@ class SqlAlchemyFoodEntryRepository(FoodEntryRepositoryPort):
             return None
         return self._to_entity(model)
 
+    def list_by_ids(
+        self,
+        user_id: UserId,
+        entry_ids: Sequence[FoodEntryId],
+    ) -> Sequence[FoodEntry]:
+        models = self._load_many(user_id.value, [eid.value for eid in entry_ids])
+        # 続く update_many() / delete_many() で読み直さないように持っておく
+        self._listed.update((m.id, m) for m in models)
+        return [self._to_entity(m) for m in models]
+
     def list_by_user_and_date(
         self,
         user_id: UserId,
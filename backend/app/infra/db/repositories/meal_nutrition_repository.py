@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import Sequence
+from typing import TYPE_CHECKING, Sequence
 from uuid import UUID
 
-from sqlalchemy.orm import Session, selectinload
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
 
 from app.application.nutrition.ports.meal_nutrition_repository_port import (
+    AsyncMealNutritionSummaryRepositoryPort,
     MealNutritionSummaryRepositoryPort,
 )
 from app.domain.auth.value_objects import UserId
@@ -21,25 +23,35 @@ from app.infra.db.models.meal_nutrition import (
     MealNutritionSummaryModel,
     MealNutritionNutrientModel,
 )
+from app.infra.db.nutrient_storage import (
+    NutrientStorageMode,
+    current_nutrient_storage_mode,
+    decode_nutrients,
+    encode_nutrients,
+    nutrients_load_option,
+)
+from app.infra.db.upsert import dialect_insert, expire_cached
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 
 class SqlAlchemyMealNutritionSummaryRepository(MealNutritionSummaryRepositoryPort):
-    def __init__(self, session: Session) -> None:
+    def __init__(
+        self,
+        session: Session,
+        nutrient_storage: NutrientStorageMode | None = None,
+    ) -> None:
         self._session = session
+        self._storage = nutrient_storage or current_nutrient_storage_mode()
 
     # --- Entity <-> Model 変換 ----------------------------------------
 
     def _to_entity(self, model: MealNutritionSummaryModel) -> MealNutritionSummary:
-        nutrients: list[MealNutrientIntake] = []
-        for n in model.nutrients:
-            nutrients.append(
-                MealNutrientIntake(
-                    code=NutrientCode(n.code),
-                    amount=NutrientAmount(
-                        value=n.amount_value, unit=n.amount_unit),
-                    source=NutrientSource(n.source),
-                )
-            )
+        if model.nutrients_compact is not None:
+            nutrients = decode_nutrients(model.nutrients_compact, MealNutrientIntake)
+        else:
+            nutrients = self._nutrients_from_rows(model)
 
         return MealNutritionSummary(
             id=MealNutritionSummaryId(model.id),
@@ -51,29 +63,21 @@ class SqlAlchemyMealNutritionSummaryRepository(MealNutritionSummaryRepositoryPor
             generated_at=model.generated_at,
         )
 
-    def _apply_entity_to_model(
-        self,
-        entity: MealNutritionSummary,
+    @staticmethod
+    def _nutrients_from_rows(
         model: MealNutritionSummaryModel,
-    ) -> None:
-        model.user_id = UUID(entity.user_id.value)
-        model.date = entity.date
-        model.meal_type = entity.meal_type.value
-        model.meal_index = entity.meal_index
-        # generated_at は基本的に作成時の値を維持したいので更新しない
-
-        # nutrients: いったん全部消して入れ直すシンプル実装
-        model.nutrients.clear()
-        for n in entity.nutrients:
-            model.nutrients.append(
-                MealNutritionNutrientModel(
-                    summary_id=model.id,
-                    code=n.code.value,
-                    amount_value=n.amount.value,
-                    amount_unit=n.amount.unit,
-                    source=n.source.value,
+    ) -> list[MealNutrientIntake]:
+        nutrients: list[MealNutrientIntake] = []
+        for n in model.nutrients:
+            nutrients.append(
+                MealNutrientIntake(
+                    code=NutrientCode(n.code),
+                    amount=NutrientAmount(
+                        value=n.amount_value, unit=n.amount_unit),
+                    source=NutrientSource(n.source),
                 )
             )
+        return nutrients
 
     # --- Port 実装 -----------------------------------------------------
 
@@ -87,7 +91,10 @@ class SqlAlchemyMealNutritionSummaryRepository(MealNutritionSummaryRepositoryPor
     ) -> MealNutritionSummary | None:
         model = (
             self._session.query(MealNutritionSummaryModel)
-            .options(selectinload(MealNutritionSummaryModel.nutrients))
+            .options(
+                nutrients_load_option(
+                    self._storage, MealNutritionSummaryModel.nutrients)
+            )
             .filter(
                 MealNutritionSummaryModel.user_id == UUID(user_id.value),
                 MealNutritionSummaryModel.date == target_date,
@@ -108,7 +115,10 @@ class SqlAlchemyMealNutritionSummaryRepository(MealNutritionSummaryRepositoryPor
     ) -> Sequence[MealNutritionSummary]:
         models: Sequence[MealNutritionSummaryModel] = (
             self._session.query(MealNutritionSummaryModel)
-            .options(selectinload(MealNutritionSummaryModel.nutrients))
+            .options(
+                nutrients_load_option(
+                    self._storage, MealNutritionSummaryModel.nutrients)
+            )
             .filter(
                 MealNutritionSummaryModel.user_id == UUID(user_id.value),
                 MealNutritionSummaryModel.date == target_date,
@@ -121,33 +131,156 @@ class SqlAlchemyMealNutritionSummaryRepository(MealNutritionSummaryRepositoryPor
         )
         return [self._to_entity(m) for m in models]
 
+    def list_user_dates_in_range(
+        self,
+        *,
+        start_date: date,
+        end_date: date,
+    ) -> Sequence[tuple[UserId, date]]:
+        rows = (
+            self._session.query(
+                MealNutritionSummaryModel.user_id,
+                MealNutritionSummaryModel.date,
+            )
+            .filter(
+                MealNutritionSummaryModel.date >= start_date,
+                MealNutritionSummaryModel.date <= end_date,
+            )
+            .distinct()
+            .order_by(
+                MealNutritionSummaryModel.date.asc(),
+                MealNutritionSummaryModel.user_id.asc(),
+            )
+            .all()
+        )
+        return [(UserId(str(user_id)), d) for user_id, d in rows]
+
     def save(self, summary: MealNutritionSummary) -> None:
         """
-        summary.id をキーに insert/update を行う。
+        (user_id, date, meal_type, meal_index) をキーに upsert する。
+
+        - ヘッダ行: INSERT ... ON CONFLICT (スロット) DO UPDATE ... RETURNING id
+          （dual / compact ではここに nutrients_compact も入る）
+        - 栄養素行: 複数行 INSERT ... ON CONFLICT (summary_id, code) DO UPDATE
+          （compact では書かない）
+        - 新しいサマリに無い栄養素行だけ DELETE（compact では全行）
 
-        - 既存レコードがあれば更新
-        - なければ新規作成
+        既存行があればその id を summary.id に反映する（generated_at は初回の値を維持）。
         """
-        model = (
-            self._session.query(MealNutritionSummaryModel)
-            .options(selectinload(MealNutritionSummaryModel.nutrients))
-            .filter(MealNutritionSummaryModel.id == summary.id.value)
-            .one_or_none()
+        summaries = MealNutritionSummaryModel.__table__
+        header = dialect_insert(self._session, summaries).values(
+            id=summary.id.value,
+            user_id=UUID(summary.user_id.value),
+            date=summary.date,
+            meal_type=summary.meal_type.value,
+            meal_index=summary.meal_index,
+            generated_at=summary.generated_at,
+            updated_at=summary.generated_at,
+            nutrients_compact=(
+                encode_nutrients(summary.nutrients)
+                if self._storage.writes_compact
+                else None
+            ),
         )
-
-        if model is None:
-            model = MealNutritionSummaryModel(
-                id=summary.id.value,
-                user_id=UUID(summary.user_id.value),
-                date=summary.date,
-                meal_type=summary.meal_type.value,
-                meal_index=summary.meal_index,
-                generated_at=summary.generated_at,
-                updated_at=summary.generated_at,
-                nutrients=[],
+        if summary.meal_index is None:
+            # 間食 (meal_index IS NULL) は部分ユニークインデックスで一意
+            conflict = dict(
+                index_elements=["user_id", "date", "meal_type"],
+                index_where=summaries.c.meal_index.is_(None),
             )
-            self._apply_entity_to_model(summary, model)
-            self._session.add(model)
         else:
-            self._apply_entity_to_model(summary, model)
-            # updated_at は DB 側の onupdate に任せる
+            conflict = dict(
+                index_elements=["user_id", "date", "meal_type", "meal_index"],
+            )
+        summary_id: UUID = self._session.execute(
+            header.on_conflict_do_update(
+                **conflict,
+                set_={
+                    "updated_at": sa.func.now(),
+                    "nutrients_compact": header.excluded.nutrients_compact,
+                },
+            ).returning(summaries.c.id)
+        ).scalar_one()
+        summary.id = MealNutritionSummaryId(summary_id)
+
+        nutrients = MealNutritionNutrientModel.__table__
+        codes = (
+            [n.code.value for n in summary.nutrients]
+            if self._storage.writes_rows
+            else []
+        )
+        if codes:
+            rows = dialect_insert(self._session, nutrients).values(
+                [
+                    {
+                        "summary_id": summary_id,
+                        "code": n.code.value,
+                        "amount_value": n.amount.value,
+                        "amount_unit": n.amount.unit,
+                        "source": n.source.value,
+                    }
+                    for n in summary.nutrients
+                ]
+            )
+            self._session.execute(
+                rows.on_conflict_do_update(
+                    index_elements=["summary_id", "code"],
+                    set_={
+                        "amount_value": rows.excluded.amount_value,
+                        "amount_unit": rows.excluded.amount_unit,
+                        "source": rows.excluded.source,
+                    },
+                )
+            )
+        self._session.execute(
+            sa.delete(nutrients).where(
+                nutrients.c.summary_id == summary_id,
+                *([nutrients.c.code.not_in(codes)] if codes else []),
+            )
+        )
+
+        expire_cached(
+            self._session,
+            MealNutritionSummaryModel,
+            lambda identity: identity[0] == summary_id,
+        )
+        expire_cached(
+            self._session,
+            MealNutritionNutrientModel,
+            lambda identity: identity[0] == summary_id,
+        )
+
+
+class AsyncSqlAlchemyMealNutritionSummaryRepository(
+    AsyncMealNutritionSummaryRepositoryPort
+):
+    """
+    AsyncSession 上の参照系実装（同期版を run_sync 内で呼ぶ）。
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        nutrient_storage: NutrientStorageMode | None = None,
+    ) -> None:
+        self._session = session
+        self._storage = nutrient_storage
+
+    async def get_by_user_date_meal(
+        self,
+        *,
+        user_id: UserId,
+        target_date: date,
+        meal_type: MealType,
+        meal_index: int | None,
+    ) -> MealNutritionSummary | None:
+        return await self._session.run_sync(
+            lambda session: SqlAlchemyMealNutritionSummaryRepository(
+                session, self._storage
+            ).get_by_user_date_meal(
+                user_id=user_id,
+                target_date=target_date,
+                meal_type=meal_type,
+                meal_index=meal_index,
+            )
+        )
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from uuid import UUID
+
+import sqlalchemy as sa
 from sqlalchemy.orm import Session
 
 from app.application.profile.ports.profile_repository_port import ProfileRepositoryPort
@@ -33,6 +36,10 @@ class SqlAlchemyProfileRepository(ProfileRepositoryPort):
             weight_kg=WeightKg(model.weight_kg),
             image_id=ProfileImageId(
                 model.image_id) if model.image_id else None,
+            image_thumbnails={
+                int(size): ProfileImageId(key)
+                for size, key in (model.image_thumbnails or {}).items()
+            },
             meals_per_day=model.meals_per_day,
             created_at=model.created_at,
             updated_at=model.updated_at,
@@ -40,9 +47,9 @@ class SqlAlchemyProfileRepository(ProfileRepositoryPort):
 
     def _from_entity(self, entity: Profile) -> ProfileModel:
         existing: ProfileModel | None = self._session.get(
-            ProfileModel, entity.user_id.value)
+            ProfileModel, UUID(entity.user_id.value))
         if existing is None:
-            model = ProfileModel(user_id=entity.user_id.value)
+            model = ProfileModel(user_id=UUID(entity.user_id.value))
         else:
             model = existing
 
@@ -50,7 +57,12 @@ class SqlAlchemyProfileRepository(ProfileRepositoryPort):
         model.birthdate = entity.birthdate
         model.height_cm = entity.height_cm.value
         model.weight_kg = entity.weight_kg.value
-        model.image_id = entity.image_id.value if entity.image_id else None
+        image_id = entity.image_id.value if entity.image_id else None
+        # サムネイルは attach_thumbnails() だけが書く。ここで entity の値を書き戻すと、
+        # 読んだ後に生成が終わったサムネイルの記録を消してしまう
+        if existing is not None and model.image_id != image_id:
+            model.image_thumbnails = None
+        model.image_id = image_id
         model.meals_per_day = entity.meals_per_day
         model.created_at = entity.created_at
         model.updated_at = entity.updated_at
@@ -60,7 +72,7 @@ class SqlAlchemyProfileRepository(ProfileRepositoryPort):
     # --- Port 実装 ---------------------------------------------------
 
     def get_by_user_id(self, user_id: UserId) -> Profile | None:
-        model = self._session.get(ProfileModel, user_id.value)
+        model = self._session.get(ProfileModel, UUID(user_id.value))
         if model is None:
             return None
         return self._to_entity(model)
@@ -79,3 +91,28 @@ class SqlAlchemyProfileRepository(ProfileRepositoryPort):
         self._session.flush()
 
         return self._to_entity(model)
+
+    def attach_thumbnails(
+        self,
+        user_id: UserId,
+        image_id: ProfileImageId,
+        thumbnails: dict[int, ProfileImageId],
+    ) -> bool:
+        """
+        UPDATE ... WHERE user_id = ? AND image_id = ? で、この列だけを書く。
+        プロフィールの他の列は読まないので、同時に走る save() と競合しない。
+        """
+        result = self._session.execute(
+            sa.update(ProfileModel)
+            .where(
+                ProfileModel.user_id == UUID(user_id.value),
+                ProfileModel.image_id == image_id.value,
+            )
+            .values(
+                image_thumbnails={
+                    str(size): thumbnail_id.value
+                    for size, thumbnail_id in thumbnails.items()
+                }
+            )
+        )
+        return result.rowcount == 1
@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import List
 from uuid import UUID
 
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm import Session
 from sqlalchemy import select, update
 
 from app.application.target.ports.target_repository_port import TargetRepositoryPort
@@ -19,7 +19,15 @@ from app.domain.target.value_objects import (
     NutrientSource,
 )
 
+from app.infra.db.day_rollups import mark_active_target_changed
 from app.infra.db.models.target import TargetModel, TargetNutrientModel
+from app.infra.db.nutrient_storage import (
+    NutrientStorageMode,
+    current_nutrient_storage_mode,
+    decode_nutrients,
+    encode_nutrients,
+    nutrients_load_option,
+)
 
 
 class SqlAlchemyTargetRepository(TargetRepositoryPort):
@@ -27,14 +35,24 @@ class SqlAlchemyTargetRepository(TargetRepositoryPort):
     TargetRepositoryPort の SQLAlchemy 実装。
     """
 
-    def __init__(self, session: Session) -> None:
+    def __init__(
+        self,
+        session: Session,
+        nutrient_storage: NutrientStorageMode | None = None,
+    ) -> None:
         self._session = session
+        self._storage = nutrient_storage or current_nutrient_storage_mode()
 
     # ------------------------------------------------------------------
     # Entity <-> Model 変換
     # ------------------------------------------------------------------
 
     def _to_entity(self, model: TargetModel) -> TargetDefinition:
+        if model.nutrients_compact is not None:
+            return self._build_entity(
+                model, decode_nutrients(model.nutrients_compact, TargetNutrient)
+            )
+
         nutrients = [
             TargetNutrient(
                 code=NutrientCode(n.code),
@@ -46,7 +64,13 @@ class SqlAlchemyTargetRepository(TargetRepositoryPort):
             )
             for n in model.nutrients
         ]
+        return self._build_entity(model, nutrients)
 
+    def _build_entity(
+        self,
+        model: TargetModel,
+        nutrients: list[TargetNutrient],
+    ) -> TargetDefinition:
         return TargetDefinition(
             id=TargetId(str(model.id)),
             user_id=UserId(str(model.user_id)),
@@ -71,6 +95,7 @@ class SqlAlchemyTargetRepository(TargetRepositoryPort):
         Domain エンティティの状態を既存の TargetModel に反映する。
 
         - nutrients は一旦全削除してから再作成（シンプルな実装）
+        - compact モードでは子テーブルには書かず nutrients_compact だけを更新する
         """
 
         model.title = entity.title
@@ -82,9 +107,12 @@ class SqlAlchemyTargetRepository(TargetRepositoryPort):
         model.disclaimer = entity.disclaimer
         model.created_at = entity.created_at
         model.updated_at = entity.updated_at
+        model.nutrients_compact = self._compact_of(entity)
 
         # nutrients を入れ替え
         model.nutrients.clear()
+        if not self._storage.writes_rows:
+            return
         for n in entity.nutrients:
             model.nutrients.append(
                 TargetNutrientModel(
@@ -96,6 +124,11 @@ class SqlAlchemyTargetRepository(TargetRepositoryPort):
                 )
             )
 
+    def _compact_of(self, entity: TargetDefinition) -> dict | None:
+        if not self._storage.writes_compact:
+            return None
+        return encode_nutrients(entity.nutrients)
+
     # ------------------------------------------------------------------
     # Port 実装
     # ------------------------------------------------------------------
@@ -113,10 +146,11 @@ class SqlAlchemyTargetRepository(TargetRepositoryPort):
             disclaimer=target.disclaimer,
             created_at=target.created_at,
             updated_at=target.updated_at,
+            nutrients_compact=self._compact_of(target),
         )
 
-        # nutrients も一緒に追加
-        for n in target.nutrients:
+        # nutrients も一緒に追加（compact モードでは子テーブルに書かない）
+        for n in target.nutrients if self._storage.writes_rows else []:
             model.nutrients.append(
                 TargetNutrientModel(
                     code=n.code.value,
@@ -127,6 +161,8 @@ class SqlAlchemyTargetRepository(TargetRepositoryPort):
             )
 
         self._session.add(model)
+        if target.is_active:
+            mark_active_target_changed(self._session, model.user_id)
 
     def get_by_id(
         self,
@@ -135,7 +171,7 @@ class SqlAlchemyTargetRepository(TargetRepositoryPort):
     ) -> TargetDefinition | None:
         stmt = (
             select(TargetModel)
-            .options(selectinload(TargetModel.nutrients))
+            .options(nutrients_load_option(self._storage, TargetModel.nutrients))
             .where(
                 TargetModel.id == UUID(target_id.value),
                 TargetModel.user_id == UUID(user_id.value),
@@ -149,7 +185,7 @@ class SqlAlchemyTargetRepository(TargetRepositoryPort):
     def get_active(self, user_id: UserId) -> TargetDefinition | None:
         stmt = (
             select(TargetModel)
-            .options(selectinload(TargetModel.nutrients))
+            .options(nutrients_load_option(self._storage, TargetModel.nutrients))
             .where(
                 TargetModel.user_id == UUID(user_id.value),
                 TargetModel.is_active.is_(True),
@@ -169,7 +205,7 @@ class SqlAlchemyTargetRepository(TargetRepositoryPort):
     ) -> list[TargetDefinition]:
         stmt = (
             select(TargetModel)
-            .options(selectinload(TargetModel.nutrients))
+            .options(nutrients_load_option(self._storage, TargetModel.nutrients))
             .where(TargetModel.user_id == UUID(user_id.value))
             .order_by(TargetModel.created_at.desc())
             .offset(offset)
@@ -189,7 +225,7 @@ class SqlAlchemyTargetRepository(TargetRepositoryPort):
         """
         stmt = (
             select(TargetModel)
-            .options(selectinload(TargetModel.nutrients))
+            .options(nutrients_load_option(self._storage, TargetModel.nutrients))
             .where(TargetModel.id == UUID(target.id.value))
         )
         model = self._session.execute(stmt).scalar_one_or_none()
@@ -197,6 +233,8 @@ class SqlAlchemyTargetRepository(TargetRepositoryPort):
             # add() すべきケースかもしれないが、ここでは単純に何もしない
             return
 
+        if model.is_active or target.is_active:
+            mark_active_target_changed(self._session, model.user_id)
         self._apply_entity_to_model(target, model)
 
     def deactivate_all(self, user_id: UserId) -> None:
@@ -209,6 +247,7 @@ class SqlAlchemyTargetRepository(TargetRepositoryPort):
             .values(is_active=False)
         )
         self._session.execute(stmt)
+        mark_active_target_changed(self._session, user_id.value)
 
     def delete(self, user_id: UserId, target_id: TargetId) -> bool:
         """
@@ -224,5 +263,7 @@ class SqlAlchemyTargetRepository(TargetRepositoryPort):
         model = self._session.execute(stmt).scalar_one_or_none()
         if model is None:
             return False
+        if model.is_active:
+            mark_active_target_changed(self._session, model.user_id)
         self._session.delete(model)
         return True
@@ -4,7 +4,7 @@ from datetime import date
 from uuid import UUID
 
 from sqlalchemy import select
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm import Session
 
 from app.application.target.ports.target_snapshot_repository_port import (
     TargetSnapshotRepositoryPort,
@@ -21,6 +21,14 @@ from app.infra.db.models.target import (
     DailyTargetSnapshotModel,
     DailyTargetSnapshotNutrientModel,
 )
+from app.infra.db.day_rollups import NUTRITION_ACHIEVEMENT, mark_day_rollup_dirty
+from app.infra.db.nutrient_storage import (
+    NutrientStorageMode,
+    current_nutrient_storage_mode,
+    decode_nutrients,
+    encode_nutrients,
+    nutrients_load_option,
+)
 
 
 class SqlAlchemyTargetSnapshotRepository(TargetSnapshotRepositoryPort):
@@ -28,15 +36,37 @@ class SqlAlchemyTargetSnapshotRepository(TargetSnapshotRepositoryPort):
     DailyTargetSnapshot 用の SQLAlchemy リポジトリ。
     """
 
-    def __init__(self, session: Session) -> None:
+    def __init__(
+        self,
+        session: Session,
+        nutrient_storage: NutrientStorageMode | None = None,
+    ) -> None:
         self._session = session
+        self._storage = nutrient_storage or current_nutrient_storage_mode()
 
     # ------------------------------------------------------------------
     # Entity <-> Model
     # ------------------------------------------------------------------
 
     def _to_entity(self, model: DailyTargetSnapshotModel) -> DailyTargetSnapshot:
-        nutrients = tuple(
+        if model.nutrients_compact is not None:
+            nutrients = tuple(
+                decode_nutrients(model.nutrients_compact, TargetNutrient))
+        else:
+            nutrients = self._nutrients_from_rows(model)
+
+        return DailyTargetSnapshot(
+            user_id=UserId(str(model.user_id)),
+            date=model.date,
+            target_id=TargetId(str(model.target_id)),
+            nutrients=nutrients,
+            created_at=model.created_at,
+        )
+
+    def _nutrients_from_rows(
+        self, model: DailyTargetSnapshotModel
+    ) -> tuple[TargetNutrient, ...]:
+        return tuple(
             TargetNutrient(
                 code=NutrientCode(n.code),
                 amount=NutrientAmount(
@@ -48,23 +78,21 @@ class SqlAlchemyTargetSnapshotRepository(TargetSnapshotRepositoryPort):
             for n in model.nutrients
         )
 
-        return DailyTargetSnapshot(
-            user_id=UserId(str(model.user_id)),
-            date=model.date,
-            target_id=TargetId(str(model.target_id)),
-            nutrients=nutrients,
-            created_at=model.created_at,
-        )
-
     def _from_entity(self, snapshot: DailyTargetSnapshot) -> DailyTargetSnapshotModel:
         model = DailyTargetSnapshotModel(
             user_id=UUID(snapshot.user_id.value),
             date=snapshot.date,
             target_id=UUID(snapshot.target_id.value),
             created_at=snapshot.created_at,
+            nutrients_compact=(
+                encode_nutrients(snapshot.nutrients)
+                if self._storage.writes_compact
+                else None
+            ),
         )
 
-        for n in snapshot.nutrients:
+        # compact モードでは子テーブルに書かない
+        for n in snapshot.nutrients if self._storage.writes_rows else ():
             model.nutrients.append(
                 DailyTargetSnapshotNutrientModel(
                     code=n.code.value,
@@ -83,6 +111,9 @@ class SqlAlchemyTargetSnapshotRepository(TargetSnapshotRepositoryPort):
     def add(self, snapshot: DailyTargetSnapshot) -> None:
         model = self._from_entity(snapshot)
         self._session.add(model)
+        mark_day_rollup_dirty(
+            self._session, snapshot.user_id.value, snapshot.date, NUTRITION_ACHIEVEMENT
+        )
 
     def get_by_user_and_date(
         self,
@@ -91,7 +122,10 @@ class SqlAlchemyTargetSnapshotRepository(TargetSnapshotRepositoryPort):
     ) -> DailyTargetSnapshot | None:
         stmt = (
             select(DailyTargetSnapshotModel)
-            .options(selectinload(DailyTargetSnapshotModel.nutrients))
+            .options(
+                nutrients_load_option(
+                    self._storage, DailyTargetSnapshotModel.nutrients)
+            )
             .where(
                 DailyTargetSnapshotModel.user_id == UUID(user_id.value),
                 DailyTargetSnapshotModel.date == snapshot_date,
@@ -111,7 +145,10 @@ class SqlAlchemyTargetSnapshotRepository(TargetSnapshotRepositoryPort):
     ) -> list[DailyTargetSnapshot]:
         stmt = (
             select(DailyTargetSnapshotModel)
-            .options(selectinload(DailyTargetSnapshotModel.nutrients))
+            .options(
+                nutrients_load_option(
+                    self._storage, DailyTargetSnapshotModel.nutrients)
+            )
             .where(DailyTargetSnapshotModel.user_id == UUID(user_id.value))
             .order_by(DailyTargetSnapshotModel.date.asc())
         )
@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Any
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+from app.domain.auth.value_objects import UserId
+from app.domain.calendar.entities import CalendarDaySnapshot
+from app.domain.calendar.services import compute_nutrition_achievement
+from app.domain.target.entities import TargetDefinition
+from app.infra.db.day_rollups import (
+    HAS_DAILY_REPORT,
+    HAS_MEAL_LOGS,
+    NUTRITION_ACHIEVEMENT,
+    RECOMPUTE,
+    ROLLUP_COLUMNS,
+    mark_day_rollup_dirty,
+    pop_active_target_changes,
+    pop_dirty_day_rollups,
+)
+from app.infra.db.models.daily_nutrition import DailyNutritionSummaryModel
+from app.infra.db.models.daily_nutrition_report import DailyNutritionReportModel
+from app.infra.db.models.meal import FoodEntryModel
+from app.infra.db.models.target import DailyTargetSnapshotModel
+from app.infra.db.models.user_day_rollup import UserDayRollupModel
+from app.infra.db.repositories.daily_nutrition_repository import (
+    SqlAlchemyDailyNutritionSummaryRepository,
+)
+from app.infra.db.repositories.target_repository import SqlAlchemyTargetRepository
+from app.infra.db.repositories.target_snapshot_repository import (
+    SqlAlchemyTargetSnapshotRepository,
+)
+from app.infra.db.upsert import dialect_insert, expire_cached
+
+
+class SqlAlchemyUserDayRollupRepository:
+    """
+    user_day_rollups（カレンダー用の日別集計）の読み書き。
+
+    - 書き込みリポジトリは mark_day_rollup_dirty() / set_day_rollup_value() で
+      変わった列だけを記録し、refresh_dirty() は UoW が commit 直前に呼ぶ。
+    - 値が分かっている列はそのまま、RECOMPUTE の列だけ元テーブルから計算する。
+      他の列には触らないので、1 日あたりの再計算は変わった列の分だけで済む。
+    - 達成率の分母はその日の目標スナップショット、無ければアクティブな目標
+      （カレンダーの元テーブル集計と同じ）。アクティブな目標が変わったユーザーは
+      スナップショットの無い日をまとめて再計算する。
+    - refresh() は全列を元テーブルから計算し直す（再構築用。何度呼んでも結果は同じ）。
+    """
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+        # 1 回の更新の中でアクティブな目標を日ごとに読み直さないためのキャッシュ
+        self._active_targets: dict[UUID, TargetDefinition | None] = {}
+
+    # --- 書き込み -----------------------------------------------------
+
+    def refresh_dirty(self) -> int:
+        """session に記録された日の集計を更新する。戻り値は更新した日数。"""
+        for user_id in pop_active_target_changes(self._session):
+            for date_ in self._days_without_snapshot(user_id):
+                mark_day_rollup_dirty(
+                    self._session, user_id, date_, NUTRITION_ACHIEVEMENT)
+        dirty = pop_dirty_day_rollups(self._session)
+        self._active_targets.clear()
+        for (user_id, date_), changes in sorted(dirty.items()):
+            self._apply(user_id, date_, changes)
+        return len(dirty)
+
+    def _days_without_snapshot(self, user_id: UUID) -> list[date]:
+        """日次サマリーはあるがスナップショットの無い日（達成率がアクティブな目標で決まる日）。"""
+        summaries = DailyNutritionSummaryModel
+        snapshots = DailyTargetSnapshotModel
+        return list(
+            self._session.execute(
+                sa.select(summaries.date)
+                .where(
+                    summaries.user_id == user_id,
+                    ~sa.select(snapshots.id)
+                    .where(
+                        snapshots.user_id == summaries.user_id,
+                        snapshots.date == summaries.date,
+                    )
+                    .exists(),
+                )
+                .order_by(summaries.date)
+            ).scalars()
+        )
+
+    def refresh(self, user_id: UUID, date_: date) -> None:
+        """(user_id, date) の集計を元テーブルから計算し直す。何も無い日は行を消す。"""
+        self._apply(user_id, date_, dict.fromkeys(ROLLUP_COLUMNS, RECOMPUTE))
+
+    def _apply(self, user_id: UUID, date_: date, changes: dict[str, Any]) -> None:
+        values = {
+            column: (
+                self._compute(column, user_id, date_) if value is RECOMPUTE else value
+            )
+            for column, value in changes.items()
+        }
+
+        rollups = UserDayRollupModel.__table__
+        where = (rollups.c.user_id == user_id, rollups.c.date == date_)
+        if any(value not in (None, False) for value in values.values()):
+            # 行が無ければ作る（触らない列は「何も無い」既定値のまま）
+            insert = dialect_insert(self._session, rollups)
+            self._session.execute(
+                insert.values(user_id=user_id, date=date_, **values)
+                .on_conflict_do_update(
+                    index_elements=["user_id", "date"],
+                    set_={**values, "updated_at": sa.func.now()},
+                )
+            )
+        else:
+            # 空にする列だけ書き、全列が空になった行は消す（何も無い日は行を持たない）
+            self._session.execute(
+                sa.update(rollups)
+                .where(*where)
+                .values(**values, updated_at=sa.func.now())
+            )
+            self._session.execute(
+                sa.delete(rollups).where(
+                    *where,
+                    rollups.c.has_meal_logs.is_(False),
+                    rollups.c.nutrition_achievement.is_(None),
+                    rollups.c.has_daily_report.is_(False),
+                )
+            )
+
+        expire_cached(
+            self._session,
+            UserDayRollupModel,
+            lambda identity: identity == (user_id, date_),
+        )
+
+    def _compute(self, column: str, user_id: UUID, date_: date) -> Any:
+        if column == HAS_MEAL_LOGS:
+            return self._exists(
+                sa.select(FoodEntryModel.id).where(
+                    FoodEntryModel.user_id == user_id,
+                    FoodEntryModel.date == date_,
+                    FoodEntryModel.deleted_at.is_(None),
+                )
+            )
+        if column == HAS_DAILY_REPORT:
+            return self._exists(
+                sa.select(DailyNutritionReportModel.id).where(
+                    DailyNutritionReportModel.user_id == user_id,
+                    DailyNutritionReportModel.date == date_,
+                )
+            )
+        if column == NUTRITION_ACHIEVEMENT:
+            return self._compute_achievement(user_id, date_)
+        raise ValueError(f"unknown rollup column: {column}")
+
+    def _exists(self, stmt: sa.Select) -> bool:
+        return self._session.execute(sa.select(stmt.exists())).scalar_one()
+
+    def _compute_achievement(self, user_id: UUID, date_: date) -> int | None:
+        uid = UserId(str(user_id))
+        summary = SqlAlchemyDailyNutritionSummaryRepository(
+            self._session
+        ).get_by_user_and_date(user_id=uid, target_date=date_)
+        if summary is None:
+            return None
+        snapshot = SqlAlchemyTargetSnapshotRepository(
+            self._session
+        ).get_by_user_and_date(uid, date_)
+        if snapshot is not None:
+            return compute_nutrition_achievement(summary.nutrients, snapshot.nutrients)
+        # スナップショットは過去日にしか無いので、今日などはアクティブな目標を使う
+        if user_id not in self._active_targets:
+            self._active_targets[user_id] = SqlAlchemyTargetRepository(
+                self._session
+            ).get_active(uid)
+        active = self._active_targets[user_id]
+        if active is None:
+            return None
+        return compute_nutrition_achievement(summary.nutrients, active.nutrients)
+
+    # --- 読み取り -----------------------------------------------------
+
+    def list_range(
+        self,
+        user_id: UUID,
+        start_date: date,
+        end_date: date,
+    ) -> list[CalendarDaySnapshot]:
+        """[start_date, end_date) の行を日付順に返す（行の無い日は含まない）。"""
+        rollups = UserDayRollupModel.__table__
+        rows = self._session.execute(
+            sa.select(
+                rollups.c.date,
+                rollups.c.has_meal_logs,
+                rollups.c.nutrition_achievement,
+                rollups.c.has_daily_report,
+            )
+            .where(
+                rollups.c.user_id == user_id,
+                rollups.c.date >= start_date,
+                rollups.c.date < end_date,
+            )
+            .order_by(rollups.c.date)
+        )
+        return [
+            CalendarDaySnapshot(
+                date=row.date.strftime("%Y-%m-%d"),
+                has_meal_logs=row.has_meal_logs,
+                nutrition_achievement=row.nutrition_achievement,
+                has_daily_report=row.has_daily_report,
+            )
+            for row in rows
+        ]
+
+    def list_candidate_days(
+        self,
+        start_date: date,
+        end_date: date,
+    ) -> list[tuple[UUID, date]]:
+        """
+        [start_date, end_date] で集計行を持ちうる (user_id, date) を返す（再構築用）。
+
+        - 元テーブルのどれかに行がある日と、既に集計行がある日（消すべき行の掃除）の和集合。
+        """
+        sources = [
+            FoodEntryModel,
+            DailyNutritionSummaryModel,
+            DailyTargetSnapshotModel,
+            DailyNutritionReportModel,
+            UserDayRollupModel,
+        ]
+        union = sa.union(
+            *(
+                sa.select(m.user_id, m.date).where(
+                    m.date >= start_date, m.date <= end_date)
+                for m in sources
+            )
+        ).subquery()
+        rows = self._session.execute(
+            sa.select(union.c.user_id, union.c.date).order_by(
+                union.c.date, union.c.user_id)
+        )
+        return [(row.user_id, row.date) for row in rows]
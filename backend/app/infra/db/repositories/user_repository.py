@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Sequence
+
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
@@ -93,7 +95,8 @@ class SqlAlchemyUserRepository(UserRepositoryPort):
         except IntegrityError as e:
             # DB の UNIQUE 制約違反などをドメインエラーに変換
             # ここでは email UNIQUE だけを扱う想定
-            self._session.rollback()
+            # rollback は UoW の __exit__ に任せる（リクエスト共有 Session では
+            # ここで rollback するとリクエスト全体のトランザクションが巻き戻るため）
 
             msg = str(e.orig) if hasattr(e, "orig") else str(e)
             # 制約名やメッセージに応じて判定（Postgres / SQLite 両対応のざっくり例）
@@ -106,3 +109,19 @@ class SqlAlchemyUserRepository(UserRepositoryPort):
 
         # flush に成功していれば PK などは振られているので entity に戻して返す
         return self._to_entity(model)
+
+    def list_active_users(self) -> Sequence[User]:
+        """
+        退会していない / プロフィール登録済みのユーザー（id 順）。
+        プラン（プレミアムか）は提案生成側でチェックする。
+        """
+        models = (
+            self._session.query(UserModel)
+            .filter(
+                UserModel.deleted_at.is_(None),
+                UserModel.has_profile.is_(True),
+            )
+            .order_by(UserModel.id)
+            .all()
+        )
+        return [self._to_entity(model) for model in models]
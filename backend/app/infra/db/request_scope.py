@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Iterator, TypeVar
+
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+
+def run_after_commit_callbacks(callbacks: list[Callable[[], None]]) -> None:
+    """
+    コミット後の副作用（ストレージ削除 / ジョブ投入など）を順に呼ぶ。
+    データは既にコミット済みなので、失敗してもログだけ残して残りを続ける。
+    """
+    for callback in callbacks:
+        try:
+            callback()
+        except Exception:
+            logger.exception("after-commit callback failed")
+
+
+class RequestSessionScope:
+    """
+    1 HTTP リクエストの間だけ有効な Session 置き場。
+
+    - UoW は __enter__ 時に acquire() で Session を受け取り、
+      自分用の SAVEPOINT を張ってその中で作業する。
+    - Session は最初の UoW が必要としたときに遅延生成する（DB を触らない
+      リクエストではプールから接続を借りない）。
+    - commit / rollback / close はリクエスト終了時に finish() で 1 回だけ行う。
+    - session_factory ごとに Session を持つので、別エンジン向けの UoW が
+      混在しても同じエンジン同士だけが 1 トランザクションにまとまる。
+    - 開いている UoW が 0 の間は release_connections() で接続をプールへ返せる
+      （LLM 呼び出しなど、長い外部 I/O の前に使う）。
+    - after_commit() で積んだ副作用は、実際に COMMIT できたときだけ呼ぶ
+      （UoW の SAVEPOINT 解放時点ではまだ巻き戻り得るため）。
+    """
+
+    def __init__(self) -> None:
+        self._sessions: dict[Callable[[], Session], Session] = {}
+        self._active_uows = 0
+        self._after_commit: list[Callable[[], None]] = []
+
+    @property
+    def has_sessions(self) -> bool:
+        return bool(self._sessions)
+
+    def acquire(self, session_factory: Callable[[], Session]) -> Session:
+        session = self._sessions.get(session_factory)
+        if session is None:
+            session = session_factory()
+            self._sessions[session_factory] = session
+        self._active_uows += 1
+        return session
+
+    def leave(self) -> None:
+        """acquire() と対になる呼び出し（UoW の __exit__ で呼ぶ）。"""
+        self._active_uows = max(0, self._active_uows - 1)
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """リクエストのトランザクションを COMMIT した後に callback を呼ぶ。"""
+        self._after_commit.append(callback)
+
+    def release_connections(self) -> None:
+        """
+        開いている UoW が無ければ、ここまでの作業を commit して接続を返す。
+        次に UoW が acquire() したときは新しい Session / 接続を借りる。
+        """
+        if self._active_uows > 0 or not self._sessions:
+            return
+        self.finish(commit=True)
+
+    def finish(self, commit: bool) -> None:
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        callbacks, self._after_commit = self._after_commit, []
+        try:
+            for session in sessions:
+                if commit:
+                    session.commit()
+                else:
+                    session.rollback()
+        except Exception:
+            for session in sessions:
+                session.rollback()
+            raise
+        finally:
+            for session in sessions:
+                session.close()
+
+        if commit:
+            run_after_commit_callbacks(callbacks)
+
+
+_current_scope: ContextVar[RequestSessionScope | None] = ContextVar(
+    "db_request_session_scope", default=None
+)
+
+
+def current_request_scope() -> RequestSessionScope | None:
+    """
+    現在のコンテキストで有効な RequestSessionScope を返す。
+    リクエスト外（バッチ / スクリプト / テスト直呼び）では None。
+    """
+    return _current_scope.get()
+
+
+def bind_request_scope(scope: RequestSessionScope) -> Token[RequestSessionScope | None]:
+    """
+    scope を現在のコンテキストに紐づける（ASGI ミドルウェア用の低レベル API）。
+    戻り値の token は reset_request_scope() に渡す。
+    """
+    return _current_scope.set(scope)
+
+
+def reset_request_scope(token: Token[RequestSessionScope | None]) -> None:
+    _current_scope.reset(token)
+
+
+def detach_request_scope() -> None:
+    """
+    以降このコンテキストで開く UoW をスコープに参加させない（単独で commit する）。
+
+    レスポンス送信後に動くバックグラウンドタスクが、既に COMMIT 済みのスコープに
+    Session を作って置き去りにしないようにする。reset_request_scope() はそのまま呼べる。
+    """
+    _current_scope.set(None)
+
+
+def release_request_connections() -> None:
+    """
+    現在の RequestSessionScope が握っている接続を（UoW 外なら）プールへ返す。
+    スコープ外では何もしない。
+    """
+    scope = current_request_scope()
+    if scope is not None:
+        scope.release_connections()
+
+
+T = TypeVar("T")
+
+
+class _ReleaseConnectionsProxy:
+    def __init__(self, target: Any) -> None:
+        self._target = target
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._target, name)
+        if not callable(attr):
+            return attr
+
+        if inspect.iscoroutinefunction(attr):
+            # async ポート: commit / close はブロッキング I/O なのでスレッドで行う
+            @functools.wraps(attr)
+            async def _call_async(*args: Any, **kwargs: Any) -> Any:
+                await asyncio.to_thread(release_request_connections)
+                return await attr(*args, **kwargs)
+
+            return _call_async
+
+        @functools.wraps(attr)
+        def _call(*args: Any, **kwargs: Any) -> Any:
+            release_request_connections()
+            return attr(*args, **kwargs)
+
+        return _call
+
+
+def release_connections_before_calls(port: T) -> T:
+    """
+    port のメソッド呼び出しの直前に release_request_connections() を挟むプロキシを返す。
+
+    - LLM などの外部ポートを DI で包み、呼び出し中に DB 接続を握らないようにする。
+    - ユースケース側は DB / リクエストスコープを意識しなくてよい。
+    - async メソッドもそのまま包める（解放はスレッドで行ってから await する）。
+    """
+    return _ReleaseConnectionsProxy(port)  # type: ignore[return-value]
+
+
+@contextmanager
+def request_session_scope() -> Iterator[RequestSessionScope]:
+    """
+    with ブロックの間、UoW が 1 つの Session / トランザクションを共有するようにする。
+
+    - 正常終了なら commit、例外が伝播したら rollback する。
+    - FastAPI の sync 依存 / エンドポイントはスレッドプールで動くが、
+      ContextVar はコピーされ、scope オブジェクト自体は共有されるので問題ない。
+    """
+    scope = RequestSessionScope()
+    token = bind_request_scope(scope)
+    try:
+        yield scope
+    except BaseException:
+        scope.finish(commit=False)
+        raise
+    else:
+        scope.finish(commit=True)
+    finally:
+        reset_request_scope(token)
@@ -4,7 +4,7 @@ from typing import Generator
 
 from sqlalchemy.orm import Session
 
-from app.infra.db.base import SessionLocal
+from app.infra.db.base import ReplicaSessionLocal, SessionLocal
 
 
 def create_session() -> Session:
@@ -15,6 +15,20 @@ def create_session() -> Session:
     return SessionLocal()
 
 
+def has_replica() -> bool:
+    return ReplicaSessionLocal is not None
+
+
+def create_replica_session() -> Session:
+    """
+    読み取りレプリカ向けの Session を生成する（未設定ならプライマリ）。
+    読み取り専用 UoW が使う。
+    """
+    if ReplicaSessionLocal is None:
+        return SessionLocal()
+    return ReplicaSessionLocal()
+
+
 def get_db_session() -> Generator[Session, None, None]:
     """
     FastAPI の Depends で使うための DB セッション依存。
@@ -1,10 +1,21 @@
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
 from sqlalchemy.orm import Session
-from app.application.calendar.ports.calendar_unit_of_work_port import CalendarUnitOfWorkPort
-from app.infra.db.repositories.calendar_repository import SqlAlchemyCalendarRepository
+from app.application.calendar.ports.calendar_unit_of_work_port import (
+    AsyncCalendarUnitOfWorkPort,
+    CalendarUnitOfWorkPort,
+)
+from app.infra.db.repositories.calendar_repository import (
+    AsyncSqlAlchemyCalendarRepository,
+    SqlAlchemyCalendarRepository,
+)
+from app.infra.db.uow.sqlalchemy_async_base import AsyncSqlAlchemyUnitOfWorkBase
 from app.infra.db.uow.sqlalchemy_base import SqlAlchemyUnitOfWorkBase
+from app.infra.db.async_session import create_async_session
 from app.infra.db.session import create_session
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
 
 class SqlAlchemyCalendarUnitOfWork(SqlAlchemyUnitOfWorkBase, CalendarUnitOfWorkPort):
     """SQLAlchemy を使ったカレンダー Unit of Work 実装"""
@@ -15,3 +26,19 @@ class SqlAlchemyCalendarUnitOfWork(SqlAlchemyUnitOfWorkBase, CalendarUnitOfWorkP
     def _on_enter(self, session: Session) -> None:
         """セッション開始時にリポジトリを初期化"""
         self.calendar_repo = SqlAlchemyCalendarRepository(session)
+
+
+class AsyncSqlAlchemyCalendarUnitOfWork(
+    AsyncSqlAlchemyUnitOfWorkBase, AsyncCalendarUnitOfWorkPort
+):
+    """AsyncSession を使ったカレンダー Unit of Work 実装"""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], "AsyncSession"] = create_async_session,
+    ) -> None:
+        super().__init__(session_factory)
+
+    def _on_enter(self, session: "AsyncSession") -> None:
+        """セッション開始時にリポジトリを初期化"""
+        self.calendar_repo = AsyncSqlAlchemyCalendarRepository(session)
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+from app.application.day.ports.uow_port import DayReadUnitOfWorkPort
+from app.application.meal.ports.food_entry_repository_port import (
+    FoodEntryRepositoryPort,
+)
+from app.application.nutrition.ports.daily_nutrition_repository_port import (
+    DailyNutritionSummaryRepositoryPort,
+)
+from app.application.nutrition.ports.daily_report_repository_port import (
+    DailyNutritionReportRepositoryPort,
+)
+from app.application.nutrition.ports.meal_nutrition_repository_port import (
+    MealNutritionSummaryRepositoryPort,
+)
+from app.application.nutrition.ports.recommendation_repository_port import (
+    MealRecommendationRepositoryPort,
+)
+from app.application.target.ports.target_repository_port import TargetRepositoryPort
+from app.application.target.ports.target_snapshot_repository_port import (
+    TargetSnapshotRepositoryPort,
+)
+from app.infra.db.repositories.daily_nutrition_report_repository import (
+    SqlAlchemyDailyNutritionReportRepository,
+)
+from app.infra.db.repositories.daily_nutrition_repository import (
+    SqlAlchemyDailyNutritionSummaryRepository,
+)
+from app.infra.db.repositories.food_entry_repository import SqlAlchemyFoodEntryRepository
+from app.infra.db.repositories.meal_nutrition_repository import (
+    SqlAlchemyMealNutritionSummaryRepository,
+)
+from app.infra.db.repositories.meal_recommendation_repository import (
+    SqlAlchemyMealRecommendationRepository,
+)
+from app.infra.db.repositories.target_repository import SqlAlchemyTargetRepository
+from app.infra.db.repositories.target_snapshot_repository import (
+    SqlAlchemyTargetSnapshotRepository,
+)
+from app.infra.db.session import create_session
+from app.infra.db.uow.sqlalchemy_base import SqlAlchemyUnitOfWorkBase
+
+
+class SqlAlchemyDayReadUnitOfWork(SqlAlchemyUnitOfWorkBase, DayReadUnitOfWorkPort):
+    """
+    1 日分の画面表示用の Unit of Work 実装。
+
+    - meal / nutrition / target の既存 Repository を同じ Session の上に組み立てる
+      （接続の取得とトランザクションは 1 回で済む）。
+    """
+
+    food_entry_repo: FoodEntryRepositoryPort
+    meal_nutrition_repo: MealNutritionSummaryRepositoryPort
+    daily_nutrition_repo: DailyNutritionSummaryRepositoryPort
+    daily_report_repo: DailyNutritionReportRepositoryPort
+    meal_recommendation_repo: MealRecommendationRepositoryPort
+    target_repo: TargetRepositoryPort
+    target_snapshot_repo: TargetSnapshotRepositoryPort
+
+    def __init__(self, session_factory: Callable[[], Session] = create_session) -> None:
+        super().__init__(session_factory)
+
+    def _on_enter(self, session: Session) -> None:
+        self.food_entry_repo = SqlAlchemyFoodEntryRepository(session)
+        self.meal_nutrition_repo = SqlAlchemyMealNutritionSummaryRepository(
+            session)
+        self.daily_nutrition_repo = SqlAlchemyDailyNutritionSummaryRepository(
+            session)
+        self.daily_report_repo = SqlAlchemyDailyNutritionReportRepository(
+            session)
+        self.meal_recommendation_repo = SqlAlchemyMealRecommendationRepository(
+            session)
+        self.target_repo = SqlAlchemyTargetRepository(session)
+        self.target_snapshot_repo = SqlAlchemyTargetSnapshotRepository(session)
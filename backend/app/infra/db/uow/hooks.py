@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+SessionHook = Callable[[Session], object]
+
+
+@dataclass(frozen=True)
+class UnitOfWorkHook:
+    """
+    UoW の commit / rollback に差し込む処理。
+
+    - before_commit: commit（SAVEPOINT の解放）の直前に、同じトランザクション内で呼ぶ。
+    - discard: rollback で書き込みを捨てるときに呼ぶ（session.info の印の掃除など）。
+    - order の小さいものから呼ぶ（書き込みを伴うものを先に、それを数えるものを後に）。
+    """
+
+    name: str
+    before_commit: SessionHook | None = None
+    discard: SessionHook | None = None
+    order: int = 0
+
+
+_hooks: dict[str, UnitOfWorkHook] = {}
+
+
+def register_unit_of_work_hook(hook: UnitOfWorkHook) -> None:
+    """
+    hook を登録する（同じ name なら置き換える）。
+
+    機能を持つモジュールが import 時に自分で登録する（day_rollups.py / read_routing.py）。
+    """
+    _hooks[hook.name] = hook
+
+
+def unregister_unit_of_work_hook(name: str) -> None:
+    _hooks.pop(name, None)
+
+
+def _ordered() -> list[UnitOfWorkHook]:
+    return sorted(_hooks.values(), key=lambda hook: hook.order)
+
+
+def run_before_commit_hooks(session: Session) -> None:
+    for hook in _ordered():
+        if hook.before_commit is not None:
+            hook.before_commit(session)
+
+
+def run_discard_hooks(session: Session) -> None:
+    for hook in _ordered():
+        if hook.discard is not None:
+            hook.discard(session)
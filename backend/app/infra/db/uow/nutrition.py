@@ -1,14 +1,19 @@
 from __future__ import annotations
 
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
 
 from sqlalchemy.orm import Session
 
-from app.application.nutrition.ports.uow_port import NutritionUnitOfWorkPort
+from app.application.nutrition.ports.uow_port import (
+    AsyncNutritionReadUnitOfWorkPort,
+    NutritionUnitOfWorkPort,
+)
 from app.application.nutrition.ports.meal_nutrition_repository_port import (
+    AsyncMealNutritionSummaryRepositoryPort,
     MealNutritionSummaryRepositoryPort,
 )
 from app.application.nutrition.ports.daily_nutrition_repository_port import (
+    AsyncDailyNutritionSummaryRepositoryPort,
     DailyNutritionSummaryRepositoryPort,
 )
 from app.application.nutrition.ports.daily_report_repository_port import (
@@ -18,12 +23,16 @@ from app.application.nutrition.ports.recommendation_repository_port import (
     MealRecommendationRepositoryPort,
 )
 
+from app.infra.db.async_session import create_async_session
 from app.infra.db.session import create_session
+from app.infra.db.uow.sqlalchemy_async_base import AsyncSqlAlchemyUnitOfWorkBase
 from app.infra.db.uow.sqlalchemy_base import SqlAlchemyUnitOfWorkBase
 from app.infra.db.repositories.meal_nutrition_repository import (
+    AsyncSqlAlchemyMealNutritionSummaryRepository,
     SqlAlchemyMealNutritionSummaryRepository,
 )
 from app.infra.db.repositories.daily_nutrition_repository import (
+    AsyncSqlAlchemyDailyNutritionSummaryRepository,
     SqlAlchemyDailyNutritionSummaryRepository,
 )
 from app.infra.db.repositories.daily_nutrition_report_repository import (
@@ -33,6 +42,9 @@ from app.infra.db.repositories.meal_recommendation_repository import (
     SqlAlchemyMealRecommendationRepository,
 )
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
 
 class SqlAlchemyNutritionUnitOfWork(SqlAlchemyUnitOfWorkBase, NutritionUnitOfWorkPort):
     """
@@ -56,3 +68,26 @@ class SqlAlchemyNutritionUnitOfWork(SqlAlchemyUnitOfWorkBase, NutritionUnitOfWor
             session)
         self.meal_recommendation_repo = SqlAlchemyMealRecommendationRepository(
             session)
+
+
+class AsyncSqlAlchemyNutritionReadUnitOfWork(
+    AsyncSqlAlchemyUnitOfWorkBase, AsyncNutritionReadUnitOfWorkPort
+):
+    """
+    栄養サマリ（Meal / Daily）を async で読むための Unit of Work 実装。
+    """
+
+    meal_nutrition_repo: AsyncMealNutritionSummaryRepositoryPort
+    daily_nutrition_repo: AsyncDailyNutritionSummaryRepositoryPort
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = create_async_session,
+    ) -> None:
+        super().__init__(session_factory)
+
+    def _on_enter(self, session: AsyncSession) -> None:
+        self.meal_nutrition_repo = AsyncSqlAlchemyMealNutritionSummaryRepository(
+            session)
+        self.daily_nutrition_repo = AsyncSqlAlchemyDailyNutritionSummaryRepository(
+            session)
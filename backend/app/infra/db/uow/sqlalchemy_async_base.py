@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Self
+
+from app.application.common.ports.unit_of_work_port import AsyncUnitOfWorkPort
+from app.infra.db.uow.hooks import run_before_commit_hooks, run_discard_hooks
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class AsyncSqlAlchemyUnitOfWorkBase(AsyncUnitOfWorkPort):
+    """
+    SqlAlchemyUnitOfWorkBase の async 版（AsyncSession を使う）。
+
+    - サブクラスは `_on_enter(session)` でリポジトリを組み立てる
+    - RequestSessionScope には参加しない（リクエスト共有 Session は同期 Session のため）。
+      同じリクエスト内の未コミットの書き込みは見えないので、参照系ルートで使う。
+    - commit 前 / rollback 時のフック（uow/hooks.py）は同期版と同じものを
+      run_sync で同じトランザクション内に流す。
+    """
+
+    def __init__(self, session_factory: Callable[[], AsyncSession]) -> None:
+        self._session_factory = session_factory
+        self._session: AsyncSession | None = None
+
+    @property
+    def session(self) -> AsyncSession:
+        assert self._session is not None, "Use UnitOfWork via 'async with' block."
+        return self._session
+
+    async def __aenter__(self) -> Self:
+        self._session = self._session_factory()
+        self._on_enter(self.session)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                await self.commit()
+            else:
+                await self.rollback()
+        finally:
+            await self.session.close()
+            self._session = None
+
+    async def commit(self) -> None:
+        await self.session.run_sync(run_before_commit_hooks)
+        await self.session.commit()
+
+    async def rollback(self) -> None:
+        run_discard_hooks(self.session.sync_session)
+        await self.session.rollback()
+
+    def _on_enter(self, session: AsyncSession) -> None:
+        raise NotImplementedError
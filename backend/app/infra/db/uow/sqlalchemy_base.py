@@ -1,10 +1,19 @@
 from __future__ import annotations
 
+import copy
 from typing import Callable, Self
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, SessionTransaction
 
 from app.application.common.ports.unit_of_work_port import UnitOfWorkPort
+from app.infra.db.read_routing import prefer_primary
+from app.infra.db.request_scope import (
+    RequestSessionScope,
+    current_request_scope,
+    run_after_commit_callbacks,
+)
+from app.infra.db.session import create_replica_session, create_session, has_replica
+from app.infra.db.uow.hooks import run_before_commit_hooks, run_discard_hooks
 
 
 class SqlAlchemyUnitOfWorkBase(UnitOfWorkPort):
@@ -13,37 +22,134 @@ class SqlAlchemyUnitOfWorkBase(UnitOfWorkPort):
 
     - Session の生成 / commit / rollback / close を共通化
     - サブクラスは `_on_enter(session)` でリポジトリを組み立てる
+    - RequestSessionScope が有効な場合（HTTP リクエスト内）は、
+      リクエスト共有の Session 上で SAVEPOINT を張るだけにして、
+      commit / close はリクエスト終了時にまとめて行う。
+    - commit（SAVEPOINT の解放）の直前 / rollback 時に、登録されたフック
+      （uow/hooks.py。user_day_rollups の更新、読み取りルーティングの記録など）を呼ぶ。
+    - as_read_only() で得た UoW は、レプリカが設定されていればレプリカで読む
+      （同じクライアントが直前に書き込んだ場合はプライマリ。read_routing.py 参照）。
+    - after_commit() で積んだ副作用は、トランザクションが実際に COMMIT された後に呼ぶ
+      （リクエスト共有 Session ではリクエスト終了時の COMMIT 後）。
     """
 
     def __init__(self, session_factory: Callable[[], Session]) -> None:
         self._session_factory = session_factory
         self._session: Session | None = None
+        self._savepoint: SessionTransaction | None = None
+        self._scope: RequestSessionScope | None = None
+        self._read_only = False
+        self._after_commit: list[Callable[[], None]] = []
+
+    def as_read_only(self) -> Self:
+        """
+        同じ設定の読み取り専用 UoW を返す（self は変更しない）。
+
+        - FastAPI の依存キャッシュで同じ UoW インスタンスが書き込み系ユースケースと
+          共有されることがあるので、フラグはコピー側にだけ立てる。
+        """
+        clone = copy.copy(self)
+        clone._read_only = True
+        return clone
+
+    def _select_session_factory(self) -> Callable[[], Session]:
+        # テストなどで独自の session_factory を渡した場合はそのまま使う
+        if (
+            self._read_only
+            and self._session_factory is create_session
+            and has_replica()
+            and not prefer_primary()
+        ):
+            return create_replica_session
+        return self._session_factory
 
     @property
     def session(self) -> Session:
         assert self._session is not None, "Use UnitOfWork via 'with' block."
         return self._session
 
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """
+        COMMIT 後に callback を呼ぶ（ロールバックしたら呼ばない）。
+        with ブロックの中で呼ぶ。
+        """
+        self._after_commit.append(callback)
+
     def __enter__(self) -> Self:
-        self._session = self._session_factory()
+        # as_read_only() のコピーとリストを共有しないよう、ここで作り直す
+        self._after_commit = []
+        session_factory = self._select_session_factory()
+        scope = current_request_scope()
+        if scope is not None:
+            self._session = scope.acquire(session_factory)
+            self._scope = scope
+            self._savepoint = self._session.begin_nested()
+        else:
+            self._session = session_factory()
         self._on_enter(self.session)
         return self
 
     def __exit__(self, exc_type, exc, tb) -> None:
+        if self._savepoint is not None:
+            # リクエスト共有 Session: SAVEPOINT の解放 / 巻き戻しのみ
+            try:
+                if exc_type is None:
+                    self._before_commit()
+                    self._savepoint.commit()
+                    if self._scope is not None:
+                        for callback in self._after_commit:
+                            self._scope.after_commit(callback)
+                else:
+                    self._discard_pending()
+                    self._savepoint.rollback()
+            finally:
+                self._after_commit = []
+                self._savepoint = None
+                self._session = None
+                if self._scope is not None:
+                    self._scope.leave()
+                    self._scope = None
+            return
+
+        callbacks: list[Callable[[], None]] = []
         try:
             if exc_type is None:
+                self._before_commit()
                 self.session.commit()
+                callbacks = self._after_commit
             else:
+                self._discard_pending()
                 self.session.rollback()
         finally:
+            self._after_commit = []
             self.session.close()
             self._session = None
+        run_after_commit_callbacks(callbacks)
 
     def commit(self) -> None:
+        self._before_commit()
+        if self._savepoint is not None:
+            # 実際の COMMIT はリクエスト終了時に行う
+            self.session.flush()
+            return
         self.session.commit()
+        callbacks, self._after_commit = self._after_commit, []
+        run_after_commit_callbacks(callbacks)
 
     def rollback(self) -> None:
+        self._discard_pending()
+        if self._savepoint is not None:
+            self._savepoint.rollback()
+            self._savepoint = self.session.begin_nested()
+            return
         self.session.rollback()
 
+    def _before_commit(self) -> None:
+        run_before_commit_hooks(self.session)
+
+    def _discard_pending(self) -> None:
+        self._after_commit = []
+        run_discard_hooks(self.session)
+
     def _on_enter(self, session: Session) -> None:
         raise NotImplementedError
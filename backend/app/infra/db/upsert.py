@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+
+def dialect_insert(session: Session, table: sa.Table) -> Any:
+    """
+    INSERT ... ON CONFLICT を書ける insert() を、接続先の方言に合わせて返す。
+
+    - 本番は Postgres、ユニットテストは SQLite。どちらも
+      on_conflict_do_update(index_elements=..., index_where=..., set_=...) と
+      .excluded が同じ形で使える。
+    """
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert(table)
+    if dialect == "sqlite":
+        return sqlite.insert(table)
+    raise NotImplementedError(f"ON CONFLICT upsert is not supported on {dialect}")
+
+
+def expire_cached(
+    session: Session,
+    model: type,
+    match: Callable[[tuple[Any, ...]], bool],
+) -> None:
+    """
+    Core の UPDATE / upsert で書き換えた行が identity map に残っていれば expire する。
+
+    - ORM を経由しない書き込みは、セッションが保持しているオブジェクトに反映されない。
+      同じセッションで後から読むと古い値が返るので、対象だけ読み直させる。
+    - match には主キーのタプルが渡る（属性を触らないので余計な SELECT は出ない）。
+    """
+    for key, obj in list(session.identity_map.items()):
+        cls, identity = key[0], key[1]
+        if issubclass(cls, model) and match(identity):
+            session.expire(obj)
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Iterator
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class LlmLimiterStats:
+    """
+    OpenAI 呼び出しリミッタの状況（メトリクス用）。
+
+    - in_flight: 現在実行中の呼び出し数
+    - waiting: 枠 / トークン待ちの呼び出し数
+    - acquired: これまでに枠を得た呼び出し数
+    - total_wait_seconds / max_wait_seconds: キュー待ち時間の合計 / 最大
+    """
+
+    in_flight: int
+    waiting: int
+    acquired: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+
+    @property
+    def avg_wait_seconds(self) -> float:
+        if self.acquired == 0:
+            return 0.0
+        return self.total_wait_seconds / self.acquired
+
+
+class OpenAICallLimiter:
+    """
+    プロセス全体で OpenAI への同時呼び出し数と 1 分あたりのリクエスト数を抑える。
+
+    - async アダプタは slot()、同期アダプタ（スレッドプールで動く）は sync_slot() を使う。
+    - 同時実行数は async 側が asyncio.Semaphore、同期側が threading.BoundedSemaphore で、
+      それぞれ max_concurrency まで（イベントループをスレッドのロックで止めないため）。
+    - RPM のトークンバケットは両方で共有する（スレッドセーフ）。
+    - max_concurrency / requests_per_minute が 0 以下なら、その制限は無効。
+    - 枠を得るまでの待ち時間（キュー待ち）を stats() で取得できる。
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        requests_per_minute: int,
+        *,
+        slow_wait_log_seconds: float = 1.0,
+        monotonic: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._semaphore = (
+            asyncio.Semaphore(max_concurrency) if max_concurrency > 0 else None
+        )
+        self._thread_semaphore = (
+            threading.BoundedSemaphore(max_concurrency) if max_concurrency > 0 else None
+        )
+        self._rpm = requests_per_minute
+        self._capacity = float(max(requests_per_minute, 0))
+        self._tokens = self._capacity
+        self._monotonic = monotonic
+        self._refilled_at = monotonic()
+        self._lock = threading.Lock()
+        self._slow_wait_log_seconds = slow_wait_log_seconds
+
+        self._in_flight = 0
+        self._waiting = 0
+        self._acquired = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """
+        OpenAI を 1 回呼ぶ間だけ保持する枠（async アダプタ用）。
+
+            async with limiter.slot():
+                await client.chat.completions.create(...)
+        """
+        started = self._monotonic()
+        self._add_waiting(1)
+        acquired_semaphore = False
+        try:
+            if self._semaphore is not None:
+                await self._semaphore.acquire()
+                acquired_semaphore = True
+            delay = self._reserve_token()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        except BaseException:
+            if acquired_semaphore:
+                self._semaphore.release()
+            raise
+        finally:
+            self._add_waiting(-1)
+
+        self._record_wait(self._monotonic() - started)
+        try:
+            yield
+        finally:
+            self._add_in_flight(-1)
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+    @contextmanager
+    def sync_slot(self) -> Iterator[None]:
+        """
+        slot() の同期版（スレッドで動く同期アダプタ用）。
+
+            with limiter.sync_slot():
+                client.chat.completions.create(...)
+        """
+        started = self._monotonic()
+        self._add_waiting(1)
+        acquired_semaphore = False
+        try:
+            if self._thread_semaphore is not None:
+                self._thread_semaphore.acquire()
+                acquired_semaphore = True
+            delay = self._reserve_token()
+            if delay > 0:
+                time.sleep(delay)
+        except BaseException:
+            if acquired_semaphore:
+                self._thread_semaphore.release()
+            raise
+        finally:
+            self._add_waiting(-1)
+
+        self._record_wait(self._monotonic() - started)
+        try:
+            yield
+        finally:
+            self._add_in_flight(-1)
+            if self._thread_semaphore is not None:
+                self._thread_semaphore.release()
+
+    def stats(self) -> LlmLimiterStats:
+        with self._lock:
+            return LlmLimiterStats(
+                in_flight=self._in_flight,
+                waiting=self._waiting,
+                acquired=self._acquired,
+                total_wait_seconds=self._total_wait,
+                max_wait_seconds=self._max_wait,
+            )
+
+    # ------------------------------------------------------------------
+    # internal helpers
+    # ------------------------------------------------------------------
+
+    def _reserve_token(self) -> float:
+        """
+        トークンを 1 つ予約し、使えるようになるまでの秒数を返す（0 ならすぐ使える）。
+        足りない分は前借りする（残高がマイナスになる）ので、後続はその分長く待つ。
+        """
+        if self._rpm <= 0:
+            return 0.0
+
+        with self._lock:
+            self._refill()
+            self._tokens -= 1.0
+            if self._tokens >= 0.0:
+                return 0.0
+            return -self._tokens * 60.0 / self._rpm
+
+    def _refill(self) -> None:
+        now = self._monotonic()
+        elapsed = now - self._refilled_at
+        self._refilled_at = now
+        self._tokens = min(self._capacity, self._tokens + elapsed * self._rpm / 60.0)
+
+    def _add_waiting(self, delta: int) -> None:
+        with self._lock:
+            self._waiting += delta
+
+    def _add_in_flight(self, delta: int) -> None:
+        with self._lock:
+            self._in_flight += delta
+
+    def _record_wait(self, waited: float) -> None:
+        with self._lock:
+            self._acquired += 1
+            self._in_flight += 1
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+            in_flight = self._in_flight
+            waiting = self._waiting
+        if waited >= self._slow_wait_log_seconds:
+            logger.warning(
+                "OpenAI call waited %.2fs for a slot (in_flight=%d waiting=%d)",
+                waited,
+                in_flight,
+                waiting,
+            )
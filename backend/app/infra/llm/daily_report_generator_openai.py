@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import logging
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Iterator
 
-from openai import OpenAI, OpenAIError
+from openai import AsyncOpenAI, OpenAI, OpenAIError
 from pydantic import BaseModel, Field
 
 from app.application.nutrition.dto.daily_report_llm_dto import (
@@ -12,6 +13,7 @@ from app.application.nutrition.dto.daily_report_llm_dto import (
     DailyReportLLMOutput,
 )
 from app.application.nutrition.ports.daily_report_generator_port import (
+    AsyncDailyNutritionReportGeneratorPort,
     DailyNutritionReportGeneratorPort,
 )
 from app.application.nutrition.errors import DailyReportGenerationFailedError
@@ -19,6 +21,7 @@ from app.domain.profile.entities import Profile
 from app.domain.target.entities import DailyTargetSnapshot
 from app.domain.nutrition.daily_nutrition import DailyNutritionSummary
 from app.domain.nutrition.meal_nutrition import MealNutritionSummary
+from app.infra.llm.concurrency_limiter import OpenAICallLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -98,18 +101,12 @@ class OpenAIDailyReportGeneratorConfig:
     temperature: float = 0.4
 
 
-class OpenAIDailyNutritionReportGenerator(DailyNutritionReportGeneratorPort):
+class _OpenAIDailyReportGeneratorBase:
     """
-    OpenAI Structured Outputs を使って日次栄養レポート文面を生成する実装。
+    同期版 / async 版で共有する、入力検証・プロンプト組み立て・レスポンス解釈。
     """
 
-    def __init__(
-        self,
-        client: OpenAI | None = None,
-        config: OpenAIDailyReportGeneratorConfig | None = None,
-    ) -> None:
-        self._client = client or OpenAI()
-        self._config = config or OpenAIDailyReportGeneratorConfig()
+    _config: OpenAIDailyReportGeneratorConfig
 
     def _validate_input(self, input: DailyReportLLMInput) -> None:
         """入力データの妥当性を検証"""
@@ -153,44 +150,38 @@ class OpenAIDailyNutritionReportGenerator(DailyNutritionReportGeneratorPort):
         if weight and (weight.value < 20 or weight.value > 300):
             logger.warning(f"体重の値が異常です: {weight.value}kg")
 
-    def generate(self, input: DailyReportLLMInput) -> DailyReportLLMOutput:
-        """
-        LLM に日次レポート生成を依頼する。
-        """
-        # 入力検証を最初に実行
-        self._validate_input(input)
+    def _build_request(self, input: DailyReportLLMInput) -> dict[str, Any]:
+        return {
+            "model": self._config.model,
+            "messages": [
+                {"role": "system", "content": _SYSTEM_PROMPT},
+                {"role": "user", "content": self._build_user_prompt(input)},
+            ],
+            "temperature": self._config.temperature,
+            "response_format": DailyReportResponseSchema,
+        }
 
-        user_prompt = self._build_user_prompt(input)
+    def _to_output(self, completion: Any) -> DailyReportLLMOutput:
+        parsed_response = completion.choices[0].message.parsed
 
-        try:
-            # ------------------------------------------------------------------
-            # 3. リクエスト実行 (beta.parse を使用)
-            # ------------------------------------------------------------------
-            completion = self._client.beta.chat.completions.parse(
-                model=self._config.model,
-                messages=[
-                    {"role": "system", "content": _SYSTEM_PROMPT},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=self._config.temperature,
-                response_format=DailyReportResponseSchema,
+        if parsed_response is None:
+            raise DailyReportGenerationFailedError(
+                "OpenAI refused to generate structured output."
             )
 
-            parsed_response = completion.choices[0].message.parsed
-
-            if parsed_response is None:
-                raise DailyReportGenerationFailedError(
-                    "OpenAI refused to generate structured output."
-                )
-
-            # DTOへの詰め替え
-            return DailyReportLLMOutput(
-                summary=parsed_response.summary,
-                good_points=parsed_response.good_points,
-                improvement_points=parsed_response.improvement_points,
-                tomorrow_focus=parsed_response.tomorrow_focus,
-            )
+        # DTOへの詰め替え
+        return DailyReportLLMOutput(
+            summary=parsed_response.summary,
+            good_points=parsed_response.good_points,
+            improvement_points=parsed_response.improvement_points,
+            tomorrow_focus=parsed_response.tomorrow_focus,
+        )
 
+    @contextmanager
+    def _translate_errors(self, input: DailyReportLLMInput) -> Iterator[None]:
+        """OpenAI 呼び出し〜レスポンス解釈で起きた例外をドメインエラーに詰め替える。"""
+        try:
+            yield
         except OpenAIError as e:
             logger.exception(
                 "OpenAI API error: user=%s date=%s",
@@ -350,3 +341,69 @@ class OpenAIDailyNutritionReportGenerator(DailyNutritionReportGeneratorPort):
         )
 
         return "\n".join(lines)
+
+
+class OpenAIDailyNutritionReportGenerator(
+    _OpenAIDailyReportGeneratorBase,
+    DailyNutritionReportGeneratorPort,
+):
+    """
+    OpenAI Structured Outputs を使って日次栄養レポート文面を生成する実装。
+    """
+
+    def __init__(
+        self,
+        client: OpenAI | None = None,
+        config: OpenAIDailyReportGeneratorConfig | None = None,
+        limiter: OpenAICallLimiter | None = None,
+    ) -> None:
+        self._client = client or OpenAI()
+        self._config = config or OpenAIDailyReportGeneratorConfig()
+        self._limiter = limiter
+
+    def generate(self, input: DailyReportLLMInput) -> DailyReportLLMOutput:
+        """
+        LLM に日次レポート生成を依頼する。
+        """
+        # 入力検証を最初に実行
+        self._validate_input(input)
+
+        with self._translate_errors(input):
+            # beta.parse (Structured Outputs) を使用
+            with self._limiter.sync_slot() if self._limiter else nullcontext():
+                completion = self._client.beta.chat.completions.parse(
+                    **self._build_request(input)
+                )
+            return self._to_output(completion)
+
+
+class AsyncOpenAIDailyNutritionReportGenerator(
+    _OpenAIDailyReportGeneratorBase,
+    AsyncDailyNutritionReportGeneratorPort,
+):
+    """
+    AsyncOpenAI を使う日次レポート生成の async 版（HTTP ルート用）。
+
+    - 呼び出しは OpenAICallLimiter の枠の中で行う。
+    """
+
+    def __init__(
+        self,
+        client: AsyncOpenAI | None = None,
+        config: OpenAIDailyReportGeneratorConfig | None = None,
+        *,
+        limiter: OpenAICallLimiter,
+    ) -> None:
+        self._client = client or AsyncOpenAI()
+        self._config = config or OpenAIDailyReportGeneratorConfig()
+        self._limiter = limiter
+
+    async def generate(self, input: DailyReportLLMInput) -> DailyReportLLMOutput:
+        self._validate_input(input)
+
+        with self._translate_errors(input):
+            async with self._limiter.slot():
+                completion = await self._client.beta.chat.completions.parse(
+                    **self._build_request(input)
+                )
+            return self._to_output(completion)
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+from dataclasses import asdict
+from datetime import timedelta
+from typing import Callable
+
+import sqlalchemy as sa
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.application.auth.ports.clock_port import ClockPort
+from app.application.nutrition.dto.daily_report_llm_dto import DailyReportLLMOutput
+from app.infra.db.models.daily_report_output_cache import (
+    DailyReportOutputCacheModel,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _cache_key(flight_key: str) -> str:
+    return hashlib.sha256(flight_key.encode("utf-8")).hexdigest()
+
+
+class SqlAlchemyDailyReportOutputCacheStore:
+    """
+    daily_report_output_cache テーブルを使った、日次レポート出力の短期キャッシュ。
+
+    - single-flight のキー（daily_report_flight_key）で出力を共有し、
+      advisory lock を待っていた別ワーカーが LLM を呼び直さないようにする。
+    - ttl_seconds を過ぎた行はミス扱い。set() のたびに TTL 切れの行を消す。
+    - DB 障害時はキャッシュ無しとして振る舞う（生成自体は止めない）。
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        clock: ClockPort,
+        *,
+        ttl_seconds: float,
+    ) -> None:
+        self._session_factory = session_factory
+        self._clock = clock
+        self._ttl = timedelta(seconds=ttl_seconds)
+
+    def get(self, flight_key: str) -> DailyReportLLMOutput | None:
+        cutoff = self._clock.now() - self._ttl
+        try:
+            with self._session_factory() as session:
+                raw = session.execute(
+                    sa.select(DailyReportOutputCacheModel.output).where(
+                        DailyReportOutputCacheModel.cache_key == _cache_key(flight_key),
+                        DailyReportOutputCacheModel.created_at >= cutoff,
+                    )
+                ).scalar_one_or_none()
+        except SQLAlchemyError:
+            logger.warning("daily report output cache read failed", exc_info=True)
+            return None
+
+        if raw is None:
+            return None
+        return DailyReportLLMOutput(**raw)
+
+    def set(self, flight_key: str, output: DailyReportLLMOutput) -> None:
+        now = self._clock.now()
+        table = DailyReportOutputCacheModel.__table__
+        try:
+            with self._session_factory() as session:
+                session.execute(
+                    sa.delete(table).where(table.c.created_at < now - self._ttl)
+                )
+                session.merge(
+                    DailyReportOutputCacheModel(
+                        cache_key=_cache_key(flight_key),
+                        output=asdict(output),
+                        created_at=now,
+                    )
+                )
+                session.commit()
+        except SQLAlchemyError:
+            logger.warning("daily report output cache write failed", exc_info=True)
@@ -2,13 +2,15 @@ from __future__ import annotations
 
 import json
 import logging
+from contextlib import nullcontext
 from dataclasses import dataclass
 from datetime import date as DateType
-from typing import Any, Sequence
+from typing import Any, NoReturn, Sequence
 
-from openai import OpenAI, OpenAIError
+from openai import AsyncOpenAI, OpenAI, OpenAIError
 
 from app.application.nutrition.ports.nutrition_estimator_port import (
+    AsyncNutritionEstimatorPort,
     NutritionEstimatorPort,
 )
 from app.application.nutrition.dto.meal_nutrient_intake_dto import (
@@ -22,12 +24,16 @@ from app.domain.target.value_objects import (
     NutrientCode,
     NutrientSource,
 )
+from app.infra.llm.concurrency_limiter import OpenAICallLimiter
 
 logger = logging.getLogger(__name__)
 
 
 # === LLM 用プロンプト =======================================================
 
+# プロンプトや出力の解釈を変えたら上げる（推定キャッシュのキーに含まれる）
+PROMPT_VERSION = "v1"
+
 _SYSTEM_PROMPT = """\
 You are a registered dietitian and nutrition expert.
 
@@ -110,70 +116,52 @@ class OpenAINutritionEstimatorConfig:
     # 必要に応じて max_tokens などを追加
 
 
-class OpenAINutritionEstimator(NutritionEstimatorPort):
+class _OpenAINutritionEstimatorBase:
     """
-    OpenAI Chat Completions API を使って Meal 単位の栄養素を推定する実装。
-
-    - OPENAI_API_KEY は環境変数から読み込む前提。
-    - JSON モードで nutrients を返させ、MealNutrientIntake にマッピングする。
+    同期版 / async 版で共有する、リクエスト組み立てとレスポンス解釈。
     """
 
-    def __init__(
-        self,
-        client: OpenAI | None = None,
-        config: OpenAINutritionEstimatorConfig | None = None,
-    ) -> None:
-        self._client = client or OpenAI()
-        self._config = config or OpenAINutritionEstimatorConfig()
+    _config: OpenAINutritionEstimatorConfig
 
     # ------------------------------------------------------------------
-    # Port 実装
+    # internal helpers
     # ------------------------------------------------------------------
 
-    def estimate_for_entries(
+    def _build_request(
         self,
         user_id: UserId,
         date: DateType,
         entries: Sequence[FoodEntry],
-    ) -> list[MealNutrientIntake]:
-        """
-        指定ユーザー・日付・Meal の FoodEntry 群から栄養素を推定する。
-
-        Raises:
-            NutritionEstimationFailedError: 外部 API や JSON パースなどの失敗時
-        """
-        # Meal に紐づく FoodEntry が 0 件なら、栄養素 0 として扱うか空で返す。
-        # ここでは空リストを返す（呼び出し側は「栄養なし」として扱う）。
-        if not entries:
-            logger.info(
-                "No FoodEntry for user=%s date=%s; returning empty nutrient list",
-                user_id.value,
-                date,
-            )
-            return []
-
-        user_prompt = self._build_user_prompt(user_id, date, entries)
-
-        try:
-            completion = self._client.chat.completions.create(
-                model=self._config.model,
-                messages=[
-                    {"role": "system", "content": _SYSTEM_PROMPT},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=self._config.temperature,
-                response_format={"type": "json_object"},
-            )
-        except OpenAIError as e:
-            logger.exception(
-                "OpenAI API error while estimating nutrition: user=%s date=%s",
-                user_id.value,
-                date,
-            )
-            raise NutritionEstimationFailedError(
-                "Failed to estimate nutrition via OpenAI"
-            ) from e
+    ) -> dict[str, Any]:
+        return {
+            "model": self._config.model,
+            "messages": [
+                {"role": "system", "content": _SYSTEM_PROMPT},
+                {
+                    "role": "user",
+                    "content": self._build_user_prompt(user_id, date, entries),
+                },
+            ],
+            "temperature": self._config.temperature,
+            "response_format": {"type": "json_object"},
+        }
+
+    def _raise_api_error(
+        self,
+        error: OpenAIError,
+        user_id: UserId,
+        date: DateType,
+    ) -> NoReturn:
+        logger.exception(
+            "OpenAI API error while estimating nutrition: user=%s date=%s",
+            user_id.value,
+            date,
+        )
+        raise NutritionEstimationFailedError(
+            "Failed to estimate nutrition via OpenAI"
+        ) from error
 
+    def _to_intakes(self, completion: Any) -> list[MealNutrientIntake]:
         content = completion.choices[0].message.content
         if content is None:
             raise NutritionEstimationFailedError(
@@ -204,10 +192,6 @@ class OpenAINutritionEstimator(NutritionEstimatorPort):
 
         return nutrients
 
-    # ------------------------------------------------------------------
-    # internal helpers
-    # ------------------------------------------------------------------
-
     def _build_user_prompt(
         self,
         user_id: UserId,
@@ -256,60 +240,169 @@ class OpenAINutritionEstimator(NutritionEstimatorPort):
     def _parse_nutrients(
         self,
         raw_nutrients: dict[str, Any],
+    ) -> list[MealNutrientIntake]:
+        return parse_nutrients(raw_nutrients)
+
+
+class OpenAINutritionEstimator(
+    _OpenAINutritionEstimatorBase,
+    NutritionEstimatorPort,
+):
+    """
+    OpenAI Chat Completions API を使って Meal 単位の栄養素を推定する実装。
+
+    - OPENAI_API_KEY は環境変数から読み込む前提。
+    - JSON モードで nutrients を返させ、MealNutrientIntake にマッピングする。
+    """
+
+    def __init__(
+        self,
+        client: OpenAI | None = None,
+        config: OpenAINutritionEstimatorConfig | None = None,
+        limiter: OpenAICallLimiter | None = None,
+    ) -> None:
+        self._client = client or OpenAI()
+        self._config = config or OpenAINutritionEstimatorConfig()
+        self._limiter = limiter
+
+    # ------------------------------------------------------------------
+    # Port 実装
+    # ------------------------------------------------------------------
+
+    def estimate_for_entries(
+        self,
+        user_id: UserId,
+        date: DateType,
+        entries: Sequence[FoodEntry],
     ) -> list[MealNutrientIntake]:
         """
-        LLM から返ってきた JSON の "nutrients" 部分を MealNutrientIntake のリストに変換する。
+        指定ユーザー・日付・Meal の FoodEntry 群から栄養素を推定する。
 
-        - 必須 10 栄養素が揃っているか
-        - 余計なキーが混ざっていないか
-        - unit が期待通りか
-        を検証する。
+        Raises:
+            NutritionEstimationFailedError: 外部 API や JSON パースなどの失敗時
         """
-        if not isinstance(raw_nutrients, dict):
-            raise ValueError("nutrients must be an object")
+        # Meal に紐づく FoodEntry が 0 件なら、栄養素 0 として扱うか空で返す。
+        # ここでは空リストを返す（呼び出し側は「栄養なし」として扱う）。
+        if not entries:
+            logger.info(
+                "No FoodEntry for user=%s date=%s; returning empty nutrient list",
+                user_id.value,
+                date,
+            )
+            return []
 
-        keys = set(raw_nutrients.keys())
-        expected_keys = {code.value for code in EXPECTED_CODES}
+        try:
+            with self._limiter.sync_slot() if self._limiter else nullcontext():
+                completion = self._client.chat.completions.create(
+                    **self._build_request(user_id, date, entries)
+                )
+        except OpenAIError as e:
+            self._raise_api_error(e, user_id, date)
 
-        missing = expected_keys - keys
-        extra = keys - expected_keys
+        return self._to_intakes(completion)
 
-        if missing:
-            raise ValueError(
-                f"Missing nutrients in response: {sorted(missing)}"
-            )
-        if extra:
-            # ここでは余計なキーもエラーとして扱う（挙動を厳しめにしておく）
-            raise ValueError(
-                f"Unexpected nutrients in response: {sorted(extra)}"
-            )
 
-        results: list[MealNutrientIntake] = []
+class AsyncOpenAINutritionEstimator(
+    _OpenAINutritionEstimatorBase,
+    AsyncNutritionEstimatorPort,
+):
+    """
+    AsyncOpenAI を使う OpenAINutritionEstimator の async 版（HTTP ルート用）。
 
-        for code in EXPECTED_CODES:
-            key = code.value
-            entry = raw_nutrients[key]
+    - プロンプト組み立て / レスポンス解釈は同期版と共有する。
+    - 呼び出しは OpenAICallLimiter の枠の中で行う（同時実行数 / RPM の上限）。
+    """
 
-            try:
-                amount_val = float(entry["amount"])
-                unit = str(entry["unit"])
-            except (KeyError, TypeError, ValueError) as e:
-                raise ValueError(
-                    f"Invalid nutrient entry for code={key}: {entry}"
-                ) from e
+    def __init__(
+        self,
+        client: AsyncOpenAI | None = None,
+        config: OpenAINutritionEstimatorConfig | None = None,
+        *,
+        limiter: OpenAICallLimiter,
+    ) -> None:
+        self._client = client or AsyncOpenAI()
+        self._config = config or OpenAINutritionEstimatorConfig()
+        self._limiter = limiter
 
-            expected_unit = EXPECTED_UNITS[code]
-            if unit != expected_unit:
-                raise ValueError(
-                    f"Invalid unit for {key}: expected {expected_unit}, got {unit}"
-                )
+    async def estimate_for_entries(
+        self,
+        user_id: UserId,
+        date: DateType,
+        entries: Sequence[FoodEntry],
+    ) -> list[MealNutrientIntake]:
+        if not entries:
+            return []
 
-            results.append(
-                MealNutrientIntake(
-                    code=code,
-                    amount=NutrientAmount(value=amount_val, unit=unit),
-                    source=NutrientSource("llm"),
+        try:
+            async with self._limiter.slot():
+                completion = await self._client.chat.completions.create(
+                    **self._build_request(user_id, date, entries)
                 )
+        except OpenAIError as e:
+            self._raise_api_error(e, user_id, date)
+
+        return self._to_intakes(completion)
+
+
+# === nutrients パース（品目単位の推定アダプタとも共有） =======================
+
+
+def parse_nutrients(
+    raw_nutrients: dict[str, Any],
+) -> list[MealNutrientIntake]:
+    """
+    LLM から返ってきた JSON の "nutrients" 部分を MealNutrientIntake のリストに変換する。
+
+    - 必須 10 栄養素が揃っているか
+    - 余計なキーが混ざっていないか
+    - unit が期待通りか
+    を検証する。
+    """
+    if not isinstance(raw_nutrients, dict):
+        raise ValueError("nutrients must be an object")
+
+    keys = set(raw_nutrients.keys())
+    expected_keys = {code.value for code in EXPECTED_CODES}
+
+    missing = expected_keys - keys
+    extra = keys - expected_keys
+
+    if missing:
+        raise ValueError(
+            f"Missing nutrients in response: {sorted(missing)}"
+        )
+    if extra:
+        # ここでは余計なキーもエラーとして扱う（挙動を厳しめにしておく）
+        raise ValueError(
+            f"Unexpected nutrients in response: {sorted(extra)}"
+        )
+
+    results: list[MealNutrientIntake] = []
+
+    for code in EXPECTED_CODES:
+        key = code.value
+        entry = raw_nutrients[key]
+
+        try:
+            amount_val = float(entry["amount"])
+            unit = str(entry["unit"])
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(
+                f"Invalid nutrient entry for code={key}: {entry}"
+            ) from e
+
+        expected_unit = EXPECTED_UNITS[code]
+        if unit != expected_unit:
+            raise ValueError(
+                f"Invalid unit for {key}: expected {expected_unit}, got {unit}"
+            )
+
+        results.append(
+            MealNutrientIntake(
+                code=code,
+                amount=NutrientAmount(value=amount_val, unit=unit),
+                source=NutrientSource("llm"),
             )
+        )
 
-        return results
+    return results
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import json
+import logging
+from contextlib import nullcontext
+from typing import Any, Sequence
+
+from openai import OpenAI, OpenAIError
+
+from app.domain.nutrition.errors import NutritionEstimationFailedError
+from app.infra.llm.concurrency_limiter import OpenAICallLimiter
+from app.infra.llm.estimator_openai import (
+    OpenAINutritionEstimatorConfig,
+    parse_nutrients,
+)
+from app.infra.nutrition.food_item_vectors import (
+    FoodItemKey,
+    NutrientVector,
+    SERVING_UNIT,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# プロンプトや出力の解釈を変えたら上げる（品目ベクトルのキーに含まれる）
+ITEM_PROMPT_VERSION = "items-v1"
+
+_SYSTEM_PROMPT = """\
+You are a registered dietitian and nutrition expert.
+
+Your task:
+Given a numbered list of standalone food items, each with a reference quantity,
+estimate the nutrients contained in exactly that reference quantity of the item.
+
+You MUST return a JSON object with the following structure:
+
+{
+  "items": [
+    {
+      "index": <item number>,
+      "nutrients": {
+        "carbohydrate":  {"amount": <number>, "unit": "g"},
+        "fat":           {"amount": <number>, "unit": "g"},
+        "protein":       {"amount": <number>, "unit": "g"},
+        "water":         {"amount": <number>, "unit": "ml"},
+        "fiber":         {"amount": <number>, "unit": "g"},
+        "sodium":        {"amount": <number>, "unit": "mg"},
+        "iron":          {"amount": <number>, "unit": "mg"},
+        "calcium":       {"amount": <number>, "unit": "mg"},
+        "vitamin_d":     {"amount": <number>, "unit": "µg"},
+        "potassium":     {"amount": <number>, "unit": "mg"}
+      }
+    }
+  ]
+}
+
+Requirements:
+
+- Return exactly one element in "items" per input item, using the same index.
+- "nutrients" must contain exactly these 10 nutrient codes with the units shown.
+- Estimate for the reference quantity only, not for a whole meal.
+- If some information is missing, make reasonable assumptions.
+- Do NOT include any extra keys outside this JSON object.
+"""
+
+
+class OpenAIFoodItemNutrientEstimator:
+    """
+    未知の食品品目を 1 回の Chat Completions 呼び出しでまとめて推定する。
+
+    - ItemVectorNutritionEstimator の item_estimator として使う。
+    - 各品目は「100 unit あたり」または「1 人前あたり」で推定させる。
+    """
+
+    prompt_version = ITEM_PROMPT_VERSION
+
+    def __init__(
+        self,
+        client: OpenAI | None = None,
+        config: OpenAINutritionEstimatorConfig | None = None,
+        limiter: OpenAICallLimiter | None = None,
+    ) -> None:
+        self._client = client or OpenAI()
+        self._config = config or OpenAINutritionEstimatorConfig()
+        self._limiter = limiter
+
+    @property
+    def model(self) -> str:
+        return self._config.model
+
+    def estimate_items(self, items: Sequence[FoodItemKey]) -> list[NutrientVector]:
+        """
+        Raises:
+            NutritionEstimationFailedError: 外部 API や JSON パースなどの失敗時
+        """
+        if not items:
+            return []
+
+        try:
+            with self._limiter.sync_slot() if self._limiter else nullcontext():
+                completion = self._client.chat.completions.create(
+                    model=self._config.model,
+                    messages=[
+                        {"role": "system", "content": _SYSTEM_PROMPT},
+                        {"role": "user", "content": self._build_user_prompt(items)},
+                    ],
+                    temperature=self._config.temperature,
+                    response_format={"type": "json_object"},
+                )
+        except OpenAIError as e:
+            logger.exception(
+                "OpenAI API error while estimating %d food items", len(items)
+            )
+            raise NutritionEstimationFailedError(
+                "Failed to estimate nutrition via OpenAI"
+            ) from e
+
+        content = completion.choices[0].message.content
+        if content is None:
+            raise NutritionEstimationFailedError(
+                "OpenAI returned empty content"
+            )
+
+        try:
+            data: dict[str, Any] = json.loads(content)
+            return self._parse_items(data.get("items"), len(items))
+        except Exception:
+            logger.exception(
+                "Failed to map food item nutrients from OpenAI response: %s",
+                content,
+            )
+            raise NutritionEstimationFailedError(
+                "Failed to map nutrients from OpenAI response"
+            )
+
+    # ------------------------------------------------------------------
+    # internal helpers
+    # ------------------------------------------------------------------
+
+    def _build_user_prompt(self, items: Sequence[FoodItemKey]) -> str:
+        lines: list[str] = ["Food items:"]
+        for idx, item in enumerate(items, start=1):
+            if item.unit == SERVING_UNIT:
+                quantity = "1 serving"
+            else:
+                quantity = f"{item.reference_amount:g} {item.unit}"
+            lines.append(f"{idx}. name: {item.name}, reference quantity: {quantity}")
+        return "\n".join(lines)
+
+    def _parse_items(self, raw_items: Any, expected: int) -> list[NutrientVector]:
+        if not isinstance(raw_items, list):
+            raise ValueError("items must be an array")
+
+        by_index: dict[int, NutrientVector] = {}
+        for raw in raw_items:
+            index = int(raw["index"])
+            intakes = parse_nutrients(raw.get("nutrients", {}))
+            by_index[index] = {i.code: i.amount.value for i in intakes}
+
+        missing = [i for i in range(1, expected + 1) if i not in by_index]
+        if missing:
+            raise ValueError(f"Missing items in response: {missing}")
+
+        return [by_index[i] for i in range(1, expected + 1)]
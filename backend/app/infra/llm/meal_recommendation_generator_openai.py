@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import logging
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
 from datetime import date as DateType
-from typing import Any
+from typing import Any, Iterator
 
-from openai import OpenAI, OpenAIError
+from openai import AsyncOpenAI, OpenAI, OpenAIError
 from pydantic import BaseModel, Field, ValidationError
 from openai.types.chat import ParsedChatCompletion
 
@@ -15,9 +16,11 @@ from app.application.nutrition.dto.meal_recommendation_llm_dto import (
     RecommendedMealDTO,
 )
 from app.application.nutrition.ports.recommendation_generator_port import (
+    AsyncMealRecommendationGeneratorPort,
     MealRecommendationGeneratorPort,
 )
 from app.domain.nutrition.errors import NutritionDomainError
+from app.infra.llm.concurrency_limiter import OpenAICallLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -90,63 +93,58 @@ class OpenAIMealRecommendationGeneratorConfig:
     max_retries: int = 2        # リトライ回数
 
 
-class OpenAIMealRecommendationGenerator(MealRecommendationGeneratorPort):
+class _OpenAIMealRecommendationGeneratorBase:
     """
-    OpenAI Structured Outputsを使用した食事提案生成器。
-
-    - JSON parseエラーを回避
-    - 型安全性の確保
-    - 明確なプロンプト構造
+    同期版 / async 版で共有する、プロンプト組み立てとレスポンス解釈。
     """
 
-    def __init__(
+    _config: OpenAIMealRecommendationGeneratorConfig
+
+    def _build_request(self, input: MealRecommendationLLMInput) -> dict[str, Any]:
+        return {
+            "model": self._config.model,
+            "messages": [
+                {"role": "system", "content": self._build_system_prompt()},
+                {"role": "user", "content": self._build_user_prompt(input)},
+            ],
+            "temperature": self._config.temperature,
+            "response_format": MealRecommendationResponseSchema,
+            "max_retries": self._config.max_retries,
+        }
+
+    def _to_output(
         self,
-        client: OpenAI | None = None,
-        config: OpenAIMealRecommendationGeneratorConfig | None = None,
-    ) -> None:
-        self._client = client or OpenAI()
-        self._config = config or OpenAIMealRecommendationGeneratorConfig()
-
-    def generate(self, input: MealRecommendationLLMInput) -> MealRecommendationLLMOutput:
-        """食事提案を生成する。"""
-        try:
-            user_prompt = self._build_user_prompt(input)
-            system_prompt = self._build_system_prompt()
-
-            completion: ParsedChatCompletion[MealRecommendationResponseSchema] = self._client.beta.chat.completions.parse(
-                model=self._config.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=self._config.temperature,
-                response_format=MealRecommendationResponseSchema,
-                max_retries=self._config.max_retries,
+        completion: ParsedChatCompletion[MealRecommendationResponseSchema],
+    ) -> MealRecommendationLLMOutput:
+        parsed_response: MealRecommendationResponseSchema | None = completion.choices[
+            0].message.parsed
+        if parsed_response is None:
+            raise MealRecommendationGenerationFailedError(
+                "OpenAI failed to generate structured response"
             )
 
-            parsed_response: MealRecommendationResponseSchema | None = completion.choices[
-                0].message.parsed
-            if parsed_response is None:
-                raise MealRecommendationGenerationFailedError(
-                    "OpenAI failed to generate structured response"
-                )
+        # Pydantic -> DTO 変換
+        recommended_meals_dto = [
+            RecommendedMealDTO(
+                title=meal.title,
+                description=meal.description,
+                ingredients=meal.ingredients,
+                nutrition_focus=meal.nutrition_focus,
+            )
+            for meal in parsed_response.recommended_meals
+        ]
 
-            # Pydantic -> DTO 変換
-            recommended_meals_dto = [
-                RecommendedMealDTO(
-                    title=meal.title,
-                    description=meal.description,
-                    ingredients=meal.ingredients,
-                    nutrition_focus=meal.nutrition_focus,
-                )
-                for meal in parsed_response.recommended_meals
-            ]
+        return MealRecommendationLLMOutput(
+            body=parsed_response.body,
+            tips=parsed_response.tips,
+            recommended_meals=recommended_meals_dto,
+        )
 
-            return MealRecommendationLLMOutput(
-                body=parsed_response.body,
-                tips=parsed_response.tips,
-                recommended_meals=recommended_meals_dto,
-            )
+    @contextmanager
+    def _translate_errors(self, input: MealRecommendationLLMInput) -> Iterator[None]:
+        """OpenAI 呼び出し〜レスポンス解釈で起きた例外をドメインエラーに詰め替える。"""
+        try:
+            yield
 
         except OpenAIError as e:
             logger.error(
@@ -280,3 +278,68 @@ class OpenAIMealRecommendationGenerator(MealRecommendationGeneratorPort):
         """BMIを計算。"""
         height_m = height_cm / 100
         return weight_kg / (height_m ** 2)
+
+
+class OpenAIMealRecommendationGenerator(
+    _OpenAIMealRecommendationGeneratorBase,
+    MealRecommendationGeneratorPort,
+):
+    """
+    OpenAI Structured Outputsを使用した食事提案生成器。
+
+    - JSON parseエラーを回避
+    - 型安全性の確保
+    - 明確なプロンプト構造
+    """
+
+    def __init__(
+        self,
+        client: OpenAI | None = None,
+        config: OpenAIMealRecommendationGeneratorConfig | None = None,
+        limiter: OpenAICallLimiter | None = None,
+    ) -> None:
+        self._client = client or OpenAI()
+        self._config = config or OpenAIMealRecommendationGeneratorConfig()
+        self._limiter = limiter
+
+    def generate(self, input: MealRecommendationLLMInput) -> MealRecommendationLLMOutput:
+        """食事提案を生成する。"""
+        with self._translate_errors(input):
+            with self._limiter.sync_slot() if self._limiter else nullcontext():
+                completion = self._client.beta.chat.completions.parse(
+                    **self._build_request(input)
+                )
+            return self._to_output(completion)
+
+
+class AsyncOpenAIMealRecommendationGenerator(
+    _OpenAIMealRecommendationGeneratorBase,
+    AsyncMealRecommendationGeneratorPort,
+):
+    """
+    AsyncOpenAI を使う食事提案生成の async 版（HTTP ルート用）。
+
+    - 呼び出しは OpenAICallLimiter の枠の中で行う。
+    """
+
+    def __init__(
+        self,
+        client: AsyncOpenAI | None = None,
+        config: OpenAIMealRecommendationGeneratorConfig | None = None,
+        *,
+        limiter: OpenAICallLimiter,
+    ) -> None:
+        self._client = client or AsyncOpenAI()
+        self._config = config or OpenAIMealRecommendationGeneratorConfig()
+        self._limiter = limiter
+
+    async def generate(
+        self,
+        input: MealRecommendationLLMInput,
+    ) -> MealRecommendationLLMOutput:
+        with self._translate_errors(input):
+            async with self._limiter.slot():
+                completion = await self._client.beta.chat.completions.parse(
+                    **self._build_request(input)
+                )
+            return self._to_output(completion)
@@ -0,0 +1,415 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date as DateType
+from typing import Any, Awaitable, Callable, Iterator, Sequence, TypeVar
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.application.nutrition.dto.daily_report_llm_dto import (
+    DailyReportLLMInput,
+    DailyReportLLMOutput,
+)
+from app.application.nutrition.dto.meal_nutrient_intake_dto import (
+    MealNutrientIntake,
+)
+from app.application.nutrition.ports.daily_report_generator_port import (
+    AsyncDailyNutritionReportGeneratorPort,
+    DailyNutritionReportGeneratorPort,
+)
+from app.application.nutrition.ports.nutrition_estimator_port import (
+    AsyncNutritionEstimatorPort,
+    NutritionEstimatorPort,
+)
+from app.domain.auth.value_objects import UserId
+from app.domain.meal.entities import FoodEntry
+from app.infra.llm.daily_report_output_cache import (
+    SqlAlchemyDailyReportOutputCacheStore,
+)
+from app.infra.nutrition.estimate_cache import build_estimate_cache_key
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+# === プロセス間ロック (Postgres advisory lock) ================================
+
+
+def _advisory_lock_id(key: str) -> int:
+    # pg_advisory_lock は signed bigint を取る
+    digest = hashlib.sha256(key.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big", signed=True)
+
+
+class PostgresAdvisoryLock:
+    """
+    キーごとの Postgres セッションレベル advisory lock。
+
+    - pg_try_advisory_lock を poll_interval_seconds 間隔で試し、取れるまで待つ。
+      待っている間は DB 接続をプールに返す（保持している間だけ接続を 1 本使う）。
+    - timeout_seconds 待っても取れなければ、ロック無しで続行する
+      （重複呼び出しになるだけで、リクエスト自体は失敗させない）。
+    - Postgres 以外（テストの SQLite など）では何もしない。
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        *,
+        timeout_seconds: float = 60.0,
+        poll_interval_seconds: float = 0.2,
+    ) -> None:
+        self._session_factory = session_factory
+        self._timeout = timeout_seconds
+        self._poll_interval = poll_interval_seconds
+
+    @contextmanager
+    def hold(self, key: str) -> Iterator[None]:
+        lock_id = _advisory_lock_id(key)
+        session = self._acquire(key, lock_id)
+        try:
+            yield
+        finally:
+            if session is not None:
+                try:
+                    session.execute(
+                        text("SELECT pg_advisory_unlock(:id)"), {"id": lock_id}
+                    )
+                finally:
+                    session.close()
+
+    def _acquire(self, key: str, lock_id: int) -> Session | None:
+        """ロックを取れたらそのセッションを返す。取れなかった / 不要なら None。"""
+        deadline = time.monotonic() + self._timeout
+        while True:
+            session = self._session_factory()
+            try:
+                if session.get_bind().dialect.name != "postgresql":
+                    session.close()
+                    return None
+                acquired = session.execute(
+                    text("SELECT pg_try_advisory_lock(:id)"), {"id": lock_id}
+                ).scalar()
+            except BaseException:
+                session.close()
+                raise
+            if acquired:
+                return session
+            session.close()
+
+            if time.monotonic() >= deadline:
+                logger.warning(
+                    "single-flight: advisory lock wait timed out, continuing without lock key=%s",
+                    key,
+                )
+                return None
+            time.sleep(self._poll_interval)
+
+
+# === single-flight 本体 =====================================================
+
+
+@dataclass(frozen=True)
+class SingleFlightStats:
+    """
+    single-flight の状況（メトリクス用）。
+
+    - leaders: 実際に内側を呼んだ回数
+    - coalesced: 先行呼び出しの結果を待って相乗りした回数
+    """
+
+    leaders: int
+    coalesced: int
+
+
+@dataclass
+class _Call:
+    done: threading.Event = field(default_factory=threading.Event)
+    result: Any = None
+    error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    同じキーの呼び出しが同時に来たら、最初の 1 件だけ実行して残りは結果を共有する。
+
+    - do() はスレッド（同期ポート）用、do_async() はイベントループ（async ポート）用。
+    - 例外も共有する（先行呼び出しが失敗したら、待っていた呼び出しも同じ例外）。
+    - async 版は実行を別タスクにして shield で待つので、先行リクエストが
+      切断 / キャンセルされても相乗りしている側は結果を受け取れる。
+    - cross_process_lock を渡すと、実行中は advisory lock を保持し、
+      別ワーカーの同一キーを直列化する。recheck を渡すと、ロックを取った後に
+      まず recheck() を呼び、None 以外ならそれを結果として fn() を呼ばない
+      （先に終わった別ワーカーの結果を拾う）。
+    """
+
+    def __init__(self, *, cross_process_lock: PostgresAdvisoryLock | None = None) -> None:
+        self._cross_process_lock = cross_process_lock
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+        self._tasks: dict[str, asyncio.Future[Any]] = {}
+        self._leaders = 0
+        self._coalesced = 0
+
+    def do(
+        self,
+        key: str,
+        fn: Callable[[], T],
+        *,
+        recheck: Callable[[], T | None] | None = None,
+    ) -> T:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+                self._leaders += 1
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            logger.info("single-flight: coalesced duplicate call key=%s", key)
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            if self._cross_process_lock is not None:
+                with self._cross_process_lock.hold(key):
+                    cached = recheck() if recheck is not None else None
+                    call.result = cached if cached is not None else fn()
+            else:
+                call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    async def do_async(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[T]],
+        *,
+        recheck: Callable[[], T | None] | None = None,
+    ) -> T:
+        """do() の async 版。recheck は同期関数（スレッドで実行する）。"""
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._run_async(key, fn, recheck))
+            self._tasks[key] = task
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+            with self._lock:
+                self._leaders += 1
+        else:
+            with self._lock:
+                self._coalesced += 1
+            logger.info("single-flight: coalesced duplicate call key=%s", key)
+        return await asyncio.shield(task)
+
+    def stats(self) -> SingleFlightStats:
+        with self._lock:
+            return SingleFlightStats(leaders=self._leaders, coalesced=self._coalesced)
+
+    async def _run_async(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[T]],
+        recheck: Callable[[], T | None] | None,
+    ) -> T:
+        if self._cross_process_lock is None:
+            return await fn()
+
+        # advisory lock の取得 / 解放はブロッキング I/O なのでスレッドで行う
+        hold = self._cross_process_lock.hold(key)
+        await asyncio.to_thread(hold.__enter__)
+        try:
+            if recheck is not None:
+                cached = await asyncio.to_thread(recheck)
+                if cached is not None:
+                    return cached
+            return await fn()
+        finally:
+            await asyncio.to_thread(hold.__exit__, None, None, None)
+
+
+# === キー ===================================================================
+
+
+def meal_flight_key(
+    user_id: UserId,
+    date: DateType,
+    entries: Sequence[FoodEntry],
+) -> str:
+    """(user, date, meal slot, 入力内容のハッシュ)"""
+    first = entries[0]
+    content = build_estimate_cache_key(entries, model="", prompt_version="")
+    return (
+        f"meal:{user_id.value}:{date.isoformat()}:"
+        f"{first.meal_type.value}:{first.meal_index}:{content}"
+    )
+
+
+def daily_report_flight_key(input: DailyReportLLMInput) -> str:
+    """
+    (user, date, 入力内容のハッシュ)
+
+    generated_at などの時刻は毎回変わるので、数値と属性だけをハッシュする。
+    """
+
+    def _nutrients(items: Any) -> list[tuple[str, float, str]]:
+        return sorted(
+            (n.code.value, round(float(n.amount.value), 6), n.amount.unit)
+            for n in items
+        )
+
+    profile = input.profile
+    payload = {
+        "profile": [
+            str(getattr(profile, name, None))
+            for name in ("sex", "birthdate", "height_cm", "weight_kg", "meals_per_day")
+        ],
+        "target": _nutrients(input.target_snapshot.nutrients),
+        "daily": _nutrients(input.daily_summary.nutrients),
+        "meals": sorted(
+            (m.meal_type.value, m.meal_index or 0, _nutrients(m.nutrients))
+            for m in input.meal_summaries
+        ),
+    }
+    digest = hashlib.sha256(
+        json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    ).hexdigest()
+    user_id = getattr(input.user_id, "value", input.user_id)
+    return f"daily-report:{user_id}:{input.date.isoformat()}:{digest}"
+
+
+# === ポートのデコレータ =====================================================
+
+
+class SingleFlightNutritionEstimator(NutritionEstimatorPort):
+    """同じ食事の推定が同時に走ったら 1 回の呼び出しにまとめる。"""
+
+    def __init__(self, inner: NutritionEstimatorPort, flight: SingleFlight) -> None:
+        self._inner = inner
+        self._flight = flight
+
+    def estimate_for_entries(
+        self,
+        user_id: UserId,
+        date: DateType,
+        entries: Sequence[FoodEntry],
+    ) -> list[MealNutrientIntake]:
+        if not entries:
+            return self._inner.estimate_for_entries(
+                user_id=user_id, date=date, entries=entries
+            )
+        intakes = self._flight.do(
+            meal_flight_key(user_id, date, entries),
+            lambda: self._inner.estimate_for_entries(
+                user_id=user_id, date=date, entries=entries
+            ),
+        )
+        # 相乗りした呼び出し同士でリストを共有しない
+        return list(intakes)
+
+
+class AsyncSingleFlightNutritionEstimator(AsyncNutritionEstimatorPort):
+    """SingleFlightNutritionEstimator の async 版。"""
+
+    def __init__(self, inner: AsyncNutritionEstimatorPort, flight: SingleFlight) -> None:
+        self._inner = inner
+        self._flight = flight
+
+    async def estimate_for_entries(
+        self,
+        user_id: UserId,
+        date: DateType,
+        entries: Sequence[FoodEntry],
+    ) -> list[MealNutrientIntake]:
+        if not entries:
+            return await self._inner.estimate_for_entries(
+                user_id=user_id, date=date, entries=entries
+            )
+        intakes = await self._flight.do_async(
+            meal_flight_key(user_id, date, entries),
+            lambda: self._inner.estimate_for_entries(
+                user_id=user_id, date=date, entries=entries
+            ),
+        )
+        return list(intakes)
+
+
+class SingleFlightDailyReportGenerator(DailyNutritionReportGeneratorPort):
+    """
+    同じ日・同じ内容のレポート生成が同時に走ったら 1 回の呼び出しにまとめる。
+
+    output_cache を渡すと、生成結果をキー単位で保存し、advisory lock を待っていた
+    別ワーカーはロック取得後にそれを使う（LLM を呼び直さない）。
+    """
+
+    def __init__(
+        self,
+        inner: DailyNutritionReportGeneratorPort,
+        flight: SingleFlight,
+        output_cache: SqlAlchemyDailyReportOutputCacheStore | None = None,
+    ) -> None:
+        self._inner = inner
+        self._flight = flight
+        self._output_cache = output_cache
+
+    def generate(self, input: DailyReportLLMInput) -> DailyReportLLMOutput:
+        key = daily_report_flight_key(input)
+        cache = self._output_cache
+        if cache is None:
+            return self._flight.do(key, lambda: self._inner.generate(input))
+
+        def run() -> DailyReportLLMOutput:
+            output = self._inner.generate(input)
+            # ロックを放す前に保存して、待っているワーカーから見えるようにする
+            cache.set(key, output)
+            return output
+
+        return self._flight.do(key, run, recheck=lambda: cache.get(key))
+
+
+class AsyncSingleFlightDailyReportGenerator(AsyncDailyNutritionReportGeneratorPort):
+    """SingleFlightDailyReportGenerator の async 版。"""
+
+    def __init__(
+        self,
+        inner: AsyncDailyNutritionReportGeneratorPort,
+        flight: SingleFlight,
+        output_cache: SqlAlchemyDailyReportOutputCacheStore | None = None,
+    ) -> None:
+        self._inner = inner
+        self._flight = flight
+        self._output_cache = output_cache
+
+    async def generate(self, input: DailyReportLLMInput) -> DailyReportLLMOutput:
+        key = daily_report_flight_key(input)
+        cache = self._output_cache
+        if cache is None:
+            return await self._flight.do_async(
+                key, lambda: self._inner.generate(input))
+
+        async def run() -> DailyReportLLMOutput:
+            output = await self._inner.generate(input)
+            await asyncio.to_thread(cache.set, key, output)
+            return output
+
+        return await self._flight.do_async(
+            key, run, recheck=lambda: cache.get(key))
@@ -2,13 +2,15 @@ from __future__ import annotations
 
 import json
 import logging
+from contextlib import nullcontext
 from dataclasses import dataclass
 from datetime import date
-from typing import Any
+from typing import Any, NoReturn
 
-from openai import OpenAI, OpenAIError  # pip install openai>=1.0.0
+from openai import AsyncOpenAI, OpenAI, OpenAIError  # pip install openai>=1.0.0
 
 from app.application.target.ports.target_generator_port import (
+    AsyncTargetGeneratorPort,
     TargetGeneratorPort,
     TargetGenerationContext,
     TargetGenerationResult,
@@ -20,6 +22,7 @@ from app.domain.target.value_objects import (
     NutrientSource,
 )
 from app.application.target.errors import TargetGenerationFailedError
+from app.infra.llm.concurrency_limiter import OpenAICallLimiter
 
 
 logger = logging.getLogger(__name__)
@@ -79,43 +82,35 @@ class OpenAITargetGeneratorConfig:
     # 必要に応じて max_tokens なども追加可能
 
 
-class OpenAITargetGenerator(TargetGeneratorPort):
+class _OpenAITargetGeneratorBase:
     """
-    OpenAI Chat Completions API を使って 10 栄養素のターゲットを生成する実装。
-
-    - env の OPENAI_API_KEY を利用して認証する想定。
+    同期版 / async 版で共有する、リクエスト組み立てとレスポンス解釈。
     """
 
-    def __init__(
-        self,
-        client: OpenAI | None = None,
-        config: OpenAITargetGeneratorConfig | None = None,
-    ) -> None:
-        self._client = client or OpenAI()  # OPENAI_API_KEY を自動で読む
-        self._config = config or OpenAITargetGeneratorConfig()
-
-    def generate(self, ctx: TargetGenerationContext) -> TargetGenerationResult:
-        """
-        Profile + goal 情報をもとに LLM に JSON 形式で 10 栄養素のターゲット生成を依頼。
-        """
-        user_prompt = self._build_user_prompt(ctx)
+    _config: OpenAITargetGeneratorConfig
 
-        try:
-            completion = self._client.chat.completions.create(
-                model=self._config.model,
-                messages=[
-                    {"role": "system", "content": _SYSTEM_PROMPT},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=self._config.temperature,
-                response_format={"type": "json_object"},
-            )
-        except OpenAIError as e:
-            logger.exception("OpenAI API error while generating target: %s", e)
-            raise TargetGenerationFailedError(
-                "Failed to generate target via OpenAI"
-            ) from e
+    # ------------------------------------------------------------------
+    # internal helpers
+    # ------------------------------------------------------------------
 
+    def _build_request(self, ctx: TargetGenerationContext) -> dict[str, Any]:
+        return {
+            "model": self._config.model,
+            "messages": [
+                {"role": "system", "content": _SYSTEM_PROMPT},
+                {"role": "user", "content": self._build_user_prompt(ctx)},
+            ],
+            "temperature": self._config.temperature,
+            "response_format": {"type": "json_object"},
+        }
+
+    def _raise_api_error(self, error: OpenAIError) -> NoReturn:
+        logger.exception("OpenAI API error while generating target: %s", error)
+        raise TargetGenerationFailedError(
+            "Failed to generate target via OpenAI"
+        ) from error
+
+    def _to_result(self, completion: Any) -> TargetGenerationResult:
         content = completion.choices[0].message.content
         if content is None:
             raise TargetGenerationFailedError("OpenAI returned empty content")
@@ -149,9 +144,6 @@ class OpenAITargetGenerator(TargetGeneratorPort):
             disclaimer=disclaimer,
         )
 
-    # ------------------------------------------------------------------
-    # internal helpers
-    # ------------------------------------------------------------------
 
     def _build_user_prompt(self, ctx: TargetGenerationContext) -> str:
         """
@@ -217,3 +209,70 @@ Please propose daily target amounts for the 10 nutrients described in the system
             )
 
         return nutrients
+
+
+class OpenAITargetGenerator(_OpenAITargetGeneratorBase, TargetGeneratorPort):
+    """
+    OpenAI Chat Completions API を使って 10 栄養素のターゲットを生成する実装。
+
+    - env の OPENAI_API_KEY を利用して認証する想定。
+    """
+
+    def __init__(
+        self,
+        client: OpenAI | None = None,
+        config: OpenAITargetGeneratorConfig | None = None,
+        limiter: OpenAICallLimiter | None = None,
+    ) -> None:
+        self._client = client or OpenAI()  # OPENAI_API_KEY を自動で読む
+        self._config = config or OpenAITargetGeneratorConfig()
+        self._limiter = limiter
+
+    def generate(self, ctx: TargetGenerationContext) -> TargetGenerationResult:
+        """
+        Profile + goal 情報をもとに LLM に JSON 形式で 10 栄養素のターゲット生成を依頼。
+        """
+        try:
+            with self._limiter.sync_slot() if self._limiter else nullcontext():
+                completion = self._client.chat.completions.create(
+                    **self._build_request(ctx)
+                )
+        except OpenAIError as e:
+            self._raise_api_error(e)
+
+        return self._to_result(completion)
+
+
+class AsyncOpenAITargetGenerator(
+    _OpenAITargetGeneratorBase,
+    AsyncTargetGeneratorPort,
+):
+    """
+    AsyncOpenAI を使う OpenAITargetGenerator の async 版（HTTP ルート用）。
+
+    - 呼び出しは OpenAICallLimiter の枠の中で行う。
+    """
+
+    def __init__(
+        self,
+        client: AsyncOpenAI | None = None,
+        config: OpenAITargetGeneratorConfig | None = None,
+        *,
+        limiter: OpenAICallLimiter,
+    ) -> None:
+        self._client = client or AsyncOpenAI()
+        self._config = config or OpenAITargetGeneratorConfig()
+        self._limiter = limiter
+
+    async def generate(
+        self, ctx: TargetGenerationContext
+    ) -> TargetGenerationResult:
+        try:
+            async with self._limiter.slot():
+                completion = await self._client.chat.completions.create(
+                    **self._build_request(ctx)
+                )
+        except OpenAIError as e:
+            self._raise_api_error(e)
+
+        return self._to_result(completion)
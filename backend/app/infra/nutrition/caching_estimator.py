@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import date as DateType
+from typing import Sequence
+
+from app.application.nutrition.dto.meal_nutrient_intake_dto import (
+    MealNutrientIntake,
+)
+from app.application.nutrition.ports.nutrition_estimator_port import (
+    AsyncNutritionEstimatorPort,
+    NutritionEstimatorPort,
+)
+from app.domain.auth.value_objects import UserId
+from app.domain.meal.entities import FoodEntry
+from app.infra.cache.lru_ttl_cache import LruTtlCache
+from app.infra.nutrition.estimate_cache import (
+    SqlAlchemyNutritionEstimateCacheStore,
+    build_estimate_cache_key,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class EstimateCacheStats:
+    """
+    栄養推定キャッシュのヒット状況（メトリクス用）。
+
+    - memory_hits: プロセス内 LRU でのヒット
+    - persistent_hits: Postgres 層でのヒット
+    - misses: 両方外れて内側の Estimator を呼んだ回数
+    """
+
+    memory_hits: int
+    persistent_hits: int
+    misses: int
+
+    @property
+    def lookups(self) -> int:
+        return self.memory_hits + self.persistent_hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        if self.lookups == 0:
+            return 0.0
+        return (self.memory_hits + self.persistent_hits) / self.lookups
+
+
+class CachingNutritionEstimator(NutritionEstimatorPort):
+    """
+    NutritionEstimatorPort のデコレータ。同じ内容の食事なら LLM を呼ばない。
+
+    - キーは build_estimate_cache_key()（正規化した品目 + モデル + プロンプト版）。
+    - 1 段目: プロセス内 LruTtlCache、2 段目: Postgres (任意)。
+    - 2 段目でヒットしたら 1 段目にも載せる。
+    - 空の entries はキャッシュせず、そのまま内側へ渡す。
+    """
+
+    def __init__(
+        self,
+        inner: NutritionEstimatorPort,
+        *,
+        model: str,
+        prompt_version: str,
+        memory_cache: LruTtlCache[list[MealNutrientIntake]],
+        persistent_store: SqlAlchemyNutritionEstimateCacheStore | None = None,
+    ) -> None:
+        self._inner = inner
+        self._model = model
+        self._prompt_version = prompt_version
+        self._memory_cache = memory_cache
+        self._persistent_store = persistent_store
+        self._lock = threading.Lock()
+        self._memory_hits = 0
+        self._persistent_hits = 0
+        self._misses = 0
+
+    def estimate_for_entries(
+        self,
+        user_id: UserId,
+        date: DateType,
+        entries: Sequence[FoodEntry],
+    ) -> list[MealNutrientIntake]:
+        if not entries:
+            return self._inner.estimate_for_entries(
+                user_id=user_id,
+                date=date,
+                entries=entries,
+            )
+
+        key = self._cache_key(entries)
+        cached = self._lookup_memory(key)
+        if cached is None and self._persistent_store is not None:
+            cached = self._lookup_persistent(key)
+        if cached is not None:
+            return cached
+
+        self._count()
+        intakes = self._inner.estimate_for_entries(
+            user_id=user_id,
+            date=date,
+            entries=entries,
+        )
+
+        self._memory_cache.set(key, list(intakes))
+        self._store_persistent(key, intakes)
+        return intakes
+
+    def stats(self) -> EstimateCacheStats:
+        with self._lock:
+            return EstimateCacheStats(
+                memory_hits=self._memory_hits,
+                persistent_hits=self._persistent_hits,
+                misses=self._misses,
+            )
+
+    # ------------------------------------------------------------------
+    # internal helpers（AsyncCachingNutritionEstimator と共有）
+    # ------------------------------------------------------------------
+
+    def _cache_key(self, entries: Sequence[FoodEntry]) -> str:
+        return build_estimate_cache_key(
+            entries,
+            model=self._model,
+            prompt_version=self._prompt_version,
+        )
+
+    def _lookup_memory(self, key: str) -> list[MealNutrientIntake] | None:
+        cached = self._memory_cache.get(key)
+        if cached is None:
+            return None
+        self._count(memory_hit=True)
+        return list(cached)
+
+    def _lookup_persistent(self, key: str) -> list[MealNutrientIntake] | None:
+        if self._persistent_store is None:
+            return None
+        cached = self._persistent_store.get(key)
+        if cached is None:
+            return None
+        self._count(persistent_hit=True)
+        self._memory_cache.set(key, cached)
+        return list(cached)
+
+    def _store_persistent(
+        self,
+        key: str,
+        intakes: Sequence[MealNutrientIntake],
+    ) -> None:
+        if self._persistent_store is None:
+            return
+        self._persistent_store.set(
+            key,
+            intakes,
+            model=self._model,
+            prompt_version=self._prompt_version,
+        )
+
+    def _count(self, *, memory_hit: bool = False, persistent_hit: bool = False) -> None:
+        with self._lock:
+            if memory_hit:
+                self._memory_hits += 1
+            elif persistent_hit:
+                self._persistent_hits += 1
+            else:
+                self._misses += 1
+            lookups = self._memory_hits + self._persistent_hits + self._misses
+            if lookups % 100 == 0:
+                hits = self._memory_hits + self._persistent_hits
+                logger.info(
+                    "nutrition estimate cache: lookups=%d memory_hits=%d "
+                    "persistent_hits=%d misses=%d hit_rate=%.2f",
+                    lookups,
+                    self._memory_hits,
+                    self._persistent_hits,
+                    self._misses,
+                    hits / lookups,
+                )
+
+
+class AsyncCachingNutritionEstimator(AsyncNutritionEstimatorPort):
+    """
+    CachingNutritionEstimator の async 版。
+
+    - 同期版とキャッシュ（LRU / Postgres）と統計を共有する。
+    - ミス時だけ async の inner（AsyncOpenAINutritionEstimator など）を await する。
+    - Postgres 層の読み書きはブロッキング I/O なのでスレッドで行う。
+    """
+
+    def __init__(
+        self,
+        cache: CachingNutritionEstimator,
+        inner: AsyncNutritionEstimatorPort,
+    ) -> None:
+        self._cache = cache
+        self._inner = inner
+
+    async def estimate_for_entries(
+        self,
+        user_id: UserId,
+        date: DateType,
+        entries: Sequence[FoodEntry],
+    ) -> list[MealNutrientIntake]:
+        if not entries:
+            return await self._inner.estimate_for_entries(
+                user_id=user_id,
+                date=date,
+                entries=entries,
+            )
+
+        cache = self._cache
+        key = cache._cache_key(entries)
+        cached = cache._lookup_memory(key)
+        if cached is None and cache._persistent_store is not None:
+            cached = await asyncio.to_thread(cache._lookup_persistent, key)
+        if cached is not None:
+            return cached
+
+        cache._count()
+        intakes = await self._inner.estimate_for_entries(
+            user_id=user_id,
+            date=date,
+            entries=entries,
+        )
+
+        cache._memory_cache.set(key, list(intakes))
+        if cache._persistent_store is not None:
+            await asyncio.to_thread(cache._store_persistent, key, intakes)
+        return intakes
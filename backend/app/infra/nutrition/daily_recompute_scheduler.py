@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from datetime import date as DateType
+from typing import Callable, Iterable
+
+from app.application.nutrition.ports.daily_recompute_scheduler_port import (
+    DailyNutritionRecomputeSchedulerPort,
+    MealSlot,
+)
+from app.domain.auth.errors import PremiumFeatureRequiredError
+from app.domain.auth.value_objects import UserId
+from app.infra.db.read_routing import note_request_wrote
+
+logger = logging.getLogger(__name__)
+
+Recompute = Callable[[UserId, DateType, frozenset[MealSlot]], None]
+_Key = tuple[str, DateType]
+
+
+class DebouncedDailyNutritionRecomputeScheduler(DailyNutritionRecomputeSchedulerPort):
+    """
+    食事ログ編集後の栄養サマリの計算し直しを (user_id, date) ごとに遅らせてまとめる
+    DailyNutritionRecomputeSchedulerPort 実装（プロセス内）。
+
+    - recompute(user_id, date, slots) には、待っている間に依頼された食事スロットを
+      まとめて渡す（食事サマリを計算し直し、差分が日次サマリに反映される）。
+    - schedule() のたびに実行予定を quiet_window 秒後へずらす。ただし最初の依頼から
+      max_delay 秒を超えては遅らせない（編集が続いても反映されなくならないように）。
+    - 予定の時刻が来たものをディスパッチ用のスレッドがプールへ渡して実行する。
+      同じキーの計算は同時に 1 つだけ。実行中に来た依頼はその後にもう 1 回実行する。
+    - flush() は待ち中の計算を呼び出し元で先に実行する（読む側が古い値を見ないように）。
+      待った / 実行したときは、リクエストの読み取りをプライマリに向ける
+      （書いた直後の値をレプリカで読み損ねないように）。
+    - 予定はこのプロセスのメモリにしか無い。別プロセスの flush() では待たない。
+    - スレッド / プールは最初の schedule() で作る。
+    """
+
+    def __init__(
+        self,
+        recompute: Recompute,
+        *,
+        quiet_window: float,
+        max_delay: float,
+        max_workers: int = 2,
+        executor: Executor | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._recompute = recompute
+        self._quiet_window = quiet_window
+        self._max_delay = max(max_delay, quiet_window)
+        self._max_workers = max_workers
+        self._executor = executor
+        self._clock = clock
+        self._cond = threading.Condition()
+        # key -> (最初の依頼の時刻, 実行予定の時刻, 依頼された食事スロット)
+        self._pending: dict[_Key, tuple[float, float, frozenset[MealSlot]]] = {}
+        self._running: set[_Key] = set()
+        self._dispatcher: threading.Thread | None = None
+        self._stopped = False
+
+    def schedule(
+        self,
+        user_id: UserId,
+        date_: DateType,
+        slots: Iterable[MealSlot],
+    ) -> None:
+        key = (user_id.value, date_)
+        now = self._clock()
+        with self._cond:
+            first, _, pending_slots = self._pending.get(key, (now, now, frozenset()))
+            self._pending[key] = (
+                first,
+                min(now + self._quiet_window, first + self._max_delay),
+                pending_slots | frozenset(slots),
+            )
+            self._ensure_dispatcher()
+            self._cond.notify_all()
+
+    def pending(self, user_id: UserId, date_: DateType) -> bool:
+        key = (user_id.value, date_)
+        with self._cond:
+            return key in self._pending or key in self._running
+
+    def flush(self, user_id: UserId, date_: DateType) -> None:
+        key = (user_id.value, date_)
+        with self._cond:
+            waited = key in self._running
+            while key in self._running:
+                self._cond.wait()
+            entry = self._pending.pop(key, None)
+            if entry is None:
+                if waited:
+                    note_request_wrote()
+                return
+            self._running.add(key)
+        self._run(key, entry[2])
+        note_request_wrote()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        アプリ終了時に呼ぶ。待ち中の計算は捨てずにすぐ実行してから止める。
+        """
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+            dispatcher, self._dispatcher = self._dispatcher, None
+        if dispatcher is not None and wait:
+            dispatcher.join()
+
+        with self._cond:
+            keys = [key for key in self._pending if key not in self._running]
+            jobs = [(key, self._pending.pop(key)[2]) for key in keys]
+            self._running.update(keys)
+        for key, slots in jobs:
+            self._run(key, slots)
+
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    # --- 内部 -----------------------------------------------------------
+
+    def _ensure_dispatcher(self) -> None:
+        # self._cond を持った状態で呼ぶ
+        if self._stopped or self._dispatcher is not None:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix="daily-recompute",
+            )
+        self._dispatcher = threading.Thread(
+            target=self._dispatch, name="daily-recompute-dispatcher", daemon=True)
+        self._dispatcher.start()
+
+    def _dispatch(self) -> None:
+        while True:
+            with self._cond:
+                due = self._take_due()
+                while not due and not self._stopped:
+                    self._cond.wait(self._next_timeout())
+                    due = self._take_due()
+                if not due:
+                    return
+                executor = self._executor
+            for key, slots in due:
+                assert executor is not None
+                executor.submit(self._run, key, slots)
+
+    def _take_due(self) -> list[tuple[_Key, frozenset[MealSlot]]]:
+        # self._cond を持った状態で呼ぶ
+        now = self._clock()
+        keys = [
+            key
+            for key, (_, run_at, _) in self._pending.items()
+            if run_at <= now and key not in self._running
+        ]
+        due = [(key, self._pending.pop(key)[2]) for key in keys]
+        self._running.update(keys)
+        return due
+
+    def _next_timeout(self) -> float | None:
+        # 実行中のキーは終わったときに notify されるので、待ち時間の計算から外す
+        waiting = [
+            run_at
+            for key, (_, run_at, _) in self._pending.items()
+            if key not in self._running
+        ]
+        if not waiting:
+            return None
+        return max(0.0, min(waiting) - self._clock())
+
+    def _run(self, key: _Key, slots: frozenset[MealSlot]) -> None:
+        user_id, date_ = key
+        try:
+            self._recompute(UserId(user_id), date_, slots)
+        except PremiumFeatureRequiredError:
+            # プランが変わった等。計算しないのが正しいので何もしない
+            pass
+        except Exception:
+            logger.exception(
+                "Daily nutrition recompute failed: user=%s date=%s", user_id, date_)
+        finally:
+            with self._cond:
+                self._running.discard(key)
+                self._cond.notify_all()
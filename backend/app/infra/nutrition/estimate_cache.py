@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from datetime import timedelta
+from typing import Any, Callable, Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.application.auth.ports.clock_port import ClockPort
+from app.application.nutrition.dto.meal_nutrient_intake_dto import (
+    MealNutrientIntake,
+)
+from app.domain.meal.entities import FoodEntry
+from app.domain.target.value_objects import (
+    NutrientAmount,
+    NutrientCode,
+    NutrientSource,
+)
+from app.infra.db.models.nutrition_estimate_cache import (
+    NutritionEstimateCacheModel,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# === キャッシュキー ==========================================================
+
+
+def normalize_food_text(value: str | None) -> str | None:
+    if value is None:
+        return None
+    normalized = " ".join(value.split()).casefold()
+    return normalized or None
+
+
+def _normalize_number(value: float | None) -> float | None:
+    if value is None:
+        return None
+    # 150 と 150.0、浮動小数の誤差で別キーにならないよう丸める
+    return round(float(value), 3)
+
+
+def _normalize_entry(entry: FoodEntry) -> dict[str, Any]:
+    return {
+        "name": normalize_food_text(entry.name),
+        "amount": _normalize_number(entry.amount_value),
+        "unit": normalize_food_text(entry.amount_unit),
+        "servings": _normalize_number(entry.serving_count),
+        "note": normalize_food_text(entry.note),
+    }
+
+
+def build_estimate_cache_key(
+    entries: Sequence[FoodEntry],
+    *,
+    model: str,
+    prompt_version: str,
+) -> str:
+    """
+    正規化した FoodEntry 群 + モデル + プロンプト版から SHA-256 のキーを作る。
+
+    - 1 食の推定値は品目の並び順に依存しないので、正規化後にソートする。
+    - user_id / date はキーに含めない（同じ内容の食事なら別ユーザーでも同じ推定値）。
+    """
+    normalized = sorted(
+        (_normalize_entry(e) for e in entries),
+        key=lambda d: json.dumps(d, sort_keys=True, ensure_ascii=False),
+    )
+    payload = {
+        "model": model,
+        "prompt_version": prompt_version,
+        "entries": normalized,
+    }
+    canonical = json.dumps(
+        payload,
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+# === シリアライズ ============================================================
+
+
+def serialize_intakes(intakes: Sequence[MealNutrientIntake]) -> list[dict[str, Any]]:
+    return [
+        {
+            "code": i.code.value,
+            "amount": i.amount.value,
+            "unit": i.amount.unit,
+            "source": i.source.value,
+        }
+        for i in intakes
+    ]
+
+
+def deserialize_intakes(raw: Sequence[dict[str, Any]]) -> list[MealNutrientIntake]:
+    return [
+        MealNutrientIntake(
+            code=NutrientCode(item["code"]),
+            amount=NutrientAmount(value=float(item["amount"]), unit=item["unit"]),
+            source=NutrientSource(item["source"]),
+        )
+        for item in raw
+    ]
+
+
+# === Postgres 永続層 =========================================================
+
+
+class SqlAlchemyNutritionEstimateCacheStore:
+    """
+    nutrition_estimate_cache テーブルを使った永続キャッシュ層。
+
+    - プロセス再起動やワーカー間でも推定結果を共有する。
+    - ttl_days を過ぎた行はミス扱い。掃除は prune() でまとめて行う。
+    - set() が prune_every 回呼ばれるごとに prune() を実行し、
+      TTL 切れと max_rows 超過分（古い順）を削除する。
+    - DB 障害時はキャッシュ無しとして振る舞う（推定自体は止めない）。
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        clock: ClockPort,
+        *,
+        ttl_days: int,
+        max_rows: int,
+        prune_every: int = 100,
+    ) -> None:
+        self._session_factory = session_factory
+        self._clock = clock
+        self._ttl = timedelta(days=ttl_days)
+        self._max_rows = max_rows
+        self._prune_every = prune_every
+        self._writes_since_prune = 0
+
+    def get(self, key: str) -> list[MealNutrientIntake] | None:
+        cutoff = self._clock.now() - self._ttl
+        try:
+            with self._session_factory() as session:
+                raw = session.execute(
+                    sa.select(NutritionEstimateCacheModel.nutrients).where(
+                        NutritionEstimateCacheModel.cache_key == key,
+                        NutritionEstimateCacheModel.created_at >= cutoff,
+                    )
+                ).scalar_one_or_none()
+        except SQLAlchemyError:
+            logger.warning("nutrition estimate cache read failed", exc_info=True)
+            return None
+
+        if raw is None:
+            return None
+        return deserialize_intakes(raw)
+
+    def set(
+        self,
+        key: str,
+        intakes: Sequence[MealNutrientIntake],
+        *,
+        model: str,
+        prompt_version: str,
+    ) -> None:
+        try:
+            with self._session_factory() as session:
+                session.merge(
+                    NutritionEstimateCacheModel(
+                        cache_key=key,
+                        model=model,
+                        prompt_version=prompt_version,
+                        nutrients=serialize_intakes(intakes),
+                        created_at=self._clock.now(),
+                    )
+                )
+                session.commit()
+        except SQLAlchemyError:
+            logger.warning("nutrition estimate cache write failed", exc_info=True)
+            return
+
+        self._writes_since_prune += 1
+        if self._writes_since_prune >= self._prune_every:
+            self._writes_since_prune = 0
+            self.prune()
+
+    def prune(self) -> int:
+        """
+        TTL 切れの行と、max_rows を超えた古い行を削除する。
+
+        Returns:
+            削除した行数
+        """
+        table = NutritionEstimateCacheModel.__table__
+        cutoff = self._clock.now() - self._ttl
+        try:
+            with self._session_factory() as session:
+                deleted = session.execute(
+                    sa.delete(table).where(table.c.created_at < cutoff)
+                ).rowcount or 0
+
+                if self._max_rows > 0:
+                    # max_rows 番目より古い行を落とす
+                    boundary = session.execute(
+                        sa.select(table.c.created_at)
+                        .order_by(table.c.created_at.desc())
+                        .offset(self._max_rows - 1)
+                        .limit(1)
+                    ).scalar_one_or_none()
+                    if boundary is not None:
+                        deleted += session.execute(
+                            sa.delete(table).where(table.c.created_at < boundary)
+                        ).rowcount or 0
+
+                session.commit()
+        except SQLAlchemyError:
+            logger.warning("nutrition estimate cache prune failed", exc_info=True)
+            return 0
+
+        if deleted:
+            logger.info("Pruned %d nutrition estimate cache rows", deleted)
+        return deleted
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import logging
+from datetime import date as DateType
+from typing import Sequence
+
+import numpy as np
+
+from app.application.nutrition.dto.meal_nutrient_intake_dto import (
+    MealNutrientIntake,
+)
+from app.application.nutrition.ports.nutrition_estimator_port import (
+    NutritionEstimatorPort,
+)
+from app.domain.auth.value_objects import UserId
+from app.domain.meal.entities import FoodEntry
+from app.domain.nutrition.errors import NutritionEstimationFailedError
+from app.domain.target.value_objects import NutrientAmount, NutrientSource
+from app.infra.llm.estimator_openai import EXPECTED_UNITS
+from app.infra.nutrition.estimate_cache import normalize_food_text
+from app.infra.nutrition.food_composition import (
+    FoodCompositionTable,
+    TrigramFoodIndex,
+)
+
+logger = logging.getLogger(__name__)
+
+# 量の単位 → g への換算係数（ml は 1 g とみなす）
+_GRAMS_PER_UNIT: dict[str, float] = {
+    "g": 1.0,
+    "gram": 1.0,
+    "grams": 1.0,
+    "グラム": 1.0,
+    "kg": 1000.0,
+    "mg": 0.001,
+    "ml": 1.0,
+    "cc": 1.0,
+    "l": 1000.0,
+}
+
+
+class OfflineNutritionEstimator(NutritionEstimatorPort):
+    """
+    同梱の食品成分表から、ネットワークなしで栄養素を推定する実装。
+
+    - FoodEntry.name を trigram インデックスで成分表の行に解決する。
+    - 量は g / ml 系の単位ならそのまま、serving_count やそれ以外の単位
+      （「個」「杯」など）は成分表の 1 人前目安量を掛けて g に換算する。
+    - 各行を量でスケールして合計する計算は NumPy でまとめて行う。
+    - 一致度が min_score 未満の品目は fallback（OpenAI 等）に回し、結果を合算する。
+      fallback が無ければ NutritionEstimationFailedError。
+    """
+
+    def __init__(
+        self,
+        table: FoodCompositionTable,
+        *,
+        min_score: float = 0.5,
+        fallback: NutritionEstimatorPort | None = None,
+        index: TrigramFoodIndex | None = None,
+    ) -> None:
+        self._table = table
+        self._index = index or TrigramFoodIndex(table)
+        self._min_score = min_score
+        self._fallback = fallback
+
+    def estimate_for_entries(
+        self,
+        user_id: UserId,
+        date: DateType,
+        entries: Sequence[FoodEntry],
+    ) -> list[MealNutrientIntake]:
+        if not entries:
+            return []
+
+        rows: list[int] = []
+        grams: list[float] = []
+        unmatched: list[FoodEntry] = []
+
+        for entry in entries:
+            match = self._index.lookup(entry.name)
+            if match is None or match.score < self._min_score:
+                unmatched.append(entry)
+                continue
+            rows.append(match.row)
+            grams.append(self._to_grams(entry, match.row))
+
+        if unmatched and self._fallback is None:
+            names = ", ".join(e.name for e in unmatched)
+            raise NutritionEstimationFailedError(
+                f"No confident food-composition match for: {names}"
+            )
+
+        # (n_entries, n_codes) の行を量でスケールして列方向に合計
+        totals = np.zeros(len(self._table.codes), dtype=np.float64)
+        if rows:
+            scale = np.asarray(grams, dtype=np.float64) / 100.0
+            totals = scale @ self._table.matrix[np.asarray(rows, dtype=np.intp)]
+
+        result = {
+            code: float(totals[i]) for i, code in enumerate(self._table.codes)
+        }
+
+        if unmatched:
+            logger.info(
+                "Offline estimator: %d/%d items fell back (user=%s date=%s)",
+                len(unmatched),
+                len(entries),
+                user_id.value,
+                date,
+            )
+            for intake in self._fallback.estimate_for_entries(
+                user_id=user_id,
+                date=date,
+                entries=unmatched,
+            ):
+                if intake.code in result:
+                    result[intake.code] += intake.amount.value
+
+        return [
+            MealNutrientIntake(
+                code=code,
+                amount=NutrientAmount(
+                    value=round(result[code], 3),
+                    unit=EXPECTED_UNITS[code],
+                ),
+                # Stub と同様、「推定値」という扱いで "llm" を使う
+                source=NutrientSource("llm"),
+            )
+            for code in self._table.codes
+        ]
+
+    def _to_grams(self, entry: FoodEntry, row: int) -> float:
+        serving_g = float(self._table.serving_grams[row])
+        unit = normalize_food_text(entry.amount_unit)
+
+        if entry.amount_value is not None and unit is not None:
+            per_unit = _GRAMS_PER_UNIT.get(unit)
+            if per_unit is not None:
+                return float(entry.amount_value) * per_unit
+            # 「個」「杯」など: 1 単位 = 1 人前とみなす
+            return float(entry.amount_value) * serving_g
+
+        if entry.serving_count is not None:
+            return float(entry.serving_count) * serving_g
+        return serving_g
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import csv
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from app.domain.target.value_objects import NutrientCode
+from app.infra.llm.estimator_openai import EXPECTED_CODES
+from app.infra.nutrition.estimate_cache import normalize_food_text
+
+DEFAULT_FOOD_COMPOSITION_PATH = Path(__file__).parent / "data" / "food_composition.csv"
+
+
+# === 食品成分表 ==============================================================
+
+
+@dataclass(frozen=True)
+class FoodCompositionTable:
+    """
+    食品成分表（可食部 100 g あたり）を列指向の行列で保持する。
+
+    - names[i] が matrix[i] の食品名。
+    - matrix の列は codes の順（EXPECTED_CODES と同じ並び / 単位）。
+    - serving_grams[i] は 1 人前の目安量 (g)。
+    """
+
+    names: tuple[str, ...]
+    aliases: tuple[tuple[str, ...], ...]
+    codes: tuple[NutrientCode, ...]
+    matrix: np.ndarray
+    serving_grams: np.ndarray
+
+    @classmethod
+    def from_csv(cls, path: Path | str = DEFAULT_FOOD_COMPOSITION_PATH) -> "FoodCompositionTable":
+        """
+        CSV を読み込む。
+
+        列: name, aliases ("|" 区切り), serving_g, 各 NutrientCode.value
+        """
+        codes = tuple(EXPECTED_CODES)
+        names: list[str] = []
+        aliases: list[tuple[str, ...]] = []
+        servings: list[float] = []
+        rows: list[list[float]] = []
+
+        with open(path, encoding="utf-8", newline="") as f:
+            for record in csv.DictReader(f):
+                names.append(record["name"])
+                aliases.append(
+                    tuple(a for a in (record.get("aliases") or "").split("|") if a)
+                )
+                servings.append(float(record["serving_g"]))
+                rows.append([float(record[code.value]) for code in codes])
+
+        return cls(
+            names=tuple(names),
+            aliases=tuple(aliases),
+            codes=codes,
+            matrix=np.asarray(rows, dtype=np.float64).reshape(len(rows), len(codes)),
+            serving_grams=np.asarray(servings, dtype=np.float64),
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+# === 食品名のあいまい検索 ====================================================
+
+
+def _trigrams(text: str) -> frozenset[str]:
+    # 短い名前（「卵」など）でも trigram が取れるよう前後をパディングする
+    padded = f"  {text} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+@dataclass(frozen=True)
+class FoodMatch:
+    row: int
+    name: str
+    score: float
+
+
+class TrigramFoodIndex:
+    """
+    食品名 / 別名の trigram 転置インデックス。
+
+    - 類似度は trigram 集合の Dice 係数 (0.0〜1.0)。正規化後の完全一致は 1.0。
+    - 1 食品に複数の別名がある場合は最もスコアの高いものを採用する。
+    """
+
+    def __init__(self, table: FoodCompositionTable) -> None:
+        self._labels: list[tuple[int, str, frozenset[str]]] = []
+        self._exact: dict[str, int] = {}
+        self._postings: dict[str, list[int]] = defaultdict(list)
+
+        for row, (name, aliases) in enumerate(zip(table.names, table.aliases)):
+            for label in (name, *aliases):
+                normalized = normalize_food_text(label)
+                if normalized is None:
+                    continue
+                self._exact.setdefault(normalized, row)
+                grams = _trigrams(normalized)
+                label_id = len(self._labels)
+                self._labels.append((row, name, grams))
+                for gram in grams:
+                    self._postings[gram].append(label_id)
+
+        self._names = table.names
+
+    def lookup(self, query: str) -> FoodMatch | None:
+        normalized = normalize_food_text(query)
+        if normalized is None:
+            return None
+
+        row = self._exact.get(normalized)
+        if row is not None:
+            return FoodMatch(row=row, name=self._names[row], score=1.0)
+
+        query_grams = _trigrams(normalized)
+        shared: dict[int, int] = defaultdict(int)
+        for gram in query_grams:
+            for label_id in self._postings.get(gram, ()):
+                shared[label_id] += 1
+        if not shared:
+            return None
+
+        best: FoodMatch | None = None
+        for label_id, count in shared.items():
+            row, name, grams = self._labels[label_id]
+            score = 2.0 * count / (len(query_grams) + len(grams))
+            if best is None or score > best.score:
+                best = FoodMatch(row=row, name=name, score=score)
+        return best
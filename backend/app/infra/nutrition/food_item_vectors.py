@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Callable, Iterable, Mapping, Protocol, Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.application.auth.ports.clock_port import ClockPort
+from app.domain.meal.entities import FoodEntry
+from app.domain.target.value_objects import NutrientCode
+from app.infra.db.models.food_item_nutrient_vector import (
+    FoodItemNutrientVectorModel,
+)
+from app.infra.nutrition.estimate_cache import normalize_food_text
+
+logger = logging.getLogger(__name__)
+
+# 基準量あたりの栄養素量（単位は estimator_openai.EXPECTED_UNITS）
+NutrientVector = dict[NutrientCode, float]
+
+SERVING_UNIT = "serving"
+
+
+@dataclass(frozen=True)
+class FoodItemKey:
+    """
+    栄養素ベクトルを引くためのキー。
+
+    - name / unit は正規化済み。
+    - unit="serving" なら 1 人前あたり、それ以外は 100 unit あたりのベクトル。
+    """
+
+    name: str
+    unit: str
+
+    @property
+    def reference_amount(self) -> float:
+        return 1.0 if self.unit == SERVING_UNIT else 100.0
+
+    @property
+    def cache_key(self) -> str:
+        return f"{self.unit}\x1f{self.name}"
+
+    @classmethod
+    def from_entry(cls, entry: FoodEntry) -> "FoodItemKey":
+        name = normalize_food_text(entry.name) or ""
+        unit = normalize_food_text(entry.amount_unit)
+        if entry.amount_value is not None and unit is not None:
+            return cls(name=name, unit=unit)
+        return cls(name=name, unit=SERVING_UNIT)
+
+
+def scale_factor(entry: FoodEntry, key: FoodItemKey) -> float:
+    """
+    FoodEntry の量を「基準量の何倍か」に変換する。
+
+    - amount_value + amount_unit があればそれを総量とみなす（serving_count は使わない）。
+    - serving_count のみなら人前数をそのまま使う。
+    """
+    if key.unit != SERVING_UNIT and entry.amount_value is not None:
+        return float(entry.amount_value) / key.reference_amount
+    if entry.serving_count is not None:
+        return float(entry.serving_count)
+    return 1.0
+
+
+class FoodItemNutrientEstimator(Protocol):
+    """
+    未知の品目をまとめて推定する外部推定器（OpenAI など）。
+
+    - 返り値は items と同じ順序・同じ長さ。
+    """
+
+    model: str
+    prompt_version: str
+
+    def estimate_items(self, items: Sequence[FoodItemKey]) -> list[NutrientVector]:
+        ...
+
+
+def _vector_to_json(vector: Mapping[NutrientCode, float]) -> dict[str, float]:
+    return {code.value: float(amount) for code, amount in vector.items()}
+
+
+def _vector_from_json(raw: Mapping[str, float]) -> NutrientVector:
+    return {NutrientCode(code): float(amount) for code, amount in raw.items()}
+
+
+class SqlAlchemyFoodItemVectorStore:
+    """
+    food_item_nutrient_vectors テーブルを使った品目ベクトルの永続層。
+
+    - 食品の組成は時間で変わらないので TTL は持たない
+      （model / prompt_version を変えれば別の行になる）。
+    - DB 障害時は「未登録」として振る舞い、推定自体は止めない。
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        clock: ClockPort,
+        *,
+        model: str,
+        prompt_version: str,
+    ) -> None:
+        self._session_factory = session_factory
+        self._clock = clock
+        self._model = model
+        self._prompt_version = prompt_version
+
+    def get_many(self, keys: Iterable[FoodItemKey]) -> dict[FoodItemKey, NutrientVector]:
+        wanted = set(keys)
+        if not wanted:
+            return {}
+
+        m = FoodItemNutrientVectorModel
+        try:
+            with self._session_factory() as session:
+                rows = session.execute(
+                    sa.select(m.name, m.unit, m.nutrients).where(
+                        m.model == self._model,
+                        m.prompt_version == self._prompt_version,
+                        m.name.in_({k.name for k in wanted}),
+                    )
+                ).all()
+        except SQLAlchemyError:
+            logger.warning("food item vector read failed", exc_info=True)
+            return {}
+
+        found: dict[FoodItemKey, NutrientVector] = {}
+        for name, unit, nutrients in rows:
+            key = FoodItemKey(name=name, unit=unit)
+            if key in wanted:
+                found[key] = _vector_from_json(nutrients)
+        return found
+
+    def put_many(self, vectors: Mapping[FoodItemKey, NutrientVector]) -> None:
+        if not vectors:
+            return
+
+        now = self._clock.now()
+        try:
+            with self._session_factory() as session:
+                for key, vector in vectors.items():
+                    session.merge(
+                        FoodItemNutrientVectorModel(
+                            name=key.name,
+                            unit=key.unit,
+                            model=self._model,
+                            prompt_version=self._prompt_version,
+                            nutrients=_vector_to_json(vector),
+                            created_at=now,
+                        )
+                    )
+                session.commit()
+        except SQLAlchemyError:
+            logger.warning("food item vector write failed", exc_info=True)
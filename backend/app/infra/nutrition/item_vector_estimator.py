@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import date as DateType
+from typing import Sequence
+
+from app.application.nutrition.dto.meal_nutrient_intake_dto import (
+    MealNutrientIntake,
+)
+from app.application.nutrition.ports.nutrition_estimator_port import (
+    NutritionEstimatorPort,
+)
+from app.domain.auth.value_objects import UserId
+from app.domain.meal.entities import FoodEntry
+from app.domain.target.value_objects import NutrientAmount, NutrientSource
+from app.infra.cache.lru_ttl_cache import LruTtlCache
+from app.infra.llm.estimator_openai import EXPECTED_CODES, EXPECTED_UNITS
+from app.infra.nutrition.food_item_vectors import (
+    FoodItemKey,
+    FoodItemNutrientEstimator,
+    NutrientVector,
+    SqlAlchemyFoodItemVectorStore,
+    scale_factor,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ItemVectorStats:
+    """
+    品目ベクトルストアの利用状況（メトリクス用）。
+
+    - item_*: 品目単位のヒット / ミス
+    - llm_calls: 未知品目をまとめて推定した回数（1 食あたり最大 1 回）
+    """
+
+    item_memory_hits: int
+    item_persistent_hits: int
+    item_misses: int
+    llm_calls: int
+
+
+class ItemVectorNutritionEstimator(NutritionEstimatorPort):
+    """
+    品目ごとの栄養素ベクトルを貯めて、食事単位の推定をローカルで合算する Estimator。
+
+    - FoodEntry を (正規化した名前, 単位) で引き、基準量あたりのベクトルを
+      量に応じてスケールして合計する。
+    - 未知の品目だけを 1 回のバッチで item_estimator（OpenAI など）に問い合わせる。
+    - ベクトルはプロセス内 LruTtlCache と、任意で Postgres に保存する。
+    """
+
+    def __init__(
+        self,
+        item_estimator: FoodItemNutrientEstimator,
+        *,
+        memory_cache: LruTtlCache[NutrientVector],
+        persistent_store: SqlAlchemyFoodItemVectorStore | None = None,
+    ) -> None:
+        self._item_estimator = item_estimator
+        self._memory_cache = memory_cache
+        self._persistent_store = persistent_store
+        self._lock = threading.Lock()
+        self._item_memory_hits = 0
+        self._item_persistent_hits = 0
+        self._item_misses = 0
+        self._llm_calls = 0
+
+    def estimate_for_entries(
+        self,
+        user_id: UserId,
+        date: DateType,
+        entries: Sequence[FoodEntry],
+    ) -> list[MealNutrientIntake]:
+        if not entries:
+            return []
+
+        keys = [FoodItemKey.from_entry(e) for e in entries]
+        vectors = self._resolve_vectors(keys)
+
+        totals = {code: 0.0 for code in EXPECTED_CODES}
+        for entry, key in zip(entries, keys):
+            factor = scale_factor(entry, key)
+            vector = vectors[key]
+            for code in EXPECTED_CODES:
+                totals[code] += vector.get(code, 0.0) * factor
+
+        return [
+            MealNutrientIntake(
+                code=code,
+                amount=NutrientAmount(
+                    value=round(totals[code], 3),
+                    unit=EXPECTED_UNITS[code],
+                ),
+                source=NutrientSource("llm"),
+            )
+            for code in EXPECTED_CODES
+        ]
+
+    def stats(self) -> ItemVectorStats:
+        with self._lock:
+            return ItemVectorStats(
+                item_memory_hits=self._item_memory_hits,
+                item_persistent_hits=self._item_persistent_hits,
+                item_misses=self._item_misses,
+                llm_calls=self._llm_calls,
+            )
+
+    # ------------------------------------------------------------------
+    # internal helpers
+    # ------------------------------------------------------------------
+
+    def _resolve_vectors(
+        self,
+        keys: Sequence[FoodItemKey],
+    ) -> dict[FoodItemKey, NutrientVector]:
+        unique_keys = list(dict.fromkeys(keys))
+        resolved: dict[FoodItemKey, NutrientVector] = {}
+
+        for key in unique_keys:
+            vector = self._memory_cache.get(key.cache_key)
+            if vector is not None:
+                resolved[key] = vector
+        memory_hits = len(resolved)
+
+        missing = [k for k in unique_keys if k not in resolved]
+        persistent_hits = 0
+        if missing and self._persistent_store is not None:
+            found = self._persistent_store.get_many(missing)
+            for key, vector in found.items():
+                resolved[key] = vector
+                self._memory_cache.set(key.cache_key, vector)
+            persistent_hits = len(found)
+            missing = [k for k in missing if k not in resolved]
+
+        if missing:
+            # 未知品目はまとめて 1 回で問い合わせる
+            estimated = self._item_estimator.estimate_items(missing)
+            new_vectors = dict(zip(missing, estimated))
+            for key, vector in new_vectors.items():
+                resolved[key] = vector
+                self._memory_cache.set(key.cache_key, vector)
+            if self._persistent_store is not None:
+                self._persistent_store.put_many(new_vectors)
+
+        with self._lock:
+            self._item_memory_hits += memory_hits
+            self._item_persistent_hits += persistent_hits
+            self._item_misses += len(missing)
+            if missing:
+                self._llm_calls += 1
+
+        if missing:
+            logger.info(
+                "Estimated %d new food items (%d cached) in one LLM call",
+                len(missing),
+                memory_hits + persistent_hits,
+            )
+        return resolved
@@ -0,0 +1,355 @@
+from __future__ import annotations
+
+import logging
+import os
+import statistics
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator, Protocol
+
+import certifi
+import urllib3
+from minio import Minio
+from urllib3.util import Retry, Timeout
+
+from app.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+# ----------------------------
+# メトリクス
+# ----------------------------
+@dataclass(frozen=True)
+class StoragePoolStats:
+    """
+    MinIO クライアント（urllib3 PoolManager）の接続プールの状況。
+
+    - hosts: 接続先ホストごとのプールの数
+    - maxsize: ホストごとに保持する接続数の上限
+    - idle: いまプールに戻っている（再利用できる）接続の数
+    - connections: これまでに新規に張った接続の数
+    - requests: これまでに送ったリクエストの数（requests / connections が再利用率の目安）
+    """
+
+    hosts: int
+    maxsize: int
+    idle: int
+    connections: int
+    requests: int
+
+
+@dataclass(frozen=True)
+class StorageOperationStats:
+    """操作ごとのレイテンシ（直近 _LATENCY_WINDOW 回分の ms）と件数。"""
+
+    count: int
+    errors: int
+    mean_ms: float
+    p95_ms: float
+    max_ms: float
+
+
+@dataclass(frozen=True)
+class ObjectStorageStats:
+    """
+    オブジェクトストレージのメトリクス（/api/v1/health/storage 用）。
+
+    - bucket_state: バケット確認の結果（pending / ready / failed）
+    """
+
+    bucket: str
+    bucket_state: str
+    bucket_error: str | None
+    pool: StoragePoolStats
+    operations: dict[str, StorageOperationStats] = field(default_factory=dict)
+
+
+_LATENCY_WINDOW = 1024
+
+
+class StorageLatencyMetrics:
+    """
+    ストレージ操作のレイテンシを操作名ごとに記録する。
+
+        with metrics.timed("put_object"):
+            client.put_object(...)
+    """
+
+    def __init__(self, window: int = _LATENCY_WINDOW) -> None:
+        self._window = window
+        self._lock = threading.Lock()
+        self._samples: dict[str, deque[float]] = {}
+        self._counts: dict[str, int] = {}
+        self._errors: dict[str, int] = {}
+
+    @contextmanager
+    def timed(self, operation: str) -> Iterator[None]:
+        start = time.perf_counter()
+        failed = False
+        try:
+            yield
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self._record(operation, (time.perf_counter() - start) * 1000, failed)
+
+    def _record(self, operation: str, elapsed_ms: float, failed: bool) -> None:
+        with self._lock:
+            samples = self._samples.get(operation)
+            if samples is None:
+                samples = self._samples[operation] = deque(maxlen=self._window)
+            samples.append(elapsed_ms)
+            self._counts[operation] = self._counts.get(operation, 0) + 1
+            if failed:
+                self._errors[operation] = self._errors.get(operation, 0) + 1
+
+    def stats(self) -> dict[str, StorageOperationStats]:
+        with self._lock:
+            snapshot = {
+                name: (list(samples), self._counts[name], self._errors.get(name, 0))
+                for name, samples in self._samples.items()
+            }
+
+        result: dict[str, StorageOperationStats] = {}
+        for name, (samples, count, errors) in sorted(snapshot.items()):
+            ordered = sorted(samples)
+            p95_index = min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))
+            result[name] = StorageOperationStats(
+                count=count,
+                errors=errors,
+                mean_ms=round(statistics.fmean(ordered), 3),
+                p95_ms=round(ordered[p95_index], 3),
+                max_ms=round(ordered[-1], 3),
+            )
+        return result
+
+
+def pool_stats(http: urllib3.PoolManager) -> StoragePoolStats:
+    """PoolManager が持つホストごとのプールを集計する。"""
+    pools = [http.pools[key] for key in list(http.pools.keys())]
+    idle = connections = requests = 0
+    for pool in pools:
+        queue = getattr(pool, "pool", None)
+        if queue is not None:
+            # 未使用の枠は None で埋まっているので、実際の接続だけ数える
+            idle += sum(1 for conn in list(queue.queue) if conn is not None)
+        connections += pool.num_connections
+        requests += pool.num_requests
+    return StoragePoolStats(
+        hosts=len(pools),
+        maxsize=int(http.connection_pool_kw.get("maxsize", 1)),
+        idle=idle,
+        connections=connections,
+        requests=requests,
+    )
+
+
+# ----------------------------
+# バケットのウォームアップ
+# ----------------------------
+class _BucketClient(Protocol):
+    def bucket_exists(self, bucket_name: str) -> bool: ...
+
+    def make_bucket(self, bucket_name: str) -> None: ...
+
+
+class BucketWarmup:
+    """
+    バケットの存在確認（無ければ作成）をバックグラウンドで 1 回だけ行い、結果を覚えておく。
+
+    - start() はスレッドを起こすだけですぐ戻る（コンストラクタやリクエストを止めない）。
+    - 成功したら以後は何もしない。失敗したら retry_interval 秒たってからの
+      start() で再試行する（ストレージが落ちていても API は起動できる）。
+    """
+
+    def __init__(
+        self,
+        client: _BucketClient,
+        bucket: str,
+        *,
+        metrics: StorageLatencyMetrics | None = None,
+        retry_interval: float = 30.0,
+    ) -> None:
+        self._client = client
+        self._bucket = bucket
+        self._metrics = metrics or StorageLatencyMetrics()
+        self._retry_interval = retry_interval
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._state = "pending"
+        self._error: str | None = None
+        self._failed_at = 0.0
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    @property
+    def error(self) -> str | None:
+        return self._error
+
+    def start(self) -> None:
+        if self._state == "ready":
+            return
+        with self._lock:
+            if self._state == "ready" or (
+                self._thread is not None and self._thread.is_alive()
+            ):
+                return
+            if (
+                self._state == "failed"
+                and time.monotonic() - self._failed_at < self._retry_interval
+            ):
+                return
+            self._done.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="minio-bucket-warmup", daemon=True)
+            self._thread.start()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """確認が終わるまで待つ（テスト / スクリプト用）。準備できていれば True。"""
+        self._done.wait(timeout)
+        return self._state == "ready"
+
+    def _run(self) -> None:
+        try:
+            with self._metrics.timed("bucket_exists"):
+                exists = self._client.bucket_exists(self._bucket)
+            if not exists:
+                with self._metrics.timed("make_bucket"):
+                    self._client.make_bucket(self._bucket)
+        except Exception as e:
+            logger.warning(
+                "Object storage bucket check failed: bucket=%s error=%s",
+                self._bucket,
+                e,
+            )
+            self._error = f"{type(e).__name__}: {e}"
+            self._failed_at = time.monotonic()
+            self._state = "failed"
+        else:
+            self._error = None
+            self._state = "ready"
+        finally:
+            self._done.set()
+
+
+# ----------------------------
+# クライアント（プロセス内で共有）
+# ----------------------------
+# Minio の生成自体は通信しない。接続は urllib3 のプールで使い回すので、
+# 呼び出しごとに作らずプロセスで 1 つにする（fork / spawn 先のプロセスでは作り直すこと）。
+
+_lock = threading.Lock()
+_http: urllib3.PoolManager | None = None
+_client: Minio | None = None
+_presign_client: Minio | None = None
+_metrics: StorageLatencyMetrics | None = None
+_warmup: BucketWarmup | None = None
+
+
+def _build_http_client() -> urllib3.PoolManager:
+    # minio の既定（タイムアウト 5 分 / ホストごと 10 接続）はリクエスト処理に長すぎ・少なすぎる
+    return urllib3.PoolManager(
+        num_pools=4,
+        maxsize=settings.MINIO_POOL_MAXSIZE,
+        block=False,
+        timeout=Timeout(
+            connect=settings.MINIO_CONNECT_TIMEOUT_SECONDS,
+            read=settings.MINIO_READ_TIMEOUT_SECONDS,
+        ),
+        cert_reqs="CERT_REQUIRED",
+        ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+        retries=Retry(
+            total=settings.MINIO_MAX_RETRIES,
+            backoff_factor=0.2,
+            status_forcelist=[500, 502, 503, 504],
+        ),
+    )
+
+
+def _ensure_clients() -> None:
+    global _http, _client, _presign_client, _metrics, _warmup
+    if _client is not None:
+        return
+
+    with _lock:
+        if _client is not None:
+            return
+        http = _build_http_client()
+        client = Minio(
+            settings.MINIO_ENDPOINT,
+            access_key=settings.MINIO_ACCESS_KEY,
+            secret_key=settings.MINIO_SECRET_KEY,
+            secure=settings.MINIO_USE_SSL,
+            region=settings.MINIO_REGION,
+            http_client=http,
+        )
+        # presigned URL の発行専用（クライアントから見えるホストで署名する）。
+        # region を渡しておけば署名時に通信しない。
+        _presign_client = Minio(
+            settings.MINIO_PUBLIC_ENDPOINT or settings.MINIO_ENDPOINT,
+            access_key=settings.MINIO_ACCESS_KEY,
+            secret_key=settings.MINIO_SECRET_KEY,
+            secure=(
+                settings.MINIO_PUBLIC_USE_SSL
+                if settings.MINIO_PUBLIC_ENDPOINT
+                else settings.MINIO_USE_SSL
+            ),
+            region=settings.MINIO_REGION,
+            http_client=http,
+        )
+        _metrics = StorageLatencyMetrics()
+        _warmup = BucketWarmup(
+            client, settings.MINIO_BUCKET_NAME, metrics=_metrics)
+        _http = http
+        _client = client
+
+
+def get_http_client() -> urllib3.PoolManager:
+    _ensure_clients()
+    assert _http is not None
+    return _http
+
+
+def get_minio_client() -> Minio:
+    _ensure_clients()
+    assert _client is not None
+    return _client
+
+
+def get_presign_client() -> Minio:
+    _ensure_clients()
+    assert _presign_client is not None
+    return _presign_client
+
+
+def get_storage_metrics() -> StorageLatencyMetrics:
+    _ensure_clients()
+    assert _metrics is not None
+    return _metrics
+
+
+def get_bucket_warmup() -> BucketWarmup:
+    _ensure_clients()
+    assert _warmup is not None
+    return _warmup
+
+
+def object_storage_stats() -> ObjectStorageStats | None:
+    """共有クライアントのメトリクス（まだ作られていなければ None）。"""
+    if _client is None or _http is None or _metrics is None or _warmup is None:
+        return None
+    return ObjectStorageStats(
+        bucket=settings.MINIO_BUCKET_NAME,
+        bucket_state=_warmup.state,
+        bucket_error=_warmup.error,
+        pool=pool_stats(_http),
+        operations=_metrics.stats(),
+    )
@@ -1,35 +1,86 @@
 from __future__ import annotations
 
+from datetime import datetime, timedelta, timezone
+from io import BytesIO
+
+import urllib3
 from minio import Minio
+from minio.error import S3Error
 
 from app.application.profile.ports.profile_image_storage_port import (
     ProfileImageStoragePort,
+    ProfileImageUpload,
     StoredProfileImage,
 )
 from app.domain.auth.value_objects import UserId
 from app.domain.profile.value_objects import ProfileImageId
+from app.infra.storage.minio_client import (
+    BucketWarmup,
+    ObjectStorageStats,
+    StorageLatencyMetrics,
+    get_bucket_warmup,
+    get_http_client,
+    get_minio_client,
+    get_presign_client,
+    get_storage_metrics,
+    pool_stats,
+)
+from app.infra.storage.profile_image_keys import (
+    IMMUTABLE_CACHE_CONTROL,
+    belongs_to,
+    content_hash_key,
+    derivative_key,
+    extension_for,
+    new_upload_key,
+)
 from app.settings import settings
 
+# S3 の presigned URL の有効期限の上限
+_MAX_PRESIGN_TTL = timedelta(days=7)
+# presigned GET の署名時刻をこの幅で丸める（同じ窓の間は同じ URL になり、ブラウザ / CDN が効く）
+_GET_URL_WINDOW = timedelta(days=1)
+
 
 class MinioProfileImageStorage(ProfileImageStoragePort):
     """
     MinIO を使ったプロフィール画像ストレージ実装。
 
-    - オブジェクトキー: profiles/{user_id}/avatar
+    - オブジェクトキー: profiles/{user_id}/avatar-{id}（アップロードごとに新しいキー）
+    - サムネイル: profiles/{user_id}/thumb{size}-{内容のハッシュ}.webp
+    - アップロードはクライアントが presigned PUT で直接送る（API は本体を受け取らない）
+    - 読み取り URL は PROFILE_IMAGE_PUBLIC_BASE_URL があれば公開 URL、
+      無ければ署名時刻を丸めた presigned GET（同じ日の間は同じ URL）
+    - 生成時に通信しない（バケット確認は BucketWarmup がバックグラウンドで行う）
     """
 
-    def __init__(self) -> None:
-        self._client = Minio(
-            settings.MINIO_ENDPOINT,
-            access_key=settings.MINIO_ACCESS_KEY,
-            secret_key=settings.MINIO_SECRET_KEY,
-            secure=settings.MINIO_USE_SSL,
-        )
+    def __init__(
+        self,
+        client: Minio | None = None,
+        presign_client: Minio | None = None,
+        *,
+        http: urllib3.PoolManager | None = None,
+        metrics: StorageLatencyMetrics | None = None,
+        warmup: BucketWarmup | None = None,
+    ) -> None:
+        # クライアント / 接続プールはプロセスで共有する（minio_client）。
+        # ここでは通信しない。バケットの確認はバックグラウンドで 1 回だけ行う。
+        self._client = client or get_minio_client()
+        self._presign_client = presign_client or get_presign_client()
+        self._http = http or get_http_client()
+        self._metrics = metrics or get_storage_metrics()
+        self._warmup = warmup or get_bucket_warmup()
         self._bucket = settings.MINIO_BUCKET_NAME
+        self._warmup.start()
 
-        # バケットがなければ作成
-        if not self._client.bucket_exists(self._bucket):
-            self._client.make_bucket(self._bucket)
+    def stats(self) -> ObjectStorageStats:
+        """接続プール / 操作ごとのレイテンシ / バケット確認の結果。"""
+        return ObjectStorageStats(
+            bucket=self._bucket,
+            bucket_state=self._warmup.state,
+            bucket_error=self._warmup.error,
+            pool=pool_stats(self._http),
+            operations=self._metrics.stats(),
+        )
 
     def save(
         self,
@@ -37,27 +88,120 @@ class MinioProfileImageStorage(ProfileImageStoragePort):
         content: bytes,
         content_type: str,
     ) -> StoredProfileImage:
-        object_name = f"profiles/{user_id.value}/avatar"
+        image_id = content_hash_key(user_id, content)
+        self._put(image_id, content, content_type)
 
-        # MinIO にアップロード
-        from io import BytesIO
+        return StoredProfileImage(
+            id=image_id,
+            url=self.get_url(image_id),
+            size=len(content),
+            content_type=content_type,
+        )
 
-        data = BytesIO(content)
-        size = len(content)
+    def create_upload(
+        self,
+        user_id: UserId,
+        content_type: str,
+        expires_in: timedelta,
+    ) -> ProfileImageUpload:
+        image_id = new_upload_key(user_id)
+        expires_in = min(expires_in, _MAX_PRESIGN_TTL)
 
-        self._client.put_object(
-            bucket_name=self._bucket,
-            object_name=object_name,
-            data=data,
-            length=size,
-            content_type=content_type,
+        url = self._presign_client.presigned_put_object(
+            self._bucket, image_id.value, expires=expires_in
+        )
+        return ProfileImageUpload(
+            id=image_id,
+            url=url,
+            expires_at=datetime.now(timezone.utc) + expires_in,
+            headers={
+                "Content-Type": content_type,
+                "Cache-Control": IMMUTABLE_CACHE_CONTROL,
+            },
+        )
+
+    def find_upload(
+        self,
+        user_id: UserId,
+        image_id: ProfileImageId,
+    ) -> StoredProfileImage | None:
+        if not belongs_to(user_id, image_id):
+            return None
+        try:
+            with self._metrics.timed("stat_object"):
+                stat = self._client.stat_object(self._bucket, image_id.value)
+        except S3Error as e:
+            if e.code in ("NoSuchKey", "NoSuchObject"):
+                return None
+            raise
+
+        return StoredProfileImage(
+            id=image_id,
+            url=self.get_url(image_id),
+            size=stat.size,
+            content_type=stat.content_type,
         )
 
-        image_id = ProfileImageId(object_name)
+    def read(self, image_id: ProfileImageId) -> bytes:
+        with self._metrics.timed("get_object"):
+            response = self._client.get_object(self._bucket, image_id.value)
+            try:
+                return response.read()
+            finally:
+                response.close()
+                response.release_conn()
 
-        # presigned URL 等が必要ならここで発行して返す
-        # url = self._client.presigned_get_object(self._bucket, object_name)
-        return StoredProfileImage(id=image_id, url=None)
+    def save_derivative(
+        self,
+        user_id: UserId,
+        name: str,
+        content: bytes,
+        content_type: str,
+    ) -> ProfileImageId:
+        image_id = derivative_key(user_id, name, content, extension_for(content_type))
+        self._put(image_id, content, content_type)
+        return image_id
+
+    def get_url(self, image_id: ProfileImageId) -> str | None:
+        if settings.PROFILE_IMAGE_PUBLIC_BASE_URL:
+            return f"{settings.PROFILE_IMAGE_PUBLIC_BASE_URL}/{image_id.value}"
+
+        ttl = min(
+            timedelta(seconds=settings.PROFILE_IMAGE_URL_TTL_SECONDS), _MAX_PRESIGN_TTL
+        )
+        window = min(_GET_URL_WINDOW, ttl / 2)
+        now = datetime.now(timezone.utc)
+        request_date = datetime.fromtimestamp(
+            now.timestamp() // window.total_seconds() * window.total_seconds(),
+            tz=timezone.utc,
+        )
+        # 窓の最後に発行した URL でも、キャッシュが URL より長生きしないようにする
+        max_age = int((ttl - window).total_seconds())
+        return self._presign_client.presigned_get_object(
+            self._bucket,
+            image_id.value,
+            expires=ttl,
+            request_date=request_date,
+            response_headers={
+                "response-cache-control": f"private, max-age={max_age}, immutable",
+            },
+        )
 
     def delete(self, image_id: ProfileImageId) -> None:
-        self._client.remove_object(self._bucket, image_id.value)
+        with self._metrics.timed("remove_object"):
+            self._client.remove_object(self._bucket, image_id.value)
+
+    # --- 内部 -----------------------------------------------------------
+
+    def _put(self, image_id: ProfileImageId, content: bytes, content_type: str) -> None:
+        # 起動時の確認が失敗していたら、書き込みのついでに（間隔を空けて）再確認する
+        self._warmup.start()
+        with self._metrics.timed("put_object"):
+            self._client.put_object(
+                bucket_name=self._bucket,
+                object_name=image_id.value,
+                data=BytesIO(content),
+                length=len(content),
+                content_type=content_type,
+                metadata={"Cache-Control": IMMUTABLE_CACHE_CONTROL},
+            )
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import hashlib
+import uuid
+
+from app.domain.auth.value_objects import UserId
+from app.domain.profile.value_objects import ProfileImageId
+
+# オブジェクトに付ける Cache-Control。キーはアップロードごとに変わり中身は不変なので 1 年。
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def _user_prefix(user_id: UserId) -> str:
+    return f"profiles/{user_id.value}/"
+
+
+def new_upload_key(user_id: UserId) -> ProfileImageId:
+    """
+    presigned PUT 用のキー。中身はまだ分からないのでアップロードごとのランダム ID。
+    """
+    return ProfileImageId(f"{_user_prefix(user_id)}avatar-{uuid.uuid4().hex}")
+
+
+def content_hash_key(user_id: UserId, content: bytes) -> ProfileImageId:
+    """API が本体を受け取る場合のキー（内容のハッシュ）。"""
+    digest = hashlib.sha256(content).hexdigest()[:32]
+    return ProfileImageId(f"{_user_prefix(user_id)}avatar-{digest}")
+
+
+def derivative_key(
+    user_id: UserId,
+    name: str,
+    content: bytes,
+    extension: str,
+) -> ProfileImageId:
+    """
+    サムネイルなど派生物のキー（名前 + 内容のハッシュ）。
+    同じ画像から作り直しても同じキーになるので、再実行しても重複しない。
+    """
+    digest = hashlib.sha256(content).hexdigest()[:32]
+    return ProfileImageId(f"{_user_prefix(user_id)}{name}-{digest}.{extension}")
+
+
+def extension_for(content_type: str) -> str:
+    """content_type から拡張子を決める（image/webp → webp）。"""
+    return content_type.rsplit("/", 1)[-1].split(";", 1)[0].strip() or "bin"
+
+
+def belongs_to(user_id: UserId, image_id: ProfileImageId) -> bool:
+    """他ユーザーのキーや、階層をまたぐキーを確認 API に渡されても受け付けない。"""
+    key = image_id.value
+    prefix = _user_prefix(user_id)
+    return key.startswith(prefix) and "/" not in key[len(prefix):] and ".." not in key
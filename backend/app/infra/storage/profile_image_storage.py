@@ -1,13 +1,22 @@
 from __future__ import annotations
 
+from datetime import datetime, timedelta, timezone
 from typing import Dict
 
 from app.application.profile.ports.profile_image_storage_port import (
     ProfileImageStoragePort,
+    ProfileImageUpload,
     StoredProfileImage,
 )
 from app.domain.auth.value_objects import UserId
 from app.domain.profile.value_objects import ProfileImageId
+from app.infra.storage.profile_image_keys import (
+    belongs_to,
+    content_hash_key,
+    derivative_key,
+    extension_for,
+    new_upload_key,
+)
 
 
 class InMemoryProfileImageStorage(ProfileImageStoragePort):
@@ -16,6 +25,8 @@ class InMemoryProfileImageStorage(ProfileImageStoragePort):
 
     - 実際の環境では MinIO / S3 などの実装に置き換える前提。
     - プロセスが落ちるとデータは消える。
+    - presigned PUT の代わりに memory:// の URL を返す。クライアントの直接アップロードは
+      put_uploaded() で再現する。
     """
 
     def __init__(self) -> None:
@@ -28,15 +39,68 @@ class InMemoryProfileImageStorage(ProfileImageStoragePort):
         content: bytes,
         content_type: str,
     ) -> StoredProfileImage:
-        # シンプルに user_id ベースのキーを使う（1ユーザー1画像想定）
-        key = f"profile/{user_id.value}/avatar"
+        image_id = content_hash_key(user_id, content)
 
         # メモリ上に保存
-        self._store[key] = (content, content_type)
+        self._store[image_id.value] = (content, content_type)
+
+        # URL は InMemory では意味がないので None
+        return StoredProfileImage(
+            id=image_id, url=None, size=len(content), content_type=content_type
+        )
+
+    def create_upload(
+        self,
+        user_id: UserId,
+        content_type: str,
+        expires_in: timedelta,
+    ) -> ProfileImageUpload:
+        image_id = new_upload_key(user_id)
+        return ProfileImageUpload(
+            id=image_id,
+            url=f"memory://upload/{image_id.value}",
+            expires_at=datetime.now(timezone.utc) + expires_in,
+            headers={"Content-Type": content_type},
+        )
+
+    def put_uploaded(
+        self,
+        image_id: ProfileImageId,
+        content: bytes,
+        content_type: str,
+    ) -> None:
+        """クライアントが presigned PUT でアップロードしたことにする（テスト用）。"""
+        self._store[image_id.value] = (content, content_type)
+
+    def find_upload(
+        self,
+        user_id: UserId,
+        image_id: ProfileImageId,
+    ) -> StoredProfileImage | None:
+        if not belongs_to(user_id, image_id) or image_id.value not in self._store:
+            return None
+        content, content_type = self._store[image_id.value]
+        return StoredProfileImage(
+            id=image_id, url=None, size=len(content), content_type=content_type
+        )
+
+    def read(self, image_id: ProfileImageId) -> bytes:
+        content, _ = self._store[image_id.value]
+        return content
+
+    def save_derivative(
+        self,
+        user_id: UserId,
+        name: str,
+        content: bytes,
+        content_type: str,
+    ) -> ProfileImageId:
+        image_id = derivative_key(user_id, name, content, extension_for(content_type))
+        self._store[image_id.value] = (content, content_type)
+        return image_id
 
-        image_id = ProfileImageId(key)
-        # URL は InMemory では意味がないので None。将来 MinIO 実装で presigned URL を返してもよい。
-        return StoredProfileImage(id=image_id, url=None)
+    def get_url(self, image_id: ProfileImageId) -> str | None:
+        return None
 
     def delete(self, image_id: ProfileImageId) -> None:
         self._store.pop(image_id.value, None)
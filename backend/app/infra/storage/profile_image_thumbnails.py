@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from io import BytesIO
+from typing import Callable, Sequence
+
+from app.application.profile.ports.profile_image_processor_port import (
+    ProfileImageProcessorPort,
+)
+from app.application.profile.ports.profile_image_storage_port import (
+    ProfileImageStoragePort,
+)
+from app.application.profile.ports.uow_port import ProfileUnitOfWorkPort
+from app.domain.auth.value_objects import UserId
+from app.domain.profile.value_objects import ProfileImageId
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_CONTENT_TYPE = "image/webp"
+_WEBP_QUALITY = 80
+
+RenderThumbnails = Callable[[bytes, Sequence[int]], dict[int, bytes]]
+
+
+def render_webp_thumbnails(content: bytes, sizes: Sequence[int]) -> dict[int, bytes]:
+    """
+    画像から正方形の WebP サムネイルを辺の長さごとに作る（プロセスプールで実行する）。
+
+    - 中央で切り抜いて縮小する。EXIF の向きは反映する。
+    - JPEG は draft() で縮小デコードするので、大きな写真でもデコードが軽い。
+    """
+    # Pillow はワーカープロセスでだけ使うので、import もここで行う
+    from PIL import Image, ImageOps
+
+    largest = max(sizes)
+    with Image.open(BytesIO(content)) as source:
+        source.draft("RGB", (largest, largest))
+        image = ImageOps.exif_transpose(source)
+        has_alpha = image.mode in ("RGBA", "LA") or "transparency" in image.info
+        image = image.convert("RGBA" if has_alpha else "RGB")
+
+        rendered: dict[int, bytes] = {}
+        for size in sorted(set(sizes), reverse=True):
+            thumbnail = ImageOps.fit(
+                image, (size, size), method=Image.Resampling.LANCZOS)
+            buffer = BytesIO()
+            thumbnail.save(buffer, format="WEBP", quality=_WEBP_QUALITY, method=4)
+            rendered[size] = buffer.getvalue()
+    return rendered
+
+
+class ProcessPoolProfileImageProcessor(ProfileImageProcessorPort):
+    """
+    プロフィール画像のサムネイルをプロセスプールで生成する ProfileImageProcessorPort 実装。
+
+    - schedule() はスレッドに積んですぐ戻る。デコード / リサイズ / エンコードは
+      CPU を使うので、API プロセス（GIL）の外のプロセスプールで行う。
+    - サムネイルのキーは内容のハッシュ（同じ画像を作り直しても同じキー）。
+    - 保存後にプロフィールへ記録する。生成中に画像が差し替えられていたら捨てる。
+    - プールは最初の schedule() で作る（使わないプロセスでは起動しない）。
+    """
+
+    def __init__(
+        self,
+        image_storage: ProfileImageStoragePort,
+        uow_factory: Callable[[], ProfileUnitOfWorkPort],
+        sizes: Sequence[int],
+        max_workers: int,
+        *,
+        render: RenderThumbnails = render_webp_thumbnails,
+        executor: Executor | None = None,
+        coordinator: Executor | None = None,
+    ) -> None:
+        self._image_storage = image_storage
+        self._uow_factory = uow_factory
+        self._sizes = tuple(sorted(set(sizes)))
+        self._max_workers = max_workers
+        self._render = render
+        self._executor = executor
+        self._coordinator = coordinator
+        self._lock = threading.Lock()
+
+    def schedule(self, user_id: UserId, image_id: ProfileImageId) -> None:
+        self._coordinator_executor().submit(self._run, user_id, image_id)
+
+    def process(
+        self, user_id: UserId, image_id: ProfileImageId
+    ) -> dict[int, ProfileImageId] | None:
+        """
+        サムネイルを作って保存し、プロフィールに記録する。
+        画像が差し替えられていて記録しなかった場合は None。
+        """
+        content = self._image_storage.read(image_id)
+        rendered = (
+            self._pool_executor()
+            .submit(self._render, content, self._sizes)
+            .result()
+        )
+
+        thumbnails = {
+            size: self._image_storage.save_derivative(
+                user_id, f"thumb{size}", data, THUMBNAIL_CONTENT_TYPE)
+            for size, data in rendered.items()
+        }
+
+        # プロフィール全体を読んで save() すると、その間に保存された変更を上書きするので
+        # サムネイルの列だけを条件付きで更新する
+        with self._uow_factory() as uow:
+            attached = uow.profile_repo.attach_thumbnails(
+                user_id, image_id, thumbnails)
+
+        if not attached:
+            for thumbnail_id in thumbnails.values():
+                self._image_storage.delete(thumbnail_id)
+            return None
+        return thumbnails
+
+    def shutdown(self, wait: bool = True) -> None:
+        """アプリ終了時に呼ぶ（自分で作ったプールだけ止める）。"""
+        with self._lock:
+            coordinator, self._coordinator = self._coordinator, None
+            executor, self._executor = self._executor, None
+        if coordinator is not None:
+            coordinator.shutdown(wait=wait)
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    # --- 内部 -----------------------------------------------------------
+
+    def _run(self, user_id: UserId, image_id: ProfileImageId) -> None:
+        try:
+            self.process(user_id, image_id)
+        except Exception:
+            # サムネイルが無くても元画像で表示できるので、失敗はログだけ残す
+            logger.exception(
+                "Profile image thumbnail generation failed: image_id=%s",
+                image_id.value,
+            )
+
+    def _coordinator_executor(self) -> Executor:
+        with self._lock:
+            if self._coordinator is None:
+                self._coordinator = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="profile-thumbnails",
+                )
+            return self._coordinator
+
+    def _pool_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                # fork だと API プロセスのスレッド / DB 接続を引き継ぐので spawn で起動する
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
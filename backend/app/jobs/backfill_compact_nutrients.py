@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from typing import Callable
+
+import sqlalchemy as sa
+from dotenv import load_dotenv
+from sqlalchemy.orm import Session, selectinload
+
+from app.infra.db.models.daily_nutrition import DailyNutritionSummaryModel
+from app.infra.db.models.meal_nutrition import MealNutritionSummaryModel
+from app.infra.db.models.target import DailyTargetSnapshotModel, TargetModel
+from app.infra.db.nutrient_storage import encode_nutrient_rows
+from app.infra.db.session import create_session
+
+# プロジェクトルート（backend/）を基準に .env を読む
+BASE_DIR = Path(__file__).resolve().parent.parent
+load_dotenv(BASE_DIR / ".env")
+
+# nutrients_compact を持つ親テーブル（nutrients リレーションで子テーブルを持つ）
+_MODELS = (
+    MealNutritionSummaryModel,
+    DailyNutritionSummaryModel,
+    TargetModel,
+    DailyTargetSnapshotModel,
+)
+
+
+def backfill_model(
+    session_factory: Callable[[], Session],
+    model: type,
+    *,
+    batch_size: int,
+    dry_run: bool = False,
+) -> int:
+    """
+    nutrients_compact が NULL の行を子テーブルから埋める。
+
+    - batch_size 件ずつ別トランザクションでコミットするので、途中で止めても
+      再実行すれば NULL の行から続きを処理する（冪等）。
+    - FOR UPDATE SKIP LOCKED で読むので、アプリが同時に書いている行は次回に回す。
+    - 子テーブルの行は消さない（NUTRIENT_STORAGE_MODE=compact で書き直されたときに消える）。
+    """
+    if dry_run:
+        with session_factory() as session:
+            return session.execute(
+                sa.select(sa.func.count())
+                .select_from(model)
+                .where(model.nutrients_compact.is_(None))
+            ).scalar_one()
+
+    total = 0
+    last_id = None
+    while True:
+        with session_factory() as session:
+            stmt = (
+                sa.select(model)
+                .options(selectinload(model.nutrients))
+                .where(model.nutrients_compact.is_(None))
+                .order_by(model.id)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True, of=model)
+            )
+            # ロック中でスキップした行で止まらないよう、id で前に進める
+            if last_id is not None:
+                stmt = stmt.where(model.id > last_id)
+            rows = session.execute(stmt).scalars().all()
+            if not rows:
+                return total
+
+            for row in rows:
+                row.nutrients_compact = encode_nutrient_rows(row.nutrients)
+            last_id = rows[-1].id
+            session.commit()
+            total += len(rows)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "既存のサマリ / ターゲット / スナップショットの nutrients_compact を"
+            "子テーブルから埋める（NUTRIENT_STORAGE_MODE を compact に切り替える前に実行）"
+        )
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=500,
+        help="1 トランザクションで処理する親行の数 (既定: 500)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="書き込まず、未処理の件数だけ数える",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+
+    print("=== Job: BackfillCompactNutrients ===")
+    print(f"batch_size: {args.batch_size}")
+    print(f"dry_run   : {args.dry_run}")
+    print()
+
+    for model in _MODELS:
+        count = backfill_model(
+            create_session,
+            model,
+            batch_size=args.batch_size,
+            dry_run=args.dry_run,
+        )
+        label = "pending" if args.dry_run else "filled"
+        print(f"{model.__tablename__:<28} {label}: {count}")
+
+
+if __name__ == "__main__":
+    main()
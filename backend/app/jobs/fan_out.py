@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import statistics
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Generic, Sequence, TypeVar
+
+# 結果の分類（これ以外は _SKIP_REASONS などで決める "skip:..."）
+STATUS_OK = "ok"
+STATUS_ERROR = "error"
+
+T = TypeVar("T")
+U = TypeVar("U")
+R = TypeVar("R", bound="JobReport")
+
+
+def classify_error(
+    error: Exception,
+    skip_reasons: Sequence[tuple[type[Exception], str]],
+) -> tuple[str, str]:
+    """例外を (status, detail) にする。skip_reasons に無いものは error（detail 付き）。"""
+    for error_type, status in skip_reasons:
+        if isinstance(error, error_type):
+            return status, ""
+    return STATUS_ERROR, f"{type(error).__name__}: {error}"
+
+
+@dataclass
+class JobReport:
+    """夜間ジョブ全体の件数 / スループット / レイテンシ（1 件あたり）。"""
+
+    unit: str = "items"
+    statuses: Counter[str] = field(default_factory=Counter)
+    latencies_ms: list[float] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def processed(self) -> int:
+        return sum(self.statuses.values())
+
+    def header_lines(self) -> list[str]:
+        """件数の前に出す行（シャードなど、ジョブごとの情報）。"""
+        return []
+
+    def lines(self) -> list[str]:
+        throughput = self.processed / self.elapsed_seconds if self.elapsed_seconds else 0.0
+        lines = [
+            "=== Report ===",
+            *self.header_lines(),
+            f"processed  : {self.processed} in {self.elapsed_seconds:.1f}s "
+            f"({throughput:.2f} {self.unit}/s)",
+        ]
+        for status, count in sorted(self.statuses.items()):
+            lines.append(f"  {status:<24}: {count}")
+        if self.latencies_ms:
+            ordered = sorted(self.latencies_ms)
+
+            def pct(p: float) -> float:
+                return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))]
+
+            lines.append(
+                "latency ms : "
+                f"mean={statistics.fmean(ordered):.0f} p50={pct(50):.0f} "
+                f"p95={pct(95):.0f} p99={pct(99):.0f} max={ordered[-1]:.0f}"
+            )
+        return lines
+
+
+@dataclass
+class FanOut(Generic[T, U]):
+    """
+    items を最大 concurrency 並列で処理し、結果を JobReport に集計する。
+
+    - 処理時間のほとんどは LLM の待ち時間なので、スレッドプールで並べる。
+      （同期の OpenAI アダプタも OpenAICallLimiter.sync_slot() を通るので、
+      concurrency を上げても同時呼び出しは OPENAI_MAX_CONCURRENCY まで）
+    - UseCase / UoW はスレッドをまたいで共有できないので、use_case_factory で
+      スレッドごとに作る。
+    - run_one(use_case, item) は (status, detail) を返す。on_done(item, status,
+      elapsed_ms, detail) は 1 件終わるごとにワーカースレッドで呼ばれる
+      （チェックポイントへの記録など）。
+    """
+
+    use_case_factory: Callable[[], U]
+    run_one: Callable[[U, T], tuple[str, str]]
+    describe: Callable[[T], str]
+    concurrency: int
+    thread_name_prefix: str
+    on_done: Callable[[T, str, float, str], None] | None = None
+    log: Callable[[str], None] = print
+
+    def run(self, items: Sequence[T], report: R) -> R:
+        local = threading.local()
+
+        def run(item: T) -> tuple[T, str, str, float]:
+            use_case = getattr(local, "use_case", None)
+            if use_case is None:
+                use_case = local.use_case = self.use_case_factory()
+            start = time.perf_counter()
+            status, detail = self.run_one(use_case, item)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            if self.on_done is not None:
+                self.on_done(item, status, elapsed_ms, detail)
+            return item, status, detail, elapsed_ms
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(
+            max_workers=max(1, self.concurrency),
+            thread_name_prefix=self.thread_name_prefix,
+        ) as executor:
+            futures = [executor.submit(run, item) for item in items]
+            for future in as_completed(futures):
+                item, status, detail, elapsed_ms = future.result()
+                report.statuses[status] += 1
+                report.latencies_ms.append(elapsed_ms)
+                suffix = f" ({detail})" if detail else ""
+                self.log(f"{self.describe(item)} ... {status.upper()}{suffix} "
+                         f"{elapsed_ms:.0f}ms")
+        report.elapsed_seconds = time.perf_counter() - start
+        return report
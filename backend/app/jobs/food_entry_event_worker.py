@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import argparse
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable
+
+from dotenv import load_dotenv
+from sqlalchemy.orm import Session
+
+from app.application.nutrition.use_cases.compute_meal_nutrition import (
+    ComputeMealNutritionUseCase,
+)
+from app.di.container import get_compute_meal_nutrition_use_case
+from app.domain.auth.errors import PremiumFeatureRequiredError
+from app.domain.auth.value_objects import UserId
+from app.domain.meal.errors import InvalidMealIndexError, InvalidMealTypeError
+from app.infra.db.repositories.food_entry_event_repository import (
+    FoodEntryEvent,
+    Slot,
+    SqlAlchemyFoodEntryEventRepository,
+)
+from app.infra.db.session import create_session
+from app.settings import settings
+
+# プロジェクトルート（backend/）を基準に .env を読む
+BASE_DIR = Path(__file__).resolve().parent.parent
+load_dotenv(BASE_DIR / ".env")
+
+# 再計算しても意味がない（何度やっても同じ結果になる）ので、イベントを捨てるエラー
+_DROP_ERRORS: tuple[type[Exception], ...] = (
+    PremiumFeatureRequiredError,
+    InvalidMealTypeError,
+    InvalidMealIndexError,
+)
+# 失敗したイベントを取り直すまでの待ち（秒）の上限
+_MAX_BACKOFF_SECONDS = 300
+
+
+@dataclass
+class BatchResult:
+    """process_batch() 1 回分の件数。"""
+
+    claimed: int = 0
+    slots: int = 0
+    completed: int = 0
+    dropped: int = 0
+    failed: int = 0
+
+
+def coalesce(events: list[FoodEntryEvent]) -> dict[Slot, list[FoodEntryEvent]]:
+    """同じ食事スロットのイベントをまとめる（1 スロット 1 回の再計算で済ませる）。"""
+    slots: dict[Slot, list[FoodEntryEvent]] = {}
+    for event in events:
+        slots.setdefault(event.slot, []).append(event)
+    return slots
+
+
+def _backoff(attempts: int) -> timedelta:
+    return timedelta(seconds=min(2 ** attempts, _MAX_BACKOFF_SECONDS))
+
+
+def process_batch(
+    session_factory: Callable[[], Session],
+    use_case_factory: Callable[[], ComputeMealNutritionUseCase],
+    *,
+    batch_size: int,
+    lease: timedelta,
+    max_attempts: int,
+    executor: ThreadPoolExecutor,
+) -> BatchResult:
+    """
+    outbox からイベントを取り出し、食事スロットごとに栄養サマリを計算し直す。
+
+    - 取り出し（リース付与）は短いトランザクションで commit してから計算する。
+      計算には LLM 呼び出しが入るので、その間は行ロックも DB 接続も持たない。
+      途中でワーカーが落ちても、リースが切れれば別のワーカーが取り直す。
+    - 食事サマリの保存時に日次サマリへ差分が反映されるので、日次は別に計算しない。
+    - 成功したスロットのイベントは消し、失敗したものは指数バックオフで戻す。
+    """
+    with session_factory() as session:
+        events = SqlAlchemyFoodEntryEventRepository(session).claim(
+            batch_size, lease, max_attempts)
+        session.commit()
+
+    result = BatchResult(claimed=len(events))
+    if not events:
+        return result
+
+    slots = coalesce(events)
+    result.slots = len(slots)
+    local = threading.local()
+
+    def run(slot: Slot) -> tuple[Slot, str, str]:
+        use_case = getattr(local, "use_case", None)
+        if use_case is None:
+            use_case = local.use_case = use_case_factory()
+        user_id, date_, meal_type, meal_index = slot
+        try:
+            use_case.execute(UserId(str(user_id)), date_, meal_type, meal_index)
+        except _DROP_ERRORS as e:
+            return slot, "dropped", f"{type(e).__name__}: {e}"
+        except Exception as e:
+            return slot, "failed", f"{type(e).__name__}: {e}"
+        return slot, "completed", ""
+
+    done_ids: list[int] = []
+    failures: list[tuple[list[FoodEntryEvent], str]] = []
+    for slot, status, detail in executor.map(run, slots):
+        slot_events = slots[slot]
+        if status == "failed":
+            failures.append((slot_events, detail))
+            result.failed += 1
+            print(f"[Slot] {slot[0]} {slot[1]} {slot[2]}/{slot[3]} ... FAILED ({detail})")
+            continue
+        done_ids.extend(event.id for event in slot_events)
+        if status == "dropped":
+            result.dropped += 1
+        else:
+            result.completed += 1
+
+    now = datetime.now(timezone.utc)
+    with session_factory() as session:
+        repo = SqlAlchemyFoodEntryEventRepository(session)
+        repo.complete(done_ids)
+        for slot_events, detail in failures:
+            attempts = max(event.attempts for event in slot_events)
+            repo.release(
+                [event.id for event in slot_events],
+                detail,
+                now + _backoff(attempts),
+            )
+        session.commit()
+    return result
+
+
+def run_worker(
+    session_factory: Callable[[], Session],
+    use_case_factory: Callable[[], ComputeMealNutritionUseCase],
+    *,
+    batch_size: int,
+    lease: timedelta,
+    max_attempts: int,
+    concurrency: int,
+    poll_seconds: float,
+    once: bool,
+    stop: threading.Event,
+) -> BatchResult:
+    """
+    stop されるまでイベントを処理し続ける（once なら空になった時点で終わる）。
+    取り出せるイベントが無いときだけ poll_seconds 待つ。
+    """
+    total = BatchResult()
+    with ThreadPoolExecutor(
+        max_workers=max(1, concurrency), thread_name_prefix="food-entry-events"
+    ) as executor:
+        while not stop.is_set():
+            start = time.perf_counter()
+            batch = process_batch(
+                session_factory,
+                use_case_factory,
+                batch_size=batch_size,
+                lease=lease,
+                max_attempts=max_attempts,
+                executor=executor,
+            )
+            total.claimed += batch.claimed
+            total.slots += batch.slots
+            total.completed += batch.completed
+            total.dropped += batch.dropped
+            total.failed += batch.failed
+            if batch.claimed:
+                print(
+                    f"[Batch] events={batch.claimed} slots={batch.slots} "
+                    f"completed={batch.completed} dropped={batch.dropped} "
+                    f"failed={batch.failed} "
+                    f"{(time.perf_counter() - start) * 1000:.0f}ms"
+                )
+                continue
+            if once:
+                break
+            stop.wait(poll_seconds)
+    return total
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="FoodEntry の変更イベント（outbox）を処理して栄養サマリを計算し直す"
+    )
+    parser.add_argument(
+        "--once",
+        action="store_true",
+        help="イベントが無くなったら終了する（既定: 止めるまで待ち続ける）",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=settings.FOOD_ENTRY_OUTBOX_BATCH_SIZE,
+        help=f"1 回に取り出すイベント数 (既定: {settings.FOOD_ENTRY_OUTBOX_BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=settings.FOOD_ENTRY_OUTBOX_CONCURRENCY,
+        help=f"同時に計算するスロット数 (既定: {settings.FOOD_ENTRY_OUTBOX_CONCURRENCY})",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+
+    stop = threading.Event()
+    # SIGTERM / Ctrl-C では処理中のバッチを終えてから止まる
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: stop.set())
+
+    print("=== Worker: FoodEntryEvents ===")
+    print(f"batch size  : {args.batch_size}")
+    print(f"concurrency : {args.concurrency}")
+    print(f"lease       : {settings.FOOD_ENTRY_OUTBOX_LEASE_SECONDS}s")
+    print()
+
+    total = run_worker(
+        create_session,
+        get_compute_meal_nutrition_use_case,
+        batch_size=args.batch_size,
+        lease=timedelta(seconds=settings.FOOD_ENTRY_OUTBOX_LEASE_SECONDS),
+        max_attempts=settings.FOOD_ENTRY_OUTBOX_MAX_ATTEMPTS,
+        concurrency=args.concurrency,
+        poll_seconds=settings.FOOD_ENTRY_OUTBOX_POLL_SECONDS,
+        once=args.once,
+        stop=stop,
+    )
+    print()
+    print("=== Report ===")
+    print(f"events    : {total.claimed}")
+    print(f"slots     : {total.slots}")
+    print(f"completed : {total.completed}")
+    print(f"dropped   : {total.dropped}")
+    print(f"failed    : {total.failed}")
+
+
+if __name__ == "__main__":
+    main()
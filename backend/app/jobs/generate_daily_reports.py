@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import argparse
+from datetime import date as DateType
+from datetime import timedelta
+from pathlib import Path
+from typing import Callable, Sequence
+from uuid import UUID
+
+from dotenv import load_dotenv
+from sqlalchemy.orm import Session
+
+from app.application.nutrition.use_cases.generate_daily_nutrition_report import (
+    GenerateDailyNutritionReportUseCase,
+)
+from app.di.container import get_generate_daily_nutrition_report_use_case
+from app.domain.auth.errors import PremiumFeatureRequiredError
+from app.domain.auth.value_objects import UserId
+from app.domain.meal.errors import DailyLogProfileNotFoundError
+from app.domain.nutrition.errors import (
+    DailyLogNotCompletedError,
+    DailyNutritionReportAlreadyExistsError,
+)
+from app.infra.db.repositories.daily_nutrition_report_repository import (
+    SqlAlchemyDailyNutritionReportRepository,
+)
+from app.infra.db.session import create_session
+from app.jobs.fan_out import STATUS_OK, FanOut, JobReport, classify_error
+from app.settings import settings
+
+# プロジェクトルート（backend/）を基準に .env を読む
+BASE_DIR = Path(__file__).resolve().parent.parent
+load_dotenv(BASE_DIR / ".env")
+
+# 対象の一覧を取ってから生成までの間に状態が変わったものは SKIP 扱い
+_SKIP_REASONS: tuple[tuple[type[Exception], str], ...] = (
+    (DailyNutritionReportAlreadyExistsError, "skip:already_exists"),
+    (DailyLogNotCompletedError, "skip:not_completed"),
+    (DailyLogProfileNotFoundError, "skip:no_profile"),
+    (PremiumFeatureRequiredError, "skip:not_premium"),
+)
+
+
+def list_report_ready_days(
+    session_factory: Callable[[], Session],
+    start_date: DateType,
+    end_date: DateType,
+) -> list[tuple[UUID, DateType]]:
+    """記録完了 / サマリあり / レポート未作成の (user_id, date) を 1 クエリで取る。"""
+    with session_factory() as session:
+        return SqlAlchemyDailyNutritionReportRepository(
+            session).list_report_ready_days(start_date, end_date)
+
+
+def _generate_one(
+    use_case: GenerateDailyNutritionReportUseCase,
+    day: tuple[UUID, DateType],
+) -> tuple[str, str]:
+    """1 日分を生成して (status, detail) を返す。"""
+    user_id, date_ = day
+    try:
+        use_case.execute(UserId(str(user_id)), date_)
+    except Exception as e:
+        return classify_error(e, _SKIP_REASONS)
+    return STATUS_OK, ""
+
+
+def generate_daily_reports(
+    days: Sequence[tuple[UUID, DateType]],
+    use_case_factory: Callable[[], GenerateDailyNutritionReportUseCase],
+    *,
+    concurrency: int,
+    log: Callable[[str], None] = print,
+) -> JobReport:
+    """(user_id, date) ごとにレポートを最大 concurrency 並列で生成する（FanOut）。"""
+    return FanOut(
+        use_case_factory=use_case_factory,
+        run_one=_generate_one,
+        describe=lambda day: f"[Report] {day[0]} {day[1].isoformat()}",
+        concurrency=concurrency,
+        thread_name_prefix="daily-report",
+        log=log,
+    ).run(days, JobReport(unit="reports"))
+
+
+def _parse_args() -> argparse.Namespace:
+    yesterday = DateType.today() - timedelta(days=1)
+    parser = argparse.ArgumentParser(
+        description="記録が完了した日の日次レポートをまとめて生成する（夜間ジョブ）"
+    )
+    parser.add_argument(
+        "--from",
+        dest="start_date",
+        type=DateType.fromisoformat,
+        default=yesterday,
+        help="開始日 (YYYY-MM-DD, 既定: 昨日)",
+    )
+    parser.add_argument(
+        "--to",
+        dest="end_date",
+        type=DateType.fromisoformat,
+        default=yesterday,
+        help="終了日 (YYYY-MM-DD, 既定: 昨日)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=settings.JOB_DAILY_REPORT_CONCURRENCY,
+        help=f"同時に生成する件数 (既定: {settings.JOB_DAILY_REPORT_CONCURRENCY})",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+
+    days = list_report_ready_days(create_session, args.start_date, args.end_date)
+    print("=== Job: GenerateDailyReports ===")
+    print(f"range      : {args.start_date.isoformat()} .. {args.end_date.isoformat()}")
+    print(f"targets    : {len(days)}")
+    print(f"concurrency: {args.concurrency}")
+    print()
+
+    report = generate_daily_reports(
+        days,
+        get_generate_daily_nutrition_report_use_case,
+        concurrency=args.concurrency,
+    )
+    print()
+    for line in report.lines():
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
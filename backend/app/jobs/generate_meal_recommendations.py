@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import argparse
+import hashlib
+import json
+import threading
+from dataclasses import dataclass, field
 from datetime import date as DateType
 from pathlib import Path
+from typing import Callable, Iterable
 
 from dotenv import load_dotenv
 
@@ -9,74 +15,281 @@ from app.application.nutrition.use_cases.generate_meal_recommendation import (
     GenerateMealRecommendationInput,
     GenerateMealRecommendationUseCase,
 )
+from app.domain.auth.errors import PremiumFeatureRequiredError
 from app.domain.auth.value_objects import UserId
 from app.domain.nutrition.errors import (
     NotEnoughDailyReportsError,
     MealRecommendationAlreadyExistsError,
+    MealRecommendationCooldownError,
+    MealRecommendationDailyLimitError,
 )
 from app.domain.meal.errors import DailyLogProfileNotFoundError
 from app.di.container import (
     get_auth_uow,
     get_generate_meal_recommendation_use_case,
 )
+from app.jobs.fan_out import (
+    STATUS_ERROR,
+    STATUS_OK,
+    FanOut,
+    JobReport,
+    classify_error,
+)
 from app.settings import settings
 
 # プロジェクトルート（backend/）を基準に .env を読む
 BASE_DIR = Path(__file__).resolve().parent.parent
 load_dotenv(BASE_DIR / ".env")
 
+# チェックポイントの既定の置き場所（--checkpoint で変更可）
+CHECKPOINT_DIR = BASE_DIR / ".job_state"
+
+# 結果の分類。"error" 以外は再実行時に飛ばす
+_SKIP_REASONS: tuple[tuple[type[Exception], str], ...] = (
+    (DailyLogProfileNotFoundError, "skip:no_profile"),
+    (NotEnoughDailyReportsError, "skip:not_enough_reports"),
+    (MealRecommendationAlreadyExistsError, "skip:already_exists"),
+    (PremiumFeatureRequiredError, "skip:not_premium"),
+    (MealRecommendationCooldownError, "skip:cooldown"),
+    (MealRecommendationDailyLimitError, "skip:daily_limit"),
+)
+
+
+# ----------------------------
+# シャード
+# ----------------------------
+@dataclass(frozen=True)
+class Shard:
+    """
+    ユーザーを user_id のハッシュで N 個に分けたうちの 1 つ（index は 0 始まり）。
+
+    プロセス / マシンごとに --shard 0/4 .. 3/4 を渡せば、重複なく全員を分担できる。
+    """
+
+    index: int = 0
+    count: int = 1
+
+    @classmethod
+    def parse(cls, value: str) -> "Shard":
+        try:
+            index_str, count_str = value.split("/", 1)
+            shard = cls(int(index_str), int(count_str))
+        except ValueError as e:
+            raise argparse.ArgumentTypeError(
+                f"--shard は i/N 形式で指定する（例: 0/4）: {value!r}") from e
+        if shard.count < 1 or not (0 <= shard.index < shard.count):
+            raise argparse.ArgumentTypeError(
+                f"--shard は 0 <= i < N で指定する: {value!r}")
+        return shard
+
+    def owns(self, user_id: UserId) -> bool:
+        # hash() はプロセスごとに変わるので、マシン間で同じになる sha1 を使う
+        digest = hashlib.sha1(user_id.value.encode()).digest()
+        return int.from_bytes(digest[:8], "big") % self.count == self.index
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
+
+
+# ----------------------------
+# チェックポイント
+# ----------------------------
+class JobCheckpoint:
+    """
+    処理済みユーザーを JSON Lines で記録する（1 ユーザー 1 行、終わるたびに追記）。
+
+    - 途中で落ちても、同じファイルを指定して再実行すれば続きから処理する。
+    - status が error のユーザーは再実行時にもう一度処理する（最後の行が優先）。
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+        self._statuses: dict[str, str] = {}
+        if path.exists():
+            for line in path.read_text(encoding="utf-8").splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # 書き込み途中で落ちた最後の行は読み飛ばす
+                    continue
+                self._statuses[entry["user_id"]] = entry["status"]
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def is_done(self, user_id: UserId) -> bool:
+        status = self._statuses.get(user_id.value)
+        return status is not None and status != STATUS_ERROR
+
+    def done_count(self) -> int:
+        return sum(1 for status in self._statuses.values() if status != STATUS_ERROR)
+
+    def record(
+        self, user_id: UserId, status: str, elapsed_ms: float, detail: str = ""
+    ) -> None:
+        entry = {
+            "user_id": user_id.value,
+            "status": status,
+            "elapsed_ms": round(elapsed_ms, 1),
+        }
+        if detail:
+            entry["detail"] = detail
+        line = json.dumps(entry, ensure_ascii=False)
+        with self._lock:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with self._path.open("a", encoding="utf-8") as f:
+                f.write(line + "\n")
+            self._statuses[user_id.value] = status
+
+
+# ----------------------------
+# レポート
+# ----------------------------
+@dataclass
+class RecommendationJobReport(JobReport):
+    """JobReport にシャードとチェックポイントで飛ばした件数を足したもの。"""
+
+    unit: str = "users"
+    shard: Shard = field(default_factory=Shard)
+    total_users: int = 0
+    resumed: int = 0
+
+    def header_lines(self) -> list[str]:
+        return [
+            f"shard      : {self.shard}",
+            f"users      : {self.total_users} (resumed/skipped by checkpoint: {self.resumed})",
+        ]
+
+
+# ----------------------------
+# 実行
+# ----------------------------
+def _generate_one(
+    use_case: GenerateMealRecommendationUseCase,
+    user_id: UserId,
+    base_date: DateType | None,
+) -> tuple[str, str]:
+    """1 ユーザー分を生成して (status, detail) を返す。"""
+    try:
+        rec = use_case.execute(
+            GenerateMealRecommendationInput(user_id=user_id, base_date=base_date)
+        )
+    except Exception as e:
+        return classify_error(e, _SKIP_REASONS)
+    return STATUS_OK, f"generated for {rec.generated_for_date}"
+
+
+def generate_meal_recommendations(
+    user_ids: Iterable[UserId],
+    use_case_factory: Callable[[], GenerateMealRecommendationUseCase],
+    *,
+    base_date: DateType | None,
+    shard: Shard,
+    concurrency: int,
+    checkpoint: JobCheckpoint,
+    log: Callable[[str], None] = print,
+) -> RecommendationJobReport:
+    """
+    shard に属するユーザーの提案を最大 concurrency 並列で生成する（FanOut）。
+
+    1 ユーザー終わるごとにチェックポイントへ書く。
+    """
+    targets = [uid for uid in user_ids if shard.owns(uid)]
+    pending = [uid for uid in targets if not checkpoint.is_done(uid)]
+    report = RecommendationJobReport(
+        shard=shard,
+        total_users=len(targets),
+        resumed=len(targets) - len(pending),
+    )
+    return FanOut(
+        use_case_factory=use_case_factory,
+        run_one=lambda use_case, user_id: _generate_one(use_case, user_id, base_date),
+        describe=lambda user_id: f"[User] {user_id.value}",
+        concurrency=concurrency,
+        thread_name_prefix="recommend",
+        on_done=checkpoint.record,
+        log=log,
+    ).run(pending, report)
+
 
 def _list_active_user_ids() -> list[UserId]:
     """
     Auth UoW 経由でアクティブユーザー一覧を取得する。
-
-    - SqlAlchemyUserRepository に list_active_users() がある前提。
-    - 無ければ TODO にしておいてもOK。
     """
     from app.application.auth.ports.uow_port import AuthUnitOfWorkPort
 
     uow: AuthUnitOfWorkPort = get_auth_uow()
     with uow as tx:
-        users = tx.user_repo.list_active_users()  # TODO: 実装に合わせて名称調整
+        users = tx.user_repo.list_active_users()
         return [user.id for user in users]
 
 
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="アクティブユーザーの食事提案をまとめて生成する（夜間ジョブ）"
+    )
+    parser.add_argument(
+        "--shard",
+        type=Shard.parse,
+        default=Shard(),
+        help="担当するシャード i/N（0 始まり, 既定: 0/1 = 全員）",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=settings.JOB_RECOMMEND_CONCURRENCY,
+        help=f"同時に処理するユーザー数 (既定: {settings.JOB_RECOMMEND_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        default=None,
+        help="チェックポイントファイル（既定: .job_state/ 以下に基準日とシャードごと）",
+    )
+    return parser.parse_args()
+
+
 def main() -> None:
-    # 今日の日付
+    args = _parse_args()
+
     # GenerateMealRecommendationUseCase 側が None を today に解決するので省略も可
     base_date_str = settings.JOB_RECOMMEND_BASE_DATE
     base_date: DateType | None = (
         DateType.fromisoformat(base_date_str) if base_date_str else None
     )
-
-    use_case: GenerateMealRecommendationUseCase = (
-        get_generate_meal_recommendation_use_case()
+    shard: Shard = args.shard
+    checkpoint_path: Path = args.checkpoint or (
+        CHECKPOINT_DIR
+        / "meal_recommendations"
+        / f"{(base_date or DateType.today()).isoformat()}"
+          f"_shard{shard.index}-of-{shard.count}.jsonl"
     )
+    checkpoint = JobCheckpoint(checkpoint_path)
 
     user_ids = _list_active_user_ids()
     print("=== Job: GenerateMealRecommendations ===")
-    print(f"target users: {len(user_ids)}")
+    print(f"active users: {len(user_ids)}")
+    print(f"shard       : {shard}")
+    print(f"concurrency : {args.concurrency}")
     print(f"base_date   : {base_date.isoformat() if base_date else '(today)'}")
+    print(f"checkpoint  : {checkpoint.path} (done: {checkpoint.done_count()})")
     print()
 
-    for uid in user_ids:
-        print(f"[User] {uid.value} ... ", end="", flush=True)
-        try:
-            input_dto = GenerateMealRecommendationInput(
-                user_id=uid,
-                base_date=base_date,
-            )
-            rec = use_case.execute(input_dto)
-        except DailyLogProfileNotFoundError:
-            print("SKIP (no profile)")
-        except NotEnoughDailyReportsError:
-            print("SKIP (not enough daily reports)")
-        except MealRecommendationAlreadyExistsError:
-            print("SKIP (already exists)")
-        except Exception as e:
-            print(f"ERROR ({type(e).__name__}: {e})")
-        else:
-            print(f"OK (generated for {rec.generated_for_date})")
+    report = generate_meal_recommendations(
+        user_ids,
+        get_generate_meal_recommendation_use_case,
+        base_date=base_date,
+        shard=shard,
+        concurrency=args.concurrency,
+        checkpoint=checkpoint,
+    )
+    print()
+    for line in report.lines():
+        print(line)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import argparse
+from datetime import date as DateType
+from datetime import timedelta
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+from app.application.nutrition.use_cases.compute_daily_nutrition import (
+    RebuildDailyNutritionSummariesUseCase,
+)
+from app.di.container import get_rebuild_daily_nutrition_summaries_use_case
+
+# プロジェクトルート（backend/）を基準に .env を読む
+BASE_DIR = Path(__file__).resolve().parent.parent
+load_dotenv(BASE_DIR / ".env")
+
+
+def _parse_args() -> argparse.Namespace:
+    today = DateType.today()
+    parser = argparse.ArgumentParser(
+        description=(
+            "DailyNutritionSummary を MealNutritionSummary から全再計算する"
+            "（差分更新のずれの修復 / 検証）"
+        )
+    )
+    parser.add_argument(
+        "--from",
+        dest="start_date",
+        type=DateType.fromisoformat,
+        default=today - timedelta(days=30),
+        help="開始日 (YYYY-MM-DD, 既定: 30 日前)",
+    )
+    parser.add_argument(
+        "--to",
+        dest="end_date",
+        type=DateType.fromisoformat,
+        default=today,
+        help="終了日 (YYYY-MM-DD, 既定: 今日)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="保存せず、ずれている件数だけ数える",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+
+    use_case: RebuildDailyNutritionSummariesUseCase = (
+        get_rebuild_daily_nutrition_summaries_use_case()
+    )
+
+    print("=== Job: RebuildDailyNutritionSummaries ===")
+    print(f"range  : {args.start_date.isoformat()} .. {args.end_date.isoformat()}")
+    print(f"dry_run: {args.dry_run}")
+    print()
+
+    result = use_case.execute(
+        args.start_date,
+        args.end_date,
+        dry_run=args.dry_run,
+    )
+
+    print(f"checked: {result.checked}")
+    print(f"drifted: {result.drifted}")
+    print(f"fixed  : {result.fixed}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import argparse
+from datetime import date as DateType
+from datetime import timedelta
+from pathlib import Path
+from typing import Callable
+
+from dotenv import load_dotenv
+from sqlalchemy.orm import Session
+
+from app.infra.db.repositories.user_day_rollup_repository import (
+    SqlAlchemyUserDayRollupRepository,
+)
+from app.infra.db.session import create_session
+
+# プロジェクトルート（backend/）を基準に .env を読む
+BASE_DIR = Path(__file__).resolve().parent.parent
+load_dotenv(BASE_DIR / ".env")
+
+
+def rebuild_user_day_rollups(
+    session_factory: Callable[[], Session],
+    start_date: DateType,
+    end_date: DateType,
+    *,
+    batch_size: int,
+) -> int:
+    """
+    [start_date, end_date] の user_day_rollups を元テーブルから作り直す。
+
+    - 1 日ずつの再計算は書き込み時と同じ処理なので、何度実行しても同じ結果になる。
+    - batch_size 日分ごとにコミットする（途中で止めても再実行すればよい）。
+    - 戻り値は再計算した (user_id, date) の数。
+    """
+    with session_factory() as session:
+        days = SqlAlchemyUserDayRollupRepository(session).list_candidate_days(
+            start_date, end_date
+        )
+
+    for i in range(0, len(days), batch_size):
+        with session_factory() as session:
+            repo = SqlAlchemyUserDayRollupRepository(session)
+            for user_id, date_ in days[i:i + batch_size]:
+                repo.refresh(user_id, date_)
+            session.commit()
+    return len(days)
+
+
+def _parse_args() -> argparse.Namespace:
+    today = DateType.today()
+    parser = argparse.ArgumentParser(
+        description="カレンダー用の user_day_rollups を元テーブルから再構築する（バックフィル / 修復）"
+    )
+    parser.add_argument(
+        "--from",
+        dest="start_date",
+        type=DateType.fromisoformat,
+        default=today - timedelta(days=365),
+        help="開始日 (YYYY-MM-DD, 既定: 365 日前)",
+    )
+    parser.add_argument(
+        "--to",
+        dest="end_date",
+        type=DateType.fromisoformat,
+        default=today,
+        help="終了日 (YYYY-MM-DD, 既定: 今日)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=500,
+        help="1 トランザクションで再計算する日数 (既定: 500)",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+
+    print("=== Job: RebuildUserDayRollups ===")
+    print(f"range     : {args.start_date.isoformat()} .. {args.end_date.isoformat()}")
+    print(f"batch_size: {args.batch_size}")
+    print()
+
+    count = rebuild_user_day_rollups(
+        create_session,
+        args.start_date,
+        args.end_date,
+        batch_size=args.batch_size,
+    )
+    print(f"refreshed: {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import logging
+from contextlib import asynccontextmanager
+from dataclasses import asdict
 from app.settings import settings
 from pathlib import Path
 
@@ -16,6 +18,16 @@ from app.domain.profile import errors as profile_domain_errors
 from app.application.target import errors as target_app_errors
 from app.domain.target import errors as target_domain_errors
 from app.domain.calendar import errors as calendar_domain_errors
+from app.api.http.db_session_middleware import RequestSessionScopeMiddleware
+from app.api.http.read_replica_middleware import ReadReplicaStickinessMiddleware
+from app.infra.db.async_session import async_pool_stats, dispose_async_engine
+from app.di.container import (
+    shutdown_daily_nutrition_recompute_scheduler,
+    shutdown_profile_image_processor,
+    start_profile_image_storage_warmup,
+)
+from app.infra.db.base import pool_stats
+from app.infra.storage.minio_client import object_storage_stats
 from app.api.http.errors import auth_error_handler, validation_error_handler
 from app.api.http.errors import profile_domain_error_handler
 from app.api.http.errors import target_error_handler, target_domain_error_handler
@@ -33,6 +45,7 @@ from app.api.http.routers.calendar_route import router as calendar_router
 from app.api.http.routers.billing_route import router as billing_router
 from app.api.http.routers.tutorial_route import router as tutorial_router
 from app.api.http.routers.meal_recommendation_route import router as meal_recommendation_router
+from app.api.http.routers.day_route import router as day_router
 
 
 def configure_logging() -> None:
@@ -42,6 +55,19 @@ def configure_logging() -> None:
     )
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # バケット確認をバックグラウンドで始めておく（起動は待たない）
+    start_profile_image_storage_warmup()
+    yield
+    # async ルート用エンジン（ASYNC_DATABASE_URL）を作っていれば接続を閉じる
+    await dispose_async_engine()
+    # サムネイル生成のプロセスプールを起動していれば止める
+    shutdown_profile_image_processor()
+    # 遅らせている栄養サマリの計算を済ませてから止める
+    shutdown_daily_nutrition_recompute_scheduler()
+
+
 def create_app() -> FastAPI:
     # Load environment variables from .env file
     env_path = Path(__file__).parent.parent / ".env"
@@ -51,6 +77,7 @@ def create_app() -> FastAPI:
     app = FastAPI(
         title="Nutrition Backend",
         version="0.1.0",
+        lifespan=lifespan,
     )
 
     # --- CORS設定 追加ここから ---
@@ -73,10 +100,36 @@ def create_app() -> FastAPI:
     )
     # --- CORS設定 追加ここまで ---
 
+    # リクエスト単位で DB Session / トランザクションを共有する
+    if settings.DB_REQUEST_SCOPED_SESSION:
+        app.add_middleware(RequestSessionScopeMiddleware)
+
+    # 読み取りレプリカ使用時、直前に書き込んだクライアントの読み取りはプライマリへ
+    if settings.DATABASE_REPLICA_URL:
+        app.add_middleware(
+            ReadReplicaStickinessMiddleware,
+            sticky_seconds=settings.DB_REPLICA_STICKY_SECONDS,
+        )
+
     @app.get("/api/v1/health")
     def health() -> dict:
         return {"status": "ok"}
 
+    @app.get("/api/v1/health/db")
+    def health_db() -> dict:
+        # プライマリ / レプリカ / async のコネクションプールの状況
+        stats = {name: asdict(s) for name, s in pool_stats().items()}
+        async_stats = async_pool_stats()
+        if async_stats is not None:
+            stats["async"] = asdict(async_stats)
+        return stats
+
+    @app.get("/api/v1/health/storage")
+    def health_storage() -> dict:
+        # オブジェクトストレージの接続プール / レイテンシ / バケット確認の結果
+        stats = object_storage_stats()
+        return asdict(stats) if stats is not None else {}
+
     @app.get("/health/one-more")
     def health_one_more() -> dict:
         return {"status": "ok one more"}
@@ -91,6 +144,7 @@ def create_app() -> FastAPI:
     app.include_router(billing_router, prefix="/api/v1")
     app.include_router(tutorial_router, prefix="/api/v1")
     app.include_router(meal_recommendation_router, prefix="/api/v1")
+    app.include_router(day_router, prefix="/api/v1")
     app.add_exception_handler(auth_errors.AuthError, auth_error_handler)
     app.add_exception_handler(RequestValidationError, validation_error_handler)
     app.add_exception_handler(
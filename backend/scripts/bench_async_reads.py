@@ -0,0 +1,156 @@
+# backend/scripts/bench_async_reads.py
+"""
+参照系エンドポイントのスループットを、同時接続数を固定して計測する。
+同期 UoW（スレッドプール）と async UoW（ASYNC_DATABASE_URL）の比較用。
+
+    # 1) 同期: ASYNC_DATABASE_URL なしでサーバを起動
+    uv run uvicorn app.main:app --port 8000
+    uv run python -m scripts.bench_async_reads --token "$ACCESS_TOKEN" \\
+        --concurrency 500 --requests 20000
+
+    # 2) async: ASYNC_DATABASE_URL=postgresql+asyncpg://... を付けて起動し、同じコマンド
+
+- 対象は GET /calendar/monthly-summary・/calendar/range・/nutrition/meal（--path で変更可）。
+- アクセストークンは Cookie (ACCESS_TOKEN) で送る。ユーザーはプレミアム状態にしておくこと。
+- 結果は req/s と p50 / p95 / p99 レイテンシ、ステータス別の件数。
+- /api/v1/health/db のプール状況（checkouts / connects）も前後で表示する。
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections import Counter
+
+import httpx
+
+from app.api.http.cookies import ACCESS_COOKIE_NAME
+
+DEFAULT_PATHS = [
+    "/api/v1/calendar/monthly-summary?year=2025&month=1",
+    "/api/v1/calendar/range?from=2025-01-01&to=2025-12-31",
+    "/api/v1/nutrition/meal?date=2025-01-10&meal_type=main&meal_index=1",
+]
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def _worker(
+    client: httpx.AsyncClient,
+    paths: list[str],
+    queue: asyncio.Queue[int],
+    latencies: list[float],
+    statuses: Counter[str],
+) -> None:
+    while True:
+        try:
+            i = queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+        path = paths[i % len(paths)]
+        start = time.perf_counter()
+        try:
+            response = await client.get(path)
+            statuses[str(response.status_code)] += 1
+        except httpx.HTTPError as e:
+            statuses[type(e).__name__] += 1
+            continue
+        latencies.append((time.perf_counter() - start) * 1000)
+
+
+async def _pool_stats(client: httpx.AsyncClient) -> dict:
+    try:
+        return (await client.get("/api/v1/health/db")).json()
+    except (httpx.HTTPError, ValueError):
+        return {}
+
+
+async def run(
+    *,
+    base_url: str,
+    token: str,
+    paths: list[str],
+    concurrency: int,
+    requests: int,
+) -> None:
+    limits = httpx.Limits(
+        max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(
+        base_url=base_url,
+        cookies={ACCESS_COOKIE_NAME: token} if token else None,
+        limits=limits,
+        timeout=60.0,
+    ) as client:
+        before = await _pool_stats(client)
+
+        queue: asyncio.Queue[int] = asyncio.Queue()
+        for i in range(requests):
+            queue.put_nowait(i)
+        latencies: list[float] = []
+        statuses: Counter[str] = Counter()
+
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(
+                _worker(client, paths, queue, latencies, statuses)
+                for _ in range(concurrency)
+            )
+        )
+        elapsed = time.perf_counter() - start
+
+        after = await _pool_stats(client)
+
+    print(f"concurrency={concurrency} requests={requests} elapsed={elapsed:.2f}s")
+    print(f"throughput: {requests / elapsed:,.0f} req/s")
+    if latencies:
+        print(
+            "latency ms: "
+            f"mean={statistics.fmean(latencies):.1f} "
+            f"p50={_percentile(latencies, 50):.1f} "
+            f"p95={_percentile(latencies, 95):.1f} "
+            f"p99={_percentile(latencies, 99):.1f}"
+        )
+    print("status:", dict(sorted(statuses.items())))
+    for name, stats in after.items():
+        prev = before.get(name, {})
+        print(
+            f"pool[{name}]: size={stats.get('size')} "
+            f"checkouts=+{stats.get('checkouts', 0) - prev.get('checkouts', 0)} "
+            f"connects=+{stats.get('connects', 0) - prev.get('connects', 0)}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--token", default="", help="ACCESS_TOKEN Cookie の値")
+    parser.add_argument(
+        "--path",
+        action="append",
+        dest="paths",
+        help="計測するパス（複数指定可。省略時は参照系 3 本を順番に叩く）",
+    )
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    asyncio.run(
+        run(
+            base_url=args.base_url,
+            token=args.token,
+            paths=args.paths or DEFAULT_PATHS,
+            concurrency=args.concurrency,
+            requests=args.requests,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
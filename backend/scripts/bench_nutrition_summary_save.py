@@ -0,0 +1,200 @@
+# backend/scripts/bench_nutrition_summary_save.py
+"""
+MealNutritionSummary の保存にかかる SQL 文数と時間を、
+旧実装（ORM で SELECT → nutrients.clear() → 10 件 append）と
+現在の set-based upsert (INSERT ... ON CONFLICT) で比較する。
+upsert は NUTRIENT_STORAGE_MODE の rows / compact の両方を計測する。
+
+    uv run python -m scripts.bench_nutrition_summary_save --iterations 500
+
+- BENCH_DATABASE_URL が無ければ SQLite (in-memory) で実行する。
+- Postgres を指定する場合は、マイグレーション済みのスキーマを使い、
+  作成した行は最後に削除する（users への FK があるので既存ユーザー ID を渡す）。
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from datetime import date as DateType
+from datetime import timedelta
+from uuid import UUID, uuid4
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Session, selectinload, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.domain.auth.value_objects import UserId
+from app.domain.meal.value_objects import MealType
+from app.domain.nutrition.meal_nutrition import MealNutritionSummary
+from app.domain.target.value_objects import (
+    ALL_NUTRIENT_CODES,
+    NutrientAmount,
+    NutrientSource,
+)
+from app.infra.db.models.meal_nutrition import (
+    MealNutritionNutrientModel,
+    MealNutritionSummaryModel,
+)
+from app.infra.db.nutrient_storage import NutrientStorageMode
+from app.infra.db.repositories.meal_nutrition_repository import (
+    SqlAlchemyMealNutritionSummaryRepository,
+)
+
+
+def _legacy_save(session: Session, summary: MealNutritionSummary) -> None:
+    """変更前のリポジトリ実装と同じ書き方。"""
+    model = (
+        session.query(MealNutritionSummaryModel)
+        .options(selectinload(MealNutritionSummaryModel.nutrients))
+        .filter(MealNutritionSummaryModel.id == summary.id.value)
+        .one_or_none()
+    )
+    if model is None:
+        model = MealNutritionSummaryModel(
+            id=summary.id.value,
+            user_id=UUID(summary.user_id.value),
+            date=summary.date,
+            meal_type=summary.meal_type.value,
+            meal_index=summary.meal_index,
+            generated_at=summary.generated_at,
+            updated_at=summary.generated_at,
+            nutrients=[],
+        )
+        session.add(model)
+    model.nutrients.clear()
+    for n in summary.nutrients:
+        model.nutrients.append(
+            MealNutritionNutrientModel(
+                summary_id=model.id,
+                code=n.code.value,
+                amount_value=n.amount.value,
+                amount_unit=n.amount.unit,
+                source=n.source.value,
+            )
+        )
+
+
+def _summary(
+    user_id: UserId, day: DateType, value: float, summary_id=None
+) -> MealNutritionSummary:
+    return MealNutritionSummary.from_nutrient_amounts(
+        user_id=user_id,
+        date=day,
+        meal_type=MealType.MAIN,
+        meal_index=1,
+        nutrients=[
+            (code, NutrientAmount(value=value, unit="g"))
+            for code in ALL_NUTRIENT_CODES
+        ],
+        source=NutrientSource("llm"),
+        summary_id=summary_id,
+    )
+
+
+def _run(
+    label: str,
+    factory,
+    user_id: UserId,
+    iterations: int,
+    save,
+    base_day: DateType,
+) -> None:
+    calls = 0
+    statements = 0
+
+    def _count(conn, cursor, statement, parameters, context, executemany) -> None:
+        # executemany は DB ドライバによっては行数分の文になるので展開して数える
+        nonlocal calls, statements
+        calls += 1
+        statements += len(parameters) if executemany else 1
+
+    engine = factory.kw["bind"]
+
+    # 1 回目は insert、2 回目（計測対象）は同じスロットの上書き
+    ids = []
+    with factory() as session:
+        for i in range(iterations):
+            s = _summary(user_id, base_day + timedelta(days=i), 1.0)
+            save(session, s)
+            ids.append(s.id)
+        session.commit()
+
+    sa.event.listen(engine, "before_cursor_execute", _count)
+    started = time.perf_counter()
+    for i in range(iterations):
+        with factory() as session:
+            save(session, _summary(user_id, base_day + timedelta(days=i), 2.0, ids[i]))
+            session.commit()
+    elapsed = time.perf_counter() - started
+    sa.event.remove(engine, "before_cursor_execute", _count)
+
+    print(
+        f"{label:>14}: {calls / iterations:5.1f} DB calls/save, "
+        f"{statements / iterations:5.1f} statements/save (executemany expanded), "
+        f"{elapsed / iterations * 1000:7.3f} ms/save"
+    )
+
+    with factory() as session:
+        session.execute(
+            sa.delete(MealNutritionSummaryModel).where(
+                MealNutritionSummaryModel.id.in_([i.value for i in ids])
+            )
+        )
+        session.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument(
+        "--user-id",
+        default=None,
+        help="Postgres で実行する場合の既存ユーザー ID（FK 用）",
+    )
+    args = parser.parse_args()
+
+    url = os.getenv("BENCH_DATABASE_URL")
+    if url:
+        engine = sa.create_engine(url)
+    else:
+        engine = sa.create_engine(
+            "sqlite+pysqlite:///:memory:",
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+        )
+        MealNutritionSummaryModel.__table__.create(engine)
+        MealNutritionNutrientModel.__table__.create(engine)
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+    user_id = UserId(args.user_id or str(uuid4()))
+
+    print("=== Bench: MealNutritionSummary save ===")
+    print(f"database  : {engine.url.render_as_string(hide_password=True)}")
+    print(f"iterations: {args.iterations}")
+    print()
+
+    _run(
+        "legacy",
+        factory,
+        user_id,
+        args.iterations,
+        _legacy_save,
+        DateType(2000, 1, 1),
+    )
+    for offset, mode in enumerate(
+        (NutrientStorageMode.ROWS, NutrientStorageMode.COMPACT), start=1
+    ):
+        _run(
+            f"upsert/{mode.value}",
+            factory,
+            user_id,
+            args.iterations,
+            lambda session, s, mode=mode: SqlAlchemyMealNutritionSummaryRepository(
+                session, mode
+            ).save(s),
+            DateType(2000 + offset, 1, 1),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from typing import List, Dict
 from app.application.calendar.ports.calendar_repository_port import CalendarRepositoryPort
-from app.application.calendar.dto.calendar_dto import MonthlyCalendarDto
+from app.application.calendar.dto.calendar_dto import CalendarRangeDto, MonthlyCalendarDto
 from app.domain.calendar.entities import CalendarDaySnapshot
 
 
@@ -90,4 +90,23 @@ class InMemoryCalendarRepository(CalendarRepositoryPort):
             else:
                 current_date = date(current_date.year, current_date.month, current_date.day + 1)
 
-        return days
\ No newline at end of file
+        return days
+
+    def get_range_summary(
+        self,
+        request: CalendarRangeDto
+    ) -> List[CalendarDaySnapshot]:
+        """指定期間（両端を含む）の日次スナップショット一覧を取得"""
+        days = []
+        current_date = request.start_date
+        while current_date <= request.end_date:
+            date_str = current_date.strftime('%Y-%m-%d')
+            days.append(CalendarDaySnapshot(
+                date=date_str,
+                has_meal_logs=self._meal_logs.get((request.user_id, date_str), False),
+                nutrition_achievement=self._nutrition_achievements.get(
+                    (request.user_id, date_str)),
+                has_daily_report=self._daily_reports.get((request.user_id, date_str), False)
+            ))
+            current_date += timedelta(days=1)
+        return days
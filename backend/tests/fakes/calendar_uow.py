@@ -1,4 +1,8 @@
-from app.application.calendar.ports.calendar_unit_of_work_port import CalendarUnitOfWorkPort
+from app.application.calendar.ports.calendar_repository_port import AsyncCalendarRepositoryPort
+from app.application.calendar.ports.calendar_unit_of_work_port import (
+    AsyncCalendarUnitOfWorkPort,
+    CalendarUnitOfWorkPort,
+)
 from tests.fakes.calendar_repositories import InMemoryCalendarRepository
 
 
@@ -15,4 +19,32 @@ class FakeCalendarUnitOfWork(CalendarUnitOfWorkPort):
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self._entered = False
-        # Fakeなので実際のトランザクション処理は不要
\ No newline at end of file
+        # Fakeなので実際のトランザクション処理は不要
+
+
+class _AsyncInMemoryCalendarRepository(AsyncCalendarRepositoryPort):
+    """InMemoryCalendarRepository を async ポートとして見せるラッパー"""
+
+    def __init__(self, inner: InMemoryCalendarRepository):
+        self._inner = inner
+
+    async def get_monthly_summary(self, request):
+        return self._inner.get_monthly_summary(request)
+
+    async def get_range_summary(self, request):
+        return self._inner.get_range_summary(request)
+
+
+class FakeAsyncCalendarUnitOfWork(AsyncCalendarUnitOfWorkPort):
+    """カレンダー Unit of Work（async 版）のフェイク実装"""
+
+    def __init__(self, calendar_repo: InMemoryCalendarRepository):
+        self.calendar_repo = _AsyncInMemoryCalendarRepository(calendar_repo)
+        self.entered_count = 0
+
+    async def __aenter__(self):
+        self.entered_count += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
@@ -5,6 +5,7 @@ from typing import Dict
 from app.application.profile.ports.profile_repository_port import ProfileRepositoryPort
 from app.domain.profile.entities import Profile
 from app.domain.auth.value_objects import UserId
+from app.domain.profile.value_objects import ProfileImageId
 
 
 class InMemoryProfileRepository(ProfileRepositoryPort):
@@ -25,6 +26,15 @@ class InMemoryProfileRepository(ProfileRepositoryPort):
         self._profiles[profile.user_id.value] = profile
         return profile
 
+    def attach_thumbnails(
+        self,
+        user_id: UserId,
+        image_id: ProfileImageId,
+        thumbnails: dict[int, ProfileImageId],
+    ) -> bool:
+        profile = self._profiles.get(user_id.value)
+        return profile is not None and profile.attach_thumbnails(image_id, thumbnails)
+
     # テスト専用: 状態リセット用
     def clear(self) -> None:
         self._profiles.clear()
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Callable
+
 from app.application.profile.ports.uow_port import ProfileUnitOfWorkPort
 from app.application.profile.ports.profile_repository_port import ProfileRepositoryPort
 from tests.fakes.profile_repositories import InMemoryProfileRepository
@@ -11,19 +13,28 @@ class FakeProfileUnitOfWork(ProfileUnitOfWorkPort):
 
     - トランザクション管理はダミー（commit/rollback はフラグを持つだけ）。
     - profile_repo に InMemoryProfileRepository を持つ。
+    - after_commit() の callback は with ブロックを例外なく抜けたときに呼ぶ。
     """
 
     def __init__(self, profile_repo: InMemoryProfileRepository | None = None) -> None:
         self.profile_repo: ProfileRepositoryPort = profile_repo or InMemoryProfileRepository()
         self._committed = False
+        self._after_commit: list[Callable[[], None]] = []
 
     def __enter__(self) -> "FakeProfileUnitOfWork":
         self._committed = False
+        self._after_commit = []
         return self
 
     def __exit__(self, exc_type, exc, tb) -> None:
         # 本番の UoW のような commit/rollback はここでは何もしない
-        pass
+        callbacks, self._after_commit = self._after_commit, []
+        if exc_type is None:
+            for callback in callbacks:
+                callback()
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        self._after_commit.append(callback)
 
     def commit(self) -> None:
         self._committed = True
@@ -0,0 +1,380 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Sequence
+from datetime import date, datetime, timezone
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.application.auth.ports.plan_checker_port import PlanCheckerPort
+from app.application.auth.ports.token_service_port import TokenPair, TokenPayload
+from app.application.auth.use_cases.current_user.get_current_user import (
+    GetCurrentUserUseCase,
+)
+from app.application.day.ports.uow_port import DayReadUnitOfWorkPort
+from app.application.day.use_cases.get_day_overview import GetDayOverviewUseCase
+from app.application.nutrition.ports.recommendation_repository_port import (
+    MealRecommendationRepositoryPort,
+)
+from app.di.container import (
+    get_current_user_use_case,
+    get_get_day_overview_use_case,
+    get_token_service,
+)
+from app.domain.auth.entities import User
+from app.domain.auth.errors import PremiumFeatureRequiredError
+from app.domain.auth.value_objects import EmailAddress, TrialInfo, UserId, UserPlan
+from app.domain.meal.entities import FoodEntry
+from app.domain.meal.value_objects import FoodEntryId, MealType
+from app.domain.nutrition.daily_nutrition import (
+    DailyNutritionSummary,
+    DailyNutritionSummaryId,
+)
+from app.domain.nutrition.daily_report import DailyNutritionReport
+from app.domain.nutrition.meal_recommendation import MealRecommendation
+from app.domain.target.entities import DailyTargetSnapshot
+from app.domain.target.value_objects import TargetId
+from app.main import create_app
+from tests.fakes.auth_repositories import InMemoryUserRepository
+from tests.fakes.auth_services import FakePasswordHasher, FakeTokenService, FixedClock
+from tests.fakes.auth_uow import FakeAuthUnitOfWork
+from tests.integration.api.test_meal_route import FakeFoodEntryRepository
+from tests.unit.application.nutrition.fakes import (
+    FakeDailyNutritionReportRepository,
+    FakeDailyNutritionRepository,
+    FakeMealNutritionRepository,
+    FakePlanChecker,
+)
+from tests.unit.application.target.fakes import (
+    FakeTargetRepository,
+    FakeTargetSnapshotRepository,
+    make_target,
+)
+
+TEST_USER_ID = uuid.UUID("12345678-1234-5678-1234-567812345678")
+TARGET_DATE = date(2024, 1, 1)
+
+
+# =====================================================================
+# Fake Implementations
+# =====================================================================
+
+
+class FakeMealRecommendationRepository(MealRecommendationRepositoryPort):
+    """インメモリのMealRecommendationRepository（読み取りのみ）"""
+
+    def __init__(self) -> None:
+        self.items: list[MealRecommendation] = []
+
+    def get_by_user_and_date(
+        self,
+        user_id: UserId,
+        generated_for_date: date,
+    ) -> MealRecommendation | None:
+        for rec in self.items:
+            if rec.user_id == user_id and rec.generated_for_date == generated_for_date:
+                return rec
+        return None
+
+    def list_recent_by_user(
+        self, user_id: UserId, limit: int
+    ) -> Sequence[MealRecommendation]:
+        return [rec for rec in self.items if rec.user_id == user_id][:limit]
+
+
+class FakeDayReadUnitOfWork(DayReadUnitOfWorkPort):
+    """インメモリのDayReadUnitOfWork"""
+
+    def __init__(self) -> None:
+        self.food_entry_repo = FakeFoodEntryRepository()
+        self.meal_nutrition_repo = FakeMealNutritionRepository()
+        self.daily_nutrition_repo = FakeDailyNutritionRepository()
+        self.daily_report_repo = FakeDailyNutritionReportRepository()
+        self.meal_recommendation_repo = FakeMealRecommendationRepository()
+        self.target_repo = FakeTargetRepository()
+        self.target_snapshot_repo = FakeTargetSnapshotRepository()
+        self.enter_count = 0
+
+    def __enter__(self) -> "FakeDayReadUnitOfWork":
+        self.enter_count += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        pass
+
+
+class FreePlanChecker(PlanCheckerPort):
+    """常にプレミアム機能を拒否するFake実装"""
+
+    def ensure_premium_feature(self, user_id: UserId) -> None:
+        raise PremiumFeatureRequiredError("premium required")
+
+
+# =====================================================================
+# Fixtures
+# =====================================================================
+
+
+@pytest.fixture
+def user_repo() -> InMemoryUserRepository:
+    return InMemoryUserRepository()
+
+
+@pytest.fixture
+def token_service() -> FakeTokenService:
+    return FakeTokenService()
+
+
+@pytest.fixture
+def clock() -> FixedClock:
+    return FixedClock()
+
+
+@pytest.fixture
+def day_uow() -> FakeDayReadUnitOfWork:
+    return FakeDayReadUnitOfWork()
+
+
+@pytest.fixture
+def plan_checker() -> PlanCheckerPort:
+    return FakePlanChecker()
+
+
+@pytest.fixture
+def app(
+    user_repo: InMemoryUserRepository,
+    token_service: FakeTokenService,
+    day_uow: FakeDayReadUnitOfWork,
+    plan_checker: PlanCheckerPort,
+) -> FastAPI:
+    app = create_app()
+
+    current_user_use_case = GetCurrentUserUseCase(
+        uow=FakeAuthUnitOfWork(user_repo=user_repo),
+    )
+    day_overview_use_case = GetDayOverviewUseCase(
+        uow=day_uow,
+        plan_checker=plan_checker,
+    )
+
+    app.dependency_overrides[get_current_user_use_case] = lambda: current_user_use_case
+    app.dependency_overrides[get_token_service] = lambda: token_service
+    app.dependency_overrides[
+        get_get_day_overview_use_case
+    ] = lambda: day_overview_use_case
+    return app
+
+
+@pytest.fixture
+def client(app: FastAPI) -> TestClient:
+    return TestClient(app)
+
+
+@pytest.fixture
+def authenticated_user(
+    user_repo: InMemoryUserRepository,
+    token_service: FakeTokenService,
+    clock: FixedClock,
+) -> tuple[User, TokenPair]:
+    user = User(
+        id=UserId(str(TEST_USER_ID)),
+        email=EmailAddress("test@example.com"),
+        hashed_password=FakePasswordHasher().hash("password123"),
+        name="Test User",
+        plan=UserPlan.TRIAL,
+        trial_info=TrialInfo(trial_ends_at=None),
+        has_profile=False,
+        created_at=clock.now(),
+    )
+    user_repo.save(user)
+    tokens = token_service.issue_tokens(
+        TokenPayload(user_id=str(TEST_USER_ID), plan=UserPlan.TRIAL)
+    )
+    return user, tokens
+
+
+def _add_entry(day_uow: FakeDayReadUnitOfWork, user_id: UserId, name: str) -> None:
+    now = datetime.now(timezone.utc)
+    day_uow.food_entry_repo.add(
+        FoodEntry(
+            id=FoodEntryId.new(),
+            user_id=user_id,
+            date=TARGET_DATE,
+            meal_type=MealType.MAIN,
+            meal_index=1,
+            name=name,
+            amount_value=200.0,
+            amount_unit="g",
+            serving_count=None,
+            note=None,
+            created_at=now,
+            updated_at=now,
+            deleted_at=None,
+        )
+    )
+
+
+# =====================================================================
+# Tests
+# =====================================================================
+
+
+class TestGetDayOverview:
+    """GET /days/{date} のテスト"""
+
+    def test_returns_whole_day_in_one_uow(
+        self,
+        client: TestClient,
+        day_uow: FakeDayReadUnitOfWork,
+        authenticated_user: tuple[User, TokenPair],
+    ):
+        user, tokens = authenticated_user
+        now = datetime.now(timezone.utc)
+        _add_entry(day_uow, user.id, "Rice")
+        day_uow.daily_nutrition_repo.save(
+            DailyNutritionSummary(
+                id=DailyNutritionSummaryId.new(),
+                user_id=user.id,
+                date=TARGET_DATE,
+                generated_at=now,
+            )
+        )
+        day_uow.daily_report_repo.save(
+            DailyNutritionReport.create(
+                user_id=user.id,
+                date=TARGET_DATE,
+                summary="good day",
+                good_points=["protein"],
+                improvement_points=[],
+                tomorrow_focus=[],
+                created_at=now,
+            )
+        )
+        day_uow.meal_recommendation_repo.items.append(
+            MealRecommendation.create(
+                user_id=user.id,
+                generated_for_date=TARGET_DATE,
+                body="eat vegetables",
+                tips=["salad"],
+                recommended_meals=[],
+                created_at=now,
+            )
+        )
+        active = make_target(user.id.value, is_active=True)
+        day_uow.target_repo.add(active)
+
+        response = client.get(
+            "/api/v1/days/2024-01-01",
+            cookies={"ACCESS_TOKEN": tokens.access_token},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["ETag"].startswith('W/"')
+        assert response.headers["Cache-Control"] == "private, no-cache"
+        data = response.json()
+        assert data["date"] == "2024-01-01"
+        assert data["is_premium"] is True
+        assert [item["name"] for item in data["items"]] == ["Rice"]
+        assert data["meal_summaries"] == []
+        assert data["daily_summary"]["date"] == "2024-01-01"
+        assert data["report"]["summary"] == "good day"
+        assert data["recommendation"]["body"] == "eat vegetables"
+        assert data["target"]["source"] == "active"
+        assert data["target"]["target_id"] == active.id.value
+        assert day_uow.enter_count == 1
+
+    def test_prefers_target_snapshot_of_the_day(
+        self,
+        client: TestClient,
+        day_uow: FakeDayReadUnitOfWork,
+        authenticated_user: tuple[User, TokenPair],
+    ):
+        user, tokens = authenticated_user
+        active = make_target(user.id.value, is_active=True)
+        day_uow.target_repo.add(active)
+        snapshot_target_id = str(uuid.uuid4())
+        day_uow.target_snapshot_repo.add(
+            DailyTargetSnapshot(
+                user_id=user.id,
+                date=TARGET_DATE,
+                target_id=TargetId(snapshot_target_id),
+                nutrients=tuple(active.nutrients),
+                created_at=datetime.now(timezone.utc),
+            )
+        )
+
+        response = client.get(
+            "/api/v1/days/2024-01-01",
+            cookies={"ACCESS_TOKEN": tokens.access_token},
+        )
+
+        assert response.status_code == 200
+        target = response.json()["target"]
+        assert target["source"] == "snapshot"
+        assert target["target_id"] == snapshot_target_id
+
+    def test_if_none_match_returns_304_until_day_changes(
+        self,
+        client: TestClient,
+        day_uow: FakeDayReadUnitOfWork,
+        authenticated_user: tuple[User, TokenPair],
+    ):
+        user, tokens = authenticated_user
+        cookies = {"ACCESS_TOKEN": tokens.access_token}
+        _add_entry(day_uow, user.id, "Rice")
+
+        first = client.get("/api/v1/days/2024-01-01", cookies=cookies)
+        etag = first.headers["ETag"]
+
+        cached = client.get(
+            "/api/v1/days/2024-01-01",
+            cookies=cookies,
+            headers={"If-None-Match": etag},
+        )
+        assert cached.status_code == 304
+        assert cached.headers["ETag"] == etag
+        assert cached.content == b""
+
+        _add_entry(day_uow, user.id, "Miso soup")
+        changed = client.get(
+            "/api/v1/days/2024-01-01",
+            cookies=cookies,
+            headers={"If-None-Match": etag},
+        )
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etag
+        assert len(changed.json()["items"]) == 2
+
+    @pytest.mark.parametrize("plan_checker", [FreePlanChecker()])
+    def test_non_premium_user_gets_no_nutrition(
+        self,
+        client: TestClient,
+        day_uow: FakeDayReadUnitOfWork,
+        authenticated_user: tuple[User, TokenPair],
+    ):
+        user, tokens = authenticated_user
+        _add_entry(day_uow, user.id, "Rice")
+
+        response = client.get(
+            "/api/v1/days/2024-01-01",
+            cookies={"ACCESS_TOKEN": tokens.access_token},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["is_premium"] is False
+        assert data["meal_summaries"] == []
+        assert data["daily_summary"] is None
+        assert len(data["items"]) == 1
+
+    def test_unauthorized(self, client: TestClient):
+        response = client.get("/api/v1/days/2024-01-01")
+        assert response.status_code == 401
@@ -14,6 +14,7 @@ from app.di.container import (
     get_compute_daily_nutrition_summary_use_case,
     get_create_food_entry_use_case,
     get_current_user_use_case,
+    get_daily_nutrition_recompute_scheduler,
     get_delete_food_entry_use_case,
     get_list_food_entries_by_date_use_case,
     get_meal_uow,
@@ -35,6 +36,9 @@ from app.application.meal.use_cases.update_food_entry import UpdateFoodEntryUseC
 from app.application.nutrition.use_cases.compute_daily_nutrition import (
     ComputeDailyNutritionSummaryUseCase,
 )
+from app.application.nutrition.use_cases.compute_meal_nutrition import (
+    ComputeMealNutritionUseCase,
+)
 from app.application.meal.ports.food_entry_repository_port import (
     FoodEntryRepositoryPort,
 )
@@ -51,6 +55,11 @@ from app.domain.meal.entities import FoodEntry
 from app.domain.meal.value_objects import FoodEntryId, MealType
 from app.domain.nutrition.meal_nutrition import MealNutritionSummary
 from app.domain.nutrition.daily_nutrition import DailyNutritionSummary
+from app.infra.meal.meal_entry_query_service import MealEntryQueryService
+from app.infra.nutrition.daily_recompute_scheduler import (
+    DebouncedDailyNutritionRecomputeScheduler,
+)
+from app.infra.nutrition.estimator_stub import StubNutritionEstimator
 from tests.fakes.auth_repositories import InMemoryUserRepository
 from tests.fakes.auth_services import FakePasswordHasher, FakeTokenService, FixedClock
 from tests.fakes.auth_uow import FakeAuthUnitOfWork
@@ -135,6 +144,10 @@ class FakeDailyNutritionRepository(DailyNutritionSummaryRepositoryPort):
         key = f"{user_id_value}:{target_date}"
         return self._summaries.get(key)
 
+    def lock_for_update(self, *, user_id: UserId, target_date: date) -> bool:
+        return self.get_by_user_and_date(
+            user_id=user_id, target_date=target_date) is not None
+
     def save(self, summary: DailyNutritionSummary) -> None:
         user_id_value = getattr(summary.user_id, "value", str(summary.user_id))
         key = f"{user_id_value}:{summary.date}"
@@ -193,6 +206,24 @@ class FakeFoodEntryRepository(FoodEntryRepositoryPort):
 
             stored.deleted_at = datetime.now(timezone.utc)
 
+    def add_many(self, entries: Sequence[FoodEntry]) -> None:
+        for entry in entries:
+            self.add(entry)
+
+    def update_many(self, entries: Sequence[FoodEntry]) -> None:
+        for entry in entries:
+            self.update(entry)
+
+    def delete_many(self, entries: Sequence[FoodEntry]) -> None:
+        for entry in entries:
+            self.delete(entry)
+
+    def list_by_ids(
+        self, user_id: UserId, entry_ids: Sequence[FoodEntryId]
+    ) -> Sequence[FoodEntry]:
+        found = [self.get_by_id(user_id, entry_id) for entry_id in entry_ids]
+        return [e for e in found if e is not None and e.deleted_at is None]
+
     def get_by_id(
         self, user_id: UserId, entry_id: FoodEntryId
     ) -> FoodEntry | None:
@@ -351,6 +382,11 @@ def app(
                 user_id = UserId(user_id)
             return self._real_uc.execute(user_id, dto)
 
+        def execute_many(self, user_id: UserId | str, dtos) -> list[FoodEntryDTO]:
+            if isinstance(user_id, str):
+                user_id = UserId(user_id)
+            return self._real_uc.execute_many(user_id, dtos)
+
     class FakeListFoodEntriesUseCase:
         def __init__(self, real_uc: ListFoodEntriesByDateUseCase) -> None:
             self._real_uc = real_uc
@@ -369,6 +405,11 @@ def app(
                 user_id = UserId(user_id)
             return self._real_uc.execute(user_id, dto)
 
+        def execute_many(self, user_id: UserId | str, dtos) -> list[UpdateFoodEntryResultDTO]:
+            if isinstance(user_id, str):
+                user_id = UserId(user_id)
+            return self._real_uc.execute_many(user_id, dtos)
+
     class FakeDeleteFoodEntryUseCase:
         def __init__(self, real_uc: DeleteFoodEntryUseCase) -> None:
             self._real_uc = real_uc
@@ -378,6 +419,11 @@ def app(
                 user_id = UserId(user_id)
             return self._real_uc.execute(user_id, entry_id_str)
 
+        def execute_many(self, user_id: UserId | str, entry_id_strs) -> list[DeleteFoodEntryResultDTO]:
+            if isinstance(user_id, str):
+                user_id = UserId(user_id)
+            return self._real_uc.execute_many(user_id, entry_id_strs)
+
     create_food_entry_use_case = FakeCreateFoodEntryUseCase(
         CreateFoodEntryUseCase(meal_uow=meal_uow)
     )
@@ -405,6 +451,13 @@ def app(
                 user_id = UserId(user_id)
             return self._real_uc.execute(user_id, date_)
 
+        def get_or_compute(
+            self, user_id: UserId | str, date_: DateType
+        ) -> DailyNutritionSummary:
+            if isinstance(user_id, str):
+                user_id = UserId(user_id)
+            return self._real_uc.get_or_compute(user_id, date_)
+
     compute_daily_nutrition_use_case = FakeComputeDailyNutritionSummaryUseCase(
         ComputeDailyNutritionSummaryUseCase(
             uow=nutrition_uow,
@@ -867,3 +920,260 @@ class TestDeleteMealItem:
         assert response.status_code == 401
         data = response.json()
         assert "error" in data
+
+
+class TestBatchMealItems:
+    """/meal-items:batch のテスト"""
+
+    @staticmethod
+    def _item(name: str, meal_index: int = 1, day: str = "2024-01-01") -> dict:
+        return {
+            "date": day,
+            "meal_type": "main",
+            "meal_index": meal_index,
+            "name": name,
+            "amount_value": 100.0,
+            "amount_unit": "g",
+            "serving_count": None,
+            "note": None,
+        }
+
+    def test_batch_create_update_delete(
+        self,
+        client: TestClient,
+        authenticated_user: tuple[User, TokenPair],
+        meal_uow: FakeMealUnitOfWork,
+        daily_nutrition_repo: FakeDailyNutritionRepository,
+    ):
+        """正常系: まとめて作成 → 更新 → 削除できる"""
+        user, tokens = authenticated_user
+        cookies = {"ACCESS_TOKEN": tokens.access_token}
+
+        response = client.post(
+            "/api/v1/meal-items:batch",
+            json={"items": [self._item("Rice"), self._item("Miso Soup"), self._item("Fish")]},
+            cookies=cookies,
+        )
+        assert response.status_code == 201
+        created = response.json()["items"]
+        assert [item["name"] for item in created] == ["Rice", "Miso Soup", "Fish"]
+        # 影響のある日の日次サマリが用意されている
+        assert daily_nutrition_repo.get_by_user_and_date(
+            user_id=user.id, target_date=date(2024, 1, 1)) is not None
+
+        response = client.patch(
+            "/api/v1/meal-items:batch",
+            json={
+                "items": [
+                    {**self._item("Brown Rice", day="2024-01-02"), "id": created[0]["id"]},
+                    {**self._item("Salmon"), "id": created[2]["id"]},
+                ]
+            },
+            cookies=cookies,
+        )
+        assert response.status_code == 200
+        assert [item["name"] for item in response.json()["items"]] == ["Brown Rice", "Salmon"]
+
+        response = client.request(
+            "DELETE",
+            "/api/v1/meal-items:batch",
+            json={"ids": [created[1]["id"], created[2]["id"]]},
+            cookies=cookies,
+        )
+        assert response.status_code == 204
+
+        remaining = meal_uow.food_entry_repo.list_by_user_and_date(user.id, date(2024, 1, 1))
+        assert remaining == []
+        moved = meal_uow.food_entry_repo.list_by_user_and_date(user.id, date(2024, 1, 2))
+        assert [e.name for e in moved] == ["Brown Rice"]
+
+    def test_batch_create_is_all_or_nothing(
+        self,
+        client: TestClient,
+        authenticated_user: tuple[User, TokenPair],
+        meal_uow: FakeMealUnitOfWork,
+    ):
+        """異常系: 1 件でも不正なら何も保存しない"""
+        user, tokens = authenticated_user
+
+        invalid = {**self._item("Snack"), "meal_type": "snack", "meal_index": 1}
+        response = client.post(
+            "/api/v1/meal-items:batch",
+            json={"items": [self._item("Rice"), invalid]},
+            cookies={"ACCESS_TOKEN": tokens.access_token},
+        )
+
+        assert response.status_code == 400
+        assert meal_uow.food_entry_repo.list_by_user_and_date(user.id, date(2024, 1, 1)) == []
+
+    def test_batch_update_not_found_and_duplicates(
+        self,
+        client: TestClient,
+        authenticated_user: tuple[User, TokenPair],
+    ):
+        """異常系: 存在しない ID は 404、同じ ID の重複は 400"""
+        _, tokens = authenticated_user
+        cookies = {"ACCESS_TOKEN": tokens.access_token}
+        created = client.post(
+            "/api/v1/meal-items:batch",
+            json={"items": [self._item("Rice")]},
+            cookies=cookies,
+        ).json()["items"]
+
+        response = client.patch(
+            "/api/v1/meal-items:batch",
+            json={
+                "items": [
+                    {**self._item("Rice"), "id": created[0]["id"]},
+                    {**self._item("Bread"), "id": str(uuid.uuid4())},
+                ]
+            },
+            cookies=cookies,
+        )
+        assert response.status_code == 404
+
+        response = client.patch(
+            "/api/v1/meal-items:batch",
+            json={
+                "items": [
+                    {**self._item("Rice"), "id": created[0]["id"]},
+                    {**self._item("Bread"), "id": created[0]["id"]},
+                ]
+            },
+            cookies=cookies,
+        )
+        assert response.status_code == 400
+        assert response.json()["error"]["code"] == "INVALID_FOOD_ENTRY_BATCH"
+
+    def test_batch_rejects_malformed_ids(
+        self,
+        client: TestClient,
+        authenticated_user: tuple[User, TokenPair],
+    ):
+        """異常系: UUID でない ID はバリデーションエラー（400）"""
+        _, tokens = authenticated_user
+        cookies = {"ACCESS_TOKEN": tokens.access_token}
+
+        response = client.patch(
+            "/api/v1/meal-items:batch",
+            json={"items": [{**self._item("Rice"), "id": "not-a-uuid"}]},
+            cookies=cookies,
+        )
+        assert response.status_code == 400
+
+        response = client.request(
+            "DELETE",
+            "/api/v1/meal-items:batch",
+            json={"ids": ["not-a-uuid"]},
+            cookies=cookies,
+        )
+        assert response.status_code == 400
+
+    def test_batch_requires_items(
+        self,
+        client: TestClient,
+        authenticated_user: tuple[User, TokenPair],
+    ):
+        """異常系: 空の配列は受け付けない"""
+        _, tokens = authenticated_user
+
+        response = client.post(
+            "/api/v1/meal-items:batch",
+            json={"items": []},
+            cookies={"ACCESS_TOKEN": tokens.access_token},
+        )
+
+        assert response.status_code == 400
+
+
+class TestEditThenReadNutrition:
+    """食事ログの編集後、栄養サマリの取得に編集が反映されるテスト"""
+
+    @pytest.fixture(params=["in_request", "deferred"])
+    def recompute_scheduler(
+        self,
+        request: pytest.FixtureRequest,
+        app: FastAPI,
+        meal_uow: FakeMealUnitOfWork,
+        nutrition_uow: FakeNutritionUnitOfWork,
+        plan_checker: FakePlanChecker,
+    ):
+        """None（リクエスト内で計算）と、読むまで実行しない遅延スケジューラの両方"""
+        if request.param == "in_request":
+            app.dependency_overrides[get_daily_nutrition_recompute_scheduler] = (
+                lambda: None)
+            yield None
+            return
+
+        compute = ComputeMealNutritionUseCase(
+            meal_entry_query_service=MealEntryQueryService(meal_uow=meal_uow),
+            nutrition_uow=nutrition_uow,
+            estimator=StubNutritionEstimator(),
+            plan_checker=plan_checker,
+        )
+        scheduler = DebouncedDailyNutritionRecomputeScheduler(
+            compute.recompute_slots, quiet_window=60.0, max_delay=60.0)
+        app.dependency_overrides[get_daily_nutrition_recompute_scheduler] = (
+            lambda: scheduler)
+        yield scheduler
+        scheduler.shutdown()
+
+    def test_patch_then_get_sees_updated_totals(
+        self,
+        client: TestClient,
+        meal_uow: FakeMealUnitOfWork,
+        recompute_scheduler,
+        authenticated_user: tuple[User, TokenPair],
+        clock: FixedClock,
+    ):
+        user, tokens = authenticated_user
+        cookies = {"ACCESS_TOKEN": tokens.access_token}
+        entry = FoodEntry(
+            id=FoodEntryId.new(),
+            user_id=user.id,
+            date=date(2024, 1, 1),
+            meal_type=MealType.MAIN,
+            meal_index=1,
+            name="Rice",
+            amount_value=200.0,
+            amount_unit="g",
+            serving_count=None,
+            note=None,
+            created_at=clock.now(),
+            updated_at=clock.now(),
+            deleted_at=None,
+        )
+        meal_uow.food_entry_repo.add(entry)
+
+        def patch_and_get(amount_value: float) -> dict:
+            response = client.patch(
+                f"/api/v1/meal-items/{entry.id.value}",
+                json={
+                    "date": "2024-01-01",
+                    "meal_type": "main",
+                    "meal_index": 1,
+                    "name": "Rice",
+                    "amount_value": amount_value,
+                    "amount_unit": "g",
+                },
+                cookies=cookies,
+            )
+            assert response.status_code == 200
+            response = client.get(
+                "/api/v1/nutrition/meal",
+                params={"date": "2024-01-01", "meal_type": "main", "meal_index": 1},
+                cookies=cookies,
+            )
+            assert response.status_code == 200
+            data = response.json()
+            meal = {n["code"]: n["value"] for n in data["meal"]["nutrients"]}
+            daily = {n["code"]: n["value"] for n in data["daily"]["nutrients"]}
+            # 食事スロットが 1 つなので、日次の合計は食事サマリと同じ
+            assert daily == pytest.approx(meal)
+            return daily
+
+        before = patch_and_get(100.0)
+        after = patch_and_get(250.0)
+
+        assert before["protein"] > 0
+        assert after["protein"] == pytest.approx(before["protein"] * 2.5)
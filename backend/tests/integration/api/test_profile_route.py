@@ -430,3 +430,72 @@ class TestUpsertMyProfile:
         assert response.status_code == 400
         data = response.json()
         assert "error" in data
+
+
+class TestProfileImageUpload:
+    """POST /profile/me/image/upload-url → PUT /profile/me/image のテスト"""
+
+    def test_direct_upload_flow(
+        self,
+        client: TestClient,
+        profile_image_storage: InMemoryProfileImageStorage,
+        authenticated_user: tuple[User, TokenPair],
+    ):
+        """正常系: 発行 → ストレージへ直接アップロード → 確定"""
+        _, tokens = authenticated_user
+        cookies = {"ACCESS_TOKEN": tokens.access_token}
+        client.put(
+            "/api/v1/profile/me",
+            json={
+                "sex": "male",
+                "birthdate": "1990-01-01",
+                "height_cm": 175.0,
+                "weight_kg": 70.0,
+            },
+            cookies=cookies,
+        )
+
+        response = client.post(
+            "/api/v1/profile/me/image/upload-url",
+            json={"content_type": "image/jpeg"},
+            cookies=cookies,
+        )
+        assert response.status_code == 201
+        upload = response.json()
+        assert upload["method"] == "PUT"
+        assert upload["image_id"].startswith(f"profiles/{TEST_USER_ID}/")
+
+        # クライアントが upload_url に直接 PUT した想定
+        from app.domain.profile.value_objects import ProfileImageId
+
+        profile_image_storage.put_uploaded(
+            ProfileImageId(upload["image_id"]), b"\xff\xd8jpeg", "image/jpeg"
+        )
+
+        response = client.put(
+            "/api/v1/profile/me/image",
+            json={"image_id": upload["image_id"]},
+            cookies=cookies,
+        )
+        assert response.status_code == 200
+        assert response.json()["image_id"] == upload["image_id"]
+
+        response = client.get("/api/v1/profile/me", cookies=cookies)
+        assert response.json()["image_id"] == upload["image_id"]
+
+    def test_confirm_without_upload_returns_400(
+        self,
+        client: TestClient,
+        authenticated_user: tuple[User, TokenPair],
+    ):
+        """異常系: アップロードされていない image_id"""
+        _, tokens = authenticated_user
+
+        response = client.put(
+            "/api/v1/profile/me/image",
+            json={"image_id": f"profiles/{TEST_USER_ID}/avatar-missing"},
+            cookies={"ACCESS_TOKEN": tokens.access_token},
+        )
+
+        assert response.status_code == 400
+        assert response.json()["error"]["code"] == "INVALID_PROFILE_IMAGE"
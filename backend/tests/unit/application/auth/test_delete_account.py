@@ -8,6 +8,10 @@ from app.application.auth.ports.user_repository_port import UserRepositoryPort
 from app.application.auth.use_cases.account.delete_account import DeleteAccountUseCase
 from app.domain.auth.entities import User
 from app.domain.auth.errors import UserNotFoundError
+from app.application.auth.use_cases.current_user.get_current_user import GetCurrentUserUseCase
+from app.application.auth.ports.plan_entitlement_cache_port import PlanEntitlement
+from app.infra.auth.plan_entitlement_cache import InMemoryPlanEntitlementCache
+from app.infra.auth.principal_cache import InMemoryPrincipalCache
 from app.domain.auth.value_objects import (
     EmailAddress,
     HashedPassword,
@@ -62,3 +66,48 @@ def test_delete_account_user_not_found(
 
     with pytest.raises(UserNotFoundError):
         use_case.execute(user_id="unknown-id")
+
+
+def test_delete_account_invalidates_principal_cache(
+    auth_uow: AuthUnitOfWorkPort,
+    user_repo: UserRepositoryPort,
+    clock: ClockPort,
+) -> None:
+    user_repo.save(_create_user("uid-del-2", "delete2@example.com", clock))
+    cache = InMemoryPrincipalCache(ttl_seconds=30, max_size=10)
+    get_current_user = GetCurrentUserUseCase(uow=auth_uow, principal_cache=cache)
+    get_current_user.execute("uid-del-2")
+
+    use_case = DeleteAccountUseCase(
+        uow=auth_uow,
+        clock=clock,
+        principal_cache=cache,
+    )
+    use_case.execute(user_id="uid-del-2")
+
+    assert cache.get("uid-del-2") is None
+    with pytest.raises(UserNotFoundError):
+        get_current_user.execute("uid-del-2")
+
+
+def test_delete_account_invalidates_plan_entitlement_cache(
+    auth_uow: AuthUnitOfWorkPort,
+    user_repo: UserRepositoryPort,
+    clock: ClockPort,
+) -> None:
+    user_repo.save(_create_user("uid-del-3", "delete3@example.com", clock))
+    cache = InMemoryPlanEntitlementCache(ttl_seconds=30, max_size=10)
+    cache.set(
+        UserId("uid-del-3"),
+        PlanEntitlement(plan=UserPlan.PAID, trial_ends_at=None),
+    )
+
+    use_case = DeleteAccountUseCase(
+        uow=auth_uow,
+        clock=clock,
+        entitlement_cache=cache,
+    )
+    use_case.execute(user_id="uid-del-3")
+
+    # 退会済みユーザーのプレミアム判定がキャッシュから通らない
+    assert cache.get(UserId("uid-del-3")) is None
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from dataclasses import replace
+
 import pytest
 
 from app.application.auth.ports.clock_port import ClockPort
@@ -8,6 +10,7 @@ from app.application.auth.ports.user_repository_port import UserRepositoryPort
 from app.application.auth.use_cases.current_user.get_current_user import GetCurrentUserUseCase
 from app.domain.auth.entities import User
 from app.domain.auth.errors import UserNotFoundError
+from app.infra.auth.principal_cache import InMemoryPrincipalCache
 from app.domain.auth.value_objects import (
     EmailAddress,
     HashedPassword,
@@ -49,3 +52,49 @@ def test_get_current_user_not_found(auth_uow: AuthUnitOfWorkPort) -> None:
 
     with pytest.raises(UserNotFoundError):
         use_case.execute("unknown-id")
+
+
+def _make_user(user_id: str, clock: ClockPort) -> User:
+    return User(
+        id=UserId(user_id),
+        email=EmailAddress(f"{user_id}@example.com"),
+        hashed_password=HashedPassword("hashed:dummy"),
+        name="Me",
+        plan=UserPlan.FREE,
+        trial_info=TrialInfo(trial_ends_at=None),
+        has_profile=True,
+        created_at=clock.now(),
+    )
+
+
+def test_get_current_user_uses_principal_cache(
+    auth_uow: AuthUnitOfWorkPort,
+    user_repo: UserRepositoryPort,
+    clock: ClockPort,
+) -> None:
+    user_repo.save(_make_user("uid-cache", clock))
+    cache = InMemoryPrincipalCache(ttl_seconds=30, max_size=10)
+    use_case = GetCurrentUserUseCase(uow=auth_uow, principal_cache=cache)
+
+    first = use_case.execute("uid-cache")
+
+    # DB 側を書き換えてもキャッシュから返る
+    user_repo.save(replace(_make_user("uid-cache", clock), plan=UserPlan.PAID))
+    second = use_case.execute("uid-cache")
+
+    assert first.plan == UserPlan.FREE
+    assert second.plan == UserPlan.FREE
+    assert cache.stats().hits == 1
+    assert cache.stats().misses == 1
+
+
+def test_get_current_user_does_not_cache_missing_user(
+    auth_uow: AuthUnitOfWorkPort,
+) -> None:
+    cache = InMemoryPrincipalCache(ttl_seconds=30, max_size=10)
+    use_case = GetCurrentUserUseCase(uow=auth_uow, principal_cache=cache)
+
+    with pytest.raises(UserNotFoundError):
+        use_case.execute("unknown-id")
+
+    assert cache.stats().size == 0
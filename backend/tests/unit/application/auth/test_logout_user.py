@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+from datetime import datetime, timezone
+
+from app.application.auth.dto.auth_user_dto import AuthUserDTO
 from app.application.auth.use_cases.session.logout_user import LogoutUserUseCase
+from app.domain.auth.value_objects import UserPlan
+from app.infra.auth.principal_cache import InMemoryPrincipalCache
 
 
 def test_logout_user_noop():
@@ -8,3 +13,23 @@ def test_logout_user_noop():
 
     # 現状は No-Op。例外が出ないことだけ確認。
     use_case.execute(user_id="some-user-id")
+
+
+def test_logout_user_invalidates_principal_cache():
+    cache = InMemoryPrincipalCache(ttl_seconds=30, max_size=10)
+    cache.set(
+        AuthUserDTO(
+            id="some-user-id",
+            email="me@example.com",
+            name=None,
+            plan=UserPlan.FREE,
+            trial_ends_at=None,
+            has_profile=False,
+            created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        )
+    )
+    use_case = LogoutUserUseCase(principal_cache=cache)
+
+    use_case.execute(user_id="some-user-id")
+
+    assert cache.get("some-user-id") is None
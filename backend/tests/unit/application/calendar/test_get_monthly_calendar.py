@@ -1,9 +1,10 @@
 import pytest
+from datetime import date
 from app.application.calendar.use_cases.get_monthly_calendar import GetMonthlyCalendarUseCase
-from app.application.calendar.dto.calendar_dto import MonthlyCalendarDto
+from app.application.calendar.dto.calendar_dto import CalendarRangeDto, MonthlyCalendarDto
 from app.domain.calendar.errors import InvalidDateRangeError
 from tests.fakes.calendar_repositories import InMemoryCalendarRepository
-from tests.fakes.calendar_uow import FakeCalendarUnitOfWork
+from tests.fakes.calendar_uow import FakeAsyncCalendarUnitOfWork, FakeCalendarUnitOfWork
 
 
 class TestGetMonthlyCalendarUseCase:
@@ -208,4 +209,91 @@ class TestGetMonthlyCalendarUseCase:
         assert day1.date == "2024-12-01"
         assert day1.has_meal_logs is False  # user1のデータは見えない
         assert day1.nutrition_achievement is None  # user1のデータは見えない
-        assert day1.has_daily_report is False
\ No newline at end of file
+        assert day1.has_daily_report is False
+
+    def test_get_range_calendar_across_years(self):
+        """年をまたぐ期間カレンダー取得のテスト"""
+        user_id = "user123"
+        self.calendar_repo.add_meal_log(user_id, "2024-12-31", True)
+        self.calendar_repo.add_nutrition_achievement(user_id, "2025-01-01", 80)
+
+        request = CalendarRangeDto(
+            user_id=user_id,
+            start_date=date(2024, 12, 30),
+            end_date=date(2025, 1, 2)
+        )
+
+        result = self.use_case.execute_range(request)
+
+        assert result.start_date == date(2024, 12, 30)
+        assert result.end_date == date(2025, 1, 2)
+        assert [d.date for d in result.days] == [
+            "2024-12-30", "2024-12-31", "2025-01-01", "2025-01-02"]
+        assert [d.has_meal_logs for d in result.days] == [False, True, False, False]
+        assert [d.nutrition_achievement for d in result.days] == [None, None, 80, None]
+
+    def test_get_range_calendar_allows_leap_year(self):
+        """うるう年 1 年分（366 日）は取得できるテスト"""
+        request = CalendarRangeDto(
+            user_id="user123",
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 12, 31)
+        )
+
+        result = self.use_case.execute_range(request)
+
+        assert len(result.days) == 366
+
+    @pytest.mark.parametrize(
+        "start_date,end_date",
+        [
+            (date(2024, 2, 1), date(2024, 1, 31)),   # 逆順
+            (date(2024, 1, 1), date(2025, 1, 1)),    # 367 日
+            (date(1999, 12, 31), date(2000, 1, 1)),  # 範囲外の年
+        ],
+    )
+    def test_invalid_range_raises_error(self, start_date, end_date):
+        """不正な期間のテスト"""
+        request = CalendarRangeDto(
+            user_id="user123",
+            start_date=start_date,
+            end_date=end_date
+        )
+
+        with pytest.raises(InvalidDateRangeError):
+            self.use_case.execute_range(request)
+
+    @pytest.mark.asyncio
+    async def test_execute_async_uses_async_uow(self):
+        """async UoW があれば同期 UoW を使わずに読むテスト"""
+        self.calendar_repo.add_meal_log("user123", "2024-12-01", True)
+        async_uow = FakeAsyncCalendarUnitOfWork(self.calendar_repo)
+        use_case = GetMonthlyCalendarUseCase(self.uow, async_uow=async_uow)
+
+        monthly = await use_case.execute_async(
+            MonthlyCalendarDto(user_id="user123", year=2024, month=12))
+        ranged = await use_case.execute_range_async(
+            CalendarRangeDto(
+                user_id="user123",
+                start_date=date(2024, 11, 30),
+                end_date=date(2024, 12, 1)
+            ))
+
+        assert async_uow.entered_count == 2
+        assert monthly.days[0].has_meal_logs is True
+        assert [d.has_meal_logs for d in ranged.days] == [False, True]
+
+        with pytest.raises(InvalidDateRangeError):
+            await use_case.execute_async(
+                MonthlyCalendarDto(user_id="user123", year=2024, month=13))
+        assert async_uow.entered_count == 2
+
+    @pytest.mark.asyncio
+    async def test_execute_async_falls_back_to_sync_uow(self):
+        """async UoW が無ければ同期版（スレッド）で読むテスト"""
+        self.calendar_repo.add_meal_log("user123", "2024-12-02", True)
+
+        result = await self.use_case.execute_async(
+            MonthlyCalendarDto(user_id="user123", year=2024, month=12))
+
+        assert result.days[1].has_meal_logs is True
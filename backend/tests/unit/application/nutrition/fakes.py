@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
+from dataclasses import replace
 from datetime import date
 
 from app.application.nutrition.ports.meal_entry_query_port import MealEntryQueryPort
@@ -178,6 +179,19 @@ class FakeMealNutritionRepository(MealNutritionSummaryRepositoryPort):
             and s.date == target_date
         ]
 
+    def list_user_dates_in_range(
+        self,
+        *,
+        start_date: date,
+        end_date: date,
+    ) -> Sequence[tuple[UserId, date]]:
+        keys = {
+            (getattr(s.user_id, "value", str(s.user_id)), s.date)
+            for s in self._summaries
+            if start_date <= s.date <= end_date
+        }
+        return [(UserId(u), d) for u, d in sorted(keys, key=lambda k: (k[1], k[0]))]
+
     def save(self, summary: MealNutritionSummary) -> None:
         # 既存のものを削除して追加（upsert）
         self._summaries = [
@@ -198,6 +212,10 @@ class FakeDailyNutritionRepository(DailyNutritionSummaryRepositoryPort):
 
     def __init__(self) -> None:
         self._summaries: dict[str, DailyNutritionSummary] = {}
+        # 差分更新が使われた回数（増分パスの検証用）
+        self.delta_updates = 0
+        # lock_for_update() が呼ばれた日付（直列化の検証用）
+        self.locked_days: list[date] = []
 
     def get_by_user_and_date(
         self,
@@ -229,6 +247,47 @@ class FakeDailyNutritionRepository(DailyNutritionSummaryRepositoryPort):
         key = f"{user_id_value}:{summary.date}"
         self._summaries[key] = summary
 
+    def lock_for_update(
+        self,
+        *,
+        user_id: UserId,
+        target_date: date,
+    ) -> bool:
+        user_id_value = getattr(user_id, "value", str(user_id))
+        self.locked_days.append(target_date)
+        return f"{user_id_value}:{target_date}" in self._summaries
+
+    def apply_nutrient_deltas(
+        self,
+        *,
+        user_id: UserId,
+        target_date: date,
+        deltas: Mapping[NutrientCode, float],
+    ) -> bool:
+        user_id_value = getattr(user_id, "value", str(user_id))
+        key = f"{user_id_value}:{target_date}"
+        summary = self._summaries.get(key)
+        if summary is None:
+            return False
+        present = {n.code for n in summary.nutrients}
+        if any(code not in present for code in deltas):
+            return False
+        self.delta_updates += 1
+        self._summaries[key] = replace(
+            summary,
+            nutrients=[
+                replace(
+                    n,
+                    amount=NutrientAmount(
+                        value=n.amount.value + deltas.get(n.code, 0.0),
+                        unit=n.amount.unit,
+                    ),
+                )
+                for n in summary.nutrients
+            ],
+        )
+        return True
+
 
 class FakeNutritionUnitOfWork(NutritionReportUnitOfWorkPort):
     """インメモリのNutritionUnitOfWork"""
@@ -249,11 +308,15 @@ class FakeNutritionUnitOfWork(NutritionReportUnitOfWorkPort):
             daily_report_repo or FakeDailyNutritionReportRepository()
         )
         self._committed = False
+        # with ブロックの内側にいるか（LLM 呼び出し中に UoW を開いていないかの検証用）
+        self.is_open = False
 
     def __enter__(self) -> "FakeNutritionUnitOfWork":
+        self.is_open = True
         return self
 
     def __exit__(self, exc_type, exc, tb) -> None:
+        self.is_open = False
         if exc_type is None:
             self.commit()
         else:
@@ -7,6 +7,7 @@ import pytest
 
 from app.application.nutrition.use_cases.compute_daily_nutrition import (
     ComputeDailyNutritionSummaryUseCase,
+    RebuildDailyNutritionSummariesUseCase,
 )
 from app.domain.auth.value_objects import UserId
 from app.domain.meal.value_objects import MealType
@@ -308,3 +309,82 @@ def test_compute_daily_nutrition_different_units() -> None:
     sodium_nutrient = next(
         n for n in result.nutrients if n.code == NutrientCode.SODIUM)
     assert sodium_nutrient.amount.unit == "mg"
+
+
+def _make_full_meal(
+    user_id: UserId, target_date: date, meal_index: int, protein: float
+) -> MealNutritionSummary:
+    return _make_meal_nutrition_summary(
+        user_id=user_id,
+        target_date=target_date,
+        meal_type=MealType.MAIN,
+        meal_index=meal_index,
+        nutrients=[
+            (NutrientCode.PROTEIN, NutrientAmount(value=protein, unit="g")),
+            (NutrientCode.FAT, NutrientAmount(value=1.0, unit="g")),
+        ],
+    )
+
+
+def test_get_or_compute_returns_stored_summary_without_recompute() -> None:
+    """正常系: 保存済みサマリがあれば、全再計算せずにそのまま返す"""
+    user_id = _make_user_id()
+    target_date = date(2025, 11, 24)
+    meal_nutrition_repo = FakeMealNutritionRepository()
+    daily_nutrition_repo = FakeDailyNutritionRepository()
+    uow = FakeNutritionUnitOfWork(
+        meal_nutrition_repo=meal_nutrition_repo,
+        daily_nutrition_repo=daily_nutrition_repo,
+    )
+    use_case = ComputeDailyNutritionSummaryUseCase(
+        uow=uow, plan_checker=FakePlanChecker())
+
+    meal_nutrition_repo.save(_make_full_meal(user_id, target_date, 1, 20.0))
+    created = use_case.get_or_compute(user_id, target_date)
+    assert created.get_amount(NutrientCode.PROTEIN).value == 20.0
+
+    # 食事サマリだけ変えても（差分反映されていない限り）保存値を返す
+    meal_nutrition_repo.save(_make_full_meal(user_id, target_date, 2, 5.0))
+    again = use_case.get_or_compute(user_id, target_date)
+    assert again.id == created.id
+    assert again.get_amount(NutrientCode.PROTEIN).value == 20.0
+
+
+def test_rebuild_daily_nutrition_summaries_fixes_drift() -> None:
+    """正常系: 保存値がずれている日 / サマリが無い日だけ再計算する"""
+    user_id = _make_user_id()
+    day1 = date(2025, 11, 24)
+    day2 = date(2025, 11, 25)
+    meal_nutrition_repo = FakeMealNutritionRepository()
+    daily_nutrition_repo = FakeDailyNutritionRepository()
+    uow = FakeNutritionUnitOfWork(
+        meal_nutrition_repo=meal_nutrition_repo,
+        daily_nutrition_repo=daily_nutrition_repo,
+    )
+    compute = ComputeDailyNutritionSummaryUseCase(
+        uow=uow, plan_checker=FakePlanChecker())
+
+    meal_nutrition_repo.save(_make_full_meal(user_id, day1, 1, 20.0))
+    compute.execute(user_id, day1)
+    meal_nutrition_repo.save(_make_full_meal(user_id, day2, 1, 10.0))
+    compute.execute(user_id, day2)
+
+    # day1 にずれを入れる / day2 は一致したまま
+    daily_nutrition_repo.apply_nutrient_deltas(
+        user_id=user_id,
+        target_date=day1,
+        deltas={NutrientCode.PROTEIN: 0.5},
+    )
+
+    rebuild = RebuildDailyNutritionSummariesUseCase(uow=uow)
+
+    dry = rebuild.execute(day1, day2, dry_run=True)
+    assert (dry.checked, dry.drifted, dry.fixed) == (2, 1, 0)
+
+    result = rebuild.execute(day1, day2)
+    assert (result.checked, result.drifted, result.fixed) == (2, 1, 1)
+    fixed = daily_nutrition_repo.get_by_user_and_date(
+        user_id=user_id, target_date=day1)
+    assert fixed.get_amount(NutrientCode.PROTEIN).value == 20.0
+
+    assert rebuild.execute(day1, day2).drifted == 0
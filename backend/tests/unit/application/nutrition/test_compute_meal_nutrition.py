@@ -14,6 +14,7 @@ from app.domain.meal.errors import InvalidMealTypeError, InvalidMealIndexError
 from app.domain.meal.value_objects import FoodEntryId, MealType
 from app.domain.auth.errors import PremiumFeatureRequiredError
 from tests.unit.application.nutrition.fakes import (
+    FakeDailyNutritionRepository,
     FakeMealEntryQueryService,
     FakeNutritionUnitOfWork,
     FakeNutritionEstimator,
@@ -216,6 +217,89 @@ def test_compute_meal_nutrition_upsert_existing() -> None:
     assert result.id == existing_id
 
 
+def test_compute_meal_nutrition_applies_delta_to_daily_summary() -> None:
+    """正常系: 日次サマリは初回だけ全計算し、以降は差分 (新 - 旧) だけ反映する"""
+    from app.domain.target.value_objects import NutrientCode
+
+    user_id = _make_user_id()
+    target_date = date(2025, 11, 24)
+
+    food_entry_repo = FakeFoodEntryRepository()
+    meal_uow = FakeMealUnitOfWork(food_entry_repo)
+    daily_nutrition_repo = FakeDailyNutritionRepository()
+    nutrition_uow = FakeNutritionUnitOfWork(
+        daily_nutrition_repo=daily_nutrition_repo)
+    use_case = ComputeMealNutritionUseCase(
+        meal_entry_query_service=FakeMealEntryQueryService(meal_uow),
+        nutrition_uow=nutrition_uow,
+        estimator=FakeNutritionEstimator(),
+        plan_checker=FakePlanChecker(),
+    )
+
+    def _daily_protein() -> float:
+        daily = daily_nutrition_repo.get_by_user_and_date(
+            user_id=user_id, target_date=target_date)
+        assert daily is not None
+        return daily.get_amount(NutrientCode.PROTEIN).value
+
+    # 1食目: 日次サマリが無いので全計算で作られる
+    food_entry_repo.add(_make_food_entry(
+        user_id, target_date, MealType.MAIN, 1, amount_value=100.0))
+    use_case.execute(user_id, target_date, "main", 1)
+    assert daily_nutrition_repo.delta_updates == 0
+    assert _daily_protein() == pytest.approx(20.0)
+
+    # 2食目: 差分だけ加算
+    food_entry_repo.add(_make_food_entry(
+        user_id, target_date, MealType.MAIN, 2, amount_value=50.0))
+    use_case.execute(user_id, target_date, "main", 2)
+    assert daily_nutrition_repo.delta_updates == 1
+    assert _daily_protein() == pytest.approx(30.0)
+
+    # 1食目の再計算: 旧値を差し引いて新値を足す
+    food_entry_repo.add(_make_food_entry(
+        user_id, target_date, MealType.MAIN, 1, amount_value=100.0))
+    use_case.execute(user_id, target_date, "main", 1)
+    assert daily_nutrition_repo.delta_updates == 2
+    assert _daily_protein() == pytest.approx(50.0)
+
+
+def test_compute_meal_nutrition_first_daily_includes_other_meals() -> None:
+    """日次サマリがまだ無い日は、ロックを取ってから他スロットも含めて全計算する"""
+    from app.domain.target.value_objects import NutrientCode
+
+    user_id = _make_user_id()
+    target_date = date(2025, 11, 24)
+
+    food_entry_repo = FakeFoodEntryRepository()
+    meal_uow = FakeMealUnitOfWork(food_entry_repo)
+    daily_nutrition_repo = FakeDailyNutritionRepository()
+    nutrition_uow = FakeNutritionUnitOfWork(
+        daily_nutrition_repo=daily_nutrition_repo)
+    use_case = ComputeMealNutritionUseCase(
+        meal_entry_query_service=FakeMealEntryQueryService(meal_uow),
+        nutrition_uow=nutrition_uow,
+        estimator=FakeNutritionEstimator(),
+        plan_checker=FakePlanChecker(),
+    )
+
+    food_entry_repo.add(_make_food_entry(
+        user_id, target_date, MealType.MAIN, 1, amount_value=100.0))
+    food_entry_repo.add(_make_food_entry(
+        user_id, target_date, MealType.MAIN, 2, amount_value=50.0))
+    use_case.execute(user_id, target_date, "main", 1)
+    # 別スロットの計算が日次サマリを作る前に終わった状況（日次サマリが消えた日）
+    daily_nutrition_repo._summaries.clear()
+    use_case.execute(user_id, target_date, "main", 2)
+
+    daily = daily_nutrition_repo.get_by_user_and_date(
+        user_id=user_id, target_date=target_date)
+    assert daily is not None
+    assert daily.get_amount(NutrientCode.PROTEIN).value == pytest.approx(30.0)
+    assert daily_nutrition_repo.delta_updates == 0
+    assert daily_nutrition_repo.locked_days[:2] == [target_date, target_date]
+
+
 def test_compute_meal_nutrition_invalid_meal_type() -> None:
     """異常系: 不正なmeal_type"""
     user_id = _make_user_id()
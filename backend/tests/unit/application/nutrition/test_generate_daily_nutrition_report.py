@@ -384,3 +384,86 @@ def test_generate_daily_nutrition_report_profile_not_found() -> None:
 
     with pytest.raises(DailyLogProfileNotFoundError):
         use_case.execute(user_id=user_id, date_=target_date)
+
+
+class _UowAwareReportGenerator(FakeDailyNutritionReportGenerator):
+    """generate() 呼び出し時に UoW が開いていたかを記録する Fake。"""
+
+    def __init__(self, uow: FakeNutritionUnitOfWork, on_generate=None) -> None:
+        self._uow = uow
+        self._on_generate = on_generate
+        self.uow_open_during_call: list[bool] = []
+
+    def generate(self, input):
+        self.uow_open_during_call.append(self._uow.is_open)
+        if self._on_generate is not None:
+            self._on_generate(input)
+        return super().generate(input)
+
+
+def _make_use_case_for_uow_tests(
+    user_id: UserId,
+    target_date: date,
+    nutrition_uow: FakeNutritionUnitOfWork,
+    report_generator: FakeDailyNutritionReportGenerator,
+) -> GenerateDailyNutritionReportUseCase:
+    return GenerateDailyNutritionReportUseCase(
+        daily_log_uc=FakeCheckDailyLogCompletionUseCase(is_completed=True),
+        profile_query=FakeProfileQueryPort(
+            profile=_make_profile_for_daily_log(user_id)),
+        ensure_target_snapshot_uc=FakeEnsureDailyTargetSnapshotUseCase(
+            snapshot=_make_daily_target_snapshot(user_id, target_date)),
+        daily_nutrition_uc=FakeComputeDailyNutritionSummaryUseCase(
+            summary=_make_daily_nutrition_summary(user_id, target_date)),
+        nutrition_uow=nutrition_uow,
+        report_generator=report_generator,
+        clock=FixedClock(),
+    )
+
+
+def test_generate_daily_nutrition_report_calls_generator_outside_uow() -> None:
+    """LLM 呼び出し中は Nutrition UoW を開いていない"""
+    user_id = _make_user_id()
+    target_date = date(2025, 11, 24)
+    nutrition_uow = FakeNutritionUnitOfWork()
+    report_generator = _UowAwareReportGenerator(nutrition_uow)
+
+    use_case = _make_use_case_for_uow_tests(
+        user_id, target_date, nutrition_uow, report_generator)
+    use_case.execute(user_id=user_id, date_=target_date)
+
+    assert report_generator.uow_open_during_call == [False]
+
+
+def test_generate_daily_nutrition_report_rechecks_existence_after_generation() -> None:
+    """LLM 呼び出し中に別リクエストが保存した場合、書き込みフェーズで弾く"""
+    from app.domain.nutrition.daily_report import DailyNutritionReport
+
+    user_id = _make_user_id()
+    target_date = date(2025, 11, 24)
+    daily_report_repo = FakeDailyNutritionReportRepository()
+    nutrition_uow = FakeNutritionUnitOfWork(daily_report_repo=daily_report_repo)
+
+    concurrent_report = DailyNutritionReport.create(
+        user_id=user_id,
+        date=target_date,
+        summary="並行リクエストのレポート",
+        good_points=[],
+        improvement_points=[],
+        tomorrow_focus=[],
+        created_at=datetime.now(timezone.utc),
+    )
+    report_generator = _UowAwareReportGenerator(
+        nutrition_uow,
+        on_generate=lambda _input: daily_report_repo.save(concurrent_report),
+    )
+
+    use_case = _make_use_case_for_uow_tests(
+        user_id, target_date, nutrition_uow, report_generator)
+    with pytest.raises(DailyNutritionReportAlreadyExistsError):
+        use_case.execute(user_id=user_id, date_=target_date)
+
+    saved = daily_report_repo.get_by_user_and_date(
+        user_id=user_id, target_date=target_date)
+    assert saved is not None
+    assert saved.id == concurrent_report.id
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from app.application.profile.dto.profile_dto import ConfirmProfileImageUploadInputDTO
+from app.application.profile.use_cases.confirm_profile_image_upload import (
+    ConfirmProfileImageUploadUseCase,
+)
+from app.application.profile.use_cases.create_profile_image_upload import (
+    CreateProfileImageUploadUseCase,
+)
+from app.domain.auth.value_objects import UserId
+from app.domain.profile.entities import Profile
+from app.domain.profile.errors import InvalidProfileImageError
+from app.domain.profile.value_objects import HeightCm, ProfileImageId, Sex, WeightKg
+from app.infra.storage.profile_image_storage import InMemoryProfileImageStorage
+from tests.fakes.profile_repositories import InMemoryProfileRepository
+from tests.fakes.profile_uow import FakeProfileUnitOfWork
+
+USER_ID = "55555555-5555-5555-5555-555555555555"
+OTHER_USER_ID = "66666666-6666-6666-6666-666666666666"
+
+
+@pytest.fixture
+def storage() -> InMemoryProfileImageStorage:
+    return InMemoryProfileImageStorage()
+
+
+@pytest.fixture
+def repo() -> InMemoryProfileRepository:
+    repo = InMemoryProfileRepository()
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    repo.save(
+        Profile(
+            user_id=UserId(USER_ID),
+            sex=Sex.FEMALE,
+            birthdate=date(1990, 1, 1),
+            height_cm=HeightCm(160.0),
+            weight_kg=WeightKg(50.0),
+            image_id=None,
+            created_at=now,
+            updated_at=now,
+        )
+    )
+    return repo
+
+
+def _create(storage, user_id: str = USER_ID, content_type: str = "image/png"):
+    use_case = CreateProfileImageUploadUseCase(
+        image_storage=storage, upload_ttl=timedelta(minutes=10)
+    )
+    return use_case.execute(user_id, content_type)
+
+
+def _confirm(storage, repo, image_id: str, user_id: str = USER_ID):
+    use_case = ConfirmProfileImageUploadUseCase(
+        uow=FakeProfileUnitOfWork(profile_repo=repo),
+        image_storage=storage,
+        max_bytes=1024,
+    )
+    return use_case.execute(
+        ConfirmProfileImageUploadInputDTO(user_id=user_id, image_id=image_id)
+    )
+
+
+def test_upload_then_confirm_replaces_image_and_deletes_previous(storage, repo):
+    first = _create(storage)
+    storage.put_uploaded(ProfileImageId(first.image_id), b"a" * 10, "image/png")
+    _confirm(storage, repo, first.image_id)
+
+    second = _create(storage)
+    assert second.image_id != first.image_id
+    assert second.headers["Content-Type"] == "image/png"
+    storage.put_uploaded(ProfileImageId(second.image_id), b"b" * 10, "image/png")
+    result = _confirm(storage, repo, second.image_id)
+
+    assert result.image_id == second.image_id
+    assert repo.get_by_user_id(UserId(USER_ID)).image_id.value == second.image_id
+    # 差し替え前の画像は消える
+    assert storage.find_upload(UserId(USER_ID), ProfileImageId(first.image_id)) is None
+
+
+def test_create_upload_rejects_unsupported_content_type(storage):
+    with pytest.raises(InvalidProfileImageError):
+        _create(storage, content_type="image/svg+xml")
+
+
+def test_confirm_rejects_missing_or_foreign_upload(storage, repo):
+    missing = _create(storage)
+    with pytest.raises(InvalidProfileImageError):
+        _confirm(storage, repo, missing.image_id)
+
+    # 他ユーザーのキーは存在していても受け付けない
+    foreign = _create(storage, user_id=OTHER_USER_ID)
+    storage.put_uploaded(ProfileImageId(foreign.image_id), b"x", "image/png")
+    with pytest.raises(InvalidProfileImageError):
+        _confirm(storage, repo, foreign.image_id)
+    assert repo.get_by_user_id(UserId(USER_ID)).image_id is None
+
+
+def test_confirm_rejects_oversized_upload_and_removes_it(storage, repo):
+    upload = _create(storage)
+    image_id = ProfileImageId(upload.image_id)
+    storage.put_uploaded(image_id, b"x" * 2048, "image/png")
+
+    with pytest.raises(InvalidProfileImageError):
+        _confirm(storage, repo, upload.image_id)
+    assert storage.find_upload(UserId(USER_ID), image_id) is None
+
+
+class _FailingSaveRepository(InMemoryProfileRepository):
+    def save(self, profile):
+        raise RuntimeError("db down")
+
+
+def test_confirm_keeps_previous_image_when_save_fails(storage, repo):
+    first = _create(storage)
+    storage.put_uploaded(ProfileImageId(first.image_id), b"a" * 10, "image/png")
+    _confirm(storage, repo, first.image_id)
+
+    failing = _FailingSaveRepository()
+    failing._profiles = repo._profiles
+    second = _create(storage)
+    storage.put_uploaded(ProfileImageId(second.image_id), b"b" * 10, "image/png")
+    with pytest.raises(RuntimeError):
+        _confirm(storage, failing, second.image_id)
+
+    # コミットされていないので、今の画像は消さない
+    assert storage.find_upload(UserId(USER_ID), ProfileImageId(first.image_id)) is not None
@@ -155,11 +155,15 @@ class FakeTargetUnitOfWork(TargetUnitOfWorkPort):
         self.target_snapshot_repo = target_snapshot_repo or FakeTargetSnapshotRepository()
         self.committed = False
         self._rollback_called = False
+        # with ブロックの内側にいるか（LLM 呼び出し中に UoW を開いていないかの検証用）
+        self.is_open = False
 
     def __enter__(self) -> "FakeTargetUnitOfWork":
+        self.is_open = True
         return self
 
     def __exit__(self, exc_type, exc, tb) -> None:
+        self.is_open = False
         if exc_type is None:
             self.commit()
         else:
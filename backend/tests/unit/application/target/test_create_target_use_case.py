@@ -124,3 +124,151 @@ def test_create_target_limit_exceeded():
 
     with pytest.raises(TargetLimitExceededError):
         use_case.execute(input_dto)
+
+
+class _UowAwareTargetGenerator(FakeTargetGenerator):
+    """generate() 呼び出し時に UoW が開いていたかを記録する Fake。"""
+
+    def __init__(self, uow: FakeTargetUnitOfWork, on_generate=None) -> None:
+        self._uow = uow
+        self._on_generate = on_generate
+        self.uow_open_during_call: list[bool] = []
+
+    def generate(self, ctx):
+        self.uow_open_during_call.append(self._uow.is_open)
+        if self._on_generate is not None:
+            self._on_generate()
+        return super().generate(ctx)
+
+
+def _profile_query_with_profile() -> FakeProfileQuery:
+    profile_query = FakeProfileQuery()
+    profile_query.set_profile_for_target(
+        ProfileForTarget(
+            sex="male",
+            birthdate=None,
+            height_cm=170.0,
+            weight_kg=70.0,
+        )
+    )
+    return profile_query
+
+
+def test_create_target_calls_generator_outside_uow():
+    user_id = str(uuid4())
+    repo = FakeTargetRepository()
+    uow = FakeTargetUnitOfWork(repo, FakeTargetSnapshotRepository())
+    generator = _UowAwareTargetGenerator(uow)
+    use_case = CreateTargetUseCase(
+        uow, generator, _profile_query_with_profile(), FixedClock()
+    )
+
+    use_case.execute(
+        CreateTargetInputDTO(
+            user_id=user_id,
+            title="Target",
+            goal_type=GoalType.WEIGHT_LOSS.value,
+            goal_description=None,
+            activity_level=ActivityLevel.LOW.value,
+        )
+    )
+
+    assert generator.uow_open_during_call == [False]
+    assert len(repo.list_by_user(UserId(user_id))) == 1
+
+
+def test_create_target_rechecks_limit_after_generation():
+    """LLM 呼び出し中に上限まで作成された場合、書き込みフェーズで弾く"""
+    user_id = str(uuid4())
+    repo = FakeTargetRepository()
+    uow = FakeTargetUnitOfWork(repo, FakeTargetSnapshotRepository())
+
+    def _fill_up_concurrently() -> None:
+        for i in range(MAX_TARGETS_PER_USER):
+            repo.add(make_target(user_id, title=f"T{i}", is_active=(i == 0)))
+
+    generator = _UowAwareTargetGenerator(uow, on_generate=_fill_up_concurrently)
+    use_case = CreateTargetUseCase(
+        uow, generator, _profile_query_with_profile(), FixedClock()
+    )
+
+    with pytest.raises(TargetLimitExceededError):
+        use_case.execute(
+            CreateTargetInputDTO(
+                user_id=user_id,
+                title="Too many",
+                goal_type=GoalType.WEIGHT_LOSS.value,
+                goal_description=None,
+                activity_level=ActivityLevel.LOW.value,
+            )
+        )
+
+    assert len(repo.list_by_user(UserId(user_id))) == MAX_TARGETS_PER_USER
+
+
+class _AsyncUowAwareTargetGenerator:
+    """AsyncTargetGeneratorPort の Fake。await 時に UoW が開いていたかを記録する。"""
+
+    def __init__(self, uow: FakeTargetUnitOfWork) -> None:
+        self._uow = uow
+        self._inner = FakeTargetGenerator()
+        self.uow_open_during_call: list[bool] = []
+
+    async def generate(self, ctx):
+        self.uow_open_during_call.append(self._uow.is_open)
+        return self._inner.generate(ctx)
+
+
+@pytest.mark.asyncio
+async def test_create_target_execute_async_awaits_async_generator():
+    user_id = str(uuid4())
+    repo = FakeTargetRepository()
+    uow = FakeTargetUnitOfWork(repo, FakeTargetSnapshotRepository())
+    sync_generator = _UowAwareTargetGenerator(uow)
+    async_generator = _AsyncUowAwareTargetGenerator(uow)
+    use_case = CreateTargetUseCase(
+        uow,
+        sync_generator,
+        _profile_query_with_profile(),
+        FixedClock(),
+        async_generator=async_generator,
+    )
+
+    result = await use_case.execute_async(
+        CreateTargetInputDTO(
+            user_id=user_id,
+            title="Async",
+            goal_type=GoalType.WEIGHT_LOSS.value,
+            goal_description=None,
+            activity_level=ActivityLevel.LOW.value,
+        )
+    )
+
+    assert async_generator.uow_open_during_call == [False]
+    assert sync_generator.uow_open_during_call == []
+    assert result.is_active is True
+    assert len(repo.list_by_user(UserId(user_id))) == 1
+
+
+@pytest.mark.asyncio
+async def test_create_target_execute_async_falls_back_to_sync_generator():
+    user_id = str(uuid4())
+    repo = FakeTargetRepository()
+    uow = FakeTargetUnitOfWork(repo, FakeTargetSnapshotRepository())
+    generator = _UowAwareTargetGenerator(uow)
+    use_case = CreateTargetUseCase(
+        uow, generator, _profile_query_with_profile(), FixedClock()
+    )
+
+    await use_case.execute_async(
+        CreateTargetInputDTO(
+            user_id=user_id,
+            title="Fallback",
+            goal_type=GoalType.WEIGHT_LOSS.value,
+            goal_description=None,
+            activity_level=ActivityLevel.LOW.value,
+        )
+    )
+
+    assert generator.uow_open_during_call == [False]
+    assert len(repo.list_by_user(UserId(user_id))) == 1
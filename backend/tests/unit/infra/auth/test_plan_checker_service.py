@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import timedelta
+
+import pytest
+
+from app.domain.auth.entities import User
+from app.domain.auth.errors import PremiumFeatureRequiredError, UserNotFoundError
+from app.domain.auth.value_objects import (
+    EmailAddress,
+    HashedPassword,
+    TrialInfo,
+    UserId,
+    UserPlan,
+)
+from app.infra.auth.plan_checker_service import PlanCheckerService
+from app.infra.auth.plan_entitlement_cache import InMemoryPlanEntitlementCache
+from tests.fakes.auth_repositories import InMemoryUserRepository
+from tests.fakes.auth_services import FixedClock
+from tests.fakes.auth_uow import FakeAuthUnitOfWork
+
+
+class _CountingAuthUnitOfWork(FakeAuthUnitOfWork):
+    def __init__(self, user_repo: InMemoryUserRepository) -> None:
+        super().__init__(user_repo=user_repo)
+        self.enter_count = 0
+
+    def __enter__(self) -> "_CountingAuthUnitOfWork":
+        self.enter_count += 1
+        return self
+
+
+def _make_user(
+    clock: FixedClock,
+    plan: UserPlan,
+    trial_days: int | None,
+) -> User:
+    trial_ends_at = (
+        clock.now() + timedelta(days=trial_days) if trial_days is not None else None
+    )
+    return User(
+        id=UserId("uid-plan"),
+        email=EmailAddress("plan@example.com"),
+        hashed_password=HashedPassword("hashed:dummy"),
+        name=None,
+        plan=plan,
+        trial_info=TrialInfo(trial_ends_at=trial_ends_at),
+        has_profile=True,
+        created_at=clock.now(),
+    )
+
+
+def _make_checker(
+    user_repo: InMemoryUserRepository,
+    clock: FixedClock,
+) -> tuple[PlanCheckerService, _CountingAuthUnitOfWork, InMemoryPlanEntitlementCache]:
+    uow = _CountingAuthUnitOfWork(user_repo)
+    cache = InMemoryPlanEntitlementCache(ttl_seconds=60, max_size=10)
+    checker = PlanCheckerService(auth_uow=uow, clock=clock, entitlement_cache=cache)
+    return checker, uow, cache
+
+
+def test_cached_entitlement_skips_auth_uow(
+    user_repo: InMemoryUserRepository,
+    clock: FixedClock,
+) -> None:
+    user_repo.save(_make_user(clock, UserPlan.PAID, trial_days=None))
+    checker, uow, cache = _make_checker(user_repo, clock)
+
+    checker.ensure_premium_feature(UserId("uid-plan"))
+    checker.ensure_premium_feature(UserId("uid-plan"))
+
+    assert uow.enter_count == 1
+    assert cache.stats().hits == 1
+
+
+def test_trial_expiry_applies_to_cached_entitlement(
+    user_repo: InMemoryUserRepository,
+    clock: FixedClock,
+) -> None:
+    user_repo.save(_make_user(clock, UserPlan.TRIAL, trial_days=1))
+    checker, uow, _ = _make_checker(user_repo, clock)
+
+    checker.ensure_premium_feature(UserId("uid-plan"))
+
+    clock.advance(timedelta(days=2))
+    with pytest.raises(PremiumFeatureRequiredError):
+        checker.ensure_premium_feature(UserId("uid-plan"))
+    assert uow.enter_count == 1
+
+
+def test_invalidate_reloads_upgraded_plan(
+    user_repo: InMemoryUserRepository,
+    clock: FixedClock,
+) -> None:
+    user = _make_user(clock, UserPlan.FREE, trial_days=None)
+    user_repo.save(user)
+    checker, uow, cache = _make_checker(user_repo, clock)
+
+    with pytest.raises(PremiumFeatureRequiredError):
+        checker.ensure_premium_feature(UserId("uid-plan"))
+
+    user_repo.save(replace(user, plan=UserPlan.PAID))
+    cache.invalidate(UserId("uid-plan"))
+
+    checker.ensure_premium_feature(UserId("uid-plan"))
+    assert uow.enter_count == 2
+
+
+def test_missing_user_is_not_cached(
+    user_repo: InMemoryUserRepository,
+    clock: FixedClock,
+) -> None:
+    checker, _, cache = _make_checker(user_repo, clock)
+
+    with pytest.raises(UserNotFoundError):
+        checker.ensure_premium_feature(UserId("unknown"))
+
+    assert cache.stats().size == 0
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from app.application.auth.dto.auth_user_dto import AuthUserDTO
+from app.domain.auth.value_objects import UserPlan
+from app.infra.auth.principal_cache import InMemoryPrincipalCache
+
+
+class _FakeMonotonic:
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def __call__(self) -> float:
+        return self.value
+
+
+def _make_dto(user_id: str) -> AuthUserDTO:
+    return AuthUserDTO(
+        id=user_id,
+        email=f"{user_id}@example.com",
+        name=None,
+        plan=UserPlan.FREE,
+        trial_ends_at=None,
+        has_profile=False,
+        created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+def test_get_returns_cached_user_and_counts_hits_and_misses() -> None:
+    cache = InMemoryPrincipalCache(ttl_seconds=30, max_size=10)
+
+    assert cache.get("u1") is None
+    cache.set(_make_dto("u1"))
+    cached = cache.get("u1")
+
+    assert cached is not None
+    assert cached.id == "u1"
+    stats = cache.stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.size == 1
+
+
+def test_entry_expires_after_ttl() -> None:
+    monotonic = _FakeMonotonic()
+    cache = InMemoryPrincipalCache(ttl_seconds=30, max_size=10, monotonic=monotonic)
+    cache.set(_make_dto("u1"))
+
+    monotonic.value = 29.9
+    assert cache.get("u1") is not None
+
+    monotonic.value = 30.0
+    assert cache.get("u1") is None
+    assert cache.stats().size == 0
+
+
+def test_least_recently_used_entry_is_evicted_when_full() -> None:
+    cache = InMemoryPrincipalCache(ttl_seconds=30, max_size=2)
+    cache.set(_make_dto("u1"))
+    cache.set(_make_dto("u2"))
+
+    # u1 を参照して u2 を最古にする
+    assert cache.get("u1") is not None
+    cache.set(_make_dto("u3"))
+
+    assert cache.get("u2") is None
+    assert cache.get("u1") is not None
+    assert cache.get("u3") is not None
+
+
+def test_invalidate_removes_entry() -> None:
+    cache = InMemoryPrincipalCache(ttl_seconds=30, max_size=10)
+    cache.set(_make_dto("u1"))
+
+    cache.invalidate("u1")
+
+    assert cache.get("u1") is None
+
+
+def test_zero_ttl_disables_cache() -> None:
+    cache = InMemoryPrincipalCache(ttl_seconds=0, max_size=10)
+    cache.set(_make_dto("u1"))
+
+    assert cache.get("u1") is None
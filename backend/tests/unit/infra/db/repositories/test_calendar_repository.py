@@ -1,8 +1,9 @@
 import pytest
+from datetime import date
 from unittest.mock import Mock, MagicMock
 from sqlalchemy.orm import Session
 from app.infra.db.repositories.calendar_repository import SqlAlchemyCalendarRepository
-from app.application.calendar.dto.calendar_dto import MonthlyCalendarDto
+from app.application.calendar.dto.calendar_dto import CalendarRangeDto, MonthlyCalendarDto
 from app.domain.calendar.entities import CalendarDaySnapshot
 
 
@@ -172,6 +173,41 @@ class TestSqlAlchemyCalendarRepository:
 
         assert result == []
 
+    def test_get_range_summary_uses_single_query(self):
+        """期間取得は 1 クエリで、終了日を含む範囲を渡すテスト"""
+        mock_result = MagicMock()
+        mock_result.__iter__ = Mock(return_value=iter([]))
+        self.session_mock.execute.return_value = mock_result
+
+        request = CalendarRangeDto(
+            user_id="user123",
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 12, 31)
+        )
+
+        self.repository.get_range_summary(request)
+
+        self.session_mock.execute.assert_called_once()
+        call_args = self.session_mock.execute.call_args
+        params = call_args.args[1] if len(call_args.args) > 1 else call_args.kwargs
+        assert params['start_date'] == '2024-01-01'
+        assert params['end_date'] == '2025-01-01'
+
+    def test_source_query_measures_achievement_against_active_target(self):
+        """元テーブル集計の達成率はアクティブな目標が基準（レポートの無い日も出す）テスト"""
+        mock_result = MagicMock()
+        mock_result.__iter__ = Mock(return_value=iter([]))
+        self.session_mock.execute.return_value = mock_result
+        repository = SqlAlchemyCalendarRepository(self.session_mock, use_rollups=False)
+
+        repository.get_monthly_summary(
+            MonthlyCalendarDto(user_id="user123", year=2024, month=12)
+        )
+
+        query = str(self.session_mock.execute.call_args.args[0])
+        assert "target.is_active = true" in query
+        assert "daily_target_snapshots" not in query
+
     def test_session_passed_correctly(self):
         """セッションが正しく保持されることのテスト"""
         assert self.repository._session is self.session_mock
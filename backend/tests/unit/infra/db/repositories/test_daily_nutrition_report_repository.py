@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from uuid import UUID, uuid4
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql as pg
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.infra.db.models.daily_nutrition import DailyNutritionSummaryModel
+from app.infra.db.models.meal import FoodEntryModel
+from app.infra.db.models.profile import ProfileModel
+from app.infra.db.models.user import UserModel
+from app.infra.db.repositories.daily_nutrition_report_repository import (
+    SqlAlchemyDailyNutritionReportRepository,
+)
+
+pytestmark = pytest.mark.unit
+
+DAY = date(2025, 1, 10)
+NOW = datetime(2025, 1, 10, tzinfo=timezone.utc)
+
+# daily_nutrition_reports は TEXT[] 列を持ち SQLite で作れないので、クエリが参照する列だけ用意する
+_reports = sa.Table(
+    "daily_nutrition_reports",
+    sa.MetaData(),
+    sa.Column("id", pg.UUID(as_uuid=True), primary_key=True),
+    sa.Column("user_id", pg.UUID(as_uuid=True), nullable=False),
+    sa.Column("date", sa.Date(), nullable=False),
+)
+
+
+@pytest.fixture
+def session():
+    engine = sa.create_engine(
+        "sqlite+pysqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    for model in (UserModel, ProfileModel, FoodEntryModel, DailyNutritionSummaryModel):
+        model.__table__.create(engine)
+    _reports.create(engine)
+    with sessionmaker(bind=engine)() as session:
+        yield session
+
+
+def _user(session, meals_per_day: int, *, deleted: bool = False) -> UUID:
+    user_id = uuid4()
+    session.add(UserModel(
+        id=user_id, email=f"{user_id}@example.com", hashed_password="x",
+        plan="paid", has_profile=True, created_at=NOW,
+        deleted_at=NOW if deleted else None,
+    ))
+    session.add(ProfileModel(
+        user_id=user_id, sex="female", birthdate=date(1990, 1, 1),
+        height_cm=160.0, weight_kg=50.0, meals_per_day=meals_per_day,
+        created_at=NOW, updated_at=NOW,
+    ))
+    return user_id
+
+
+def _entries(session, user_id: UUID, *meal_indices: int, meal_type: str = "main") -> None:
+    for index in meal_indices:
+        session.add(FoodEntryModel(
+            id=uuid4(), user_id=user_id, date=DAY, meal_type=meal_type,
+            meal_index=index, name="rice",
+        ))
+
+
+def _summary(session, user_id: UUID) -> None:
+    session.add(DailyNutritionSummaryModel(id=uuid4(), user_id=user_id, date=DAY))
+
+
+def test_list_report_ready_days_matches_completion_rule(session):
+    ready = _user(session, 3)
+    _entries(session, ready, 1, 2, 2, 3)
+    _summary(session, ready)
+
+    missing_meal = _user(session, 3)
+    _entries(session, missing_meal, 1, 2, 5)  # 5 は範囲外なので数えない
+    _summary(session, missing_meal)
+
+    no_summary = _user(session, 1)
+    _entries(session, no_summary, 1)
+
+    has_report = _user(session, 1)
+    _entries(session, has_report, 1)
+    _summary(session, has_report)
+    session.execute(_reports.insert().values(id=uuid4(), user_id=has_report, date=DAY))
+
+    deleted = _user(session, 1, deleted=True)
+    _entries(session, deleted, 1)
+    _summary(session, deleted)
+    session.flush()
+
+    repo = SqlAlchemyDailyNutritionReportRepository(session)
+
+    assert repo.list_report_ready_days(DAY, DAY) == [(ready, DAY)]
+    assert repo.list_report_ready_days(date(2025, 1, 11), date(2025, 1, 31)) == []
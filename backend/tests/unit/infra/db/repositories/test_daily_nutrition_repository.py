@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+from datetime import date
+from uuid import uuid4
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.domain.auth.value_objects import UserId
+from app.domain.nutrition.daily_nutrition import DailyNutritionSummary
+from app.domain.target.value_objects import (
+    NutrientAmount,
+    NutrientCode,
+    NutrientSource,
+)
+from app.infra.db.models.daily_nutrition import (
+    DailyNutritionNutrientModel,
+    DailyNutritionSummaryModel,
+)
+from app.infra.db.nutrient_storage import NutrientStorageMode
+from app.infra.db.repositories.daily_nutrition_repository import (
+    SqlAlchemyDailyNutritionSummaryRepository,
+)
+
+pytestmark = pytest.mark.unit
+
+DAY = date(2025, 1, 1)
+
+
+@pytest.fixture
+def session():
+    engine = sa.create_engine(
+        "sqlite+pysqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    DailyNutritionSummaryModel.__table__.create(engine)
+    DailyNutritionNutrientModel.__table__.create(engine)
+    session = sessionmaker(bind=engine, expire_on_commit=False)()
+    yield session
+    session.close()
+
+
+def _save_summary(
+    session,
+    user_id: UserId,
+    mode: NutrientStorageMode = NutrientStorageMode.ROWS,
+) -> None:
+    repo = SqlAlchemyDailyNutritionSummaryRepository(session, mode)
+    repo.save(
+        DailyNutritionSummary.from_nutrient_amounts(
+            user_id=user_id,
+            date=DAY,
+            nutrients=[
+                (NutrientCode.PROTEIN, NutrientAmount(value=20.0, unit="g")),
+                (NutrientCode.FAT, NutrientAmount(value=5.0, unit="g")),
+            ],
+            source=NutrientSource("llm"),
+        )
+    )
+    session.commit()
+
+
+def test_apply_nutrient_deltas_adds_in_one_update(session):
+    user_id = UserId(str(uuid4()))
+    _save_summary(session, user_id)
+    repo = SqlAlchemyDailyNutritionSummaryRepository(
+        session, NutrientStorageMode.ROWS)
+
+    statements: list[str] = []
+    sa.event.listen(
+        session.get_bind(),
+        "before_cursor_execute",
+        lambda conn, cursor, stmt, *args: statements.append(stmt),
+    )
+
+    applied = repo.apply_nutrient_deltas(
+        user_id=user_id,
+        target_date=DAY,
+        deltas={NutrientCode.PROTEIN: 7.5, NutrientCode.FAT: -2.0},
+    )
+    session.commit()
+
+    assert applied is True
+    assert len(statements) == 1
+    assert statements[0].lstrip().upper().startswith("UPDATE")
+
+    session.expire_all()
+    summary = repo.get_by_user_and_date(user_id=user_id, target_date=DAY)
+    assert summary.get_amount(NutrientCode.PROTEIN).value == pytest.approx(27.5)
+    assert summary.get_amount(NutrientCode.FAT).value == pytest.approx(3.0)
+
+
+def test_apply_nutrient_deltas_reports_missing_rows(session):
+    user_id = UserId(str(uuid4()))
+    repo = SqlAlchemyDailyNutritionSummaryRepository(
+        session, NutrientStorageMode.ROWS)
+
+    # サマリ自体が無い
+    assert not repo.apply_nutrient_deltas(
+        user_id=user_id,
+        target_date=DAY,
+        deltas={NutrientCode.PROTEIN: 1.0},
+    )
+
+    # サマリはあるが IRON の行が無い
+    _save_summary(session, user_id)
+    assert not repo.apply_nutrient_deltas(
+        user_id=user_id,
+        target_date=DAY,
+        deltas={NutrientCode.PROTEIN: 1.0, NutrientCode.IRON: 1.0},
+    )
+
+
+def test_save_overwrites_existing_day_in_three_statements(session):
+    user_id = UserId(str(uuid4()))
+    _save_summary(session, user_id)
+    repo = SqlAlchemyDailyNutritionSummaryRepository(
+        session, NutrientStorageMode.ROWS)
+
+    statements: list[str] = []
+    sa.event.listen(
+        session.get_bind(),
+        "before_cursor_execute",
+        lambda conn, cursor, stmt, *args: statements.append(stmt),
+    )
+    replacement = DailyNutritionSummary.from_nutrient_amounts(
+        user_id=user_id,
+        date=DAY,
+        nutrients=[(NutrientCode.PROTEIN, NutrientAmount(value=9.0, unit="g"))],
+        source=NutrientSource("llm"),
+    )
+    repo.save(replacement)
+    session.commit()
+
+    assert len(statements) == 3
+    summary = repo.get_by_user_and_date(user_id=user_id, target_date=DAY)
+    assert summary.id == replacement.id
+    # 新しいサマリに無い FAT の行は消える
+    assert [n.code for n in summary.nutrients] == [NutrientCode.PROTEIN]
+    assert summary.get_amount(NutrientCode.PROTEIN).value == 9.0
+
+
+@pytest.mark.parametrize("mode", [NutrientStorageMode.DUAL, NutrientStorageMode.COMPACT])
+def test_apply_nutrient_deltas_updates_compact_nutrients(session, mode):
+    user_id = UserId(str(uuid4()))
+    _save_summary(session, user_id, mode)
+    repo = SqlAlchemyDailyNutritionSummaryRepository(session, mode)
+
+    applied = repo.apply_nutrient_deltas(
+        user_id=user_id,
+        target_date=DAY,
+        deltas={NutrientCode.PROTEIN: 7.5, NutrientCode.FAT: -2.0},
+    )
+    session.commit()
+
+    assert applied is True
+    for read_mode in (mode, NutrientStorageMode.ROWS):
+        if read_mode is NutrientStorageMode.ROWS and not mode.writes_rows:
+            continue
+        session.expunge_all()
+        summary = SqlAlchemyDailyNutritionSummaryRepository(
+            session, read_mode
+        ).get_by_user_and_date(user_id=user_id, target_date=DAY)
+        assert summary.get_amount(NutrientCode.PROTEIN).value == pytest.approx(27.5)
+        assert summary.get_amount(NutrientCode.FAT).value == pytest.approx(3.0)
+
+    assert not repo.apply_nutrient_deltas(
+        user_id=user_id,
+        target_date=DAY,
+        deltas={NutrientCode.IRON: 1.0},
+    )
+
+
+def test_switching_back_from_compact_still_reads_nutrients(session):
+    user_id = UserId(str(uuid4()))
+    _save_summary(session, user_id, NutrientStorageMode.COMPACT)
+    assert session.query(DailyNutritionNutrientModel).count() == 0
+
+    for mode in (NutrientStorageMode.ROWS, NutrientStorageMode.DUAL):
+        session.expunge_all()
+        summary = SqlAlchemyDailyNutritionSummaryRepository(
+            session, mode
+        ).get_by_user_and_date(user_id=user_id, target_date=DAY)
+        assert summary.get_amount(NutrientCode.PROTEIN).value == 20.0
+        assert summary.get_amount(NutrientCode.FAT).value == 5.0
+
+    # rows の差分更新は compact の行に触らず、計算し直し（save）に回す
+    repo = SqlAlchemyDailyNutritionSummaryRepository(session, NutrientStorageMode.ROWS)
+    assert not repo.apply_nutrient_deltas(
+        user_id=user_id,
+        target_date=DAY,
+        deltas={NutrientCode.PROTEIN: 1.0},
+    )
+    _save_summary(session, user_id, NutrientStorageMode.ROWS)
+    session.expunge_all()
+    summary = repo.get_by_user_and_date(user_id=user_id, target_date=DAY)
+    assert summary.get_amount(NutrientCode.PROTEIN).value == 20.0
+    assert session.query(DailyNutritionNutrientModel).count() == 2
+
+
+def test_lock_for_update_creates_empty_header_once(session):
+    user_id = UserId(str(uuid4()))
+    repo = SqlAlchemyDailyNutritionSummaryRepository(
+        session, NutrientStorageMode.ROWS)
+
+    # 初回は空の行を作る（中身が無いので差分は反映できない）
+    assert repo.lock_for_update(user_id=user_id, target_date=DAY) is False
+    assert repo.lock_for_update(user_id=user_id, target_date=DAY) is True
+    assert not repo.apply_nutrient_deltas(
+        user_id=user_id,
+        target_date=DAY,
+        deltas={NutrientCode.PROTEIN: 1.0},
+    )
+    assert session.query(DailyNutritionSummaryModel).count() == 1
+
+    # 全再計算の save() はその行をそのまま使う
+    _save_summary(session, user_id)
+    assert session.query(DailyNutritionSummaryModel).count() == 1
+    assert repo.lock_for_update(user_id=user_id, target_date=DAY) is True
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.domain.auth.value_objects import UserId
+from app.domain.meal.entities import FoodEntry
+from app.domain.meal.value_objects import FoodEntryId, MealType
+from app.infra.db.models.food_entry_event import FoodEntryEventModel
+from app.infra.db.models.meal import FoodEntryModel
+from app.infra.db.repositories.food_entry_event_repository import (
+    SqlAlchemyFoodEntryEventRepository,
+)
+from app.infra.db.repositories.food_entry_repository import (
+    SqlAlchemyFoodEntryRepository,
+)
+from app.settings import settings
+
+pytestmark = pytest.mark.unit
+
+DAY = date(2025, 1, 10)
+LEASE = timedelta(minutes=5)
+
+
+@pytest.fixture
+def factory():
+    engine = sa.create_engine(
+        "sqlite+pysqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    FoodEntryModel.__table__.create(engine)
+    FoodEntryEventModel.__table__.create(engine)
+    return sessionmaker(bind=engine, expire_on_commit=False)
+
+
+@pytest.fixture
+def outbox_enabled(monkeypatch):
+    monkeypatch.setattr(settings, "FOOD_ENTRY_OUTBOX_ENABLED", True)
+
+
+def _entry(user_id: UserId, meal_index: int = 1) -> FoodEntry:
+    return FoodEntry(
+        id=FoodEntryId.new(),
+        user_id=user_id,
+        date=DAY,
+        meal_type=MealType.MAIN,
+        meal_index=meal_index,
+        name="rice",
+        amount_value=150.0,
+        amount_unit="g",
+        serving_count=None,
+    )
+
+
+def _slots(factory) -> list[tuple]:
+    with factory() as session:
+        return [
+            (str(r.user_id), r.date, r.meal_type, r.meal_index)
+            for r in session.query(FoodEntryEventModel).order_by(FoodEntryEventModel.id)
+        ]
+
+
+def _add_events(factory, user_id: UUID, meal_indexes: list[int]) -> None:
+    with factory() as session:
+        for meal_index in meal_indexes:
+            session.add(
+                FoodEntryEventModel(
+                    user_id=user_id,
+                    date=DAY,
+                    meal_type="main",
+                    meal_index=meal_index,
+                    available_at=datetime.now(timezone.utc) - timedelta(seconds=1),
+                )
+            )
+        session.commit()
+
+
+def test_food_entry_writes_enqueue_events_in_same_transaction(factory, outbox_enabled):
+    user_id = UserId(str(uuid4()))
+    entry = _entry(user_id)
+
+    with factory() as session:
+        SqlAlchemyFoodEntryRepository(session).add(entry)
+        session.commit()
+    assert _slots(factory) == [(user_id.value, DAY, "main", 1)]
+
+    # 別スロットへの移動は移動元 / 移動先の両方
+    entry.meal_index = 2
+    with factory() as session:
+        SqlAlchemyFoodEntryRepository(session).update(entry)
+        session.commit()
+    with factory() as session:
+        SqlAlchemyFoodEntryRepository(session).delete(entry)
+        session.commit()
+    assert [s[3] for s in _slots(factory)] == [1, 1, 2, 2]
+
+    # ロールバックされた書き込みのイベントは残らない
+    with factory() as session:
+        SqlAlchemyFoodEntryRepository(session).add(_entry(user_id, meal_index=3))
+        session.rollback()
+    assert len(_slots(factory)) == 4
+
+
+def test_food_entry_writes_do_not_enqueue_when_disabled(factory):
+    with factory() as session:
+        SqlAlchemyFoodEntryRepository(session).add(_entry(UserId(str(uuid4()))))
+        session.commit()
+    assert _slots(factory) == []
+
+
+def test_claim_leases_events_and_release_backs_off(factory):
+    user_id = uuid4()
+    _add_events(factory, user_id, [1, 2, 3])
+    now = datetime.now(timezone.utc)
+
+    with factory() as session:
+        repo = SqlAlchemyFoodEntryEventRepository(session)
+        claimed = repo.claim(2, LEASE, max_attempts=3, now=now)
+        session.commit()
+    assert [e.meal_index for e in claimed] == [1, 2]
+    assert all(e.attempts == 1 for e in claimed)
+
+    with factory() as session:
+        repo = SqlAlchemyFoodEntryEventRepository(session)
+        # リース中の行は取らない
+        assert [e.meal_index for e in repo.claim(10, LEASE, 3, now=now)] == [3]
+        repo.complete([claimed[0].id])
+        repo.release([claimed[1].id], "boom", retry_at=now + timedelta(seconds=30))
+        session.commit()
+
+    with factory() as session:
+        repo = SqlAlchemyFoodEntryEventRepository(session)
+        assert repo.claim(10, LEASE, 3, now=now + timedelta(seconds=10)) == []
+        # リース切れの行と、待ち時間が過ぎた行は取り直せる
+        again = repo.claim(10, LEASE, 3, now=now + timedelta(minutes=10))
+        assert [(e.meal_index, e.attempts) for e in again] == [(2, 2), (3, 2)]
+        assert repo.count_pending() == 2
+
+
+def test_claim_skips_slots_leased_by_another_worker(factory):
+    user_id = uuid4()
+    _add_events(factory, user_id, [1, 2])
+    now = datetime.now(timezone.utc)
+
+    with factory() as session:
+        first = SqlAlchemyFoodEntryEventRepository(session).claim(
+            10, LEASE, 3, now=now)
+        session.commit()
+    assert [e.meal_index for e in first] == [1, 2]
+
+    # 計算中のスロットに新しいイベントが来ても、リースが切れるまで別のワーカーは取らない
+    _add_events(factory, user_id, [1, 3])
+    with factory() as session:
+        repo = SqlAlchemyFoodEntryEventRepository(session)
+        assert [e.meal_index for e in repo.claim(10, LEASE, 3, now=now)] == [3]
+        repo.complete([e.id for e in first if e.meal_index == 1])
+        session.commit()
+
+    with factory() as session:
+        repo = SqlAlchemyFoodEntryEventRepository(session)
+        assert [e.meal_index for e in repo.claim(10, LEASE, 3, now=now)] == [1]
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from datetime import date
+from uuid import UUID, uuid4
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.domain.auth.value_objects import UserId
+from app.domain.meal.entities import FoodEntry
+from app.domain.meal.errors import FoodEntryNotFoundError
+from app.domain.meal.value_objects import FoodEntryId, MealType
+from app.infra.db.day_rollups import pop_dirty_day_rollups
+from app.infra.db.models.food_entry_event import FoodEntryEventModel
+from app.infra.db.models.meal import FoodEntryModel
+from app.infra.db.repositories.food_entry_repository import (
+    SqlAlchemyFoodEntryRepository,
+)
+from app.settings import settings
+
+pytestmark = pytest.mark.unit
+
+DAY = date(2025, 1, 10)
+
+
+@pytest.fixture
+def engine():
+    engine = sa.create_engine(
+        "sqlite+pysqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    FoodEntryModel.__table__.create(engine)
+    FoodEntryEventModel.__table__.create(engine)
+    return engine
+
+
+@pytest.fixture
+def factory(engine):
+    return sessionmaker(bind=engine, expire_on_commit=False)
+
+
+def _entry(user_id: UserId, name: str, meal_index: int = 1, day: date = DAY) -> FoodEntry:
+    return FoodEntry(
+        id=FoodEntryId.new(),
+        user_id=user_id,
+        date=day,
+        meal_type=MealType.MAIN,
+        meal_index=meal_index,
+        name=name,
+        amount_value=100.0,
+        amount_unit="g",
+        serving_count=None,
+    )
+
+
+def test_add_many_inserts_all_rows_in_one_statement(engine, factory, monkeypatch):
+    monkeypatch.setattr(settings, "FOOD_ENTRY_OUTBOX_ENABLED", True)
+    user_id = UserId(str(uuid4()))
+    entries = [_entry(user_id, name) for name in ("rice", "soup", "fish")]
+
+    statements: list[str] = []
+    sa.event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    with factory() as session:
+        SqlAlchemyFoodEntryRepository(session).add_many(entries)
+        # 同じ日 / 同じ食事スロットの記録は 1 つにまとまる
+        assert pop_dirty_day_rollups(session) == {
+            (UUID(user_id.value), DAY): {"has_meal_logs": True}
+        }
+        session.commit()
+
+    assert sum(s.startswith("INSERT INTO food_entries") for s in statements) == 1
+    assert sum(s.startswith("INSERT INTO food_entry_events") for s in statements) == 1
+    with factory() as session:
+        repo = SqlAlchemyFoodEntryRepository(session)
+        assert sorted(e.name for e in repo.list_by_user_and_date(user_id, DAY)) == [
+            "fish", "rice", "soup"]
+        assert session.query(FoodEntryEventModel).count() == 1
+
+
+def test_update_many_and_delete_many(factory):
+    user_id = UserId(str(uuid4()))
+    rice, soup, fish = (_entry(user_id, name) for name in ("rice", "soup", "fish"))
+    with factory() as session:
+        SqlAlchemyFoodEntryRepository(session).add_many([rice, soup, fish])
+        session.commit()
+
+    other_user = UserId(str(uuid4()))
+    with factory() as session:
+        repo = SqlAlchemyFoodEntryRepository(session)
+        # 他ユーザーの ID では読めない
+        assert repo.list_by_ids(other_user, [rice.id, soup.id]) == []
+        assert {e.name for e in repo.list_by_ids(user_id, [rice.id, soup.id])} == {
+            "rice", "soup"}
+
+        rice.name = "brown rice"
+        rice.meal_index = 2
+        repo.update_many([rice, soup])
+        repo.delete_many([fish, fish])
+        session.commit()
+
+    with factory() as session:
+        repo = SqlAlchemyFoodEntryRepository(session)
+        assert sorted((e.name, e.meal_index) for e in repo.list_by_user_and_date(user_id, DAY)) == [
+            ("brown rice", 2), ("soup", 1)]
+
+        with pytest.raises(FoodEntryNotFoundError):
+            repo.update_many([fish])
+
+
+def test_batch_writes_reuse_rows_loaded_by_list_by_ids(engine, factory):
+    user_id = UserId(str(uuid4()))
+    rice, soup = (_entry(user_id, name) for name in ("rice", "soup"))
+    with factory() as session:
+        SqlAlchemyFoodEntryRepository(session).add_many([rice, soup])
+        session.commit()
+
+    statements: list[str] = []
+    sa.event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    with factory() as session:
+        repo = SqlAlchemyFoodEntryRepository(session)
+        repo.list_by_ids(user_id, [rice.id, soup.id])
+        rice.name = "brown rice"
+        repo.update_many([rice])
+        repo.delete_many([soup])
+        session.commit()
+
+    # 対象を読むのは UseCase の list_by_ids の 1 回だけ
+    assert sum(s.lstrip().startswith("SELECT") for s in statements) == 1
+    with factory() as session:
+        names = [
+            e.name
+            for e in SqlAlchemyFoodEntryRepository(session).list_by_user_and_date(
+                user_id, DAY)
+        ]
+    assert names == ["brown rice"]
+
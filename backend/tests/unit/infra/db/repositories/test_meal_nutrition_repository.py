@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+from datetime import date
+from uuid import uuid4
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.domain.auth.value_objects import UserId
+from app.domain.meal.value_objects import MealType
+from app.domain.nutrition.meal_nutrition import MealNutritionSummary
+from app.domain.target.value_objects import (
+    ALL_NUTRIENT_CODES,
+    NutrientAmount,
+    NutrientSource,
+)
+from app.infra.db.models.meal_nutrition import (
+    MealNutritionNutrientModel,
+    MealNutritionSummaryModel,
+)
+from app.infra.db.nutrient_storage import NutrientStorageMode
+from app.infra.db.repositories.meal_nutrition_repository import (
+    SqlAlchemyMealNutritionSummaryRepository,
+)
+from app.jobs.backfill_compact_nutrients import backfill_model
+
+pytestmark = pytest.mark.unit
+
+DAY = date(2025, 1, 1)
+
+
+@pytest.fixture
+def session():
+    engine = sa.create_engine(
+        "sqlite+pysqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    MealNutritionSummaryModel.__table__.create(engine)
+    MealNutritionNutrientModel.__table__.create(engine)
+    session = sessionmaker(bind=engine, expire_on_commit=False)()
+    session.info["factory"] = sessionmaker(bind=engine, expire_on_commit=False)
+    yield session
+    session.close()
+
+
+def _summary(
+    user_id: UserId,
+    value: float,
+    meal_type: MealType = MealType.MAIN,
+    meal_index: int | None = 1,
+) -> MealNutritionSummary:
+    return MealNutritionSummary.from_nutrient_amounts(
+        user_id=user_id,
+        date=DAY,
+        meal_type=meal_type,
+        meal_index=meal_index,
+        nutrients=[
+            (code, NutrientAmount(value=value, unit="g"))
+            for code in ALL_NUTRIENT_CODES
+        ],
+        source=NutrientSource("llm"),
+    )
+
+
+def _count_statements(session) -> list[str]:
+    statements: list[str] = []
+    sa.event.listen(
+        session.get_bind(),
+        "before_cursor_execute",
+        lambda conn, cursor, stmt, *args: statements.append(stmt),
+    )
+    return statements
+
+
+def test_save_upserts_header_and_nutrients_in_three_statements(session):
+    user_id = UserId(str(uuid4()))
+    repo = SqlAlchemyMealNutritionSummaryRepository(session)
+    repo.save(_summary(user_id, 1.0))
+    session.commit()
+
+    statements = _count_statements(session)
+    repo.save(_summary(user_id, 2.0))
+    session.commit()
+
+    # ヘッダ upsert + 栄養素の複数行 upsert + 不要行の DELETE
+    assert len(statements) == 3
+    assert session.query(MealNutritionNutrientModel).count() == len(ALL_NUTRIENT_CODES)
+
+
+def test_save_keeps_existing_id_and_refreshes_loaded_rows(session):
+    user_id = UserId(str(uuid4()))
+    repo = SqlAlchemyMealNutritionSummaryRepository(session)
+    first = _summary(user_id, 1.0)
+    repo.save(first)
+
+    # 同じセッションで読み込んでから別 id のサマリで上書き
+    loaded = repo.get_by_user_date_meal(
+        user_id=user_id, target_date=DAY, meal_type=MealType.MAIN, meal_index=1
+    )
+    second = _summary(user_id, 5.0)
+    repo.save(second)
+
+    assert second.id == first.id
+    reloaded = repo.get_by_user_date_meal(
+        user_id=user_id, target_date=DAY, meal_type=MealType.MAIN, meal_index=1
+    )
+    assert loaded.nutrients[0].amount.value == 1.0
+    assert {n.amount.value for n in reloaded.nutrients} == {5.0}
+
+
+def test_save_upserts_snack_slot_with_null_index(session):
+    user_id = UserId(str(uuid4()))
+    repo = SqlAlchemyMealNutritionSummaryRepository(session)
+
+    repo.save(_summary(user_id, 1.0, MealType.SNACK, None))
+    repo.save(_summary(user_id, 3.0, MealType.SNACK, None))
+    repo.save(_summary(user_id, 2.0, MealType.MAIN, 1))
+    session.commit()
+
+    summaries = repo.list_by_user_and_date(user_id=user_id, target_date=DAY)
+    assert len(summaries) == 2
+    snack = next(s for s in summaries if s.meal_type == MealType.SNACK)
+    assert {n.amount.value for n in snack.nutrients} == {3.0}
+
+
+def test_compact_mode_writes_no_rows_and_reads_in_one_query(session):
+    user_id = UserId(str(uuid4()))
+    repo = SqlAlchemyMealNutritionSummaryRepository(
+        session, NutrientStorageMode.COMPACT)
+    repo.save(_summary(user_id, 1.0))
+    session.commit()
+
+    assert session.query(MealNutritionNutrientModel).count() == 0
+
+    session.expunge_all()
+    statements = _count_statements(session)
+    loaded = repo.get_by_user_date_meal(
+        user_id=user_id, target_date=DAY, meal_type=MealType.MAIN, meal_index=1
+    )
+
+    assert len(statements) == 1
+    assert {n.code for n in loaded.nutrients} == set(ALL_NUTRIENT_CODES)
+    assert {n.amount.value for n in loaded.nutrients} == {1.0}
+
+
+def test_compact_mode_removes_rows_written_in_rows_mode(session):
+    user_id = UserId(str(uuid4()))
+    SqlAlchemyMealNutritionSummaryRepository(
+        session, NutrientStorageMode.ROWS).save(_summary(user_id, 1.0))
+    session.commit()
+
+    compact = SqlAlchemyMealNutritionSummaryRepository(
+        session, NutrientStorageMode.COMPACT)
+    # バックフィル前の行は子テーブルから読める
+    before = compact.get_by_user_date_meal(
+        user_id=user_id, target_date=DAY, meal_type=MealType.MAIN, meal_index=1
+    )
+    assert {n.amount.value for n in before.nutrients} == {1.0}
+
+    compact.save(_summary(user_id, 4.0))
+    session.commit()
+
+    assert session.query(MealNutritionNutrientModel).count() == 0
+    after = compact.get_by_user_date_meal(
+        user_id=user_id, target_date=DAY, meal_type=MealType.MAIN, meal_index=1
+    )
+    assert {n.amount.value for n in after.nutrients} == {4.0}
+
+
+def test_backfill_fills_compact_from_rows_and_is_resumable(session):
+    user_id = UserId(str(uuid4()))
+    rows_repo = SqlAlchemyMealNutritionSummaryRepository(
+        session, NutrientStorageMode.ROWS)
+    rows_repo.save(_summary(user_id, 1.0, MealType.MAIN, 1))
+    rows_repo.save(_summary(user_id, 2.0, MealType.MAIN, 2))
+    rows_repo.save(_summary(user_id, 3.0, MealType.SNACK, None))
+    session.commit()
+
+    factory = session.info["factory"]
+    assert backfill_model(
+        factory, MealNutritionSummaryModel, batch_size=2, dry_run=True) == 3
+    assert backfill_model(factory, MealNutritionSummaryModel, batch_size=2) == 3
+    assert backfill_model(factory, MealNutritionSummaryModel, batch_size=2) == 0
+
+    session.expire_all()
+    rows = SqlAlchemyMealNutritionSummaryRepository(
+        session, NutrientStorageMode.ROWS
+    ).list_by_user_and_date(user_id=user_id, target_date=DAY)
+    compact = SqlAlchemyMealNutritionSummaryRepository(
+        session, NutrientStorageMode.COMPACT
+    ).list_by_user_and_date(user_id=user_id, target_date=DAY)
+    assert [s.nutrients for s in compact] == [s.nutrients for s in rows]
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from uuid import uuid4
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.domain.auth.value_objects import UserId
+from app.domain.profile.entities import Profile
+from app.domain.profile.value_objects import HeightCm, ProfileImageId, Sex, WeightKg
+from app.infra.db.models.profile import ProfileModel
+from app.infra.db.repositories.profile_repository import SqlAlchemyProfileRepository
+
+pytestmark = pytest.mark.unit
+
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+IMAGE = ProfileImageId("profiles/u/avatar-1")
+THUMBNAILS = {64: ProfileImageId("profiles/u/thumb64-1.webp")}
+
+
+@pytest.fixture
+def session_factory():
+    engine = sa.create_engine(
+        "sqlite+pysqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    ProfileModel.__table__.create(engine)
+    return sessionmaker(bind=engine, expire_on_commit=False)
+
+
+def _create_profile(session_factory) -> UserId:
+    user_id = UserId(str(uuid4()))
+    with session_factory() as session:
+        SqlAlchemyProfileRepository(session).save(
+            Profile(
+                user_id=user_id,
+                sex=Sex.MALE,
+                birthdate=date(1990, 1, 1),
+                height_cm=HeightCm(170.0),
+                weight_kg=WeightKg(60.0),
+                image_id=IMAGE,
+                created_at=NOW,
+                updated_at=NOW,
+            )
+        )
+        session.commit()
+    return user_id
+
+
+def test_save_does_not_overwrite_thumbnails_attached_meanwhile(session_factory):
+    user_id = _create_profile(session_factory)
+
+    # プロフィール更新のリクエストが読んだ後に、サムネイル生成が記録する
+    with session_factory() as request:
+        repo = SqlAlchemyProfileRepository(request)
+        profile = repo.get_by_user_id(user_id)
+
+        with session_factory() as worker:
+            assert SqlAlchemyProfileRepository(worker).attach_thumbnails(
+                user_id, IMAGE, THUMBNAILS)
+            worker.commit()
+
+        profile.weight_kg = WeightKg(61.0)
+        repo.save(profile)
+        request.commit()
+
+    with session_factory() as session:
+        saved = SqlAlchemyProfileRepository(session).get_by_user_id(user_id)
+    assert saved.weight_kg == WeightKg(61.0)
+    assert saved.image_thumbnails == THUMBNAILS
+
+
+def test_replacing_image_clears_thumbnails_and_rejects_late_attach(session_factory):
+    user_id = _create_profile(session_factory)
+    with session_factory() as session:
+        repo = SqlAlchemyProfileRepository(session)
+        assert repo.attach_thumbnails(user_id, IMAGE, THUMBNAILS)
+
+        profile = repo.get_by_user_id(user_id)
+        profile.replace_image(ProfileImageId("profiles/u/avatar-2"))
+        saved = repo.save(profile)
+
+        assert saved.image_thumbnails == {}
+        # 古い画像のサムネイルは記録しない
+        assert not repo.attach_thumbnails(user_id, IMAGE, THUMBNAILS)
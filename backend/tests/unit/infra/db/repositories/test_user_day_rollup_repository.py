@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from uuid import UUID, uuid4
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql as pg
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.application.calendar.dto.calendar_dto import MonthlyCalendarDto
+from app.domain.auth.value_objects import UserId
+from app.domain.meal.entities import FoodEntry
+from app.domain.meal.value_objects import FoodEntryId, MealType
+from app.domain.nutrition.daily_nutrition import DailyNutritionSummary
+from app.domain.target.entities import DailyTargetSnapshot, TargetNutrient
+from app.domain.target.value_objects import (
+    NutrientAmount,
+    NutrientCode,
+    NutrientSource,
+    TargetId,
+)
+from app.infra.db.models.daily_nutrition import (
+    DailyNutritionNutrientModel,
+    DailyNutritionSummaryModel,
+)
+from app.infra.db.models.meal import FoodEntryModel
+from app.infra.db.models.target import (
+    DailyTargetSnapshotModel,
+    DailyTargetSnapshotNutrientModel,
+    TargetModel,
+    TargetNutrientModel,
+)
+from app.infra.db.models.user_day_rollup import UserDayRollupModel
+from app.infra.db.repositories.calendar_repository import SqlAlchemyCalendarRepository
+from app.infra.db.repositories.daily_nutrition_repository import (
+    SqlAlchemyDailyNutritionSummaryRepository,
+)
+from app.infra.db.repositories.food_entry_repository import (
+    SqlAlchemyFoodEntryRepository,
+)
+from app.infra.db.repositories.target_snapshot_repository import (
+    SqlAlchemyTargetSnapshotRepository,
+)
+from app.infra.db.uow.meal import SqlAlchemyMealUnitOfWork
+from app.infra.db.uow.target import SqlAlchemyTargetUnitOfWork
+from app.jobs.rebuild_user_day_rollups import rebuild_user_day_rollups
+from tests.unit.application.target.fakes import make_target
+
+pytestmark = pytest.mark.unit
+
+DAY = date(2025, 1, 10)
+
+# daily_nutrition_reports は TEXT[] 列を持ち SQLite で作れないので、集計が参照する列だけ用意する
+_reports = sa.Table(
+    "daily_nutrition_reports",
+    sa.MetaData(),
+    sa.Column("id", pg.UUID(as_uuid=True), primary_key=True),
+    sa.Column("user_id", pg.UUID(as_uuid=True), nullable=False),
+    sa.Column("date", sa.Date(), nullable=False),
+)
+
+
+@pytest.fixture
+def factory():
+    engine = sa.create_engine(
+        "sqlite+pysqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    for model in (
+        FoodEntryModel,
+        DailyNutritionSummaryModel,
+        DailyNutritionNutrientModel,
+        DailyTargetSnapshotModel,
+        DailyTargetSnapshotNutrientModel,
+        TargetModel,
+        TargetNutrientModel,
+        UserDayRollupModel,
+    ):
+        model.__table__.create(engine)
+    _reports.create(engine)
+    return sessionmaker(bind=engine, expire_on_commit=False)
+
+
+def _entry(user_id: UserId, day: date = DAY) -> FoodEntry:
+    return FoodEntry(
+        id=FoodEntryId.new(),
+        user_id=user_id,
+        date=day,
+        meal_type=MealType.MAIN,
+        meal_index=1,
+        name="rice",
+        amount_value=150.0,
+        amount_unit="g",
+        serving_count=None,
+    )
+
+
+def _rollups(factory) -> list[tuple]:
+    with factory() as session:
+        return [
+            (r.date, r.has_meal_logs, r.nutrition_achievement, r.has_daily_report)
+            for r in session.query(UserDayRollupModel).order_by(UserDayRollupModel.date)
+        ]
+
+
+def _save_day_nutrition(session, user_id: UserId) -> None:
+    SqlAlchemyTargetSnapshotRepository(session).add(
+        DailyTargetSnapshot(
+            user_id=user_id,
+            date=DAY,
+            target_id=TargetId(str(uuid4())),
+            nutrients=(
+                TargetNutrient(
+                    code=NutrientCode.PROTEIN,
+                    amount=NutrientAmount(value=60.0, unit="g"),
+                    source=NutrientSource("llm"),
+                ),
+                TargetNutrient(
+                    code=NutrientCode.FAT,
+                    amount=NutrientAmount(value=50.0, unit="g"),
+                    source=NutrientSource("llm"),
+                ),
+            ),
+            created_at=datetime.now(timezone.utc),
+        )
+    )
+    _save_summary(session, user_id)
+
+
+def _save_summary(session, user_id: UserId) -> None:
+    SqlAlchemyDailyNutritionSummaryRepository(session).save(
+        DailyNutritionSummary.from_nutrient_amounts(
+            user_id=user_id,
+            date=DAY,
+            nutrients=[
+                (NutrientCode.PROTEIN, NutrientAmount(value=45.0, unit="g")),
+                (NutrientCode.FAT, NutrientAmount(value=50.0, unit="g")),
+            ],
+            source=NutrientSource("llm"),
+        )
+    )
+
+
+def test_food_entry_writes_maintain_rollup_on_commit(factory):
+    user_id = UserId(str(uuid4()))
+    entry = _entry(user_id)
+
+    with SqlAlchemyMealUnitOfWork(factory) as uow:
+        uow.food_entry_repo.add(entry)
+    assert _rollups(factory) == [(DAY, True, None, False)]
+
+    # 日付を移すと移動元の行は消える
+    moved = _entry(user_id, date(2025, 1, 11))
+    moved.id = entry.id
+    with SqlAlchemyMealUnitOfWork(factory) as uow:
+        uow.food_entry_repo.update(moved)
+    assert _rollups(factory) == [(date(2025, 1, 11), True, None, False)]
+
+    with SqlAlchemyMealUnitOfWork(factory) as uow:
+        uow.food_entry_repo.delete(moved)
+    assert _rollups(factory) == []
+
+
+def test_refresh_dirty_only_recomputes_changed_columns(factory):
+    user_id = UserId(str(uuid4()))
+    statements: list[str] = []
+    engine = factory.kw["bind"]
+    sa.event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    # 追加は記録があると分かっているので、元テーブルは読まずに書くだけ
+    with SqlAlchemyMealUnitOfWork(factory) as uow:
+        uow.food_entry_repo.add(_entry(user_id))
+        statements.clear()
+    assert not any("daily_target_snapshots" in s for s in statements)
+    assert not any("daily_nutrition_reports" in s for s in statements)
+    assert not any(s.startswith("SELECT") and "food_entries" in s for s in statements)
+    assert _rollups(factory) == [(DAY, True, None, False)]
+
+    # 日別サマリ / スナップショットの書き込みは達成率だけを計算し直す
+    with SqlAlchemyMealUnitOfWork(factory) as uow:
+        _save_day_nutrition(uow.session, user_id)
+        statements.clear()
+    assert not any(s.startswith("SELECT") and "food_entries" in s for s in statements)
+    assert not any("daily_nutrition_reports" in s for s in statements)
+    assert _rollups(factory) == [(DAY, True, 88, False)]
+
+
+def test_rollback_discards_dirty_days(factory):
+    user_id = UserId(str(uuid4()))
+
+    with SqlAlchemyMealUnitOfWork(factory) as uow:
+        uow.food_entry_repo.add(_entry(user_id))
+        uow.rollback()
+        assert not uow.session.info.get("dirty_day_rollups")
+    assert _rollups(factory) == []
+
+
+def test_achievement_uses_day_snapshot_and_calendar_reads_rollups(factory):
+    user_id = UserId(str(uuid4()))
+    with SqlAlchemyMealUnitOfWork(factory) as uow:
+        uow.food_entry_repo.add(_entry(user_id))
+        _save_day_nutrition(uow.session, user_id)
+
+    # (45 / 60 + 50 / 50) / 2 = 87.5% → 88
+    assert _rollups(factory) == [(DAY, True, 88, False)]
+
+    with SqlAlchemyMealUnitOfWork(factory) as uow:
+        SqlAlchemyDailyNutritionSummaryRepository(uow.session).apply_nutrient_deltas(
+            user_id=user_id,
+            target_date=DAY,
+            deltas={NutrientCode.PROTEIN: 15.0},
+        )
+    assert _rollups(factory) == [(DAY, True, 100, False)]
+
+    with factory() as session:
+        days = SqlAlchemyCalendarRepository(session, use_rollups=True).get_monthly_summary(
+            MonthlyCalendarDto(user_id=user_id.value, year=2025, month=1)
+        )
+    assert len(days) == 31
+    assert days[9].date == "2025-01-10"
+    assert (days[9].has_meal_logs, days[9].nutrition_achievement) == (True, 100)
+    assert not any(d.has_meal_logs for i, d in enumerate(days) if i != 9)
+
+
+def test_day_without_snapshot_uses_active_target(factory):
+    """レポート（= スナップショット）の無い日も、アクティブな目標で達成率を出す"""
+    user_id = UserId(str(uuid4()))
+    with SqlAlchemyTargetUnitOfWork(factory) as uow:
+        uow.target_repo.add(make_target(user_id.value, is_active=True))
+    with SqlAlchemyMealUnitOfWork(factory) as uow:
+        uow.food_entry_repo.add(_entry(user_id))
+        _save_summary(uow.session, user_id)
+
+    # 目標はどれも 100g: (45 + 50) / 2 = 47.5% → 48
+    assert _rollups(factory) == [(DAY, True, 48, False)]
+
+    # アクティブな目標が無くなれば、スナップショットの無い日の達成率も消える
+    with SqlAlchemyTargetUnitOfWork(factory) as uow:
+        uow.target_repo.deactivate_all(user_id)
+    assert _rollups(factory) == [(DAY, True, None, False)]
+
+    # スナップショットのある日はアクティブな目標の変更に影響されない
+    with SqlAlchemyMealUnitOfWork(factory) as uow:
+        SqlAlchemyTargetSnapshotRepository(uow.session).add(
+            DailyTargetSnapshot.from_target(
+                target=make_target(user_id.value), snapshot_date=DAY)
+        )
+    with SqlAlchemyTargetUnitOfWork(factory) as uow:
+        target = make_target(user_id.value, is_active=True)
+        target.nutrients = [
+            TargetNutrient(
+                code=NutrientCode.PROTEIN,
+                amount=NutrientAmount(value=45.0, unit="g"),
+                source=NutrientSource("llm"),
+            )
+        ]
+        uow.target_repo.add(target)
+    assert _rollups(factory) == [(DAY, True, 48, False)]
+
+
+def test_rebuild_fills_missing_rows_and_removes_stale_ones(factory):
+    user_id = UserId(str(uuid4()))
+    stale_day = date(2025, 1, 20)
+    with factory() as session:
+        SqlAlchemyFoodEntryRepository(session).add(_entry(user_id))
+        _save_day_nutrition(session, user_id)
+        session.execute(
+            sa.insert(_reports).values(
+                id=uuid4(), user_id=UUID(user_id.value), date=DAY)
+        )
+        session.add(
+            UserDayRollupModel(
+                user_id=UUID(user_id.value), date=stale_day, has_meal_logs=True)
+        )
+        # UoW を通さずに書いたので集計はまだ無い
+        session.commit()
+    assert _rollups(factory) == [(stale_day, True, None, False)]
+
+    refreshed = rebuild_user_day_rollups(
+        factory, date(2025, 1, 1), date(2025, 1, 31), batch_size=1
+    )
+
+    assert refreshed == 2
+    assert _rollups(factory) == [(DAY, True, 88, True)]
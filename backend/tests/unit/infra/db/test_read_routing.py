@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import pytest
+import sqlalchemy as sa
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool, StaticPool
+
+from app.api.http.read_replica_middleware import (
+    LAST_WRITE_COOKIE,
+    ReadReplicaStickinessMiddleware,
+)
+from app.infra.db import session as db_session
+from app.infra.db.pool_metrics import PoolMetrics
+from app.infra.db.read_routing import (
+    ReadRoutingState,
+    bind_read_routing,
+    prefer_primary,
+    reset_read_routing,
+)
+from app.infra.db.uow import sqlalchemy_base
+from app.infra.db.uow.sqlalchemy_base import SqlAlchemyUnitOfWorkBase
+
+_metadata = sa.MetaData()
+_items = sa.Table(
+    "items",
+    _metadata,
+    sa.Column("id", sa.Integer, primary_key=True),
+    sa.Column("name", sa.String, nullable=False),
+)
+
+
+def _sqlite_factory() -> sessionmaker:
+    engine = sa.create_engine(
+        "sqlite+pysqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    _metadata.create_all(engine)
+    return sessionmaker(bind=engine, expire_on_commit=False)
+
+
+class _ItemUnitOfWork(SqlAlchemyUnitOfWorkBase):
+    def _on_enter(self, session: Session) -> None:
+        self.entered_session = session
+
+    def add(self, name: str) -> None:
+        self.session.execute(sa.insert(_items).values(name=name))
+
+    def count(self) -> int:
+        return self.session.execute(
+            sa.select(sa.func.count()).select_from(_items)
+        ).scalar_one()
+
+
+@pytest.fixture
+def primary_and_replica(monkeypatch):
+    """create_session / create_replica_session を別々の SQLite に差し替える。"""
+    primary = _sqlite_factory()
+    replica = _sqlite_factory()
+    monkeypatch.setattr(db_session, "SessionLocal", primary)
+    monkeypatch.setattr(db_session, "ReplicaSessionLocal", replica)
+    monkeypatch.setattr(sqlalchemy_base, "has_replica", lambda: True)
+    return primary, replica
+
+
+@pytest.fixture
+def routing_state():
+    state = ReadRoutingState()
+    token = bind_read_routing(state)
+    yield state
+    reset_read_routing(token)
+
+
+def test_read_only_uow_uses_replica_until_request_writes(
+    primary_and_replica, routing_state
+) -> None:
+    uow = _ItemUnitOfWork(db_session.create_session)
+    read_only = uow.as_read_only()
+
+    with read_only:
+        assert read_only.count() == 0
+        assert read_only.entered_session.get_bind() is primary_and_replica[1].kw["bind"]
+
+    # 元の UoW は読み書きのまま
+    with uow:
+        uow.add("a")
+        assert uow.entered_session.get_bind() is primary_and_replica[0].kw["bind"]
+    assert routing_state.wrote
+
+    # 書き込んだ後の読み取りはプライマリ（read-your-writes）
+    with read_only:
+        assert read_only.count() == 1
+
+
+def test_read_without_write_does_not_pin_primary(
+    primary_and_replica, routing_state
+) -> None:
+    uow = _ItemUnitOfWork(db_session.create_session)
+    with uow:
+        uow.count()
+    with uow:
+        uow.add("a")
+        uow.rollback()
+
+    assert not routing_state.wrote
+    assert not prefer_primary()
+
+
+def test_custom_session_factory_is_not_rerouted(primary_and_replica) -> None:
+    factory = _sqlite_factory()
+    read_only = _ItemUnitOfWork(factory).as_read_only()
+
+    with read_only:
+        assert read_only.entered_session.get_bind() is factory.kw["bind"]
+
+
+def test_middleware_sets_cookie_after_write_and_sticks_within_window(
+    primary_and_replica,
+) -> None:
+    now = [1000.0]
+    app = FastAPI()
+    app.add_middleware(
+        ReadReplicaStickinessMiddleware, sticky_seconds=5, clock=lambda: now[0]
+    )
+
+    @app.post("/items")
+    def create_item() -> dict:
+        with _ItemUnitOfWork(db_session.create_session) as uow:
+            uow.add("a")
+        return {}
+
+    @app.get("/routing")
+    def routing() -> dict:
+        return {"prefer_primary": prefer_primary()}
+
+    client = TestClient(app)
+    assert client.get("/routing").json() == {"prefer_primary": False}
+    assert LAST_WRITE_COOKIE not in client.cookies
+
+    client.post("/items")
+    assert client.cookies[LAST_WRITE_COOKIE] == "1000.000"
+
+    now[0] = 1004.0
+    assert client.get("/routing").json() == {"prefer_primary": True}
+    now[0] = 1006.0
+    assert client.get("/routing").json() == {"prefer_primary": False}
+
+
+def test_pool_metrics_counts_checkouts_and_connects() -> None:
+    engine = sa.create_engine(
+        "sqlite+pysqlite:///:memory:", poolclass=QueuePool, pool_size=2
+    )
+    metrics = PoolMetrics(engine)
+
+    with engine.connect():
+        stats = metrics.stats()
+        assert stats.checked_out == 1
+    with engine.connect():
+        pass
+
+    stats = metrics.stats()
+    assert stats.size == 2
+    assert stats.checked_out == 0
+    assert stats.checkouts == 2
+    assert stats.connects == 1
@@ -0,0 +1,405 @@
+from __future__ import annotations
+
+import pytest
+import sqlalchemy as sa
+from fastapi import BackgroundTasks, Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.http.db_session_middleware import RequestSessionScopeMiddleware
+from app.infra.db.request_scope import (
+    release_connections_before_calls,
+    request_session_scope,
+)
+from app.infra.db.uow.hooks import (
+    UnitOfWorkHook,
+    register_unit_of_work_hook,
+    unregister_unit_of_work_hook,
+)
+from app.infra.db.uow.sqlalchemy_base import SqlAlchemyUnitOfWorkBase
+
+_metadata = sa.MetaData()
+_items = sa.Table(
+    "items",
+    _metadata,
+    sa.Column("id", sa.Integer, primary_key=True),
+    sa.Column("name", sa.String, nullable=False),
+)
+
+
+class _ItemUnitOfWork(SqlAlchemyUnitOfWorkBase):
+    def _on_enter(self, session: Session) -> None:
+        self.entered_session = session
+
+    def add(self, name: str) -> None:
+        self.session.execute(sa.insert(_items).values(name=name))
+
+
+class _EngineStats:
+    def __init__(self) -> None:
+        self.checkouts = 0
+        self.checkins = 0
+        self.commits = 0
+
+    @property
+    def checked_out(self) -> int:
+        return self.checkouts - self.checkins
+
+
+@pytest.fixture
+def engine_and_stats() -> tuple[sa.Engine, _EngineStats]:
+    engine = sa.create_engine(
+        "sqlite+pysqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    stats = _EngineStats()
+
+    # pysqlite で SAVEPOINT を正しく扱うための定番設定
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, _record) -> None:
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _on_begin(conn) -> None:
+        conn.exec_driver_sql("BEGIN")
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(*_args) -> None:
+        stats.checkouts += 1
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(*_args) -> None:
+        stats.checkins += 1
+
+    @event.listens_for(engine, "commit")
+    def _on_commit(_conn) -> None:
+        stats.commits += 1
+
+    _metadata.create_all(engine)
+    stats.checkouts = 0
+    stats.checkins = 0
+    stats.commits = 0
+    return engine, stats
+
+
+def _count(engine: sa.Engine) -> int:
+    with engine.connect() as conn:
+        return conn.execute(sa.select(sa.func.count()).select_from(_items)).scalar_one()
+
+
+def test_without_scope_each_uow_commits_separately(engine_and_stats) -> None:
+    engine, stats = engine_and_stats
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+
+    for name in ("a", "b", "c"):
+        with _ItemUnitOfWork(factory) as uow:
+            uow.add(name)
+
+    assert stats.checkouts == 3
+    assert stats.commits == 3
+    assert _count(engine) == 3
+
+
+def test_scope_shares_one_session_and_commits_once(engine_and_stats) -> None:
+    engine, stats = engine_and_stats
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+
+    sessions = []
+    with request_session_scope():
+        for name in ("a", "b", "c"):
+            with _ItemUnitOfWork(factory) as uow:
+                uow.add(name)
+                sessions.append(uow.entered_session)
+
+        # ネストした UoW も同じ Session を使う
+        with _ItemUnitOfWork(factory) as outer, _ItemUnitOfWork(factory) as inner:
+            assert outer.entered_session is inner.entered_session
+            inner.add("d")
+
+    assert len({id(s) for s in sessions}) == 1
+    assert stats.checkouts == 1
+    assert stats.commits == 1
+    assert _count(engine) == 4
+
+
+def test_failed_uow_in_scope_only_rolls_back_its_savepoint(engine_and_stats) -> None:
+    engine, _ = engine_and_stats
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+
+    with request_session_scope():
+        with _ItemUnitOfWork(factory) as uow:
+            uow.add("kept")
+
+        with pytest.raises(RuntimeError):
+            with _ItemUnitOfWork(factory) as uow:
+                uow.add("discarded")
+                raise RuntimeError("boom")
+
+    assert _count(engine) == 1
+
+
+def test_unhandled_error_rolls_back_whole_scope(engine_and_stats) -> None:
+    engine, stats = engine_and_stats
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+
+    with pytest.raises(RuntimeError):
+        with request_session_scope():
+            with _ItemUnitOfWork(factory) as uow:
+                uow.add("a")
+            raise RuntimeError("boom")
+
+    assert stats.commits == 0
+    assert _count(engine) == 0
+
+
+def test_after_commit_waits_for_the_request_commit(engine_and_stats) -> None:
+    engine, stats = engine_and_stats
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+    calls: list[tuple[str, int]] = []
+
+    with request_session_scope():
+        with _ItemUnitOfWork(factory) as uow:
+            uow.add("a")
+            uow.after_commit(lambda: calls.append(("kept", stats.commits)))
+
+        with pytest.raises(RuntimeError):
+            with _ItemUnitOfWork(factory) as uow:
+                uow.after_commit(lambda: calls.append(("discarded", stats.commits)))
+                raise RuntimeError("boom")
+
+        # SAVEPOINT を解放しただけではまだ呼ばない
+        assert calls == []
+
+    assert calls == [("kept", 1)]
+
+
+def test_after_commit_is_dropped_when_request_rolls_back(engine_and_stats) -> None:
+    engine, _ = engine_and_stats
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+    calls: list[str] = []
+
+    with pytest.raises(RuntimeError):
+        with request_session_scope():
+            with _ItemUnitOfWork(factory) as uow:
+                uow.add("a")
+                uow.after_commit(lambda: calls.append("a"))
+            raise RuntimeError("boom")
+
+    assert calls == []
+
+
+def test_after_commit_without_scope_runs_after_uow_commit(engine_and_stats) -> None:
+    engine, stats = engine_and_stats
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+    calls: list[int] = []
+
+    def failing() -> None:
+        raise RuntimeError("storage down")
+
+    with _ItemUnitOfWork(factory) as uow:
+        uow.add("a")
+        # 失敗してもコミット済みのデータには影響させず、残りも呼ぶ
+        uow.after_commit(failing)
+        uow.after_commit(lambda: calls.append(stats.commits))
+        assert calls == []
+
+    assert calls == [1]
+    assert _count(engine) == 1
+
+
+def test_scope_without_uow_does_not_checkout_connection(engine_and_stats) -> None:
+    _, stats = engine_and_stats
+
+    with request_session_scope() as scope:
+        assert scope.has_sessions is False
+
+    assert stats.checkouts == 0
+
+
+def test_middleware_commits_once_per_request(engine_and_stats) -> None:
+    engine, stats = engine_and_stats
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+
+    def _dependency() -> str:
+        # 依存解決（別スレッド）で開いた UoW も同じトランザクションに乗る
+        with _ItemUnitOfWork(factory) as uow:
+            uow.add("from-dependency")
+        return "ok"
+
+    app = FastAPI()
+    app.add_middleware(RequestSessionScopeMiddleware)
+
+    @app.post("/items")
+    def create_items(_: str = Depends(_dependency)) -> dict:
+        for name in ("a", "b"):
+            with _ItemUnitOfWork(factory) as uow:
+                uow.add(name)
+        return {"ok": True}
+
+    client = TestClient(app)
+    response = client.post("/items")
+
+    assert response.status_code == 200
+    assert stats.checkouts == 1
+    assert stats.commits == 1
+    assert _count(engine) == 3
+
+
+def test_middleware_runs_background_tasks_outside_the_request_scope(
+    engine_and_stats,
+) -> None:
+    engine, stats = engine_and_stats
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+    committed_before_task: list[int] = []
+
+    def _background() -> None:
+        committed_before_task.append(_count(engine))
+        with _ItemUnitOfWork(factory) as uow:
+            uow.add("from-background")
+
+    app = FastAPI()
+    app.add_middleware(RequestSessionScopeMiddleware)
+
+    @app.post("/items")
+    def create_item(background_tasks: BackgroundTasks) -> dict:
+        with _ItemUnitOfWork(factory) as uow:
+            uow.add("from-request")
+        background_tasks.add_task(_background)
+        return {"ok": True}
+
+    response = TestClient(app).post("/items")
+
+    assert response.status_code == 200
+    # リクエストの COMMIT はレスポンスより先、タスクの UoW は単独で commit する
+    assert committed_before_task == [1]
+    assert stats.commits == 2
+    assert stats.checked_out == 0
+    assert _count(engine) == 2
+
+
+def test_middleware_returns_500_when_request_commit_fails(engine_and_stats) -> None:
+    engine, stats = engine_and_stats
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+
+    @event.listens_for(engine, "commit")
+    def _fail_commit(_conn) -> None:
+        raise RuntimeError("commit failed")
+
+    app = FastAPI()
+    app.add_middleware(RequestSessionScopeMiddleware)
+
+    @app.post("/items")
+    def create_item() -> dict:
+        with _ItemUnitOfWork(factory) as uow:
+            uow.add("a")
+        return {"ok": True}
+
+    response = TestClient(app, raise_server_exceptions=False).post("/items")
+
+    assert response.status_code == 500
+    event.remove(engine, "commit", _fail_commit)
+    assert _count(engine) == 0
+
+
+def test_registered_hooks_run_before_commit_and_on_discard(engine_and_stats) -> None:
+    engine, _ = engine_and_stats
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+    calls: list[tuple[str, int]] = []
+    register_unit_of_work_hook(
+        UnitOfWorkHook(
+            name="test",
+            before_commit=lambda session: calls.append(
+                ("before_commit", session.execute(
+                    sa.select(sa.func.count()).select_from(_items)).scalar_one())),
+            discard=lambda session: calls.append(("discard", 0)),
+        )
+    )
+    try:
+        with _ItemUnitOfWork(factory) as uow:
+            uow.add("a")
+        with pytest.raises(RuntimeError):
+            with _ItemUnitOfWork(factory) as uow:
+                uow.add("b")
+                raise RuntimeError("boom")
+    finally:
+        unregister_unit_of_work_hook("test")
+
+    # before_commit は同じトランザクション内（書いた行が見える）で呼ばれる
+    assert calls == [("before_commit", 1), ("discard", 0)]
+    assert _count(engine) == 1
+
+
+class _SlowPort:
+    """LLM ポートの代わり: 呼び出し時点でチェックアウト中の接続数を記録する。"""
+
+    def __init__(self, stats: _EngineStats) -> None:
+        self._stats = stats
+        self.checked_out_during_call: list[int] = []
+
+    def generate(self, value: str) -> str:
+        self.checked_out_during_call.append(self._stats.checked_out)
+        return value.upper()
+
+    async def generate_async(self, value: str) -> str:
+        return self.generate(value)
+
+
+def test_no_connection_is_checked_out_while_port_call_is_in_flight(
+    engine_and_stats,
+) -> None:
+    engine, stats = engine_and_stats
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+    port = _SlowPort(stats)
+    wrapped = release_connections_before_calls(port)
+
+    with request_session_scope():
+        with _ItemUnitOfWork(factory) as uow:
+            uow.add("read-phase")
+        assert stats.checked_out == 1
+
+        assert wrapped.generate("llm") == "LLM"
+
+        with _ItemUnitOfWork(factory) as uow:
+            uow.add("write-phase")
+
+    assert port.checked_out_during_call == [0]
+    assert stats.checked_out == 0
+    assert _count(engine) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_port_call_also_releases_connections(engine_and_stats) -> None:
+    engine, stats = engine_and_stats
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+    port = _SlowPort(stats)
+    wrapped = release_connections_before_calls(port)
+
+    with request_session_scope():
+        with _ItemUnitOfWork(factory) as uow:
+            uow.add("read-phase")
+        assert stats.checked_out == 1
+
+        assert await wrapped.generate_async("llm") == "LLM"
+
+    assert port.checked_out_during_call == [0]
+    assert _count(engine) == 1
+
+
+def test_release_is_noop_while_uow_is_open(engine_and_stats) -> None:
+    engine, stats = engine_and_stats
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+    port = _SlowPort(stats)
+    wrapped = release_connections_before_calls(port)
+
+    with request_session_scope():
+        with _ItemUnitOfWork(factory) as uow:
+            uow.add("a")
+            wrapped.generate("inside")
+            uow.add("b")
+
+    # UoW の途中では接続を手放さない（SAVEPOINT が壊れない）
+    assert port.checked_out_during_call == [1]
+    assert _count(engine) == 2
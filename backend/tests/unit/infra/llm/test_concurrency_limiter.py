@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.infra.llm import concurrency_limiter as limiter_module
+from app.infra.llm.concurrency_limiter import OpenAICallLimiter
+
+
+class _FakeMonotonic:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_limiter_caps_concurrent_calls_and_records_wait():
+    limiter = OpenAICallLimiter(max_concurrency=2, requests_per_minute=0)
+    running = 0
+    peak = 0
+
+    async def _call() -> None:
+        nonlocal running, peak
+        async with limiter.slot():
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+
+    await asyncio.gather(*(_call() for _ in range(6)))
+
+    stats = limiter.stats()
+    assert peak == 2
+    assert stats.acquired == 6
+    assert stats.in_flight == 0
+    assert stats.waiting == 0
+    # 後ろの 4 件は枠が空くまで待っている
+    assert stats.max_wait_seconds > 0.0
+    assert stats.avg_wait_seconds > 0.0
+
+
+@pytest.mark.asyncio
+async def test_limiter_releases_slot_when_call_fails():
+    limiter = OpenAICallLimiter(max_concurrency=1, requests_per_minute=0)
+
+    with pytest.raises(RuntimeError):
+        async with limiter.slot():
+            raise RuntimeError("boom")
+
+    async with limiter.slot():
+        pass
+
+    assert limiter.stats().acquired == 2
+    assert limiter.stats().in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_limiter_token_bucket_waits_for_refill(monkeypatch):
+    clock = _FakeMonotonic()
+    slept: list[float] = []
+
+    async def _fake_sleep(seconds: float) -> None:
+        slept.append(seconds)
+        clock.now += seconds
+
+    monkeypatch.setattr(limiter_module.asyncio, "sleep", _fake_sleep)
+
+    # 60 RPM = 1 秒に 1 トークン、バーストは 60 まで
+    limiter = OpenAICallLimiter(
+        max_concurrency=0,
+        requests_per_minute=60,
+        monotonic=clock,
+    )
+
+    for _ in range(60):
+        async with limiter.slot():
+            pass
+    assert slept == []
+
+    async with limiter.slot():
+        pass
+
+    assert slept == [pytest.approx(1.0)]
+    assert limiter.stats().max_wait_seconds == pytest.approx(1.0)
+
+
+def test_sync_slot_caps_threads_and_shares_the_token_bucket(monkeypatch):
+    limiter = OpenAICallLimiter(max_concurrency=2, requests_per_minute=0)
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def _call() -> None:
+        nonlocal running, peak
+        with limiter.sync_slot():
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+
+    threads = [threading.Thread(target=_call) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=5)
+
+    assert peak == 2
+    assert limiter.stats().acquired == 6
+    assert limiter.stats().in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_sync_and_async_slots_draw_from_one_bucket(monkeypatch):
+    clock = _FakeMonotonic()
+    slept: list[float] = []
+
+    async def _fake_async_sleep(seconds: float) -> None:
+        slept.append(seconds)
+
+    monkeypatch.setattr(limiter_module.asyncio, "sleep", _fake_async_sleep)
+    monkeypatch.setattr(limiter_module.time, "sleep", slept.append)
+
+    # 60 RPM = バースト 60
+    limiter = OpenAICallLimiter(
+        max_concurrency=0,
+        requests_per_minute=60,
+        monotonic=clock,
+    )
+    for _ in range(30):
+        with limiter.sync_slot():
+            pass
+    for _ in range(30):
+        async with limiter.slot():
+            pass
+    assert slept == []
+
+    with limiter.sync_slot():
+        pass
+    async with limiter.slot():
+        pass
+
+    # 前借りした分だけ後続は長く待つ
+    assert slept == [pytest.approx(1.0), pytest.approx(2.0)]
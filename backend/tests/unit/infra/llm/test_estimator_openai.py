@@ -4,12 +4,17 @@ import json
 from datetime import date
 from uuid import uuid4
 
+import pytest
+
 from app.domain.auth.value_objects import UserId
 from app.domain.meal.entities import FoodEntry
 from app.domain.meal.value_objects import FoodEntryId, MealType
+from app.domain.nutrition.errors import NutritionEstimationFailedError
+from app.infra.llm.concurrency_limiter import OpenAICallLimiter
 from app.infra.llm.estimator_openai import (
     EXPECTED_CODES,
     EXPECTED_UNITS,
+    AsyncOpenAINutritionEstimator,
     OpenAINutritionEstimator,
 )
 
@@ -47,6 +52,21 @@ class FakeOpenAIClient:
         self.chat = _FakeChat(_FakeChatCompletions(content))
 
 
+class _FakeAsyncChatCompletions:
+    def __init__(self, content: str | None) -> None:
+        self._content = content
+        self.calls = 0
+
+    async def create(self, *args, **kwargs) -> _FakeCompletion:
+        self.calls += 1
+        return _FakeCompletion(self._content)
+
+
+class FakeAsyncOpenAIClient:
+    def __init__(self, content: str | None) -> None:
+        self.chat = _FakeChat(_FakeAsyncChatCompletions(content))
+
+
 def _make_entry(user_id: UserId) -> FoodEntry:
     return FoodEntry(
         id=FoodEntryId.new(),
@@ -108,3 +128,61 @@ def test_openai_nutrition_estimator_empty_entries_returns_empty():
     )
 
     assert result == []
+
+
+def test_openai_nutrition_estimator_uses_sync_limiter_slot():
+    fake_client = FakeOpenAIClient(
+        content=json.dumps({"nutrients": _build_nutrients_data()})
+    )
+    limiter = OpenAICallLimiter(max_concurrency=2, requests_per_minute=0)
+    estimator = OpenAINutritionEstimator(client=fake_client, limiter=limiter)
+    user_id = UserId(str(uuid4()))
+
+    estimator.estimate_for_entries(
+        user_id=user_id,
+        date=date(2024, 1, 1),
+        entries=[_make_entry(user_id)],
+    )
+
+    assert limiter.stats().acquired == 1
+    assert limiter.stats().in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_async_openai_nutrition_estimator_uses_limiter():
+    expected = _build_nutrients_data()
+    fake_client = FakeAsyncOpenAIClient(
+        content=json.dumps({"nutrients": expected})
+    )
+    limiter = OpenAICallLimiter(max_concurrency=2, requests_per_minute=0)
+    estimator = AsyncOpenAINutritionEstimator(client=fake_client, limiter=limiter)
+    user_id = UserId(str(uuid4()))
+
+    result = await estimator.estimate_for_entries(
+        user_id=user_id,
+        date=date(2024, 1, 1),
+        entries=[_make_entry(user_id)],
+    )
+
+    mapping = {n.code: n.amount.value for n in result}
+    assert mapping == {
+        code: expected[code.value]["amount"] for code in EXPECTED_CODES
+    }
+    assert limiter.stats().acquired == 1
+
+
+@pytest.mark.asyncio
+async def test_async_openai_nutrition_estimator_invalid_json_raises():
+    fake_client = FakeAsyncOpenAIClient(content="not json")
+    limiter = OpenAICallLimiter(max_concurrency=1, requests_per_minute=0)
+    estimator = AsyncOpenAINutritionEstimator(client=fake_client, limiter=limiter)
+    user_id = UserId(str(uuid4()))
+
+    with pytest.raises(NutritionEstimationFailedError):
+        await estimator.estimate_for_entries(
+            user_id=user_id,
+            date=date(2024, 1, 1),
+            entries=[_make_entry(user_id)],
+        )
+
+    assert limiter.stats().in_flight == 0
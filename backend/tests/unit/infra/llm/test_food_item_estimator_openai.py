@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from app.domain.nutrition.errors import NutritionEstimationFailedError
+from app.infra.llm.estimator_openai import EXPECTED_CODES, EXPECTED_UNITS
+from app.infra.llm.food_item_estimator_openai import OpenAIFoodItemNutrientEstimator
+from app.infra.nutrition.food_item_vectors import FoodItemKey
+from tests.unit.infra.llm.test_estimator_openai import FakeOpenAIClient
+
+
+def _nutrients(scale: float) -> dict[str, dict[str, object]]:
+    return {
+        code.value: {"amount": scale * idx, "unit": EXPECTED_UNITS[code]}
+        for idx, code in enumerate(EXPECTED_CODES, start=1)
+    }
+
+
+def test_estimate_items_maps_results_by_index():
+    content = json.dumps({
+        "items": [
+            {"index": 2, "nutrients": _nutrients(2.0)},
+            {"index": 1, "nutrients": _nutrients(1.0)},
+        ]
+    })
+    estimator = OpenAIFoodItemNutrientEstimator(client=FakeOpenAIClient(content))
+
+    vectors = estimator.estimate_items([
+        FoodItemKey(name="rice", unit="g"),
+        FoodItemKey(name="miso soup", unit="serving"),
+    ])
+
+    assert len(vectors) == 2
+    assert vectors[0][EXPECTED_CODES[0]] == 1.0
+    assert vectors[1][EXPECTED_CODES[0]] == 2.0
+
+
+def test_estimate_items_fails_when_an_item_is_missing():
+    content = json.dumps({"items": [{"index": 1, "nutrients": _nutrients(1.0)}]})
+    estimator = OpenAIFoodItemNutrientEstimator(client=FakeOpenAIClient(content))
+
+    with pytest.raises(NutritionEstimationFailedError):
+        estimator.estimate_items([
+            FoodItemKey(name="rice", unit="g"),
+            FoodItemKey(name="salad", unit="serving"),
+        ])
@@ -0,0 +1,383 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from contextlib import contextmanager
+from datetime import date, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.application.nutrition.dto.daily_report_llm_dto import DailyReportLLMOutput
+from app.application.nutrition.dto.meal_nutrient_intake_dto import (
+    MealNutrientIntake,
+)
+from app.domain.auth.value_objects import UserId
+from app.domain.meal.entities import FoodEntry
+from app.domain.meal.value_objects import FoodEntryId, MealType
+from app.domain.target.value_objects import (
+    NutrientAmount,
+    NutrientCode,
+    NutrientSource,
+)
+from app.infra.db.models.daily_report_output_cache import (
+    DailyReportOutputCacheModel,
+)
+from app.infra.llm.daily_report_output_cache import (
+    SqlAlchemyDailyReportOutputCacheStore,
+)
+from app.infra.llm.single_flight import (
+    AsyncSingleFlightDailyReportGenerator,
+    AsyncSingleFlightNutritionEstimator,
+    PostgresAdvisoryLock,
+    SingleFlight,
+    SingleFlightDailyReportGenerator,
+    SingleFlightNutritionEstimator,
+    meal_flight_key,
+)
+from tests.fakes.auth_services import FixedClock
+
+pytestmark = pytest.mark.unit
+
+USER = UserId(str(uuid4()))
+DAY = date(2025, 1, 1)
+
+
+def _entry(name: str, meal_index: int = 1) -> FoodEntry:
+    return FoodEntry(
+        id=FoodEntryId.new(),
+        user_id=USER,
+        date=DAY,
+        meal_type=MealType.MAIN,
+        meal_index=meal_index,
+        name=name,
+        amount_value=100.0,
+        amount_unit="g",
+        serving_count=None,
+    )
+
+
+def _intakes() -> list[MealNutrientIntake]:
+    return [
+        MealNutrientIntake(
+            code=NutrientCode.PROTEIN,
+            amount=NutrientAmount(value=10.0, unit="g"),
+            source=NutrientSource("llm"),
+        )
+    ]
+
+
+class _BlockingEstimator:
+    """release されるまで戻らない同期推定器。"""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def estimate_for_entries(self, user_id, date, entries):
+        self.calls += 1
+        self.entered.set()
+        self.release.wait(timeout=5)
+        return _intakes()
+
+
+class _AsyncEstimator:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def estimate_for_entries(self, user_id, date, entries):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return _intakes()
+
+
+def test_concurrent_duplicate_calls_share_one_inner_call():
+    inner = _BlockingEstimator()
+    flight = SingleFlight()
+    estimator = SingleFlightNutritionEstimator(inner, flight)
+    entries = [_entry("ごはん")]
+    results: list[list[MealNutrientIntake]] = []
+
+    def run() -> None:
+        results.append(estimator.estimate_for_entries(USER, DAY, entries))
+
+    leader = threading.Thread(target=run)
+    leader.start()
+    assert inner.entered.wait(timeout=5)
+
+    followers = [threading.Thread(target=run) for _ in range(3)]
+    for t in followers:
+        t.start()
+    # 相乗り側が待ちに入るまで待つ
+    while flight.stats().coalesced < 3:
+        threading.Event().wait(0.01)
+    inner.release.set()
+    for t in [leader, *followers]:
+        t.join(timeout=5)
+
+    assert inner.calls == 1
+    assert len(results) == 4
+    assert all(r == _intakes() for r in results)
+    # 呼び出し元ごとに別のリストを返す
+    assert len({id(r) for r in results}) == 4
+    assert flight.stats().leaders == 1
+
+
+def test_error_is_shared_with_waiting_callers():
+    flight = SingleFlight()
+    entered = threading.Event()
+    release = threading.Event()
+    errors: list[BaseException] = []
+
+    def failing() -> None:
+        entered.set()
+        release.wait(timeout=5)
+        raise RuntimeError("boom")
+
+    def run() -> None:
+        try:
+            flight.do("k", failing)
+        except RuntimeError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=run)
+    leader.start()
+    assert entered.wait(timeout=5)
+    follower = threading.Thread(target=run)
+    follower.start()
+    while flight.stats().coalesced < 1:
+        threading.Event().wait(0.01)
+    release.set()
+    leader.join(timeout=5)
+    follower.join(timeout=5)
+
+    assert len(errors) == 2
+    # 失敗後は次の呼び出しが改めて実行される
+    assert flight.do("k", lambda: 42) == 42
+
+
+def test_sequential_calls_are_not_coalesced():
+    flight = SingleFlight()
+    calls = []
+    for _ in range(2):
+        flight.do("k", lambda: calls.append(1))
+    assert len(calls) == 2
+    assert flight.stats().coalesced == 0
+
+
+@pytest.mark.asyncio
+async def test_async_duplicates_are_coalesced_but_other_slots_are_not():
+    inner = _AsyncEstimator()
+    flight = SingleFlight()
+    estimator = AsyncSingleFlightNutritionEstimator(inner, flight)
+    breakfast = [_entry("ごはん", meal_index=1)]
+    lunch = [_entry("ごはん", meal_index=2)]
+
+    results = await asyncio.gather(
+        estimator.estimate_for_entries(USER, DAY, breakfast),
+        estimator.estimate_for_entries(USER, DAY, breakfast),
+        estimator.estimate_for_entries(USER, DAY, lunch),
+    )
+
+    assert inner.calls == 2
+    assert all(r == _intakes() for r in results)
+    assert flight.stats().coalesced == 1
+
+
+@pytest.mark.asyncio
+async def test_async_follower_survives_leader_cancellation():
+    flight = SingleFlight()
+    started = asyncio.Event()
+
+    async def slow() -> int:
+        started.set()
+        await asyncio.sleep(0.02)
+        return 7
+
+    leader = asyncio.create_task(flight.do_async("k", slow))
+    await started.wait()
+    follower = asyncio.create_task(flight.do_async("k", slow))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == 7
+
+
+def test_meal_flight_key_includes_slot_and_content():
+    base = meal_flight_key(USER, DAY, [_entry("ごはん")])
+
+    assert base == meal_flight_key(USER, DAY, [_entry("ごはん")])
+    assert base != meal_flight_key(USER, DAY, [_entry("ごはん", meal_index=2)])
+    assert base != meal_flight_key(USER, DAY, [_entry("パン")])
+    assert base != meal_flight_key(USER, date(2025, 1, 2), [_entry("ごはん")])
+
+
+# === ワーカー間の直列化 ======================================================
+
+
+class _InProcessLock:
+    """advisory lock の代わりにプロセス内のロックで直列化する。"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def hold(self, key: str):
+        with self._lock:
+            yield
+
+
+class _ReportGenerator:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def generate(self, input):
+        self.calls += 1
+        return DailyReportLLMOutput(
+            summary="ok",
+            good_points=["protein"],
+            improvement_points=[],
+            tomorrow_focus=["veg"],
+        )
+
+
+class _AsyncReportGenerator(_ReportGenerator):
+    async def generate(self, input):
+        return super().generate(input)
+
+
+def _report_input():
+    return SimpleNamespace(
+        user_id=USER,
+        date=DAY,
+        profile=SimpleNamespace(sex="male", meals_per_day=3),
+        target_snapshot=SimpleNamespace(nutrients=[]),
+        daily_summary=SimpleNamespace(nutrients=[]),
+        meal_summaries=[],
+    )
+
+
+@pytest.fixture
+def output_cache():
+    engine = sa.create_engine(
+        "sqlite+pysqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    DailyReportOutputCacheModel.__table__.create(engine)
+    clock = FixedClock()
+    store = SqlAlchemyDailyReportOutputCacheStore(
+        session_factory=sessionmaker(bind=engine, expire_on_commit=False),
+        clock=clock,
+        ttl_seconds=600,
+    )
+    return store, clock
+
+
+def test_recheck_after_lock_skips_the_call():
+    flight = SingleFlight(cross_process_lock=_InProcessLock())
+    calls = []
+
+    assert flight.do("k", lambda: calls.append(1) or 1, recheck=lambda: 5) == 5
+    assert flight.do("k", lambda: calls.append(1) or 1, recheck=lambda: None) == 1
+    assert len(calls) == 1
+
+
+def test_second_worker_reuses_report_output(output_cache):
+    store, clock = output_cache
+    lock = _InProcessLock()
+    inner = _ReportGenerator()
+    # ワーカーごとに SingleFlight は別（プロセス内の相乗りは効かない）
+    worker_a = SingleFlightDailyReportGenerator(
+        inner, SingleFlight(cross_process_lock=lock), output_cache=store)
+    worker_b = SingleFlightDailyReportGenerator(
+        inner, SingleFlight(cross_process_lock=lock), output_cache=store)
+
+    first = worker_a.generate(_report_input())
+    second = worker_b.generate(_report_input())
+
+    assert inner.calls == 1
+    assert second == first
+
+    # TTL を過ぎたら生成し直す
+    clock.advance(timedelta(seconds=601))
+    worker_b.generate(_report_input())
+    assert inner.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_async_second_worker_reuses_report_output(output_cache):
+    store, _ = output_cache
+    lock = _InProcessLock()
+    inner = _AsyncReportGenerator()
+    worker_a = AsyncSingleFlightDailyReportGenerator(
+        inner, SingleFlight(cross_process_lock=lock), output_cache=store)
+    worker_b = AsyncSingleFlightDailyReportGenerator(
+        inner, SingleFlight(cross_process_lock=lock), output_cache=store)
+
+    first = await worker_a.generate(_report_input())
+    second = await worker_b.generate(_report_input())
+
+    assert inner.calls == 1
+    assert second == first
+
+
+class _FakePgSession:
+    """pg_try_advisory_lock の結果を順番に返すセッション。"""
+
+    def __init__(self, results: list[bool], log: list[str]) -> None:
+        self._results = results
+        self._log = log
+
+    def get_bind(self):
+        return SimpleNamespace(dialect=SimpleNamespace(name="postgresql"))
+
+    def execute(self, statement, params):
+        sql = str(statement)
+        self._log.append(sql.split("(")[0].removeprefix("SELECT "))
+        if "pg_try_advisory_lock" in sql:
+            return SimpleNamespace(scalar=lambda: self._results.pop(0))
+        return SimpleNamespace(scalar=lambda: True)
+
+    def close(self) -> None:
+        self._log.append("close")
+
+
+def test_advisory_lock_polls_without_holding_a_connection():
+    log: list[str] = []
+    results = [False, False, True]
+    lock = PostgresAdvisoryLock(
+        lambda: _FakePgSession(results, log),
+        timeout_seconds=5,
+        poll_interval_seconds=0,
+    )
+
+    with lock.hold("k"):
+        log.append("body")
+
+    # 取れなかった試行のたびに接続を返し、取れたら本体の後で解放する
+    assert log == [
+        "pg_try_advisory_lock", "close",
+        "pg_try_advisory_lock", "close",
+        "pg_try_advisory_lock", "body",
+        "pg_advisory_unlock", "close",
+    ]
+
+
+def test_advisory_lock_gives_up_after_timeout():
+    log: list[str] = []
+    lock = PostgresAdvisoryLock(
+        lambda: _FakePgSession([False] * 100, log),
+        timeout_seconds=0,
+        poll_interval_seconds=0,
+    )
+
+    with lock.hold("k"):
+        log.append("body")
+
+    assert log == ["pg_try_advisory_lock", "close", "body"]
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+from uuid import uuid4
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.application.nutrition.dto.meal_nutrient_intake_dto import (
+    MealNutrientIntake,
+)
+from app.domain.auth.value_objects import UserId
+from app.domain.meal.entities import FoodEntry
+from app.domain.meal.value_objects import FoodEntryId, MealType
+from app.domain.target.value_objects import (
+    NutrientAmount,
+    NutrientCode,
+    NutrientSource,
+)
+from app.infra.cache.lru_ttl_cache import LruTtlCache
+from app.infra.db.models.nutrition_estimate_cache import (
+    NutritionEstimateCacheModel,
+)
+from app.infra.nutrition.caching_estimator import CachingNutritionEstimator
+from app.infra.nutrition.estimate_cache import (
+    SqlAlchemyNutritionEstimateCacheStore,
+    build_estimate_cache_key,
+)
+from tests.fakes.auth_services import FixedClock
+
+pytestmark = pytest.mark.unit
+
+
+def _entry(
+    name: str,
+    amount: float | None = 100.0,
+    unit: str | None = "g",
+    servings: float | None = None,
+) -> FoodEntry:
+    return FoodEntry(
+        id=FoodEntryId.new(),
+        user_id=UserId(str(uuid4())),
+        date=date(2025, 1, 1),
+        meal_type=MealType.MAIN,
+        meal_index=1,
+        name=name,
+        amount_value=amount,
+        amount_unit=unit,
+        serving_count=servings,
+    )
+
+
+class _CountingEstimator:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def estimate_for_entries(self, user_id, date, entries):
+        self.calls += 1
+        return [
+            MealNutrientIntake(
+                code=NutrientCode.PROTEIN,
+                amount=NutrientAmount(value=10.0 * len(entries), unit="g"),
+                source=NutrientSource("llm"),
+            )
+        ]
+
+
+@pytest.fixture
+def session_factory():
+    engine = sa.create_engine(
+        "sqlite+pysqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    NutritionEstimateCacheModel.__table__.create(engine)
+    return sessionmaker(bind=engine, expire_on_commit=False)
+
+
+def _make_estimator(inner, store=None) -> CachingNutritionEstimator:
+    return CachingNutritionEstimator(
+        inner,
+        model="gpt-test",
+        prompt_version="v1",
+        memory_cache=LruTtlCache(ttl_seconds=60, max_size=100),
+        persistent_store=store,
+    )
+
+
+def _estimate(estimator, entries):
+    return estimator.estimate_for_entries(
+        user_id=UserId(str(uuid4())),
+        date=date(2025, 1, 1),
+        entries=entries,
+    )
+
+
+# ---------------------------------------------------------------------
+# キャッシュキー
+# ---------------------------------------------------------------------
+
+
+def test_cache_key_ignores_order_case_and_whitespace() -> None:
+    a = [_entry("Rice", 150, "g"), _entry("Miso  Soup", 1, "bowl")]
+    b = [_entry(" miso soup ", 1.0, "Bowl"), _entry("rice", 150.0, "g")]
+
+    key_a = build_estimate_cache_key(a, model="m", prompt_version="v1")
+    key_b = build_estimate_cache_key(b, model="m", prompt_version="v1")
+
+    assert key_a == key_b
+
+
+def test_cache_key_changes_with_amount_model_and_prompt_version() -> None:
+    entries = [_entry("rice", 150, "g")]
+    base = build_estimate_cache_key(entries, model="m", prompt_version="v1")
+
+    assert base != build_estimate_cache_key(
+        [_entry("rice", 200, "g")], model="m", prompt_version="v1")
+    assert base != build_estimate_cache_key(
+        entries, model="other", prompt_version="v1")
+    assert base != build_estimate_cache_key(
+        entries, model="m", prompt_version="v2")
+
+
+# ---------------------------------------------------------------------
+# メモリ層
+# ---------------------------------------------------------------------
+
+
+def test_identical_meal_hits_memory_cache() -> None:
+    inner = _CountingEstimator()
+    estimator = _make_estimator(inner)
+
+    first = _estimate(estimator, [_entry("rice")])
+    second = _estimate(estimator, [_entry("rice")])
+
+    assert inner.calls == 1
+    assert first == second
+    stats = estimator.stats()
+    assert (stats.memory_hits, stats.persistent_hits, stats.misses) == (1, 0, 1)
+    assert stats.hit_rate == pytest.approx(0.5)
+
+
+def test_empty_entries_bypass_cache() -> None:
+    inner = _CountingEstimator()
+    estimator = _make_estimator(inner)
+
+    _estimate(estimator, [])
+    _estimate(estimator, [])
+
+    assert inner.calls == 2
+    assert estimator.stats().lookups == 0
+
+
+# ---------------------------------------------------------------------
+# Postgres 層 (sqlite で代用)
+# ---------------------------------------------------------------------
+
+
+def test_persistent_tier_is_shared_across_processes(session_factory) -> None:
+    clock = FixedClock()
+    store = SqlAlchemyNutritionEstimateCacheStore(
+        session_factory, clock, ttl_days=30, max_rows=100)
+
+    inner = _CountingEstimator()
+    _estimate(_make_estimator(inner, store), [_entry("rice")])
+
+    # 別プロセス相当（メモリ層は空）
+    restarted = _make_estimator(inner, store)
+    result = _estimate(restarted, [_entry("rice")])
+
+    assert inner.calls == 1
+    assert result[0].amount.value == 10.0
+    assert restarted.stats().persistent_hits == 1
+
+    # 2 段目のヒットは 1 段目にも載る
+    _estimate(restarted, [_entry("rice")])
+    assert restarted.stats().memory_hits == 1
+
+
+def test_persistent_tier_expires_after_ttl(session_factory) -> None:
+    clock = FixedClock()
+    store = SqlAlchemyNutritionEstimateCacheStore(
+        session_factory, clock, ttl_days=1, max_rows=100)
+    key = build_estimate_cache_key(
+        [_entry("rice")], model="gpt-test", prompt_version="v1")
+
+    store.set(key, _CountingEstimator().estimate_for_entries(None, None, [1]),
+              model="gpt-test", prompt_version="v1")
+    assert store.get(key) is not None
+
+    clock.advance(timedelta(days=2))
+    assert store.get(key) is None
+    assert store.prune() == 1
+
+
+def test_prune_keeps_only_newest_rows(session_factory) -> None:
+    clock = FixedClock()
+    store = SqlAlchemyNutritionEstimateCacheStore(
+        session_factory, clock, ttl_days=30, max_rows=2, prune_every=1000)
+    intakes = _CountingEstimator().estimate_for_entries(None, None, [1])
+
+    keys = []
+    for name in ("a", "b", "c"):
+        key = build_estimate_cache_key(
+            [_entry(name)], model="gpt-test", prompt_version="v1")
+        store.set(key, intakes, model="gpt-test", prompt_version="v1")
+        keys.append(key)
+        clock.advance(timedelta(minutes=1))
+
+    assert store.prune() == 1
+    assert store.get(keys[0]) is None
+    assert store.get(keys[1]) is not None
+    assert store.get(keys[2]) is not None
+
+
+def test_persistent_tier_failure_falls_back_to_inner() -> None:
+    def _broken_session():
+        raise sa.exc.OperationalError("SELECT 1", {}, Exception("db down"))
+
+    store = SqlAlchemyNutritionEstimateCacheStore(
+        _broken_session, FixedClock(), ttl_days=30, max_rows=100)
+    inner = _CountingEstimator()
+
+    result = _estimate(_make_estimator(inner, store), [_entry("rice")])
+
+    assert inner.calls == 1
+    assert result[0].code == NutrientCode.PROTEIN
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import threading
+import time
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+from app.application.nutrition.use_cases.compute_meal_nutrition import (
+    ComputeMealNutritionUseCase,
+)
+from app.application.nutrition.use_cases.get_daily_nutrition import (
+    GetDailyNutritionUseCase,
+)
+from app.domain.auth.value_objects import UserId
+from app.domain.meal.entities import FoodEntry
+from app.domain.meal.value_objects import FoodEntryId, MealType
+from app.domain.target.value_objects import NutrientCode
+from app.infra.db.read_routing import (
+    ReadRoutingState,
+    bind_read_routing,
+    reset_read_routing,
+)
+from app.infra.nutrition.daily_recompute_scheduler import (
+    DebouncedDailyNutritionRecomputeScheduler,
+)
+from tests.fakes.meal_uow import FakeMealUnitOfWork
+from tests.unit.application.meal.test_create_food_entry_use_case import (
+    FakeFoodEntryRepository,
+)
+from tests.unit.application.nutrition.fakes import (
+    FakeMealEntryQueryService,
+    FakeNutritionEstimator,
+    FakeNutritionUnitOfWork,
+    FakePlanChecker,
+)
+
+pytestmark = pytest.mark.unit
+
+DAY = date(2025, 1, 10)
+LUNCH = ("main", 1)
+SNACK = ("snack", None)
+
+
+class _Recorder:
+    def __init__(self, gate: threading.Event | None = None) -> None:
+        self.calls: list[tuple[str, date, str]] = []
+        self.slots: list[frozenset] = []
+        self.started = threading.Event()
+        self._gate = gate
+        self._lock = threading.Lock()
+
+    def __call__(self, user_id: UserId, date_: date, slots: frozenset) -> None:
+        self.started.set()
+        if self._gate is not None:
+            self._gate.wait(5)
+        with self._lock:
+            self.calls.append((user_id.value, date_, threading.current_thread().name))
+            self.slots.append(slots)
+
+
+def _wait_until(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def make_scheduler():
+    schedulers: list[DebouncedDailyNutritionRecomputeScheduler] = []
+
+    def make(recompute, **kwargs):
+        kwargs.setdefault("quiet_window", 0.05)
+        kwargs.setdefault("max_delay", 5.0)
+        scheduler = DebouncedDailyNutritionRecomputeScheduler(recompute, **kwargs)
+        schedulers.append(scheduler)
+        return scheduler
+
+    yield make
+    for scheduler in schedulers:
+        scheduler.shutdown()
+
+
+def test_burst_of_edits_runs_one_recompute_per_day(make_scheduler):
+    recorder = _Recorder()
+    scheduler = make_scheduler(recorder)
+    user_id = UserId(str(uuid4()))
+
+    for _ in range(3):
+        scheduler.schedule(user_id, DAY, [LUNCH])
+    scheduler.schedule(user_id, DAY, [SNACK])
+    scheduler.schedule(user_id, date(2025, 1, 11), [LUNCH])
+    _wait_until(lambda: not scheduler.pending(user_id, DAY)
+                and not scheduler.pending(user_id, date(2025, 1, 11)))
+
+    assert sorted((c[0], c[1]) for c in recorder.calls) == [
+        (user_id.value, DAY),
+        (user_id.value, date(2025, 1, 11)),
+    ]
+    # 待っている間に依頼されたスロットはまとめて 1 回で渡る
+    assert sorted(recorder.slots, key=len) == [
+        frozenset({LUNCH}), frozenset({LUNCH, SNACK})]
+
+
+def test_max_delay_bounds_a_continuous_burst(make_scheduler):
+    recorder = _Recorder()
+    scheduler = make_scheduler(recorder, quiet_window=0.2, max_delay=0.3)
+    user_id = UserId(str(uuid4()))
+
+    deadline = time.monotonic() + 3.0
+    while not recorder.calls and time.monotonic() < deadline:
+        scheduler.schedule(user_id, DAY, [LUNCH])
+        time.sleep(0.02)
+
+    assert recorder.calls
+
+
+def test_flush_runs_pending_recompute_in_caller(make_scheduler):
+    recorder = _Recorder()
+    scheduler = make_scheduler(recorder, quiet_window=60.0, max_delay=60.0)
+    user_id = UserId(str(uuid4()))
+
+    scheduler.schedule(user_id, DAY, [LUNCH])
+    assert scheduler.pending(user_id, DAY)
+    scheduler.flush(user_id, DAY)
+
+    assert recorder.calls == [
+        (user_id.value, DAY, threading.current_thread().name)]
+    assert not scheduler.pending(user_id, DAY)
+    # 待ち中のものが無ければ何もしない
+    scheduler.flush(user_id, DAY)
+    assert len(recorder.calls) == 1
+
+
+def test_flush_waits_for_running_recompute(make_scheduler):
+    gate = threading.Event()
+    recorder = _Recorder(gate)
+    scheduler = make_scheduler(recorder, quiet_window=0.0)
+    user_id = UserId(str(uuid4()))
+
+    scheduler.schedule(user_id, DAY, [LUNCH])
+    assert recorder.started.wait(5)
+
+    flushed = threading.Event()
+    threading.Thread(
+        target=lambda: (scheduler.flush(user_id, DAY), flushed.set())).start()
+    assert not flushed.wait(0.1)
+
+    gate.set()
+    assert flushed.wait(5)
+    assert len(recorder.calls) == 1
+
+
+def test_flush_routes_reads_to_primary_only_after_a_recompute(make_scheduler):
+    gate = threading.Event()
+    recorder = _Recorder(gate)
+    scheduler = make_scheduler(recorder, quiet_window=0.0)
+    user_id = UserId(str(uuid4()))
+
+    def flush_in_request() -> ReadRoutingState:
+        state = ReadRoutingState()
+        token = bind_read_routing(state)
+        try:
+            scheduler.flush(user_id, DAY)
+        finally:
+            reset_read_routing(token)
+        return state
+
+    # 何も無ければレプリカのまま
+    assert not flush_in_request().wrote
+
+    # 別スレッドで実行中の計算を待った
+    scheduler.schedule(user_id, DAY, [LUNCH])
+    assert recorder.started.wait(5)
+    threading.Timer(0.05, gate.set).start()
+    assert flush_in_request().wrote
+
+    # 待ち中の計算を呼び出し元で実行した
+    scheduler = make_scheduler(recorder, quiet_window=60.0, max_delay=60.0)
+    scheduler.schedule(user_id, DAY, [LUNCH])
+    assert flush_in_request().wrote
+
+
+def test_shutdown_runs_pending_recomputes(make_scheduler):
+    recorder = _Recorder()
+    scheduler = make_scheduler(recorder, quiet_window=60.0, max_delay=60.0)
+    user_id = UserId(str(uuid4()))
+
+    scheduler.schedule(user_id, DAY, [LUNCH])
+    scheduler.shutdown()
+
+    assert [(c[0], c[1]) for c in recorder.calls] == [(user_id.value, DAY)]
+
+
+def test_get_daily_nutrition_flushes_before_reading(make_scheduler):
+    user_id = UserId(str(uuid4()))
+    food_entry_repo = FakeFoodEntryRepository()
+    uow = FakeNutritionUnitOfWork()
+    compute = ComputeMealNutritionUseCase(
+        meal_entry_query_service=FakeMealEntryQueryService(
+            FakeMealUnitOfWork(food_entry_repo)),
+        nutrition_uow=uow,
+        estimator=FakeNutritionEstimator(),
+        plan_checker=FakePlanChecker(),
+    )
+    scheduler = make_scheduler(
+        compute.recompute_slots, quiet_window=60.0, max_delay=60.0)
+    use_case = GetDailyNutritionUseCase(
+        nutrition_uow=uow,
+        plan_checker=FakePlanChecker(),
+        recompute_scheduler=scheduler,
+    )
+
+    assert use_case.execute(user_id, DAY) is None
+    food_entry_repo.add(
+        FoodEntry(
+            id=FoodEntryId.new(),
+            user_id=user_id,
+            date=DAY,
+            meal_type=MealType.MAIN,
+            meal_index=1,
+            name="rice",
+            amount_value=150.0,
+            amount_unit="g",
+            serving_count=None,
+        )
+    )
+    scheduler.schedule(user_id, DAY, [LUNCH])
+    summary = use_case.execute(user_id, DAY)
+
+    # 食事スロットを計算し直した結果が日次サマリに入っている（150g × 0.20）
+    assert summary is not None and summary.date == DAY
+    protein = next(n for n in summary.nutrients if n.code == NutrientCode.PROTEIN)
+    assert protein.amount.value == pytest.approx(30.0)
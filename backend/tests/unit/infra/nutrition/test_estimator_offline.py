@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+from app.application.nutrition.dto.meal_nutrient_intake_dto import (
+    MealNutrientIntake,
+)
+from app.domain.auth.value_objects import UserId
+from app.domain.meal.entities import FoodEntry
+from app.domain.meal.value_objects import FoodEntryId, MealType
+from app.domain.nutrition.errors import NutritionEstimationFailedError
+from app.domain.target.value_objects import (
+    NutrientAmount,
+    NutrientCode,
+    NutrientSource,
+)
+from app.infra.llm.estimator_openai import EXPECTED_CODES, EXPECTED_UNITS
+from app.infra.nutrition.estimator_offline import OfflineNutritionEstimator
+from app.infra.nutrition.food_composition import (
+    FoodCompositionTable,
+    TrigramFoodIndex,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(scope="module")
+def table() -> FoodCompositionTable:
+    return FoodCompositionTable.from_csv()
+
+
+def _entry(
+    name: str,
+    amount: float | None = None,
+    unit: str | None = None,
+    servings: float | None = None,
+) -> FoodEntry:
+    return FoodEntry(
+        id=FoodEntryId.new(),
+        user_id=UserId(str(uuid4())),
+        date=date(2025, 1, 1),
+        meal_type=MealType.MAIN,
+        meal_index=1,
+        name=name,
+        amount_value=amount,
+        amount_unit=unit,
+        serving_count=servings,
+    )
+
+
+def _estimate(estimator, entries) -> dict[NutrientCode, MealNutrientIntake]:
+    result = estimator.estimate_for_entries(
+        user_id=UserId(str(uuid4())),
+        date=date(2025, 1, 1),
+        entries=entries,
+    )
+    return {i.code: i for i in result}
+
+
+def _row(table: FoodCompositionTable, name: str, code: NutrientCode) -> float:
+    return float(table.matrix[table.names.index(name), table.codes.index(code)])
+
+
+class _FallbackEstimator:
+    def __init__(self) -> None:
+        self.received: list[str] = []
+
+    def estimate_for_entries(self, user_id, date, entries):
+        self.received.extend(e.name for e in entries)
+        return [
+            MealNutrientIntake(
+                code=NutrientCode.PROTEIN,
+                amount=NutrientAmount(value=7.0, unit="g"),
+                source=NutrientSource("llm"),
+            )
+        ]
+
+
+def test_table_loads_all_codes(table) -> None:
+    assert table.matrix.shape == (len(table), len(EXPECTED_CODES))
+    assert table.codes == tuple(EXPECTED_CODES)
+
+
+def test_index_resolves_aliases_and_fuzzy_names(table) -> None:
+    index = TrigramFoodIndex(table)
+
+    assert index.lookup("ご飯").name == "rice (cooked)"
+    assert index.lookup("  Chicken Breast ").score == 1.0
+
+    fuzzy = index.lookup("grilled salmon")
+    assert fuzzy is not None
+    assert fuzzy.name == "salmon"
+    assert 0.0 < fuzzy.score < 1.0
+
+
+def test_scales_by_grams_and_servings(table) -> None:
+    estimator = OfflineNutritionEstimator(table)
+
+    result = _estimate(
+        estimator,
+        [_entry("ご飯", 200, "g"), _entry("卵", servings=2)],
+    )
+
+    expected_protein = (
+        _row(table, "rice (cooked)", NutrientCode.PROTEIN) * 2.0
+        + _row(table, "egg", NutrientCode.PROTEIN) * 0.5 * 2
+    )
+    assert result[NutrientCode.PROTEIN].amount.value == pytest.approx(expected_protein)
+    for code in EXPECTED_CODES:
+        assert result[code].amount.unit == EXPECTED_UNITS[code]
+
+
+def test_unknown_unit_is_treated_as_servings(table) -> None:
+    estimator = OfflineNutritionEstimator(table)
+
+    by_count = _estimate(estimator, [_entry("banana", 2, "本")])
+    by_serving = _estimate(estimator, [_entry("banana", servings=2)])
+
+    assert by_count[NutrientCode.POTASSIUM].amount.value == pytest.approx(
+        by_serving[NutrientCode.POTASSIUM].amount.value
+    )
+
+
+def test_low_confidence_items_go_to_fallback(table) -> None:
+    fallback = _FallbackEstimator()
+    estimator = OfflineNutritionEstimator(table, fallback=fallback)
+
+    result = _estimate(
+        estimator,
+        [_entry("tofu", 100, "g"), _entry("xyz unknown dish", servings=1)],
+    )
+
+    assert fallback.received == ["xyz unknown dish"]
+    assert result[NutrientCode.PROTEIN].amount.value == pytest.approx(
+        _row(table, "tofu", NutrientCode.PROTEIN) + 7.0
+    )
+
+
+def test_low_confidence_without_fallback_raises(table) -> None:
+    estimator = OfflineNutritionEstimator(table)
+
+    with pytest.raises(NutritionEstimationFailedError):
+        _estimate(estimator, [_entry("xyz unknown dish", servings=1)])
+
+
+def test_empty_entries_return_empty(table) -> None:
+    assert _estimate(OfflineNutritionEstimator(table), []) == {}
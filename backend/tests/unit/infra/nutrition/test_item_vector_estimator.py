@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from datetime import date
+from uuid import uuid4
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.domain.auth.value_objects import UserId
+from app.domain.meal.entities import FoodEntry
+from app.domain.meal.value_objects import FoodEntryId, MealType
+from app.domain.target.value_objects import NutrientCode
+from app.infra.cache.lru_ttl_cache import LruTtlCache
+from app.infra.db.models.food_item_nutrient_vector import (
+    FoodItemNutrientVectorModel,
+)
+from app.infra.llm.estimator_openai import EXPECTED_CODES
+from app.infra.nutrition.food_item_vectors import (
+    FoodItemKey,
+    SqlAlchemyFoodItemVectorStore,
+)
+from app.infra.nutrition.item_vector_estimator import ItemVectorNutritionEstimator
+from tests.fakes.auth_services import FixedClock
+
+pytestmark = pytest.mark.unit
+
+
+def _entry(
+    name: str,
+    amount: float | None = None,
+    unit: str | None = None,
+    servings: float | None = None,
+) -> FoodEntry:
+    return FoodEntry(
+        id=FoodEntryId.new(),
+        user_id=UserId(str(uuid4())),
+        date=date(2025, 1, 1),
+        meal_type=MealType.MAIN,
+        meal_index=1,
+        name=name,
+        amount_value=amount,
+        amount_unit=unit,
+        serving_count=servings,
+    )
+
+
+class _FakeItemEstimator:
+    """品目ごとに protein = 名前の長さ (基準量あたり) を返す。"""
+
+    model = "gpt-test"
+    prompt_version = "items-test"
+
+    def __init__(self) -> None:
+        self.batches: list[list[FoodItemKey]] = []
+
+    def estimate_items(self, items):
+        self.batches.append(list(items))
+        return [
+            {code: (float(len(item.name)) if code == NutrientCode.PROTEIN else 0.0)
+             for code in EXPECTED_CODES}
+            for item in items
+        ]
+
+
+def _estimate(estimator, entries):
+    result = estimator.estimate_for_entries(
+        user_id=UserId(str(uuid4())),
+        date=date(2025, 1, 1),
+        entries=entries,
+    )
+    return {i.code: i.amount.value for i in result}
+
+
+def _make_estimator(item_estimator, store=None) -> ItemVectorNutritionEstimator:
+    return ItemVectorNutritionEstimator(
+        item_estimator,
+        memory_cache=LruTtlCache(ttl_seconds=60, max_size=100),
+        persistent_store=store,
+    )
+
+
+def test_only_unseen_items_are_sent_in_one_batch() -> None:
+    item_estimator = _FakeItemEstimator()
+    estimator = _make_estimator(item_estimator)
+
+    _estimate(estimator, [_entry("rice", 150, "g"), _entry("miso soup", servings=1)])
+    _estimate(estimator, [_entry("Rice", 150, "g"), _entry("salad", servings=1)])
+    _estimate(estimator, [_entry("rice", 300, "g"), _entry("salad", servings=2)])
+
+    assert [[k.name for k in batch] for batch in item_estimator.batches] == [
+        ["rice", "miso soup"],
+        ["salad"],
+    ]
+    stats = estimator.stats()
+    assert stats.llm_calls == 2
+    assert stats.item_misses == 3
+    assert stats.item_memory_hits == 3
+
+
+def test_vectors_are_scaled_by_amount_and_servings() -> None:
+    estimator = _make_estimator(_FakeItemEstimator())
+
+    # rice: 4 / 100g, salad: 5 / serving
+    totals = _estimate(
+        estimator,
+        [_entry("rice", 250, "g"), _entry("salad", servings=2)],
+    )
+
+    assert totals[NutrientCode.PROTEIN] == pytest.approx(4 * 2.5 + 5 * 2)
+    assert totals[NutrientCode.FAT] == 0.0
+    assert set(totals) == set(EXPECTED_CODES)
+
+
+def test_same_name_with_different_unit_is_a_different_item() -> None:
+    item_estimator = _FakeItemEstimator()
+    estimator = _make_estimator(item_estimator)
+
+    _estimate(estimator, [_entry("milk", 200, "ml"), _entry("milk", servings=1)])
+
+    assert {k.unit for k in item_estimator.batches[0]} == {"ml", "serving"}
+
+
+def test_empty_entries_return_empty_without_llm() -> None:
+    item_estimator = _FakeItemEstimator()
+    estimator = _make_estimator(item_estimator)
+
+    assert _estimate(estimator, []) == {}
+    assert item_estimator.batches == []
+
+
+def test_persistent_store_shares_vectors_across_processes() -> None:
+    engine = sa.create_engine(
+        "sqlite+pysqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    FoodItemNutrientVectorModel.__table__.create(engine)
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+    item_estimator = _FakeItemEstimator()
+
+    def _store() -> SqlAlchemyFoodItemVectorStore:
+        return SqlAlchemyFoodItemVectorStore(
+            factory,
+            FixedClock(),
+            model=item_estimator.model,
+            prompt_version=item_estimator.prompt_version,
+        )
+
+    _estimate(_make_estimator(item_estimator, _store()), [_entry("rice", 100, "g")])
+
+    restarted = _make_estimator(item_estimator, _store())
+    totals = _estimate(restarted, [_entry("rice", 200, "g")])
+
+    assert len(item_estimator.batches) == 1
+    assert totals[NutrientCode.PROTEIN] == pytest.approx(8.0)
+    assert restarted.stats().item_persistent_hits == 1
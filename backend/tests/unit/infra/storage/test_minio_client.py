@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+import urllib3
+
+from app.infra.storage.minio_client import (
+    BucketWarmup,
+    StorageLatencyMetrics,
+    pool_stats,
+)
+
+
+class _FakeBucketClient:
+    def __init__(self, exists: bool = False, fail: bool = False) -> None:
+        self.exists = exists
+        self.fail = fail
+        self.release = threading.Event()
+        self.release.set()
+        self.calls: list[str] = []
+
+    def bucket_exists(self, bucket_name: str) -> bool:
+        self.release.wait(5)
+        self.calls.append("bucket_exists")
+        if self.fail:
+            raise ConnectionError("storage down")
+        return self.exists
+
+    def make_bucket(self, bucket_name: str) -> None:
+        self.calls.append("make_bucket")
+        self.exists = True
+
+
+def test_warmup_start_does_not_block_and_caches_outcome():
+    client = _FakeBucketClient()
+    client.release.clear()
+    warmup = BucketWarmup(client, "profiles")
+
+    warmup.start()
+    # ストレージが応答しなくても start() はすぐ戻る
+    assert warmup.state == "pending"
+
+    client.release.set()
+    assert warmup.wait(5) is True
+    assert client.calls == ["bucket_exists", "make_bucket"]
+
+    # 成功後は確認し直さない
+    warmup.start()
+    assert warmup.wait(5) is True
+    assert client.calls == ["bucket_exists", "make_bucket"]
+
+
+def test_warmup_failure_is_recorded_and_retried_after_interval():
+    client = _FakeBucketClient(fail=True)
+    metrics = StorageLatencyMetrics()
+    warmup = BucketWarmup(client, "profiles", metrics=metrics, retry_interval=0)
+
+    warmup.start()
+    assert warmup.wait(5) is False
+    assert warmup.state == "failed"
+    assert "storage down" in (warmup.error or "")
+    assert metrics.stats()["bucket_exists"].errors == 1
+
+    client.fail = False
+    client.exists = True
+    warmup.start()
+    assert warmup.wait(5) is True
+    assert warmup.error is None
+
+
+def test_latency_metrics_summarize_per_operation():
+    metrics = StorageLatencyMetrics()
+    for _ in range(3):
+        with metrics.timed("put_object"):
+            pass
+    with pytest.raises(RuntimeError):
+        with metrics.timed("stat_object"):
+            raise RuntimeError("boom")
+
+    stats = metrics.stats()
+    assert stats["put_object"].count == 3
+    assert stats["put_object"].errors == 0
+    assert stats["stat_object"].errors == 1
+    assert stats["put_object"].max_ms >= stats["put_object"].mean_ms >= 0
+
+
+def test_pool_stats_before_any_request():
+    stats = pool_stats(urllib3.PoolManager(maxsize=32))
+    assert stats.hosts == 0
+    assert stats.maxsize == 32
+    assert stats.connections == 0
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from concurrent.futures import Future
+from datetime import date, datetime, timezone
+from typing import Sequence
+
+import pytest
+
+from app.domain.auth.value_objects import UserId
+from app.domain.profile.entities import Profile
+from app.domain.profile.value_objects import HeightCm, ProfileImageId, Sex, WeightKg
+from app.infra.storage.profile_image_storage import InMemoryProfileImageStorage
+from app.infra.storage.profile_image_thumbnails import ProcessPoolProfileImageProcessor
+from tests.fakes.profile_repositories import InMemoryProfileRepository
+from tests.fakes.profile_uow import FakeProfileUnitOfWork
+
+USER_ID = UserId("77777777-7777-7777-7777-777777777777")
+
+
+class _InlineExecutor:
+    """submit() をその場で実行する Executor（プロセスを起動しない）。"""
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        future: Future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+    def shutdown(self, wait: bool = True) -> None:
+        pass
+
+
+def _fake_render(content: bytes, sizes: Sequence[int]) -> dict[int, bytes]:
+    return {size: b"webp:%d:" % size + content for size in sizes}
+
+
+@pytest.fixture
+def storage() -> InMemoryProfileImageStorage:
+    return InMemoryProfileImageStorage()
+
+
+@pytest.fixture
+def repo(storage: InMemoryProfileImageStorage) -> InMemoryProfileRepository:
+    image = storage.save(USER_ID, b"original", "image/png")
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    repo = InMemoryProfileRepository()
+    repo.save(
+        Profile(
+            user_id=USER_ID,
+            sex=Sex.MALE,
+            birthdate=date(1990, 1, 1),
+            height_cm=HeightCm(170.0),
+            weight_kg=WeightKg(60.0),
+            image_id=image.id,
+            created_at=now,
+            updated_at=now,
+        )
+    )
+    return repo
+
+
+def _processor(storage, repo) -> ProcessPoolProfileImageProcessor:
+    return ProcessPoolProfileImageProcessor(
+        image_storage=storage,
+        uow_factory=lambda: FakeProfileUnitOfWork(profile_repo=repo),
+        sizes=(128, 64),
+        max_workers=1,
+        render=_fake_render,
+        executor=_InlineExecutor(),
+        coordinator=_InlineExecutor(),
+    )
+
+
+def test_schedule_saves_thumbnails_and_records_them_on_profile(storage, repo):
+    image_id = repo.get_by_user_id(USER_ID).image_id
+
+    _processor(storage, repo).schedule(USER_ID, image_id)
+
+    thumbnails = repo.get_by_user_id(USER_ID).image_thumbnails
+    assert sorted(thumbnails) == [64, 128]
+    assert thumbnails[64].value.startswith(f"profiles/{USER_ID.value}/thumb64-")
+    assert thumbnails[64].value.endswith(".webp")
+    assert storage.read(thumbnails[128]) == b"webp:128:original"
+
+
+def test_process_discards_thumbnails_when_image_was_replaced(storage, repo):
+    old_image_id = repo.get_by_user_id(USER_ID).image_id
+    new_image = storage.save(USER_ID, b"replaced", "image/png")
+    repo.get_by_user_id(USER_ID).replace_image(new_image.id)
+
+    result = _processor(storage, repo).process(USER_ID, old_image_id)
+
+    assert result is None
+    assert repo.get_by_user_id(USER_ID).image_thumbnails == {}
+    # 作ったサムネイルはストレージにも残さない（元画像 2 枚だけ）
+    assert len(storage._store) == 2
+
+
+def test_replace_image_returns_previous_image_and_thumbnails(storage, repo):
+    profile = repo.get_by_user_id(USER_ID)
+    old_image_id = profile.image_id
+    thumbnails = _processor(storage, repo).process(USER_ID, old_image_id)
+
+    stale = profile.replace_image(ProfileImageId("profiles/x/avatar-new"))
+
+    assert set(stale) == {old_image_id, *thumbnails.values()}
+    assert profile.image_thumbnails == {}
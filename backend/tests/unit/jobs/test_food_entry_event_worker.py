@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.domain.auth.errors import PremiumFeatureRequiredError
+from app.infra.db.models.food_entry_event import FoodEntryEventModel
+from app.infra.db.repositories.food_entry_event_repository import FoodEntryEvent
+from app.jobs.food_entry_event_worker import (
+    _backoff,
+    coalesce,
+    process_batch,
+    run_worker,
+)
+
+pytestmark = pytest.mark.unit
+
+DAY = date(2025, 1, 10)
+LEASE = timedelta(minutes=5)
+
+
+@pytest.fixture
+def factory():
+    engine = sa.create_engine(
+        "sqlite+pysqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    FoodEntryEventModel.__table__.create(engine)
+    return sessionmaker(bind=engine, expire_on_commit=False)
+
+
+def _add_events(factory, user_id: UUID, meal_indexes: list[int]) -> None:
+    with factory() as session:
+        for meal_index in meal_indexes:
+            session.add(
+                FoodEntryEventModel(
+                    user_id=user_id,
+                    date=DAY,
+                    meal_type="main",
+                    meal_index=meal_index,
+                    available_at=datetime.now(timezone.utc) - timedelta(seconds=1),
+                )
+            )
+        session.commit()
+
+
+def _rows(factory) -> list[FoodEntryEventModel]:
+    with factory() as session:
+        return session.query(FoodEntryEventModel).order_by(FoodEntryEventModel.id).all()
+
+
+def test_coalesce_groups_events_by_slot():
+    user_id = uuid4()
+    events = [
+        FoodEntryEvent(id=i, user_id=user_id, date=DAY, meal_type=meal_type,
+                       meal_index=meal_index, attempts=1)
+        for i, (meal_type, meal_index) in enumerate(
+            [("main", 1), ("snack", None), ("main", 1), ("snack", None), ("main", 2)]
+        )
+    ]
+
+    slots = coalesce(events)
+
+    assert {slot: [e.id for e in group] for slot, group in slots.items()} == {
+        (user_id, DAY, "main", 1): [0, 2],
+        (user_id, DAY, "snack", None): [1, 3],
+        (user_id, DAY, "main", 2): [4],
+    }
+
+
+def test_backoff_doubles_per_attempt_up_to_the_cap():
+    assert [_backoff(n).total_seconds() for n in (1, 2, 3, 8)] == [2, 4, 8, 256]
+    assert _backoff(20) == timedelta(seconds=300)
+
+
+class _FakeComputeMealUseCase:
+    def __init__(self, calls: list[tuple], fail: set[int], premium: bool = True):
+        self._calls = calls
+        self._fail = fail
+        self._premium = premium
+
+    def execute(self, user_id, date_, meal_type, meal_index):
+        self._calls.append((user_id.value, date_, meal_type, meal_index))
+        if not self._premium:
+            raise PremiumFeatureRequiredError("premium only")
+        if meal_index in self._fail:
+            raise RuntimeError("llm down")
+
+
+def _process(factory, use_case_factory):
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        return process_batch(
+            factory,
+            use_case_factory,
+            batch_size=100,
+            lease=LEASE,
+            max_attempts=3,
+            executor=executor,
+        )
+
+
+def test_process_batch_coalesces_slots_and_retries_failures(factory):
+    user_id = uuid4()
+    _add_events(factory, user_id, [1, 1, 1, 2, 2])
+    calls: list[tuple] = []
+
+    result = _process(factory, lambda: _FakeComputeMealUseCase(calls, fail={2}))
+
+    assert (result.claimed, result.slots, result.completed, result.failed) == (5, 2, 1, 1)
+    assert sorted(c[3] for c in calls) == [1, 2]
+    with factory() as session:
+        rows = session.query(FoodEntryEventModel).all()
+        assert [(r.meal_index, r.claimed_until, r.last_error) for r in rows] == [
+            (2, None, "RuntimeError: llm down"),
+            (2, None, "RuntimeError: llm down"),
+        ]
+    # バックオフ中なので、すぐには取り直さない
+    assert _process(factory, lambda: _FakeComputeMealUseCase(calls, fail=set())).claimed == 0
+
+
+def test_process_batch_drops_events_that_cannot_be_computed(factory):
+    _add_events(factory, uuid4(), [1])
+    calls: list[tuple] = []
+
+    result = _process(
+        factory, lambda: _FakeComputeMealUseCase(calls, fail=set(), premium=False))
+
+    assert (result.completed, result.dropped, result.failed) == (0, 1, 0)
+    assert _rows(factory) == []
+
+
+def test_failed_slot_is_released_with_backoff_until_max_attempts(factory):
+    _add_events(factory, uuid4(), [1])
+    calls: list[tuple] = []
+
+    before = datetime.now(timezone.utc)
+    assert _process(factory, lambda: _FakeComputeMealUseCase(calls, fail={1})).failed == 1
+    (row,) = _rows(factory)
+    # 1 回目の失敗は 2 秒後に取り直す。リースは外れている
+    assert row.attempts == 1 and row.claimed_until is None
+    retry_at = row.available_at.replace(tzinfo=timezone.utc)
+    assert before + timedelta(seconds=2) <= retry_at <= before + timedelta(seconds=5)
+
+    for _ in range(2):
+        with factory() as session:
+            session.query(FoodEntryEventModel).update(
+                {"available_at": datetime.now(timezone.utc) - timedelta(seconds=1)})
+            session.commit()
+        assert _process(factory, lambda: _FakeComputeMealUseCase(calls, fail={1})).failed == 1
+
+    # max_attempts に達した行は取り出さず、調査用に残す
+    with factory() as session:
+        session.query(FoodEntryEventModel).update(
+            {"available_at": datetime.now(timezone.utc) - timedelta(seconds=1)})
+        session.commit()
+    assert _process(factory, lambda: _FakeComputeMealUseCase(calls, fail=set())).claimed == 0
+    (row,) = _rows(factory)
+    assert (row.attempts, row.last_error) == (3, "RuntimeError: llm down")
+    assert len(calls) == 3
+
+
+def test_run_worker_once_drains_the_outbox_and_stops(factory):
+    _add_events(factory, uuid4(), [1, 2, 2, 3])
+    calls: list[tuple] = []
+
+    total = run_worker(
+        factory,
+        lambda: _FakeComputeMealUseCase(calls, fail=set()),
+        batch_size=2,
+        lease=LEASE,
+        max_attempts=3,
+        concurrency=2,
+        poll_seconds=60.0,
+        once=True,
+        stop=threading.Event(),
+    )
+
+    # バッチの境目で分かれた同じスロットのイベントは、次のバッチでもう 1 回計算する
+    assert (total.claimed, total.completed, total.failed) == (4, 4, 0)
+    assert sorted(c[3] for c in calls) == [1, 2, 2, 3]
+    assert _rows(factory) == []
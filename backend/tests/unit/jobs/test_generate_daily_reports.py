@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import threading
+from datetime import date
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.domain.auth.errors import PremiumFeatureRequiredError
+from app.domain.auth.value_objects import UserId
+from app.domain.nutrition.errors import DailyNutritionReportAlreadyExistsError
+from app.jobs.generate_daily_reports import generate_daily_reports
+
+pytestmark = pytest.mark.unit
+
+DAY = date(2025, 1, 10)
+
+
+class _FakeUseCase:
+    def __init__(self, calls: list[tuple[str, date]], errors: dict[UUID, Exception]):
+        self._calls = calls
+        self._errors = errors
+        self._lock = threading.Lock()
+
+    def execute(self, user_id: UserId, date_: date) -> None:
+        with self._lock:
+            self._calls.append((user_id.value, date_))
+        error = self._errors.get(UUID(user_id.value))
+        if error is not None:
+            raise error
+
+
+def test_generate_daily_reports_classifies_results_and_reports_percentiles():
+    days = [(uuid4(), DAY) for _ in range(10)]
+    errors: dict[UUID, Exception] = {
+        days[0][0]: RuntimeError("llm timeout"),
+        days[1][0]: DailyNutritionReportAlreadyExistsError("exists"),
+        days[2][0]: PremiumFeatureRequiredError("premium only"),
+    }
+    calls: list[tuple[str, date]] = []
+    logs: list[str] = []
+
+    report = generate_daily_reports(
+        days,
+        lambda: _FakeUseCase(calls, errors),
+        concurrency=4,
+        log=logs.append,
+    )
+
+    assert sorted(calls) == sorted((str(user_id), d) for user_id, d in days)
+    assert report.statuses == {
+        "ok": 7,
+        "error": 1,
+        "skip:already_exists": 1,
+        "skip:not_premium": 1,
+    }
+    assert len(report.latencies_ms) == 10
+    assert any("ERROR (RuntimeError: llm timeout)" in line for line in logs)
+    lines = report.lines()
+    assert lines[1].startswith("processed  : 10 in ")
+    assert lines[1].endswith("reports/s)")
+    assert lines[-1].startswith("latency ms : mean=") and " p95=" in lines[-1]
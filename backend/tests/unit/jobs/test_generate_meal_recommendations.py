@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import argparse
+import threading
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+from app.domain.auth.value_objects import UserId
+from app.domain.nutrition.errors import NotEnoughDailyReportsError
+from app.jobs.generate_meal_recommendations import (
+    JobCheckpoint,
+    Shard,
+    generate_meal_recommendations,
+)
+
+USER_IDS = [UserId(f"00000000-0000-0000-0000-{i:012d}") for i in range(40)]
+
+
+class _FakeUseCase:
+    def __init__(self, calls: list[str], fail: set[str]) -> None:
+        self._calls = calls
+        self._fail = fail
+        self._lock = threading.Lock()
+
+    def execute(self, input):
+        with self._lock:
+            self._calls.append(input.user_id.value)
+        if input.user_id.value in self._fail:
+            raise RuntimeError("llm timeout")
+        if input.user_id.value.endswith("7"):
+            raise NotEnoughDailyReportsError("not enough")
+        return SimpleNamespace(generated_for_date=date(2025, 1, 2))
+
+
+def test_shards_partition_users_without_overlap():
+    shards = [Shard(i, 4) for i in range(4)]
+    owners = [[s for s in shards if s.owns(uid)] for uid in USER_IDS]
+    assert all(len(o) == 1 for o in owners)
+    assert all(any(s.owns(uid) for uid in USER_IDS) for s in shards)
+
+
+@pytest.mark.parametrize("value", ["4/4", "1", "a/b", "0/0"])
+def test_shard_parse_rejects_invalid(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        Shard.parse(value)
+
+
+def test_job_resumes_from_checkpoint_and_retries_errors(tmp_path):
+    path = tmp_path / "checkpoint.jsonl"
+    failing = {USER_IDS[3].value}
+    calls: list[str] = []
+
+    report = generate_meal_recommendations(
+        USER_IDS,
+        lambda: _FakeUseCase(calls, failing),
+        base_date=None,
+        shard=Shard(),
+        concurrency=8,
+        checkpoint=JobCheckpoint(path),
+        log=lambda _: None,
+    )
+    assert report.processed == 40
+    assert report.statuses["error"] == 1
+    assert report.statuses["skip:not_enough_reports"] == 4
+    assert report.statuses["ok"] == 35
+    assert len(report.latencies_ms) == 40
+
+    # 再実行: チェックポイントから読み直し、エラーだったユーザーだけもう一度処理する
+    calls.clear()
+    report = generate_meal_recommendations(
+        USER_IDS,
+        lambda: _FakeUseCase(calls, set()),
+        base_date=None,
+        shard=Shard(),
+        concurrency=8,
+        checkpoint=JobCheckpoint(path),
+        log=lambda _: None,
+    )
+    assert calls == [USER_IDS[3].value]
+    assert report.resumed == 39
+    assert report.statuses == {"ok": 1}